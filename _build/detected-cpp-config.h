@@ -0,0 +1 @@
+#define HAVE_READLINE 1
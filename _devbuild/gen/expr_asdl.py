@@ -0,0 +1,188 @@
+from asdl import pybase
+from typing import Optional, List, Tuple, Dict, Any, cast, TYPE_CHECKING
+
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, Field
+
+class tok_t(pybase.SimpleObj):
+  pass
+
+class tok_e(object):
+  Const = tok_t(1)
+  Var = tok_t(2)
+  Op1 = tok_t(3)
+  Op2 = tok_t(4)
+  Paren = tok_t(5)
+  Eof = tok_t(6)
+  Invalid = tok_t(7)
+
+_tok_str = {
+  1: 'tok.Const',
+  2: 'tok.Var',
+  3: 'tok.Op1',
+  4: 'tok.Op2',
+  5: 'tok.Paren',
+  6: 'tok.Eof',
+  7: 'tok.Invalid',
+}
+
+def tok_str(val):
+  # type: (tok_t) -> str
+  return _tok_str[val]
+
+class expr_e(object):
+  Const = 1
+  Var = 2
+  Binary = 3
+
+_expr_str = {
+  1: 'Const',
+  2: 'Var',
+  3: 'Binary',
+}
+
+def expr_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _expr_str[tag]
+  if dot:
+    return "expr.%s" % v
+  else:
+    return v
+
+class expr_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class expr(object):
+  class Const(expr_t):
+    _type_tag = 1
+    __slots__ = ('i',)
+  
+    def __init__(self, i):
+      # type: (int) -> None
+      self.i = i
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Const
+      return expr.Const(-1)
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('expr.Const')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf(str(self.i), color_e.OtherConst)
+      L.append(Field('i', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('expr.Const')
+      L = out_node.fields
+      x0 = hnode.Leaf(str(self.i), color_e.OtherConst)
+      L.append(Field('i', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  class Var(expr_t):
+    _type_tag = 2
+    __slots__ = ('name',)
+  
+    def __init__(self, name):
+      # type: (str) -> None
+      self.name = name
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Var
+      return expr.Var('')
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('expr.Var')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('expr.Var')
+      L = out_node.fields
+      x0 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  class Binary(expr_t):
+    _type_tag = 3
+    __slots__ = ('op', 'left', 'right')
+  
+    def __init__(self, op, left, right):
+      # type: (str, expr_t, expr_t) -> None
+      self.op = op
+      self.left = left
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Binary
+      return expr.Binary('', cast(expr_t, None), cast(expr_t, None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('expr.Binary')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.op, color_e.StringConst)
+      L.append(Field('op', x0))
+  
+      assert self.left is not None
+      x1 = self.left.PrettyTree()
+      L.append(Field('left', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree()
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('expr.Binary')
+      L = out_node.fields
+      x0 = NewLeaf(self.op, color_e.StringConst)
+      L.append(Field('op', x0))
+  
+      assert self.left is not None
+      x1 = self.left.AbbreviatedTree()
+      L.append(Field('left', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree()
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  pass
+
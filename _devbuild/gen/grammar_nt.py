@@ -0,0 +1,74 @@
+# This code is generated by pgen2/grammar.py
+
+augassign = 256
+and_expr = 257
+and_test = 258
+arg_group = 259
+arglist = 260
+argument = 261
+arith_expr = 262
+array_item = 263
+atom = 264
+braced_var_sub = 265
+char_literal = 266
+class_literal = 267
+class_literal_term = 268
+comma_newline = 269
+command_expr = 270
+comp_for = 271
+comp_op = 272
+comparison = 273
+dict = 274
+dict_pair = 275
+dq_string = 276
+end_stmt = 277
+expr = 278
+factor = 279
+lambdef = 280
+lhs_list = 281
+literal_expr = 282
+name_type = 283
+name_type_list = 284
+not_test = 285
+old_sh_array_literal = 286
+or_test = 287
+param = 288
+param_group = 289
+pat_eggex = 290
+pat_else = 291
+pat_exprs = 292
+place_trailer = 293
+power = 294
+range_char = 295
+range_expr = 296
+re_alt = 297
+re_atom = 298
+re_flag = 299
+re_flags = 300
+regex = 301
+repeat_op = 302
+repeat_range = 303
+sh_array_literal = 304
+sh_command_sub = 305
+shift_expr = 306
+simple_var_sub = 307
+splat_expr = 308
+sq_string = 309
+subscript = 310
+subscriptlist = 311
+term = 312
+test = 313
+testlist = 314
+testlist_comp = 315
+trailer = 316
+type_expr = 317
+xor_expr = 318
+ysh_case_pat = 319
+ysh_eager_arglist = 320
+ysh_expr = 321
+ysh_expr_sub = 322
+ysh_func = 323
+ysh_lazy_arglist = 324
+ysh_mutation = 325
+ysh_proc = 326
+ysh_var_decl = 327
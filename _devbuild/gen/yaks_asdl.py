@@ -0,0 +1,1563 @@
+from asdl import pybase
+from typing import Optional, List, Tuple, Dict, Any, cast, TYPE_CHECKING
+
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, Field
+
+class node_e(object):
+  Bool = 65
+  Int = 66
+  Str = 67
+  MultiStr = 68
+  Name = 64
+  List = 6
+
+_node_str = {
+  6: 'List',
+  64: 'Name',
+  65: 'Bool',
+  66: 'Int',
+  67: 'Str',
+  68: 'MultiStr',
+}
+
+def node_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _node_str[tag]
+  if dot:
+    return "node.%s" % v
+  else:
+    return v
+
+class node_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class node(object):
+  class List(node_t):
+    _type_tag = 6
+    __slots__ = ('children', 'loc')
+  
+    def __init__(self, children, loc):
+      # type: (List[node_t], Token) -> None
+      self.children = children
+      self.loc = loc
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> node.List
+      return node.List([] if alloc_lists else cast('List[node_t]', None), cast(Token, None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('node.List')
+      L = out_node.fields
+  
+      if self.children is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.children:
+          x0.children.append(i0.PrettyTree())
+        L.append(Field('children', x0))
+  
+      assert self.loc is not None
+      x1 = self.loc.PrettyTree()
+      L.append(Field('loc', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('node.List')
+      L = out_node.fields
+      if self.children is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.children:
+          x0.children.append(i0.AbbreviatedTree())
+        L.append(Field('children', x0))
+  
+      assert self.loc is not None
+      x1 = self.loc.AbbreviatedTree()
+      L.append(Field('loc', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  pass
+
+class op_t(pybase.SimpleObj):
+  pass
+
+class op_e(object):
+  Plus = op_t(1)
+  Minus = op_t(2)
+
+_op_str = {
+  1: 'op.Plus',
+  2: 'op.Minus',
+}
+
+def op_str(val):
+  # type: (op_t) -> str
+  return _op_str[val]
+
+class expr_e(object):
+  Bool = 65
+  Int = 66
+  Str = 67
+  MultiStr = 68
+  Unary = 5
+  Binary = 6
+  Call = 7
+
+_expr_str = {
+  5: 'Unary',
+  6: 'Binary',
+  7: 'Call',
+  65: 'Bool',
+  66: 'Int',
+  67: 'Str',
+  68: 'MultiStr',
+}
+
+def expr_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _expr_str[tag]
+  if dot:
+    return "expr.%s" % v
+  else:
+    return v
+
+class expr_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class expr(object):
+  class Unary(expr_t):
+    _type_tag = 5
+    __slots__ = ('op', 'child')
+  
+    def __init__(self, op, child):
+      # type: (Token, expr_t) -> None
+      self.op = op
+      self.child = child
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Unary
+      return expr.Unary(cast(Token, None), cast(expr_t, None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('expr.Unary')
+      L = out_node.fields
+  
+      assert self.op is not None
+      x0 = self.op.PrettyTree()
+      L.append(Field('op', x0))
+  
+      assert self.child is not None
+      x1 = self.child.PrettyTree()
+      L.append(Field('child', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('expr.Unary')
+      L = out_node.fields
+      assert self.op is not None
+      x0 = self.op.AbbreviatedTree()
+      L.append(Field('op', x0))
+  
+      assert self.child is not None
+      x1 = self.child.AbbreviatedTree()
+      L.append(Field('child', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  class Binary(expr_t):
+    _type_tag = 6
+    __slots__ = ('op', 'left', 'right')
+  
+    def __init__(self, op, left, right):
+      # type: (Token, expr_t, expr_t) -> None
+      self.op = op
+      self.left = left
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Binary
+      return expr.Binary(cast(Token, None), cast(expr_t, None), cast(expr_t, None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('expr.Binary')
+      L = out_node.fields
+  
+      assert self.op is not None
+      x0 = self.op.PrettyTree()
+      L.append(Field('op', x0))
+  
+      assert self.left is not None
+      x1 = self.left.PrettyTree()
+      L.append(Field('left', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree()
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('expr.Binary')
+      L = out_node.fields
+      assert self.op is not None
+      x0 = self.op.AbbreviatedTree()
+      L.append(Field('op', x0))
+  
+      assert self.left is not None
+      x1 = self.left.AbbreviatedTree()
+      L.append(Field('left', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree()
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  class Call(expr_t):
+    _type_tag = 7
+    __slots__ = ('f', 'args')
+  
+    def __init__(self, f, args):
+      # type: (expr_t, List[expr_t]) -> None
+      self.f = f
+      self.args = args
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> expr.Call
+      return expr.Call(cast(expr_t, None), [] if alloc_lists else cast('List[expr_t]', None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('expr.Call')
+      L = out_node.fields
+  
+      assert self.f is not None
+      x0 = self.f.PrettyTree()
+      L.append(Field('f', x0))
+  
+      if self.args is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.args:
+          x1.children.append(i1.PrettyTree())
+        L.append(Field('args', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('expr.Call')
+      L = out_node.fields
+      assert self.f is not None
+      x0 = self.f.AbbreviatedTree()
+      L.append(Field('f', x0))
+  
+      if self.args is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.args:
+          x1.children.append(i1.AbbreviatedTree())
+        L.append(Field('args', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  pass
+
+class type_e(object):
+  Bool = 1
+  Int = 2
+  Str = 3
+  List = 4
+  Dict = 5
+  Data = 6
+  Enum = 7
+
+_type_str = {
+  1: 'Bool',
+  2: 'Int',
+  3: 'Str',
+  4: 'List',
+  5: 'Dict',
+  6: 'Data',
+  7: 'Enum',
+}
+
+def type_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _type_str[tag]
+  if dot:
+    return "type.%s" % v
+  else:
+    return v
+
+class type_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class type__Bool(type_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('type__Bool')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('type__Bool')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class type__Int(type_t):
+  _type_tag = 2
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('type__Int')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('type__Int')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class type__Str(type_t):
+  _type_tag = 3
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('type__Str')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('type__Str')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class type(object):
+  Bool = type__Bool()
+  
+  Int = type__Int()
+  
+  Str = type__Str()
+  
+  class List(type_t):
+    _type_tag = 4
+    __slots__ = ('T',)
+  
+    def __init__(self, T):
+      # type: (type_t) -> None
+      self.T = T
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> type.List
+      return type.List(cast(type_t, None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('type.List')
+      L = out_node.fields
+  
+      assert self.T is not None
+      x0 = self.T.PrettyTree()
+      L.append(Field('T', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('type.List')
+      L = out_node.fields
+      assert self.T is not None
+      x0 = self.T.AbbreviatedTree()
+      L.append(Field('T', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  class Dict(type_t):
+    _type_tag = 5
+    __slots__ = ('K', 'V')
+  
+    def __init__(self, K, V):
+      # type: (type_t, type_t) -> None
+      self.K = K
+      self.V = V
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> type.Dict
+      return type.Dict(cast(type_t, None), cast(type_t, None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('type.Dict')
+      L = out_node.fields
+  
+      assert self.K is not None
+      x0 = self.K.PrettyTree()
+      L.append(Field('K', x0))
+  
+      assert self.V is not None
+      x1 = self.V.PrettyTree()
+      L.append(Field('V', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('type.Dict')
+      L = out_node.fields
+      assert self.K is not None
+      x0 = self.K.AbbreviatedTree()
+      L.append(Field('K', x0))
+  
+      assert self.V is not None
+      x1 = self.V.AbbreviatedTree()
+      L.append(Field('V', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  class Data(type_t):
+    _type_tag = 6
+    __slots__ = ('fields',)
+  
+    def __init__(self, fields):
+      # type: (List[Field_]) -> None
+      self.fields = fields
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> type.Data
+      return type.Data([] if alloc_lists else cast('List[Field_]', None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('type.Data')
+      L = out_node.fields
+  
+      if self.fields is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.fields:
+          x0.children.append(i0.PrettyTree())
+        L.append(Field('fields', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('type.Data')
+      L = out_node.fields
+      if self.fields is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.fields:
+          x0.children.append(i0.AbbreviatedTree())
+        L.append(Field('fields', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  class Enum(type_t):
+    _type_tag = 7
+    __slots__ = ('variants',)
+  
+    def __init__(self, variants):
+      # type: (List[variant]) -> None
+      self.variants = variants
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> type.Enum
+      return type.Enum([] if alloc_lists else cast('List[variant]', None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('type.Enum')
+      L = out_node.fields
+  
+      if self.variants is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.variants:
+          x0.children.append(i0.PrettyTree())
+        L.append(Field('variants', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('type.Enum')
+      L = out_node.fields
+      if self.variants is not None:  # List
+        x0 = hnode.Array([])
+        for i0 in self.variants:
+          x0.children.append(i0.AbbreviatedTree())
+        L.append(Field('variants', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  pass
+
+class stmt_e(object):
+  VarDecl = 1
+  PlaceMutation = 2
+  If = 3
+  Switch = 4
+  For = 5
+  While = 6
+  Break = 7
+  Continue = 8
+  Return = 9
+  Try = 10
+  With = 11
+
+_stmt_str = {
+  1: 'VarDecl',
+  2: 'PlaceMutation',
+  3: 'If',
+  4: 'Switch',
+  5: 'For',
+  6: 'While',
+  7: 'Break',
+  8: 'Continue',
+  9: 'Return',
+  10: 'Try',
+  11: 'With',
+}
+
+def stmt_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _stmt_str[tag]
+  if dot:
+    return "stmt.%s" % v
+  else:
+    return v
+
+class stmt_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class stmt__If(stmt_t):
+  _type_tag = 3
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__If')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__If')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class stmt__Switch(stmt_t):
+  _type_tag = 4
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__Switch')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__Switch')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class stmt__For(stmt_t):
+  _type_tag = 5
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__For')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__For')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class stmt__While(stmt_t):
+  _type_tag = 6
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__While')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__While')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class stmt__Break(stmt_t):
+  _type_tag = 7
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__Break')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__Break')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class stmt__Continue(stmt_t):
+  _type_tag = 8
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__Continue')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__Continue')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class stmt__Try(stmt_t):
+  _type_tag = 10
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__Try')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__Try')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class stmt__With(stmt_t):
+  _type_tag = 11
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__With')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('stmt__With')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class stmt(object):
+  class VarDecl(stmt_t):
+    _type_tag = 1
+    __slots__ = ('keyword',)
+  
+    def __init__(self, keyword):
+      # type: (Token) -> None
+      self.keyword = keyword
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> stmt.VarDecl
+      return stmt.VarDecl(cast(Token, None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('stmt.VarDecl')
+      L = out_node.fields
+  
+      assert self.keyword is not None
+      x0 = self.keyword.PrettyTree()
+      L.append(Field('keyword', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('stmt.VarDecl')
+      L = out_node.fields
+      assert self.keyword is not None
+      x0 = self.keyword.AbbreviatedTree()
+      L.append(Field('keyword', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  class PlaceMutation(stmt_t):
+    _type_tag = 2
+    __slots__ = ('keyword',)
+  
+    def __init__(self, keyword):
+      # type: (Token) -> None
+      self.keyword = keyword
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> stmt.PlaceMutation
+      return stmt.PlaceMutation(cast(Token, None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('stmt.PlaceMutation')
+      L = out_node.fields
+  
+      assert self.keyword is not None
+      x0 = self.keyword.PrettyTree()
+      L.append(Field('keyword', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('stmt.PlaceMutation')
+      L = out_node.fields
+      assert self.keyword is not None
+      x0 = self.keyword.AbbreviatedTree()
+      L.append(Field('keyword', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  If = stmt__If()
+  
+  Switch = stmt__Switch()
+  
+  For = stmt__For()
+  
+  While = stmt__While()
+  
+  Break = stmt__Break()
+  
+  Continue = stmt__Continue()
+  
+  class Return(stmt_t):
+    _type_tag = 9
+    __slots__ = ('e',)
+  
+    def __init__(self, e):
+      # type: (expr_t) -> None
+      self.e = e
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> stmt.Return
+      return stmt.Return(cast(expr_t, None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('stmt.Return')
+      L = out_node.fields
+  
+      assert self.e is not None
+      x0 = self.e.PrettyTree()
+      L.append(Field('e', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('stmt.Return')
+      L = out_node.fields
+      assert self.e is not None
+      x0 = self.e.AbbreviatedTree()
+      L.append(Field('e', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  Try = stmt__Try()
+  
+  With = stmt__With()
+  
+  pass
+
+class definition_e(object):
+  Static = 1
+  Func = 2
+  Data = 3
+  Enum = 4
+  Import = 5
+  Include = 6
+  Class = 7
+
+_definition_str = {
+  1: 'Static',
+  2: 'Func',
+  3: 'Data',
+  4: 'Enum',
+  5: 'Import',
+  6: 'Include',
+  7: 'Class',
+}
+
+def definition_str(tag, dot=True):
+  # type: (int, bool) -> str
+  v = _definition_str[tag]
+  if dot:
+    return "definition.%s" % v
+  else:
+    return v
+
+class definition_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class definition__Static(definition_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('definition__Static')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('definition__Static')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class definition__Func(definition_t):
+  _type_tag = 2
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('definition__Func')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('definition__Func')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class definition__Data(definition_t):
+  _type_tag = 3
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('definition__Data')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('definition__Data')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class definition__Enum(definition_t):
+  _type_tag = 4
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('definition__Enum')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('definition__Enum')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class definition__Import(definition_t):
+  _type_tag = 5
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('definition__Import')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('definition__Import')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class definition__Class(definition_t):
+  _type_tag = 7
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('definition__Class')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('definition__Class')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class definition(object):
+  Static = definition__Static()
+  
+  Func = definition__Func()
+  
+  Data = definition__Data()
+  
+  Enum = definition__Enum()
+  
+  Import = definition__Import()
+  
+  class Include(definition_t):
+    _type_tag = 6
+    __slots__ = ('path',)
+  
+    def __init__(self, path):
+      # type: (str) -> None
+      self.path = path
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> definition.Include
+      return definition.Include('')
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('definition.Include')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.path, color_e.StringConst)
+      L.append(Field('path', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('definition.Include')
+      L = out_node.fields
+      x0 = NewLeaf(self.path, color_e.StringConst)
+      L.append(Field('path', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  Class = definition__Class()
+  
+  pass
+
+class Token(node_t):
+  _type_tag = 64
+  __slots__ = ('path', 'chunk', 'start', 'length')
+
+  def __init__(self, path, chunk, start, length):
+    # type: (str, str, int, int) -> None
+    self.path = path
+    self.chunk = chunk
+    self.start = start
+    self.length = length
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> Token
+    return Token('', '', -1, -1)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Token')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.path, color_e.StringConst)
+    L.append(Field('path', x0))
+
+    x1 = NewLeaf(self.chunk, color_e.StringConst)
+    L.append(Field('chunk', x1))
+
+    x2 = hnode.Leaf(str(self.start), color_e.OtherConst)
+    L.append(Field('start', x2))
+
+    x3 = hnode.Leaf(str(self.length), color_e.OtherConst)
+    L.append(Field('length', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Token')
+    L = out_node.fields
+    x0 = NewLeaf(self.path, color_e.StringConst)
+    L.append(Field('path', x0))
+
+    x1 = NewLeaf(self.chunk, color_e.StringConst)
+    L.append(Field('chunk', x1))
+
+    x2 = hnode.Leaf(str(self.start), color_e.OtherConst)
+    L.append(Field('start', x2))
+
+    x3 = hnode.Leaf(str(self.length), color_e.OtherConst)
+    L.append(Field('length', x3))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class Bool(node_t, expr_t):
+  _type_tag = 65
+  __slots__ = ('b', 'loc')
+
+  def __init__(self, b, loc):
+    # type: (bool, Token) -> None
+    self.b = b
+    self.loc = loc
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> Bool
+    return Bool(False, cast(Token, None))
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Bool')
+    L = out_node.fields
+
+    x0 = hnode.Leaf('T' if self.b else 'F', color_e.OtherConst)
+    L.append(Field('b', x0))
+
+    assert self.loc is not None
+    x1 = self.loc.PrettyTree()
+    L.append(Field('loc', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Bool')
+    L = out_node.fields
+    x0 = hnode.Leaf('T' if self.b else 'F', color_e.OtherConst)
+    L.append(Field('b', x0))
+
+    assert self.loc is not None
+    x1 = self.loc.AbbreviatedTree()
+    L.append(Field('loc', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class Int(node_t, expr_t):
+  _type_tag = 66
+  __slots__ = ('i', 'loc')
+
+  def __init__(self, i, loc):
+    # type: (int, Token) -> None
+    self.i = i
+    self.loc = loc
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> Int
+    return Int(-1, cast(Token, None))
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Int')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.i), color_e.OtherConst)
+    L.append(Field('i', x0))
+
+    assert self.loc is not None
+    x1 = self.loc.PrettyTree()
+    L.append(Field('loc', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Int')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.i), color_e.OtherConst)
+    L.append(Field('i', x0))
+
+    assert self.loc is not None
+    x1 = self.loc.AbbreviatedTree()
+    L.append(Field('loc', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class Str(node_t, expr_t):
+  _type_tag = 67
+  __slots__ = ('s', 'loc')
+
+  def __init__(self, s, loc):
+    # type: (str, Token) -> None
+    self.s = s
+    self.loc = loc
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> Str
+    return Str('', cast(Token, None))
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Str')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.s, color_e.StringConst)
+    L.append(Field('s', x0))
+
+    assert self.loc is not None
+    x1 = self.loc.PrettyTree()
+    L.append(Field('loc', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Str')
+    L = out_node.fields
+    x0 = NewLeaf(self.s, color_e.StringConst)
+    L.append(Field('s', x0))
+
+    assert self.loc is not None
+    x1 = self.loc.AbbreviatedTree()
+    L.append(Field('loc', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class MultiStr(node_t, expr_t):
+  _type_tag = 68
+  __slots__ = ('lines',)
+
+  def __init__(self, lines):
+    # type: (List[Token]) -> None
+    self.lines = lines
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> MultiStr
+    return MultiStr([] if alloc_lists else cast('List[Token]', None))
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('MultiStr')
+    L = out_node.fields
+
+    if self.lines is not None:  # List
+      x0 = hnode.Array([])
+      for i0 in self.lines:
+        x0.children.append(i0.PrettyTree())
+      L.append(Field('lines', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('MultiStr')
+    L = out_node.fields
+    if self.lines is not None:  # List
+      x0 = hnode.Array([])
+      for i0 in self.lines:
+        x0.children.append(i0.AbbreviatedTree())
+      L.append(Field('lines', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class Field_(pybase.CompoundObj):
+  _type_tag = 69
+  __slots__ = ('name', 'typ')
+
+  def __init__(self, name, typ):
+    # type: (str, type_t) -> None
+    self.name = name
+    self.typ = typ
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> Field_
+    return Field_('', cast(type_t, None))
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Field_')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x0))
+
+    assert self.typ is not None
+    x1 = self.typ.PrettyTree()
+    L.append(Field('typ', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Field_')
+    L = out_node.fields
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(Field('name', x0))
+
+    assert self.typ is not None
+    x1 = self.typ.AbbreviatedTree()
+    L.append(Field('typ', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class variant(pybase.CompoundObj):
+  _type_tag = 70
+  __slots__ = ('fields',)
+
+  def __init__(self, fields):
+    # type: (List[Field_]) -> None
+    self.fields = fields
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> variant
+    return variant([] if alloc_lists else cast('List[Field_]', None))
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('variant')
+    L = out_node.fields
+
+    if self.fields is not None:  # List
+      x0 = hnode.Array([])
+      for i0 in self.fields:
+        x0.children.append(i0.PrettyTree())
+      L.append(Field('fields', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('variant')
+    L = out_node.fields
+    if self.fields is not None:  # List
+      x0 = hnode.Array([])
+      for i0 in self.fields:
+        x0.children.append(i0.AbbreviatedTree())
+      L.append(Field('fields', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class Module(pybase.CompoundObj):
+  _type_tag = 71
+  __slots__ = ('namespace', 'defs')
+
+  def __init__(self, namespace, defs):
+    # type: (str, List[definition_t]) -> None
+    self.namespace = namespace
+    self.defs = defs
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> Module
+    return Module('', [] if alloc_lists else cast('List[definition_t]', None))
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Module')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.namespace, color_e.StringConst)
+    L.append(Field('namespace', x0))
+
+    if self.defs is not None:  # List
+      x1 = hnode.Array([])
+      for i1 in self.defs:
+        x1.children.append(i1.PrettyTree())
+      L.append(Field('defs', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Module')
+    L = out_node.fields
+    x0 = NewLeaf(self.namespace, color_e.StringConst)
+    L.append(Field('namespace', x0))
+
+    if self.defs is not None:  # List
+      x1 = hnode.Array([])
+      for i1 in self.defs:
+        x1.children.append(i1.AbbreviatedTree())
+      L.append(Field('defs', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
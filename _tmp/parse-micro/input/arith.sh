@@ -0,0 +1,200 @@
+(( x = (i + 1) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 1 ))
+(( x = (i + 2) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 2 ))
+(( x = (i + 3) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 3 ))
+(( x = (i + 4) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 4 ))
+(( x = (i + 5) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 5 ))
+(( x = (i + 6) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 6 ))
+(( x = (i + 7) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 7 ))
+(( x = (i + 8) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 8 ))
+(( x = (i + 9) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 9 ))
+(( x = (i + 10) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 10 ))
+(( x = (i + 11) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 11 ))
+(( x = (i + 12) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 12 ))
+(( x = (i + 13) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 13 ))
+(( x = (i + 14) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 14 ))
+(( x = (i + 15) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 15 ))
+(( x = (i + 16) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 16 ))
+(( x = (i + 17) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 17 ))
+(( x = (i + 18) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 18 ))
+(( x = (i + 19) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 19 ))
+(( x = (i + 20) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 20 ))
+(( x = (i + 21) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 21 ))
+(( x = (i + 22) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 22 ))
+(( x = (i + 23) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 23 ))
+(( x = (i + 24) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 24 ))
+(( x = (i + 25) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 25 ))
+(( x = (i + 26) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 26 ))
+(( x = (i + 27) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 27 ))
+(( x = (i + 28) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 28 ))
+(( x = (i + 29) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 29 ))
+(( x = (i + 30) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 30 ))
+(( x = (i + 31) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 31 ))
+(( x = (i + 32) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 32 ))
+(( x = (i + 33) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 33 ))
+(( x = (i + 34) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 34 ))
+(( x = (i + 35) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 35 ))
+(( x = (i + 36) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 36 ))
+(( x = (i + 37) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 37 ))
+(( x = (i + 38) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 38 ))
+(( x = (i + 39) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 39 ))
+(( x = (i + 40) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 40 ))
+(( x = (i + 41) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 41 ))
+(( x = (i + 42) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 42 ))
+(( x = (i + 43) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 43 ))
+(( x = (i + 44) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 44 ))
+(( x = (i + 45) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 45 ))
+(( x = (i + 46) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 46 ))
+(( x = (i + 47) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 47 ))
+(( x = (i + 48) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 48 ))
+(( x = (i + 49) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 49 ))
+(( x = (i + 50) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 50 ))
+(( x = (i + 51) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 51 ))
+(( x = (i + 52) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 52 ))
+(( x = (i + 53) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 53 ))
+(( x = (i + 54) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 54 ))
+(( x = (i + 55) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 55 ))
+(( x = (i + 56) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 56 ))
+(( x = (i + 57) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 57 ))
+(( x = (i + 58) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 58 ))
+(( x = (i + 59) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 59 ))
+(( x = (i + 60) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 60 ))
+(( x = (i + 61) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 61 ))
+(( x = (i + 62) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 62 ))
+(( x = (i + 63) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 63 ))
+(( x = (i + 64) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 64 ))
+(( x = (i + 65) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 65 ))
+(( x = (i + 66) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 66 ))
+(( x = (i + 67) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 67 ))
+(( x = (i + 68) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 68 ))
+(( x = (i + 69) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 69 ))
+(( x = (i + 70) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 70 ))
+(( x = (i + 71) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 71 ))
+(( x = (i + 72) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 72 ))
+(( x = (i + 73) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 73 ))
+(( x = (i + 74) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 74 ))
+(( x = (i + 75) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 75 ))
+(( x = (i + 76) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 76 ))
+(( x = (i + 77) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 77 ))
+(( x = (i + 78) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 78 ))
+(( x = (i + 79) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 79 ))
+(( x = (i + 80) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 80 ))
+(( x = (i + 81) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 81 ))
+(( x = (i + 82) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 82 ))
+(( x = (i + 83) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 83 ))
+(( x = (i + 84) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 84 ))
+(( x = (i + 85) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 85 ))
+(( x = (i + 86) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 86 ))
+(( x = (i + 87) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 87 ))
+(( x = (i + 88) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 88 ))
+(( x = (i + 89) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 89 ))
+(( x = (i + 90) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 90 ))
+(( x = (i + 91) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 91 ))
+(( x = (i + 92) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 92 ))
+(( x = (i + 93) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 93 ))
+(( x = (i + 94) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 94 ))
+(( x = (i + 95) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 95 ))
+(( x = (i + 96) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 96 ))
+(( x = (i + 97) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 97 ))
+(( x = (i + 98) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 98 ))
+(( x = (i + 99) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 99 ))
+(( x = (i + 100) * 3 % 7 << 2 ))
+echo $(( a[i] + b ? c : d - 100 ))
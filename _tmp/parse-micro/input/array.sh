@@ -0,0 +1,102 @@
+a=(
+  item1 "dq 1" 'sq' ${x}
+  item2 "dq 2" 'sq' ${x}
+  item3 "dq 3" 'sq' ${x}
+  item4 "dq 4" 'sq' ${x}
+  item5 "dq 5" 'sq' ${x}
+  item6 "dq 6" 'sq' ${x}
+  item7 "dq 7" 'sq' ${x}
+  item8 "dq 8" 'sq' ${x}
+  item9 "dq 9" 'sq' ${x}
+  item10 "dq 10" 'sq' ${x}
+  item11 "dq 11" 'sq' ${x}
+  item12 "dq 12" 'sq' ${x}
+  item13 "dq 13" 'sq' ${x}
+  item14 "dq 14" 'sq' ${x}
+  item15 "dq 15" 'sq' ${x}
+  item16 "dq 16" 'sq' ${x}
+  item17 "dq 17" 'sq' ${x}
+  item18 "dq 18" 'sq' ${x}
+  item19 "dq 19" 'sq' ${x}
+  item20 "dq 20" 'sq' ${x}
+  item21 "dq 21" 'sq' ${x}
+  item22 "dq 22" 'sq' ${x}
+  item23 "dq 23" 'sq' ${x}
+  item24 "dq 24" 'sq' ${x}
+  item25 "dq 25" 'sq' ${x}
+  item26 "dq 26" 'sq' ${x}
+  item27 "dq 27" 'sq' ${x}
+  item28 "dq 28" 'sq' ${x}
+  item29 "dq 29" 'sq' ${x}
+  item30 "dq 30" 'sq' ${x}
+  item31 "dq 31" 'sq' ${x}
+  item32 "dq 32" 'sq' ${x}
+  item33 "dq 33" 'sq' ${x}
+  item34 "dq 34" 'sq' ${x}
+  item35 "dq 35" 'sq' ${x}
+  item36 "dq 36" 'sq' ${x}
+  item37 "dq 37" 'sq' ${x}
+  item38 "dq 38" 'sq' ${x}
+  item39 "dq 39" 'sq' ${x}
+  item40 "dq 40" 'sq' ${x}
+  item41 "dq 41" 'sq' ${x}
+  item42 "dq 42" 'sq' ${x}
+  item43 "dq 43" 'sq' ${x}
+  item44 "dq 44" 'sq' ${x}
+  item45 "dq 45" 'sq' ${x}
+  item46 "dq 46" 'sq' ${x}
+  item47 "dq 47" 'sq' ${x}
+  item48 "dq 48" 'sq' ${x}
+  item49 "dq 49" 'sq' ${x}
+  item50 "dq 50" 'sq' ${x}
+  item51 "dq 51" 'sq' ${x}
+  item52 "dq 52" 'sq' ${x}
+  item53 "dq 53" 'sq' ${x}
+  item54 "dq 54" 'sq' ${x}
+  item55 "dq 55" 'sq' ${x}
+  item56 "dq 56" 'sq' ${x}
+  item57 "dq 57" 'sq' ${x}
+  item58 "dq 58" 'sq' ${x}
+  item59 "dq 59" 'sq' ${x}
+  item60 "dq 60" 'sq' ${x}
+  item61 "dq 61" 'sq' ${x}
+  item62 "dq 62" 'sq' ${x}
+  item63 "dq 63" 'sq' ${x}
+  item64 "dq 64" 'sq' ${x}
+  item65 "dq 65" 'sq' ${x}
+  item66 "dq 66" 'sq' ${x}
+  item67 "dq 67" 'sq' ${x}
+  item68 "dq 68" 'sq' ${x}
+  item69 "dq 69" 'sq' ${x}
+  item70 "dq 70" 'sq' ${x}
+  item71 "dq 71" 'sq' ${x}
+  item72 "dq 72" 'sq' ${x}
+  item73 "dq 73" 'sq' ${x}
+  item74 "dq 74" 'sq' ${x}
+  item75 "dq 75" 'sq' ${x}
+  item76 "dq 76" 'sq' ${x}
+  item77 "dq 77" 'sq' ${x}
+  item78 "dq 78" 'sq' ${x}
+  item79 "dq 79" 'sq' ${x}
+  item80 "dq 80" 'sq' ${x}
+  item81 "dq 81" 'sq' ${x}
+  item82 "dq 82" 'sq' ${x}
+  item83 "dq 83" 'sq' ${x}
+  item84 "dq 84" 'sq' ${x}
+  item85 "dq 85" 'sq' ${x}
+  item86 "dq 86" 'sq' ${x}
+  item87 "dq 87" 'sq' ${x}
+  item88 "dq 88" 'sq' ${x}
+  item89 "dq 89" 'sq' ${x}
+  item90 "dq 90" 'sq' ${x}
+  item91 "dq 91" 'sq' ${x}
+  item92 "dq 92" 'sq' ${x}
+  item93 "dq 93" 'sq' ${x}
+  item94 "dq 94" 'sq' ${x}
+  item95 "dq 95" 'sq' ${x}
+  item96 "dq 96" 'sq' ${x}
+  item97 "dq 97" 'sq' ${x}
+  item98 "dq 98" 'sq' ${x}
+  item99 "dq 99" 'sq' ${x}
+  item100 "dq 100" 'sq' ${x}
+)
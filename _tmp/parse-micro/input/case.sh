@@ -0,0 +1,103 @@
+case $x in
+  pat1|other1|*.1) echo 1 ;;
+  pat2|other2|*.2) echo 2 ;;
+  pat3|other3|*.3) echo 3 ;;
+  pat4|other4|*.4) echo 4 ;;
+  pat5|other5|*.5) echo 5 ;;
+  pat6|other6|*.6) echo 6 ;;
+  pat7|other7|*.7) echo 7 ;;
+  pat8|other8|*.8) echo 8 ;;
+  pat9|other9|*.9) echo 9 ;;
+  pat10|other10|*.10) echo 10 ;;
+  pat11|other11|*.11) echo 11 ;;
+  pat12|other12|*.12) echo 12 ;;
+  pat13|other13|*.13) echo 13 ;;
+  pat14|other14|*.14) echo 14 ;;
+  pat15|other15|*.15) echo 15 ;;
+  pat16|other16|*.16) echo 16 ;;
+  pat17|other17|*.17) echo 17 ;;
+  pat18|other18|*.18) echo 18 ;;
+  pat19|other19|*.19) echo 19 ;;
+  pat20|other20|*.20) echo 20 ;;
+  pat21|other21|*.21) echo 21 ;;
+  pat22|other22|*.22) echo 22 ;;
+  pat23|other23|*.23) echo 23 ;;
+  pat24|other24|*.24) echo 24 ;;
+  pat25|other25|*.25) echo 25 ;;
+  pat26|other26|*.26) echo 26 ;;
+  pat27|other27|*.27) echo 27 ;;
+  pat28|other28|*.28) echo 28 ;;
+  pat29|other29|*.29) echo 29 ;;
+  pat30|other30|*.30) echo 30 ;;
+  pat31|other31|*.31) echo 31 ;;
+  pat32|other32|*.32) echo 32 ;;
+  pat33|other33|*.33) echo 33 ;;
+  pat34|other34|*.34) echo 34 ;;
+  pat35|other35|*.35) echo 35 ;;
+  pat36|other36|*.36) echo 36 ;;
+  pat37|other37|*.37) echo 37 ;;
+  pat38|other38|*.38) echo 38 ;;
+  pat39|other39|*.39) echo 39 ;;
+  pat40|other40|*.40) echo 40 ;;
+  pat41|other41|*.41) echo 41 ;;
+  pat42|other42|*.42) echo 42 ;;
+  pat43|other43|*.43) echo 43 ;;
+  pat44|other44|*.44) echo 44 ;;
+  pat45|other45|*.45) echo 45 ;;
+  pat46|other46|*.46) echo 46 ;;
+  pat47|other47|*.47) echo 47 ;;
+  pat48|other48|*.48) echo 48 ;;
+  pat49|other49|*.49) echo 49 ;;
+  pat50|other50|*.50) echo 50 ;;
+  pat51|other51|*.51) echo 51 ;;
+  pat52|other52|*.52) echo 52 ;;
+  pat53|other53|*.53) echo 53 ;;
+  pat54|other54|*.54) echo 54 ;;
+  pat55|other55|*.55) echo 55 ;;
+  pat56|other56|*.56) echo 56 ;;
+  pat57|other57|*.57) echo 57 ;;
+  pat58|other58|*.58) echo 58 ;;
+  pat59|other59|*.59) echo 59 ;;
+  pat60|other60|*.60) echo 60 ;;
+  pat61|other61|*.61) echo 61 ;;
+  pat62|other62|*.62) echo 62 ;;
+  pat63|other63|*.63) echo 63 ;;
+  pat64|other64|*.64) echo 64 ;;
+  pat65|other65|*.65) echo 65 ;;
+  pat66|other66|*.66) echo 66 ;;
+  pat67|other67|*.67) echo 67 ;;
+  pat68|other68|*.68) echo 68 ;;
+  pat69|other69|*.69) echo 69 ;;
+  pat70|other70|*.70) echo 70 ;;
+  pat71|other71|*.71) echo 71 ;;
+  pat72|other72|*.72) echo 72 ;;
+  pat73|other73|*.73) echo 73 ;;
+  pat74|other74|*.74) echo 74 ;;
+  pat75|other75|*.75) echo 75 ;;
+  pat76|other76|*.76) echo 76 ;;
+  pat77|other77|*.77) echo 77 ;;
+  pat78|other78|*.78) echo 78 ;;
+  pat79|other79|*.79) echo 79 ;;
+  pat80|other80|*.80) echo 80 ;;
+  pat81|other81|*.81) echo 81 ;;
+  pat82|other82|*.82) echo 82 ;;
+  pat83|other83|*.83) echo 83 ;;
+  pat84|other84|*.84) echo 84 ;;
+  pat85|other85|*.85) echo 85 ;;
+  pat86|other86|*.86) echo 86 ;;
+  pat87|other87|*.87) echo 87 ;;
+  pat88|other88|*.88) echo 88 ;;
+  pat89|other89|*.89) echo 89 ;;
+  pat90|other90|*.90) echo 90 ;;
+  pat91|other91|*.91) echo 91 ;;
+  pat92|other92|*.92) echo 92 ;;
+  pat93|other93|*.93) echo 93 ;;
+  pat94|other94|*.94) echo 94 ;;
+  pat95|other95|*.95) echo 95 ;;
+  pat96|other96|*.96) echo 96 ;;
+  pat97|other97|*.97) echo 97 ;;
+  pat98|other98|*.98) echo 98 ;;
+  pat99|other99|*.99) echo 99 ;;
+  pat100|other100|*.100) echo 100 ;;
+  *) echo default ;;
+esac
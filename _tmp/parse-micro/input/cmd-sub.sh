@@ -0,0 +1,100 @@
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
+echo $(echo 10 $(echo 9 $(echo 8 $(echo 7 $(echo 6 $(echo 5 $(echo 4 $(echo 3 $(echo 2 $(echo 1 x))))))))))
@@ -0,0 +1,600 @@
+cat <<EOF1
+line 1 with $var and ${x:-default} and $(echo sub)
+EOF1
+cat <<'EOF1'
+literal line 1
+EOF1
+cat <<EOF2
+line 2 with $var and ${x:-default} and $(echo sub)
+EOF2
+cat <<'EOF2'
+literal line 2
+EOF2
+cat <<EOF3
+line 3 with $var and ${x:-default} and $(echo sub)
+EOF3
+cat <<'EOF3'
+literal line 3
+EOF3
+cat <<EOF4
+line 4 with $var and ${x:-default} and $(echo sub)
+EOF4
+cat <<'EOF4'
+literal line 4
+EOF4
+cat <<EOF5
+line 5 with $var and ${x:-default} and $(echo sub)
+EOF5
+cat <<'EOF5'
+literal line 5
+EOF5
+cat <<EOF6
+line 6 with $var and ${x:-default} and $(echo sub)
+EOF6
+cat <<'EOF6'
+literal line 6
+EOF6
+cat <<EOF7
+line 7 with $var and ${x:-default} and $(echo sub)
+EOF7
+cat <<'EOF7'
+literal line 7
+EOF7
+cat <<EOF8
+line 8 with $var and ${x:-default} and $(echo sub)
+EOF8
+cat <<'EOF8'
+literal line 8
+EOF8
+cat <<EOF9
+line 9 with $var and ${x:-default} and $(echo sub)
+EOF9
+cat <<'EOF9'
+literal line 9
+EOF9
+cat <<EOF10
+line 10 with $var and ${x:-default} and $(echo sub)
+EOF10
+cat <<'EOF10'
+literal line 10
+EOF10
+cat <<EOF11
+line 11 with $var and ${x:-default} and $(echo sub)
+EOF11
+cat <<'EOF11'
+literal line 11
+EOF11
+cat <<EOF12
+line 12 with $var and ${x:-default} and $(echo sub)
+EOF12
+cat <<'EOF12'
+literal line 12
+EOF12
+cat <<EOF13
+line 13 with $var and ${x:-default} and $(echo sub)
+EOF13
+cat <<'EOF13'
+literal line 13
+EOF13
+cat <<EOF14
+line 14 with $var and ${x:-default} and $(echo sub)
+EOF14
+cat <<'EOF14'
+literal line 14
+EOF14
+cat <<EOF15
+line 15 with $var and ${x:-default} and $(echo sub)
+EOF15
+cat <<'EOF15'
+literal line 15
+EOF15
+cat <<EOF16
+line 16 with $var and ${x:-default} and $(echo sub)
+EOF16
+cat <<'EOF16'
+literal line 16
+EOF16
+cat <<EOF17
+line 17 with $var and ${x:-default} and $(echo sub)
+EOF17
+cat <<'EOF17'
+literal line 17
+EOF17
+cat <<EOF18
+line 18 with $var and ${x:-default} and $(echo sub)
+EOF18
+cat <<'EOF18'
+literal line 18
+EOF18
+cat <<EOF19
+line 19 with $var and ${x:-default} and $(echo sub)
+EOF19
+cat <<'EOF19'
+literal line 19
+EOF19
+cat <<EOF20
+line 20 with $var and ${x:-default} and $(echo sub)
+EOF20
+cat <<'EOF20'
+literal line 20
+EOF20
+cat <<EOF21
+line 21 with $var and ${x:-default} and $(echo sub)
+EOF21
+cat <<'EOF21'
+literal line 21
+EOF21
+cat <<EOF22
+line 22 with $var and ${x:-default} and $(echo sub)
+EOF22
+cat <<'EOF22'
+literal line 22
+EOF22
+cat <<EOF23
+line 23 with $var and ${x:-default} and $(echo sub)
+EOF23
+cat <<'EOF23'
+literal line 23
+EOF23
+cat <<EOF24
+line 24 with $var and ${x:-default} and $(echo sub)
+EOF24
+cat <<'EOF24'
+literal line 24
+EOF24
+cat <<EOF25
+line 25 with $var and ${x:-default} and $(echo sub)
+EOF25
+cat <<'EOF25'
+literal line 25
+EOF25
+cat <<EOF26
+line 26 with $var and ${x:-default} and $(echo sub)
+EOF26
+cat <<'EOF26'
+literal line 26
+EOF26
+cat <<EOF27
+line 27 with $var and ${x:-default} and $(echo sub)
+EOF27
+cat <<'EOF27'
+literal line 27
+EOF27
+cat <<EOF28
+line 28 with $var and ${x:-default} and $(echo sub)
+EOF28
+cat <<'EOF28'
+literal line 28
+EOF28
+cat <<EOF29
+line 29 with $var and ${x:-default} and $(echo sub)
+EOF29
+cat <<'EOF29'
+literal line 29
+EOF29
+cat <<EOF30
+line 30 with $var and ${x:-default} and $(echo sub)
+EOF30
+cat <<'EOF30'
+literal line 30
+EOF30
+cat <<EOF31
+line 31 with $var and ${x:-default} and $(echo sub)
+EOF31
+cat <<'EOF31'
+literal line 31
+EOF31
+cat <<EOF32
+line 32 with $var and ${x:-default} and $(echo sub)
+EOF32
+cat <<'EOF32'
+literal line 32
+EOF32
+cat <<EOF33
+line 33 with $var and ${x:-default} and $(echo sub)
+EOF33
+cat <<'EOF33'
+literal line 33
+EOF33
+cat <<EOF34
+line 34 with $var and ${x:-default} and $(echo sub)
+EOF34
+cat <<'EOF34'
+literal line 34
+EOF34
+cat <<EOF35
+line 35 with $var and ${x:-default} and $(echo sub)
+EOF35
+cat <<'EOF35'
+literal line 35
+EOF35
+cat <<EOF36
+line 36 with $var and ${x:-default} and $(echo sub)
+EOF36
+cat <<'EOF36'
+literal line 36
+EOF36
+cat <<EOF37
+line 37 with $var and ${x:-default} and $(echo sub)
+EOF37
+cat <<'EOF37'
+literal line 37
+EOF37
+cat <<EOF38
+line 38 with $var and ${x:-default} and $(echo sub)
+EOF38
+cat <<'EOF38'
+literal line 38
+EOF38
+cat <<EOF39
+line 39 with $var and ${x:-default} and $(echo sub)
+EOF39
+cat <<'EOF39'
+literal line 39
+EOF39
+cat <<EOF40
+line 40 with $var and ${x:-default} and $(echo sub)
+EOF40
+cat <<'EOF40'
+literal line 40
+EOF40
+cat <<EOF41
+line 41 with $var and ${x:-default} and $(echo sub)
+EOF41
+cat <<'EOF41'
+literal line 41
+EOF41
+cat <<EOF42
+line 42 with $var and ${x:-default} and $(echo sub)
+EOF42
+cat <<'EOF42'
+literal line 42
+EOF42
+cat <<EOF43
+line 43 with $var and ${x:-default} and $(echo sub)
+EOF43
+cat <<'EOF43'
+literal line 43
+EOF43
+cat <<EOF44
+line 44 with $var and ${x:-default} and $(echo sub)
+EOF44
+cat <<'EOF44'
+literal line 44
+EOF44
+cat <<EOF45
+line 45 with $var and ${x:-default} and $(echo sub)
+EOF45
+cat <<'EOF45'
+literal line 45
+EOF45
+cat <<EOF46
+line 46 with $var and ${x:-default} and $(echo sub)
+EOF46
+cat <<'EOF46'
+literal line 46
+EOF46
+cat <<EOF47
+line 47 with $var and ${x:-default} and $(echo sub)
+EOF47
+cat <<'EOF47'
+literal line 47
+EOF47
+cat <<EOF48
+line 48 with $var and ${x:-default} and $(echo sub)
+EOF48
+cat <<'EOF48'
+literal line 48
+EOF48
+cat <<EOF49
+line 49 with $var and ${x:-default} and $(echo sub)
+EOF49
+cat <<'EOF49'
+literal line 49
+EOF49
+cat <<EOF50
+line 50 with $var and ${x:-default} and $(echo sub)
+EOF50
+cat <<'EOF50'
+literal line 50
+EOF50
+cat <<EOF51
+line 51 with $var and ${x:-default} and $(echo sub)
+EOF51
+cat <<'EOF51'
+literal line 51
+EOF51
+cat <<EOF52
+line 52 with $var and ${x:-default} and $(echo sub)
+EOF52
+cat <<'EOF52'
+literal line 52
+EOF52
+cat <<EOF53
+line 53 with $var and ${x:-default} and $(echo sub)
+EOF53
+cat <<'EOF53'
+literal line 53
+EOF53
+cat <<EOF54
+line 54 with $var and ${x:-default} and $(echo sub)
+EOF54
+cat <<'EOF54'
+literal line 54
+EOF54
+cat <<EOF55
+line 55 with $var and ${x:-default} and $(echo sub)
+EOF55
+cat <<'EOF55'
+literal line 55
+EOF55
+cat <<EOF56
+line 56 with $var and ${x:-default} and $(echo sub)
+EOF56
+cat <<'EOF56'
+literal line 56
+EOF56
+cat <<EOF57
+line 57 with $var and ${x:-default} and $(echo sub)
+EOF57
+cat <<'EOF57'
+literal line 57
+EOF57
+cat <<EOF58
+line 58 with $var and ${x:-default} and $(echo sub)
+EOF58
+cat <<'EOF58'
+literal line 58
+EOF58
+cat <<EOF59
+line 59 with $var and ${x:-default} and $(echo sub)
+EOF59
+cat <<'EOF59'
+literal line 59
+EOF59
+cat <<EOF60
+line 60 with $var and ${x:-default} and $(echo sub)
+EOF60
+cat <<'EOF60'
+literal line 60
+EOF60
+cat <<EOF61
+line 61 with $var and ${x:-default} and $(echo sub)
+EOF61
+cat <<'EOF61'
+literal line 61
+EOF61
+cat <<EOF62
+line 62 with $var and ${x:-default} and $(echo sub)
+EOF62
+cat <<'EOF62'
+literal line 62
+EOF62
+cat <<EOF63
+line 63 with $var and ${x:-default} and $(echo sub)
+EOF63
+cat <<'EOF63'
+literal line 63
+EOF63
+cat <<EOF64
+line 64 with $var and ${x:-default} and $(echo sub)
+EOF64
+cat <<'EOF64'
+literal line 64
+EOF64
+cat <<EOF65
+line 65 with $var and ${x:-default} and $(echo sub)
+EOF65
+cat <<'EOF65'
+literal line 65
+EOF65
+cat <<EOF66
+line 66 with $var and ${x:-default} and $(echo sub)
+EOF66
+cat <<'EOF66'
+literal line 66
+EOF66
+cat <<EOF67
+line 67 with $var and ${x:-default} and $(echo sub)
+EOF67
+cat <<'EOF67'
+literal line 67
+EOF67
+cat <<EOF68
+line 68 with $var and ${x:-default} and $(echo sub)
+EOF68
+cat <<'EOF68'
+literal line 68
+EOF68
+cat <<EOF69
+line 69 with $var and ${x:-default} and $(echo sub)
+EOF69
+cat <<'EOF69'
+literal line 69
+EOF69
+cat <<EOF70
+line 70 with $var and ${x:-default} and $(echo sub)
+EOF70
+cat <<'EOF70'
+literal line 70
+EOF70
+cat <<EOF71
+line 71 with $var and ${x:-default} and $(echo sub)
+EOF71
+cat <<'EOF71'
+literal line 71
+EOF71
+cat <<EOF72
+line 72 with $var and ${x:-default} and $(echo sub)
+EOF72
+cat <<'EOF72'
+literal line 72
+EOF72
+cat <<EOF73
+line 73 with $var and ${x:-default} and $(echo sub)
+EOF73
+cat <<'EOF73'
+literal line 73
+EOF73
+cat <<EOF74
+line 74 with $var and ${x:-default} and $(echo sub)
+EOF74
+cat <<'EOF74'
+literal line 74
+EOF74
+cat <<EOF75
+line 75 with $var and ${x:-default} and $(echo sub)
+EOF75
+cat <<'EOF75'
+literal line 75
+EOF75
+cat <<EOF76
+line 76 with $var and ${x:-default} and $(echo sub)
+EOF76
+cat <<'EOF76'
+literal line 76
+EOF76
+cat <<EOF77
+line 77 with $var and ${x:-default} and $(echo sub)
+EOF77
+cat <<'EOF77'
+literal line 77
+EOF77
+cat <<EOF78
+line 78 with $var and ${x:-default} and $(echo sub)
+EOF78
+cat <<'EOF78'
+literal line 78
+EOF78
+cat <<EOF79
+line 79 with $var and ${x:-default} and $(echo sub)
+EOF79
+cat <<'EOF79'
+literal line 79
+EOF79
+cat <<EOF80
+line 80 with $var and ${x:-default} and $(echo sub)
+EOF80
+cat <<'EOF80'
+literal line 80
+EOF80
+cat <<EOF81
+line 81 with $var and ${x:-default} and $(echo sub)
+EOF81
+cat <<'EOF81'
+literal line 81
+EOF81
+cat <<EOF82
+line 82 with $var and ${x:-default} and $(echo sub)
+EOF82
+cat <<'EOF82'
+literal line 82
+EOF82
+cat <<EOF83
+line 83 with $var and ${x:-default} and $(echo sub)
+EOF83
+cat <<'EOF83'
+literal line 83
+EOF83
+cat <<EOF84
+line 84 with $var and ${x:-default} and $(echo sub)
+EOF84
+cat <<'EOF84'
+literal line 84
+EOF84
+cat <<EOF85
+line 85 with $var and ${x:-default} and $(echo sub)
+EOF85
+cat <<'EOF85'
+literal line 85
+EOF85
+cat <<EOF86
+line 86 with $var and ${x:-default} and $(echo sub)
+EOF86
+cat <<'EOF86'
+literal line 86
+EOF86
+cat <<EOF87
+line 87 with $var and ${x:-default} and $(echo sub)
+EOF87
+cat <<'EOF87'
+literal line 87
+EOF87
+cat <<EOF88
+line 88 with $var and ${x:-default} and $(echo sub)
+EOF88
+cat <<'EOF88'
+literal line 88
+EOF88
+cat <<EOF89
+line 89 with $var and ${x:-default} and $(echo sub)
+EOF89
+cat <<'EOF89'
+literal line 89
+EOF89
+cat <<EOF90
+line 90 with $var and ${x:-default} and $(echo sub)
+EOF90
+cat <<'EOF90'
+literal line 90
+EOF90
+cat <<EOF91
+line 91 with $var and ${x:-default} and $(echo sub)
+EOF91
+cat <<'EOF91'
+literal line 91
+EOF91
+cat <<EOF92
+line 92 with $var and ${x:-default} and $(echo sub)
+EOF92
+cat <<'EOF92'
+literal line 92
+EOF92
+cat <<EOF93
+line 93 with $var and ${x:-default} and $(echo sub)
+EOF93
+cat <<'EOF93'
+literal line 93
+EOF93
+cat <<EOF94
+line 94 with $var and ${x:-default} and $(echo sub)
+EOF94
+cat <<'EOF94'
+literal line 94
+EOF94
+cat <<EOF95
+line 95 with $var and ${x:-default} and $(echo sub)
+EOF95
+cat <<'EOF95'
+literal line 95
+EOF95
+cat <<EOF96
+line 96 with $var and ${x:-default} and $(echo sub)
+EOF96
+cat <<'EOF96'
+literal line 96
+EOF96
+cat <<EOF97
+line 97 with $var and ${x:-default} and $(echo sub)
+EOF97
+cat <<'EOF97'
+literal line 97
+EOF97
+cat <<EOF98
+line 98 with $var and ${x:-default} and $(echo sub)
+EOF98
+cat <<'EOF98'
+literal line 98
+EOF98
+cat <<EOF99
+line 99 with $var and ${x:-default} and $(echo sub)
+EOF99
+cat <<'EOF99'
+literal line 99
+EOF99
+cat <<EOF100
+line 100 with $var and ${x:-default} and $(echo sub)
+EOF100
+cat <<'EOF100'
+literal line 100
+EOF100
@@ -0,0 +1,200 @@
+var d1 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e1 = d1['a'][0] if x < y else len(z) + 1
+var d2 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e2 = d2['a'][0] if x < y else len(z) + 2
+var d3 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e3 = d3['a'][0] if x < y else len(z) + 3
+var d4 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e4 = d4['a'][0] if x < y else len(z) + 4
+var d5 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e5 = d5['a'][0] if x < y else len(z) + 5
+var d6 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e6 = d6['a'][0] if x < y else len(z) + 6
+var d7 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e7 = d7['a'][0] if x < y else len(z) + 7
+var d8 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e8 = d8['a'][0] if x < y else len(z) + 8
+var d9 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e9 = d9['a'][0] if x < y else len(z) + 9
+var d10 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e10 = d10['a'][0] if x < y else len(z) + 10
+var d11 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e11 = d11['a'][0] if x < y else len(z) + 11
+var d12 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e12 = d12['a'][0] if x < y else len(z) + 12
+var d13 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e13 = d13['a'][0] if x < y else len(z) + 13
+var d14 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e14 = d14['a'][0] if x < y else len(z) + 14
+var d15 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e15 = d15['a'][0] if x < y else len(z) + 15
+var d16 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e16 = d16['a'][0] if x < y else len(z) + 16
+var d17 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e17 = d17['a'][0] if x < y else len(z) + 17
+var d18 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e18 = d18['a'][0] if x < y else len(z) + 18
+var d19 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e19 = d19['a'][0] if x < y else len(z) + 19
+var d20 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e20 = d20['a'][0] if x < y else len(z) + 20
+var d21 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e21 = d21['a'][0] if x < y else len(z) + 21
+var d22 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e22 = d22['a'][0] if x < y else len(z) + 22
+var d23 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e23 = d23['a'][0] if x < y else len(z) + 23
+var d24 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e24 = d24['a'][0] if x < y else len(z) + 24
+var d25 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e25 = d25['a'][0] if x < y else len(z) + 25
+var d26 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e26 = d26['a'][0] if x < y else len(z) + 26
+var d27 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e27 = d27['a'][0] if x < y else len(z) + 27
+var d28 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e28 = d28['a'][0] if x < y else len(z) + 28
+var d29 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e29 = d29['a'][0] if x < y else len(z) + 29
+var d30 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e30 = d30['a'][0] if x < y else len(z) + 30
+var d31 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e31 = d31['a'][0] if x < y else len(z) + 31
+var d32 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e32 = d32['a'][0] if x < y else len(z) + 32
+var d33 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e33 = d33['a'][0] if x < y else len(z) + 33
+var d34 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e34 = d34['a'][0] if x < y else len(z) + 34
+var d35 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e35 = d35['a'][0] if x < y else len(z) + 35
+var d36 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e36 = d36['a'][0] if x < y else len(z) + 36
+var d37 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e37 = d37['a'][0] if x < y else len(z) + 37
+var d38 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e38 = d38['a'][0] if x < y else len(z) + 38
+var d39 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e39 = d39['a'][0] if x < y else len(z) + 39
+var d40 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e40 = d40['a'][0] if x < y else len(z) + 40
+var d41 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e41 = d41['a'][0] if x < y else len(z) + 41
+var d42 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e42 = d42['a'][0] if x < y else len(z) + 42
+var d43 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e43 = d43['a'][0] if x < y else len(z) + 43
+var d44 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e44 = d44['a'][0] if x < y else len(z) + 44
+var d45 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e45 = d45['a'][0] if x < y else len(z) + 45
+var d46 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e46 = d46['a'][0] if x < y else len(z) + 46
+var d47 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e47 = d47['a'][0] if x < y else len(z) + 47
+var d48 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e48 = d48['a'][0] if x < y else len(z) + 48
+var d49 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e49 = d49['a'][0] if x < y else len(z) + 49
+var d50 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e50 = d50['a'][0] if x < y else len(z) + 50
+var d51 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e51 = d51['a'][0] if x < y else len(z) + 51
+var d52 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e52 = d52['a'][0] if x < y else len(z) + 52
+var d53 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e53 = d53['a'][0] if x < y else len(z) + 53
+var d54 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e54 = d54['a'][0] if x < y else len(z) + 54
+var d55 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e55 = d55['a'][0] if x < y else len(z) + 55
+var d56 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e56 = d56['a'][0] if x < y else len(z) + 56
+var d57 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e57 = d57['a'][0] if x < y else len(z) + 57
+var d58 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e58 = d58['a'][0] if x < y else len(z) + 58
+var d59 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e59 = d59['a'][0] if x < y else len(z) + 59
+var d60 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e60 = d60['a'][0] if x < y else len(z) + 60
+var d61 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e61 = d61['a'][0] if x < y else len(z) + 61
+var d62 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e62 = d62['a'][0] if x < y else len(z) + 62
+var d63 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e63 = d63['a'][0] if x < y else len(z) + 63
+var d64 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e64 = d64['a'][0] if x < y else len(z) + 64
+var d65 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e65 = d65['a'][0] if x < y else len(z) + 65
+var d66 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e66 = d66['a'][0] if x < y else len(z) + 66
+var d67 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e67 = d67['a'][0] if x < y else len(z) + 67
+var d68 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e68 = d68['a'][0] if x < y else len(z) + 68
+var d69 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e69 = d69['a'][0] if x < y else len(z) + 69
+var d70 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e70 = d70['a'][0] if x < y else len(z) + 70
+var d71 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e71 = d71['a'][0] if x < y else len(z) + 71
+var d72 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e72 = d72['a'][0] if x < y else len(z) + 72
+var d73 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e73 = d73['a'][0] if x < y else len(z) + 73
+var d74 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e74 = d74['a'][0] if x < y else len(z) + 74
+var d75 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e75 = d75['a'][0] if x < y else len(z) + 75
+var d76 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e76 = d76['a'][0] if x < y else len(z) + 76
+var d77 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e77 = d77['a'][0] if x < y else len(z) + 77
+var d78 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e78 = d78['a'][0] if x < y else len(z) + 78
+var d79 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e79 = d79['a'][0] if x < y else len(z) + 79
+var d80 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e80 = d80['a'][0] if x < y else len(z) + 80
+var d81 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e81 = d81['a'][0] if x < y else len(z) + 81
+var d82 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e82 = d82['a'][0] if x < y else len(z) + 82
+var d83 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e83 = d83['a'][0] if x < y else len(z) + 83
+var d84 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e84 = d84['a'][0] if x < y else len(z) + 84
+var d85 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e85 = d85['a'][0] if x < y else len(z) + 85
+var d86 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e86 = d86['a'][0] if x < y else len(z) + 86
+var d87 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e87 = d87['a'][0] if x < y else len(z) + 87
+var d88 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e88 = d88['a'][0] if x < y else len(z) + 88
+var d89 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e89 = d89['a'][0] if x < y else len(z) + 89
+var d90 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e90 = d90['a'][0] if x < y else len(z) + 90
+var d91 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e91 = d91['a'][0] if x < y else len(z) + 91
+var d92 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e92 = d92['a'][0] if x < y else len(z) + 92
+var d93 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e93 = d93['a'][0] if x < y else len(z) + 93
+var d94 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e94 = d94['a'][0] if x < y else len(z) + 94
+var d95 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e95 = d95['a'][0] if x < y else len(z) + 95
+var d96 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e96 = d96['a'][0] if x < y else len(z) + 96
+var d97 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e97 = d97['a'][0] if x < y else len(z) + 97
+var d98 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e98 = d98['a'][0] if x < y else len(z) + 98
+var d99 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e99 = d99['a'][0] if x < y else len(z) + 99
+var d100 = {a: [1, 2.5, 's', "$x"], b: i + 2 * j ** 3, c: f(x, y)}
+var e100 = d100['a'][0] if x < y else len(z) + 100
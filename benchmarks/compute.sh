@@ -18,7 +18,6 @@
 # TODO:
 # - vary problem size, which is different than iters
 #   - bubble sort: array length, to test complexity of array indexing
-#   - palindrome: longer lines, to test complexity of unicode/byte slicing
 #   - word_freq: more unique words, to test complexity of assoc array
 # - write awk versions of each benchmark (could be contributed)
 # - assert that stdout is identical
@@ -136,6 +135,8 @@ palindrome-tasks() {
   while read fields; do
     echo 'palindrome unicode _' | xargs -n 3 -- echo "$fields"
     echo 'palindrome bytes   _' | xargs -n 3 -- echo "$fields"
+    # ${s:i:1} on long lines is quadratic unless length and slicing are O(1)
+    echo 'palindrome unicode long' | xargs -n 3 -- echo "$fields"
   done
 }
 
@@ -218,9 +219,14 @@ palindrome-one() {
   local name=${1:-palindrome}
   local runtime=$2
   local mode=${3:-unicode}
+  local testdata=${4:-_}
 
-  $runtime benchmarks/compute/palindrome.$(ext $runtime) $mode \
-    < $BASE_DIR/tmp/$name/testdata.txt
+  local in=$BASE_DIR/tmp/$name/testdata.txt
+  if test $testdata != _; then
+    in=$BASE_DIR/tmp/$name/testdata-$testdata.txt
+  fi
+
+  $runtime benchmarks/compute/palindrome.$(ext $runtime) $mode < $in
 }
 
 parse_help-one() {
@@ -366,8 +372,17 @@ amanaplanacanalpanama
 EOF
 
   done > $out/testdata.txt
-  
-  wc -l $out/testdata.txt
+
+  # Long lines, where one has a multi-byte char in the middle
+  local half
+  half=$(printf '%.0sab' $(seq 500))
+  for i in $(seq 10); do
+    echo "${half}c$(echo $half | rev)"
+    echo "${half}μ$(echo $half | rev)"
+    echo "${half}cd${half}"
+  done > $out/testdata-long.txt
+
+  wc -l $out/testdata.txt $out/testdata-long.txt
 }
 
 measure() {
@@ -590,6 +605,46 @@ EOF
 }
 
 
+py-closures() {
+  ### Compare bin/osh with and without OILS_CLOSURES=1 (osh/cmd_closure.py)
+
+  local n=${1:-200}
+
+  local tmp=_tmp/compute-py-closures
+  mkdir -p $tmp
+  seq $n | shuf > $tmp/bubble_sort-$n.txt
+
+  for closures in 0 1; do
+    echo "=== OILS_CLOSURES=$closures"
+    echo
+
+    echo '--- fib 200 44'
+    time OILS_CLOSURES=$closures bin/osh benchmarks/compute/fib.sh 200 44 \
+      > /dev/null
+    echo
+
+    echo "--- bubble_sort int $n"
+    time OILS_CLOSURES=$closures bin/osh benchmarks/compute/bubble_sort.sh int \
+      < $tmp/bubble_sort-$n.txt > /dev/null
+    echo
+  done
+}
+
+dynamic-scope() {
+  ### Time variable lookups at the bottom of shallow and deep call stacks
+
+  # Lookups should cost the same at any depth
+  local iters=${1:-20000}
+
+  for sh in bash bin/osh; do
+    for depth in 1 50; do
+      echo "--- $sh depth $depth"
+      time $sh benchmarks/compute/dynamic_scope.sh $iters $depth
+      echo
+    done
+  done
+}
+
 control-flow() {
   local osh=_bin/cxx-opt/osh
   #set -x
@@ -0,0 +1,33 @@
+#!/usr/bin/env bash
+#
+# Read globals and outer locals at the bottom of a deep call stack.  With
+# dynamic scope, a naive lookup walks every frame.
+#
+# Usage:
+#   benchmarks/compute/dynamic_scope.sh ITERS DEPTH
+
+iters=${1:-1000}
+depth=${2:-50}
+
+g1=1
+g2=2
+
+recurse() {
+  local n=$1
+  local outer=$n  # shadowed in every frame, found in the top one
+
+  if test $n -eq 0; then
+    local i=0
+    local sum=0
+    while (( i < iters )); do
+      sum=$(( sum + g1 + g2 + outer + depth ))
+      i=$(( i + 1 ))
+    done
+    echo "sum=$sum"
+    return
+  fi
+
+  recurse $(( n - 1 ))
+}
+
+recurse $depth
@@ -712,4 +712,34 @@ test-brace-exp() {
   expand-loop 340000
 }
 
+minor-faults() {
+  ### Run a command, and print minor page faults of it and its children
+
+  # /usr/bin/time isn't always installed
+  python3 -c '
+import resource, subprocess, sys, time
+start = time.time()
+subprocess.call(sys.argv[1:])
+elapsed = time.time() - start
+ru = resource.getrusage(resource.RUSAGE_CHILDREN)
+print("%d minor faults, %.2f secs" % (ru.ru_minflt, elapsed))
+' "$@"
+}
+
+fork-faults() {
+  ### Count copy-on-write faults of a shell that forks with a big heap
+
+  local bin=${1:-_bin/cxx-opt/osh}
+  ninja $bin
+
+  # Each $(true) child hits a GC point before exec(), and may collect.
+  minor-faults $bin -c \
+    'a=( $(seq 100000) ); for i in $(seq 1000); do x=$(true); done'
+
+  # These children run a loop, so they allocate enough to collect.  The parent
+  # makes garbage, so it forks at different distances from its GC threshold.
+  minor-faults $bin -c \
+    'a=( $(seq 100000) ); for i in $(seq 100); do b=( {1..3000} ); x=$(for j in {1..20000}; do s=$j; done; true); done'
+}
+
 "$@"
@@ -0,0 +1,107 @@
+#!/usr/bin/env bash
+#
+# Compare the speed and memory usage of 'json read' with yajl.
+#
+# Usage:
+#   benchmarks/json.sh <function name>
+#
+# Example:
+#   benchmarks/json.sh setup
+#   benchmarks/json.sh run-all bin/ysh _bin/cxx-opt/ysh
+#   benchmarks/json.sh report
+#
+# bin/ysh should be run with fastlex built (build/py.sh fastlex).  Otherwise
+# the J8 lexer falls back to Python regexes, which is ~5x slower.
+
+set -o nounset
+set -o pipefail
+set -o errexit
+
+readonly BASE_DIR=_tmp/json
+readonly BIG=$BASE_DIR/big.json
+readonly TIMES=$BASE_DIR/times.tsv
+
+# A list of records, with the strings, numbers, and nesting of typical JSON
+gen-big() {
+  local num_records=${1:-20000}
+
+  python2 -c '
+from __future__ import print_function
+import json, sys
+n = int(sys.argv[1])
+records = []
+for i in range(n):
+  records.append({
+    "id": i,
+    "name": "user %d" % i,
+    "bio": "line one\nline two \"quoted\" café",
+    "score": i * 0.25,
+    "active": i % 2 == 0,
+    "tags": ["a", "bb", "ccc"],
+    "counts": list(range(10)),
+    "parent": None,
+  })
+json.dump(records, sys.stdout, indent=2)
+print()
+' $num_records
+}
+
+setup() {
+  mkdir -p $BASE_DIR
+  gen-big "$@" > $BIG
+  ls -l $BIG
+}
+
+yajl-read() {
+  python2 -c '
+import sys, yajl
+yajl.loads(sys.stdin.read())
+'
+}
+
+# Run one shell, or 'yajl', on the big file
+run-one() {
+  local sh=$1
+
+  local -a argv
+  if test $sh = yajl; then
+    argv=( $0 yajl-read )
+  else
+    argv=( $sh -c 'json read (&x)' )
+  fi
+
+  benchmarks/time_.py \
+    --tsv \
+    --append \
+    --output $TIMES \
+    --rusage \
+    --field "$sh" \
+    -- \
+    "${argv[@]}" < $BIG || echo FAILED
+}
+
+run-all() {
+  benchmarks/time_.py --tsv --print-header --rusage --field sh \
+    --output $TIMES
+
+  for sh in yajl "$@"; do
+    run-one $sh
+  done
+
+  report
+}
+
+# Add MB/s, computed from the size of the input
+report() {
+  local num_bytes
+  num_bytes=$(stat -c %s $BIG)
+
+  awk -v num_bytes=$num_bytes '
+BEGIN { FS = OFS = "\t" }
+NR == 1 { print $0, "MB_per_sec"; next }
+{ printf "%s\t%s\t%s\t%s\t%s\t%s\t%.1f\n", $1, $2, $3, $4, $5, $6,
+         num_bytes / $2 / 1e6 }
+' $TIMES
+}
+
+"$@"
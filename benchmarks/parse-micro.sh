@@ -0,0 +1,259 @@
+#!/usr/bin/env bash
+#
+# Parser micro-benchmarks: measure each grammar construct by itself.
+#
+# benchmarks/osh-parser.sh measures whole files, where every construct is
+# mixed together.  Here we generate a file for each construct, and report
+# tokens/sec and allocations per token for each shell.  allocs_per_token is
+# only available for the C++ build, via OILS_GC_STATS_FD.
+#
+# Usage:
+#   benchmarks/parse-micro.sh <function name>
+#
+# Examples:
+#   benchmarks/parse-micro.sh measure  # writes _tmp/parse-micro/micro.tsv
+#   benchmarks/parse-micro.sh compare OLD.tsv _tmp/parse-micro/micro.tsv
+#
+#   # Bigger inputs, only the C++ build
+#   N=50000 benchmarks/parse-micro.sh measure _bin/cxx-opt/osh
+
+set -o nounset
+set -o pipefail
+set -o errexit
+
+REPO_ROOT=$(cd "$(dirname $0)/.."; pwd)
+
+source test/common.sh  # die
+source test/tsv-lib.sh  # time-tsv, tsv-row
+
+readonly BASE_DIR=_tmp/parse-micro
+
+# Number of repetitions of each construct.  The default gives 15K to 90K
+# tokens per file, which the Python build parses in a few seconds.
+readonly N=${N:-1000}
+
+readonly CONSTRUCTS=(here-doc cmd-sub case array arith ysh-expr)
+
+#
+# Inputs
+#
+
+input-here-doc() {
+  local n=$1
+  for i in $(seq $n); do
+    echo "cat <<EOF$i"
+    echo "line $i with \$var and \${x:-default} and \$(echo sub)"
+    echo "EOF$i"
+    echo "cat <<'EOF$i'"
+    echo "literal line $i"
+    echo "EOF$i"
+  done
+}
+
+input-cmd-sub() {
+  # Nested 10 deep
+  local n=$1
+  local nested='x'
+  for i in $(seq 10); do
+    nested="\$(echo $i $nested)"
+  done
+  for i in $(seq $n); do
+    echo "echo $nested"
+  done
+}
+
+input-case() {
+  # One big case statement
+  local n=$1
+  echo 'case $x in'
+  for i in $(seq $n); do
+    echo "  pat$i|other$i|*.$i) echo $i ;;"
+  done
+  echo '  *) echo default ;;'
+  echo 'esac'
+}
+
+input-array() {
+  # One long array literal
+  local n=$1
+  echo 'a=('
+  for i in $(seq $n); do
+    echo "  item$i \"dq $i\" 'sq' \${x}"
+  done
+  echo ')'
+}
+
+input-arith() {
+  local n=$1
+  for i in $(seq $n); do
+    echo "(( x = (i + $i) * 3 % 7 << 2 ))"
+    echo "echo \$(( a[i] + b ? c : d - $i ))"
+  done
+}
+
+input-ysh-expr() {
+  # Goes through pgen2.  Variable names are unique, since redeclaring is a
+  # parse error.
+  local n=$1
+  for i in $(seq $n); do
+    echo "var d$i = {a: [1, 2.5, 's', \"\$x\"], b: i + 2 * j ** 3, c: f(x, y)}"
+    echo "var e$i = d$i['a'][0] if x < y else len(z) + $i"
+  done
+}
+
+write-inputs() {
+  local n=${1:-$N}
+
+  mkdir -p $BASE_DIR/input
+  for c in "${CONSTRUCTS[@]}"; do
+    input-$c $n > $BASE_DIR/input/$c.sh
+  done
+  wc -l $BASE_DIR/input/*.sh
+}
+
+#
+# Measurement
+#
+
+shell-opts() {
+  local construct=$1
+  case $construct in
+    ysh-expr)
+      echo '-o ysh:all'
+      ;;
+  esac
+}
+
+num-tokens() {
+  local sh_path=$1
+  local construct=$2
+
+  # --tool tokens prints a line for each token
+  $sh_path $(shell-opts $construct) --tool tokens \
+    $BASE_DIR/input/$construct.sh 2>/dev/null | wc -l
+}
+
+measure-one() {
+  local sh_path=$1
+  local construct=$2
+  local times_tsv=$3
+
+  local shell_name
+  shell_name=$(basename $sh_path)
+  local stats=$BASE_DIR/raw/$shell_name.$construct.gc-stats.txt
+
+  echo "--- $sh_path $construct"
+
+  # Only the C++ build writes to this descriptor
+  OILS_GC_STATS_FD=99 \
+    time-tsv -o $times_tsv --append \
+      --field "$construct" --field "$sh_path" \
+      --field "$(num-tokens $sh_path $construct)" \
+      -- $sh_path $(shell-opts $construct) -n --ast-format none \
+      $BASE_DIR/input/$construct.sh 99>$stats
+}
+
+# Add tokens_per_sec, num_allocated, and allocs_per_token columns
+summarize() {
+  local times_tsv=$1
+
+  # time-tsv rows are: status elapsed_secs construct sh_path num_tokens
+  while IFS=$'\t' read status elapsed construct sh_path num_tokens; do
+    if test $status = status; then  # header
+      tsv-row construct sh_path num_tokens elapsed_secs tokens_per_sec \
+        num_allocated allocs_per_token
+      continue
+    fi
+    if test $status != 0; then
+      die "$sh_path failed to parse $construct"
+    fi
+
+    local stats=$BASE_DIR/raw/$(basename $sh_path).$construct.gc-stats.txt
+    local num_allocated
+    num_allocated=$(awk -F '=' '$1 ~ /num allocated/ { print $2 + 0 }' $stats)
+
+    awk -v construct=$construct -v sh_path=$sh_path \
+        -v num_tokens=$num_tokens -v elapsed=$elapsed \
+        -v num_allocated="$num_allocated" '
+      BEGIN {
+        if (num_allocated == "") {
+          num_allocated = "NA"
+          allocs_per_token = "NA"
+        } else {
+          allocs_per_token = sprintf("%.1f", num_allocated / num_tokens)
+        }
+        printf("%s\t%s\t%d\t%.3f\t%d\t%s\t%s\n", construct, sh_path,
+               num_tokens, elapsed, num_tokens / elapsed, num_allocated,
+               allocs_per_token)
+      }'
+  done < $times_tsv
+}
+
+measure() {
+  ### Measure each construct with each shell; write micro.tsv
+
+  local -a shells=( "$@" )
+  if test ${#shells[@]} -eq 0; then
+    shells=( bin/osh )
+    if test -x _bin/cxx-opt/osh; then
+      shells+=( _bin/cxx-opt/osh )
+    fi
+  fi
+
+  mkdir -p $BASE_DIR/raw
+  write-inputs
+
+  local times_tsv=$BASE_DIR/raw/times.tsv
+  time-tsv -o $times_tsv --print-header \
+    --field construct --field sh_path --field num_tokens
+
+  for sh_path in "${shells[@]}"; do
+    for c in "${CONSTRUCTS[@]}"; do
+      measure-one $sh_path $c $times_tsv
+    done
+  done
+
+  local out=$BASE_DIR/micro.tsv
+  summarize $times_tsv > $out
+
+  echo
+  if command -v pretty-tsv; then
+    pretty-tsv $out
+  else
+    cat $out
+  fi
+}
+
+compare() {
+  ### Fail if any construct got slower by more than a percentage
+
+  # The Python build has more noise, so a small threshold isn't useful
+  local old=$1
+  local new=$2
+  local max_slowdown=${3:-20}
+
+  awk -F '\t' -v max_slowdown=$max_slowdown '
+    FNR == 1 { next }  # header
+    NR == FNR { old[$1 "\t" $2] = $5; next }
+    {
+      key = $1 "\t" $2
+      if (!(key in old)) {
+        next
+      }
+      slowdown = 100 * (old[key] - $5) / old[key]
+      printf("%-10s %-20s %10d -> %10d tokens/sec (%+.1f%%)\n", $1, $2,
+             old[key], $5, -slowdown)
+      if (slowdown > max_slowdown) {
+        failed = 1
+      }
+    }
+    END {
+      if (failed) {
+        printf("FAIL: a construct got more than %d%% slower\n", max_slowdown)
+        exit 1
+      }
+    }
+  ' $old $new
+}
+
+"$@"
@@ -0,0 +1,68 @@
+#!/usr/bin/env bash
+#
+# Measure the throughput of QSN string encoding, which is used by
+# 'write --qsn', 'printf %q', 'declare -p', and xtrace.
+#
+# Usage:
+#   benchmarks/qsn.sh <function name>
+#
+# Example:
+#   benchmarks/qsn.sh encode-py            # data_lang/qsn.py in this repo
+#   benchmarks/qsn.sh encode-py ../oil     # compare with another checkout
+#   benchmarks/qsn.sh printf-q bin/osh
+
+set -o nounset
+set -o pipefail
+set -o errexit
+
+REPO_ROOT=$(cd $(dirname $0)/.. && pwd)
+readonly REPO_ROOT
+
+# Encode 1 MB strings of different kinds, and print MB/s for each
+encode-py() {
+  local repo=${1:-$REPO_ROOT}
+
+  # cd so that python2 -c doesn't import from the current dir
+  cd $repo
+  PYTHONPATH=.:vendor python2 -c '
+from __future__ import print_function
+import time
+from data_lang import qsn
+
+SIZE = 1 << 20
+
+CASES = [
+    ("ascii", "The quick brown fox jumps over the lazy dog. " * 1000),
+    ("utf8", "caf\xc3\xa9 \xce\xbc \xe2\x82\xac " * 1000),
+    ("lines", "/usr/bin/env\tfoo=bar\n" * 1000),
+    ("binary", "".join(chr(i) for i in range(256)) * 100),
+]
+
+for name, unit in CASES:
+    s = (unit * (SIZE // len(unit) + 1))[:SIZE]
+
+    start = time.time()
+    for flag in (qsn.BIT8_UTF8, qsn.BIT8_U_ESCAPE, qsn.BIT8_X_ESCAPE):
+        qsn.encode(s, flag)
+    elapsed = time.time() - start
+
+    print("%-8s %6.1f MB/s" % (name, 3 * len(s) / elapsed / 1e6))
+'
+}
+
+# The same thing through the shell
+printf-q() {
+  local sh=${1:-bin/osh}
+
+  TIMEFORMAT='%R'
+  echo "$sh: printf %q of a 1 MB string"
+  time $sh -c '
+s=$(for i in $(seq 2000); do
+  echo "The quick brown fox jumps over the lazy dog.  It was a dark night."
+done)
+s="$s$s$s$s$s$s$s$s"
+printf %q "$s" > /dev/null
+'
+}
+
+"$@"
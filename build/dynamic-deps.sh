@@ -90,6 +90,7 @@ pgen2/pnode.py
 pylib/path_stat.py
 
 ysh/cpython.py
+osh/cmd_closure.py  # Python-only optimization of bin/osh
 
 # should be py_bool_stat.py, because it's ported by hand to C++
 osh/bool_stat.py
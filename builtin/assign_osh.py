@@ -21,6 +21,7 @@ from mycpp import mylib
 from mycpp.mylib import log
 from osh import cmd_eval
 from osh import sh_expr_eval
+from osh import sparse_array
 from data_lang import qsn
 
 from typing import cast, Optional, Dict, List, TYPE_CHECKING
@@ -131,7 +132,8 @@ def _PrintVariables(mem, cmd_val, attrs, print_flags, builtin=_OTHER):
         if flag_x == '+' and cell.exported:
             continue
 
-        if flag_a and val.tag() != value_e.BashArray:
+        if flag_a and val.tag() not in (value_e.BashArray,
+                                        value_e.SparseArray):
             continue
         if flag_A and val.tag() != value_e.BashAssoc:
             continue
@@ -145,7 +147,7 @@ def _PrintVariables(mem, cmd_val, attrs, print_flags, builtin=_OTHER):
                 flags.append('r')
             if cell.exported:
                 flags.append('x')
-            if val.tag() == value_e.BashArray:
+            if val.tag() in (value_e.BashArray, value_e.SparseArray):
                 flags.append('a')
             elif val.tag() == value_e.BashAssoc:
                 flags.append('A')
@@ -193,6 +195,21 @@ def _PrintVariables(mem, cmd_val, attrs, print_flags, builtin=_OTHER):
                     body.append(qsn.maybe_shell_encode(element))
                 decl.extend(["=(", ''.join(body), ")"])
 
+        elif val.tag() == value_e.SparseArray:
+            sparse_val = cast(value.SparseArray, val)
+            # Same format as a BashArray with holes
+            decl.append("=()")
+            first = True
+            for i in sparse_array.Indices(sparse_val):
+                if first:
+                    decl.append(";")
+                    first = False
+                decl.extend([
+                    " ", name, "[",
+                    str(i), "]=",
+                    qsn.maybe_shell_encode(sparse_val.d[i])
+                ])
+
         elif val.tag() == value_e.BashAssoc:
             assoc_val = cast(value.BashAssoc, val)
             body = []
@@ -445,7 +462,8 @@ class NewVar(vm._AssignBuiltin):
             if rval is None and (arg.a or arg.A):
                 old_val = self.mem.GetValue(pair.var_name)
                 if arg.a:
-                    if old_val.tag() != value_e.BashArray:
+                    if old_val.tag() not in (value_e.BashArray,
+                                             value_e.SparseArray):
                         rval = value.BashArray([])
                 elif arg.A:
                     if old_val.tag() != value_e.BashAssoc:
@@ -8,6 +8,7 @@ from _devbuild.gen.runtime_asdl import (scope_e)
 from _devbuild.gen.value_asdl import (value, value_e, value_t, value_str)
 
 from core import error
+from core import packed_list
 from core import ui
 from core import vm
 from frontend import match
@@ -40,7 +41,11 @@ class Len(vm._Callable):
         with tagswitch(x) as case:
             if case(value_e.List):
                 x = cast(value.List, UP_x)
-                return value.Int(len(x.items))
+                return value.Int(packed_list.Len(x))
+
+            elif case(value_e.Range):
+                x = cast(value.Range, UP_x)
+                return value.Int(val_ops.RangeLen(x))
 
             elif case(value_e.Dict):
                 x = cast(value.Dict, UP_x)
@@ -50,7 +55,7 @@ class Len(vm._Callable):
                 x = cast(value.Str, UP_x)
                 return value.Int(len(x.s))
 
-        raise error.TypeErr(x, 'len() expected Str, List, or Dict',
+        raise error.TypeErr(x, 'len() expected Str, List, Dict, or Range',
                             rd.BlamePos())
 
 
@@ -88,15 +93,15 @@ class Maybe(vm._Callable):
         rd.Done()
 
         if val == value.Null:
-            return value.List([])
+            return value.List([], None)
 
         s = val_ops.ToStr(
             val, 'maybe() expected Str, but got %s' % value_str(val.tag()),
             rd.LeftParenToken())
         if len(s):
-            return value.List([val])  # use val to avoid needlessly copy
+            return value.List([val], None)  # use val to avoid needlessly copy
 
-        return value.List([])
+        return value.List([], None)
 
 
 class Type(vm._Callable):
@@ -256,19 +261,23 @@ class List_(vm._Callable):
 
             elif case(value_e.Range):
                 val = cast(value.Range, UP_val)
-                it = val_ops.RangeIterator(val)
+                return packed_list.FromRange(val.lower, val.upper)
+
+            elif case(value_e.Lines):
+                val = cast(value.Lines, UP_val)
+                it = val_ops.LinesIterator(val)
 
             else:
-                raise error.TypeErr(val,
-                                    'list() expected Dict, List, or Range',
-                                    rd.BlamePos())
+                raise error.TypeErr(
+                    val, 'list() expected Dict, List, Range, or Lines',
+                    rd.BlamePos())
 
         assert it is not None
         while not it.Done():
             l.append(it.FirstValue())
             it.Next()
 
-        return value.List(l)
+        return packed_list.NewList(l)
 
 
 class Dict_(vm._Callable):
@@ -324,7 +333,7 @@ class Split(vm._Callable):
             value.Str(elem)
             for elem in self.splitter.SplitForWordEval(s, ifs=ifs)
         ]  # type: List[value_t]
-        return value.List(l)
+        return value.List(l, None)
 
 
 class Glob(vm._Callable):
@@ -343,7 +352,7 @@ class Glob(vm._Callable):
         self.globber._Glob(s, out)
 
         l = [value.Str(elem) for elem in out]  # type: List[value_t]
-        return value.List(l)
+        return value.List(l, None)
 
 
 class Shvar_get(vm._Callable):
@@ -128,7 +128,7 @@ class HayState(object):
         # type: () -> Dict[str, value_t]
         d = NewDict()  # type: Dict[str, value_t]
         d['source'] = value.Null
-        d['children'] = value.List([])
+        d['children'] = value.List([], None)
         return d
 
     def PushEval(self):
@@ -366,7 +366,7 @@ class HayNode_(vm._Builtin):
                     arg0_loc)
 
         items = [value.Str(s) for s in arguments]  # type: List[value_t]
-        result['args'] = value.List(items)
+        result['args'] = value.List(items, None)
 
         if node_type.isupper():  # TASK build { ... }
             if lit_block is None:
@@ -403,7 +403,7 @@ class HayNode_(vm._Builtin):
             self.hay_state.AppendResult(result)
 
             if lit_block:  # 'package foo' is OK
-                result['children'] = value.List([])
+                result['children'] = value.List([], None)
 
                 # Evaluate in its own stack frame.  TODO: Turn on dynamic scope?
                 with state.ctx_Temp(self.mem):
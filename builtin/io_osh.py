@@ -129,24 +129,57 @@ class MapFile(vm._Builtin):
             if var_name.startswith(':'):
                 var_name = var_name[1:]
 
+        if arg.d is not None:
+            delim = arg.d[0] if len(arg.d) else '\0'  # -d '' is NUL
+        else:
+            delim = '\n'
+        skip = arg.s if arg.s > 0 else 0
+
+        # Like 'read', the writer may be waiting for our output
+        pyos.FlushStdout()
+
+        try:
+            if arg.n > 0 and pyos.FileSize(0) < 0:
+                # With a count, the rest of stdin is left for the next
+                # command.  We can't give back read-ahead on a pipe, so read
+                # one byte at a time, like bash.
+                lines = self._ReadSlowly(ord(delim), arg.t, skip, arg.n)
+            elif arg.n > 0:
+                # On a regular file, ReadLines() seeks back past the last
+                # line
+                lines = read_osh.ReadLines(delim, not arg.t, skip, arg.n,
+                                           self.cmd_ev)
+            else:
+                # Read until EOF in big blocks.  Note: at least on Linux,
+                # bash doesn't strip \r\n
+                lines = read_osh.ReadLines(delim, not arg.t, skip, -1,
+                                           self.cmd_ev)
+        except pyos.ReadError as e:
+            self.errfmt.PrintMessage("mapfile: read() error: %s" %
+                                     posix.strerror(e.err_num))
+            return 1
+
+        state.BuiltinSetArray(self.mem, var_name, lines)
+        return 0
+
+    def _ReadSlowly(self, delim_byte, trim, skip, max_lines):
+        # type: (int, bool, int, int) -> List[str]
+        """Read max_lines lines from a pipe, one byte at a time."""
         lines = []  # type: List[str]
-        while True:
-            # bash uses this slow algorithm; YSH could provide read --all-lines
-            try:
-                line = read_osh.ReadLineSlowly(self.cmd_ev)
-            except pyos.ReadError as e:
-                self.errfmt.PrintMessage("mapfile: read() error: %s" %
-                                         posix.strerror(e.err_num))
-                return 1
+        num_seen = 0
+        while len(lines) < max_lines:
+            line = read_osh.ReadLineSlowly(self.cmd_ev, delim_byte)
             if len(line) == 0:
                 break
-            # note: at least on Linux, bash doesn't strip \r\n
-            if arg.t and line.endswith('\n'):
+
+            num_seen += 1
+            if num_seen <= skip:
+                continue
+
+            if trim and ord(line[-1]) == delim_byte:
                 line = line[:-1]
             lines.append(line)
-
-        state.BuiltinSetArray(self.mem, var_name, lines)
-        return 0
+        return lines
 
 
 class Cat(vm._Builtin):
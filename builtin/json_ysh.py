@@ -4,7 +4,6 @@ from _devbuild.gen import arg_types
 from _devbuild.gen.runtime_asdl import cmd_value
 from _devbuild.gen.syntax_asdl import loc, loc_t
 from _devbuild.gen.value_asdl import value, LeftName
-from builtin import read_osh
 from core import error
 from core.error import e_usage
 from core import pyos
@@ -15,15 +14,13 @@ from frontend import flag_spec
 from frontend import args
 from frontend import typed_args
 from mycpp import mylib
-from ysh import cpython
 
-import sys
-import yajl
 import posix_ as posix
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from core.ui import ErrorFormatter
+    from osh.cmd_eval import CommandEvaluator
 
 _JSON_ACTION_ERROR = "builtin expects 'read' or 'write'"
 
@@ -35,9 +32,10 @@ class Json(vm._Builtin):
     --indent=2 controls multiline indentation
     """
 
-    def __init__(self, mem, errfmt, is_j8):
-        # type: (state.Mem, ErrorFormatter, bool) -> None
+    def __init__(self, mem, cmd_ev, errfmt, is_j8):
+        # type: (state.Mem, CommandEvaluator, ErrorFormatter, bool) -> None
         self.mem = mem
+        self.cmd_ev = cmd_ev  # To run blocks
         self.errfmt = errfmt
         if is_j8:
             self.printer = j8.Printer(0)
@@ -45,6 +43,49 @@ class Json(vm._Builtin):
             # TODO: restrict to JSON with some flags
             self.printer = j8.Printer(0)
 
+    def _ReplyPlace(self, blame_loc):
+        # type: (loc_t) -> value.Place
+        return value.Place(LeftName('_reply', blame_loc),
+                           self.mem.TopNamespace())
+
+    def _ReadLines(self, cmd_val):
+        # type: (cmd_value.Argv) -> int
+        """
+        json read --lines (&x) { echo $[x.name] }
+
+        Reads JSON Lines, and runs the block on each value as it's decoded.
+        """
+        rd = typed_args.ReaderForProc(cmd_val)
+        if len(rd.pos_args) == 2:  # json read --lines (&x) { ... }
+            place = rd.PosPlace()
+            blame_loc = cmd_val.typed_args.left  # type: loc_t
+        else:
+            blame_loc = cmd_val.arg_locs[0]
+            place = self._ReplyPlace(blame_loc)
+        block = rd.PosCommand()
+        rd.Done()
+
+        p = j8.Parser('', 0)
+        while True:
+            try:
+                val = p.ParseValue()
+            except pyos.ReadError as e:
+                self.errfmt.PrintMessage("read error: %s" %
+                                         posix.strerror(e.err_num))
+                return 1
+            except error.Decode as e:
+                self.errfmt.Print_('json read: %s' % e.UserErrorString(),
+                                   blame_loc=blame_loc)
+                return 1
+
+            if val is None:
+                break
+
+            self.mem.SetPlace(place, val, blame_loc)
+            unused = self.cmd_ev.EvalCommand(block)
+
+        return 0
+
     def Run(self, cmd_val):
         # type: (cmd_value.Argv) -> int
         arg_r = args.Reader(cmd_val.argv, locs=cmd_val.arg_locs)
@@ -72,25 +113,18 @@ class Json(vm._Builtin):
 
             if arg_jw.pretty:
                 indent = arg_jw.indent
-                extra_newline = False
             else:
-                # How yajl works: if indent is -1, then everything is on one line.
+                # -1 means everything is on one line
                 indent = -1
-                extra_newline = True
 
-            if 0:
-                buf = mylib.BufWriter()
-                self.printer.Print(val, buf, indent=indent)
-                sys.stdout.write(buf.getvalue())
-                sys.stdout.write('\n')
-            else:
-
-                obj = cpython._ValueToPyObj(val)
-
-                j = yajl.dumps(obj, indent=indent)
-                sys.stdout.write(j)
-                if extra_newline:
-                    sys.stdout.write('\n')
+            # Write as we go, rather than making one big string
+            try:
+                self.printer.Stream(val, mylib.Stdout(), indent)
+            except error.Encode as e:
+                self.errfmt.Print_('json write: %s' % e.UserErrorString(),
+                                   blame_loc=action_loc)
+                return 1
+            mylib.Stdout().write('\n')
 
         elif action == 'read':
             attrs = flag_spec.Parse('json_read', arg_r)
@@ -98,6 +132,12 @@ class Json(vm._Builtin):
             # TODO:
             # Respect -validate=F
 
+            if not arg_r.AtEnd():
+                e_usage('read got too many args', arg_r.Location())
+
+            if arg_jr.lines:
+                return self._ReadLines(cmd_val)
+
             if cmd_val.typed_args:  # json read (&x)
                 rd = typed_args.ReaderForProc(cmd_val)
                 place = rd.PosPlace()
@@ -106,35 +146,23 @@ class Json(vm._Builtin):
                 blame_loc = cmd_val.typed_args.left  # type: loc_t
 
             else:  # json read
-                var_name = '_reply'
-
-                #log('VAR %s', var_name)
                 blame_loc = cmd_val.arg_locs[0]
-                place = value.Place(LeftName(var_name, blame_loc),
-                                    self.mem.TopNamespace())
-
-            if not arg_r.AtEnd():
-                e_usage('read got too many args', arg_r.Location())
+                place = self._ReplyPlace(blame_loc)
 
+            p = j8.Parser('', 0)
             try:
-                contents = read_osh.ReadAll()
+                val = p.Parse()
             except pyos.ReadError as e:  # different paths for read -d, etc.
                 # don't quote code since YSH errexit will likely quote
                 self.errfmt.PrintMessage("read error: %s" %
                                          posix.strerror(e.err_num))
                 return 1
+            except error.Decode as e:
+                self.errfmt.Print_('json read: %s' % e.UserErrorString(),
+                                   blame_loc=action_loc)
+                return 1
 
-            if mylib.PYTHON:
-                try:
-                    obj = yajl.loads(contents)
-                except ValueError as e:
-                    self.errfmt.Print_('json read: %s' % e,
-                                       blame_loc=action_loc)
-                    return 1
-
-                # TODO: use token directly
-                val = cpython._PyObjToValue(obj)
-                self.mem.SetPlace(place, val, blame_loc)
+            self.mem.SetPlace(place, val, blame_loc)
 
         else:
             raise error.Usage(_JSON_ACTION_ERROR, action_loc)
@@ -26,4 +26,4 @@ class Keys(vm._Callable):
         rd.Done()
 
         keys = [value.Str(k) for k in dictionary.keys()]  # type: List[value_t]
-        return value.List(keys)
+        return value.List(keys, None)
@@ -6,6 +6,7 @@ from _devbuild.gen.value_asdl import value, value_t
 from core import vm
 from mycpp.mylib import log
 from osh import prompt
+from ysh import val_ops
 
 from typing import cast, TYPE_CHECKING
 if TYPE_CHECKING:
@@ -34,3 +35,25 @@ class PromptVal(vm._Callable):
 
         prompt_ev = cast(prompt.Evaluator, io.prompt_ev)
         return value.Str(prompt_ev.PromptVal(what))
+
+
+class Lines(vm._Callable):
+    """
+    for line in (_io->lines()) { echo $line }   # stdin
+    for line in (_io->lines(3)) { echo $line }  # another descriptor
+
+    Lines are read as the loop runs, so the file can be bigger than memory.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        pass
+
+    def Call(self, rd):
+        # type: (typed_args.Reader) -> value_t
+
+        unused_io = rd.PosIO()
+        fd = rd.OptionalInt(0)
+        rd.Done()
+
+        return value.Lines(val_ops.LineReader(fd))
@@ -4,6 +4,7 @@ from __future__ import print_function
 
 from _devbuild.gen.value_asdl import (value, value_t)
 
+from core import packed_list
 from core import vm
 from frontend import typed_args
 from mycpp.mylib import log
@@ -20,11 +21,11 @@ class Append(vm._Callable):
     def Call(self, rd):
         # type: (typed_args.Reader) -> value_t
 
-        items = rd.PosList()
+        li = rd.PosListValue()
         to_append = rd.PosValue()
         rd.Done()
 
-        items.append(to_append)
+        packed_list.Append(li, to_append)
         return value.Null
 
 
@@ -54,10 +55,10 @@ class Pop(vm._Callable):
     def Call(self, rd):
         # type: (typed_args.Reader) -> value_t
 
-        items = rd.PosList()
+        li = rd.PosListValue()
         rd.Done()
 
-        return items.pop()
+        return packed_list.Pop(li)
 
 
 class Reverse(vm._Callable):
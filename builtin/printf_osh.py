@@ -9,7 +9,6 @@ from _devbuild.gen.id_kind_asdl import Id, Kind, Id_t, Kind_t
 from _devbuild.gen.runtime_asdl import cmd_value
 from _devbuild.gen.syntax_asdl import (
     loc,
-    loc_e,
     loc_t,
     source,
     Token,
@@ -32,14 +31,14 @@ from frontend import lexer
 from frontend import match
 from frontend import reader
 from mycpp import mylib
-from mycpp.mylib import log
+from mycpp.mylib import log, iteritems
 from osh import sh_expr_eval
 from osh import word_compile
 from data_lang import qsn
 
 import posix_ as posix
 
-from typing import Dict, List, TYPE_CHECKING, cast
+from typing import Dict, List, Optional, TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
     from core import ui
@@ -156,6 +155,173 @@ class _FormatStringParser(object):
         return parts
 
 
+# What a % directive does with its arg
+_CONV_STR = 0  # %s
+_CONV_QUOTE = 1  # %q
+_CONV_ECHO = 2  # %b
+_CONV_INT = 3  # %d %i %u %o %x %X
+_CONV_TIME = 4  # %(...)T
+
+
+class _Part(object):
+    """A part of a format string, with everything that doesn't depend on the
+    args already computed."""
+
+    def __init__(self, literal):
+        # type: (Optional[str]) -> None
+        self.literal = literal  # text to print, or None for a % directive
+
+        # The rest is for % directives
+        self.conv = _CONV_STR
+        self.typ = ''  # 'd', 'x', etc., or the strftime() format for %(...)T
+        self.type_tok = None  # type: Token
+        self.left_align = False  # the - flag
+        self.zero_pad = False  # the 0 flag
+
+        self.width = -1  # -1 for none
+        self.width_star = False  # %*d takes the width from an arg
+        self.width_tok = None  # type: Token
+
+        self.precision = -1  # -1 for none
+        self.precision_star = False
+        self.precision_tok = None  # type: Token
+
+
+def _CompilePercent(UP_part):
+    # type: (printf_part_t) -> _Part
+    part = cast(printf_part.Percent, UP_part)
+    p = _Part(None)
+
+    for flag_token in part.flags:
+        flag = lexer.TokenVal(flag_token)
+        if flag == '-':
+            p.left_align = True
+        elif flag == '0':
+            p.zero_pad = True
+
+    if part.width:
+        p.width_tok = part.width
+        if part.width.id == Id.Format_Star:
+            p.width_star = True
+        else:
+            p.width = int(lexer.TokenVal(part.width))
+
+    if part.precision:
+        p.precision_tok = part.precision
+        if part.precision.id == Id.Format_Dot:
+            p.precision = 0
+        elif part.precision.id == Id.Format_Star:
+            p.precision_star = True
+        else:
+            p.precision = int(lexer.TokenVal(part.precision))
+
+    p.type_tok = part.type
+    typ = lexer.TokenVal(part.type)
+    if part.type.id == Id.Format_Time:
+        p.conv = _CONV_TIME
+        p.typ = typ[1:-2]  # %(%Y)T -> %Y
+    elif typ == 's':
+        p.conv = _CONV_STR
+    elif typ == 'q':
+        p.conv = _CONV_QUOTE
+    elif typ == 'b':
+        p.conv = _CONV_ECHO
+    elif typ in 'diouxX':
+        p.conv = _CONV_INT
+        p.typ = typ
+    else:
+        raise AssertionError()
+    return p
+
+
+def _Compile(parsed):
+    # type: (List[printf_part_t]) -> List[_Part]
+    """Turn the parsed format into _Part objects, joining adjacent literals."""
+    parts = []  # type: List[_Part]
+    literals = []  # type: List[str]
+
+    for part in parsed:
+        UP_part = part
+        if part.tag() == printf_part_e.Literal:
+            part = cast(printf_part.Literal, UP_part)
+            token = part.token
+            if token.id == Id.Format_EscapedPercent:
+                literals.append('%')
+            else:
+                literals.append(word_compile.EvalCStringToken(token))
+
+        elif part.tag() == printf_part_e.Percent:
+            if len(literals):
+                parts.append(_Part(''.join(literals)))
+                del literals[:]
+            parts.append(_CompilePercent(UP_part))
+
+        else:
+            raise AssertionError()
+
+    if len(literals):
+        parts.append(_Part(''.join(literals)))
+    return parts
+
+
+class _CacheEntry(object):
+
+    def __init__(self, parts, last_used):
+        # type: (List[_Part], int) -> None
+        self.parts = parts
+        self.last_used = last_used
+
+
+class FormatCache(object):
+    """Compiled format strings, keeping the ones used most recently.
+
+    Most scripts use a few formats, but printf "$line" makes a new one for
+    every line.  When the cache is full, the half of it that was used least
+    recently is dropped, which is cheaper than keeping the entries in order.
+    """
+
+    def __init__(self, max_size):
+        # type: (int) -> None
+        self.max_size = max_size
+        self.entries = {}  # type: Dict[str, _CacheEntry]
+        self.tick = 0  # incremented on every lookup
+
+    def Get(self, fmt):
+        # type: (str) -> Optional[List[_Part]]
+        self.tick += 1
+        entry = self.entries.get(fmt)
+        if entry is None:
+            return None
+
+        entry.last_used = self.tick
+        return entry.parts
+
+    def Put(self, fmt, parts):
+        # type: (str, List[_Part]) -> None
+        if len(self.entries) >= self.max_size:
+            self._Evict()
+        self.entries[fmt] = _CacheEntry(parts, self.tick)
+
+    def _Evict(self):
+        # type: () -> None
+        ticks = []  # type: List[int]
+        for _, entry in iteritems(self.entries):
+            ticks.append(entry.last_used)
+        ticks.sort()
+        cutoff = ticks[(len(ticks) - 1) // 2]
+
+        doomed = []  # type: List[str]
+        for fmt, entry in iteritems(self.entries):
+            if entry.last_used <= cutoff:
+                doomed.append(fmt)
+        for fmt in doomed:
+            mylib.dict_erase(self.entries, fmt)
+
+
+# Enough for any script that doesn't build formats dynamically
+_MAX_CACHED_FORMATS = 1000
+
+
 class Printf(vm._Builtin):
 
     def __init__(
@@ -170,13 +336,13 @@ class Printf(vm._Builtin):
         self.parse_ctx = parse_ctx
         self.unsafe_arith = unsafe_arith
         self.errfmt = errfmt
-        self.parse_cache = {}  # type: Dict[str, List[printf_part_t]]
+        self.parse_cache = FormatCache(_MAX_CACHED_FORMATS)
 
         self.shell_start_time = time_.time(
         )  # this object initialized in main()
 
     def _Format(self, parts, varargs, locs, out):
-        # type: (List[printf_part_t], List[str], List[CompoundWord], List[str]) -> int
+        # type: (List[_Part], List[str], List[CompoundWord], List[str]) -> int
         """Hairy printf formatting logic."""
 
         arg_index = 0
@@ -184,260 +350,217 @@ class Printf(vm._Builtin):
         backslash_c = False
 
         while True:  # loop over arguments
-            for part in parts:  # loop over parsed format string
-                UP_part = part
-                if part.tag() == printf_part_e.Literal:
-                    part = cast(printf_part.Literal, UP_part)
-                    token = part.token
-                    if token.id == Id.Format_EscapedPercent:
-                        s = '%'
+            for part in parts:  # loop over compiled format string
+                if part.literal is not None:
+                    out.append(part.literal)
+                    continue
+
+                # Note: This case is very long, but hard to refactor because of the
+                # error cases and "recycling" of args!  (arg_index, return 1, etc.)
+
+                width = part.width
+                if part.width_star:
+                    if arg_index < num_args:
+                        width_str = varargs[arg_index]
+                        width_loc = locs[arg_index]  # type: loc_t
+                        arg_index += 1
                     else:
-                        s = word_compile.EvalCStringToken(token)
-                    out.append(s)
-
-                elif part.tag() == printf_part_e.Percent:
-                    # Note: This case is very long, but hard to refactor because of the
-                    # error cases and "recycling" of args!  (arg_index, return 1, etc.)
-                    part = cast(printf_part.Percent, UP_part)
-
-                    # TODO: These calculations are independent of the data, so could be
-                    # cached
-                    flags = []  # type: List[str]
-                    if len(part.flags) > 0:
-                        for flag_token in part.flags:
-                            flags.append(lexer.TokenVal(flag_token))
-
-                    width = -1  # nonexistent
-                    if part.width:
-                        if part.width.id in (Id.Format_Num, Id.Format_Zero):
-                            width_str = lexer.TokenVal(part.width)
-                            width_loc = part.width  # type: loc_t
-                        elif part.width.id == Id.Format_Star:
-                            if arg_index < num_args:
-                                width_str = varargs[arg_index]
-                                width_loc = locs[arg_index]
-                                arg_index += 1
-                            else:
-                                width_str = ''  # invalid
-                                width_loc = loc.Missing
-                        else:
-                            raise AssertionError()
-
-                        try:
-                            width = int(width_str)
-                        except ValueError:
-                            if width_loc.tag() == loc_e.Missing:
-                                width_loc = part.width
-                            self.errfmt.Print_("printf got invalid width %r" %
-                                               width_str,
-                                               blame_loc=width_loc)
-                            return 1
+                        width_str = ''  # invalid
+                        width_loc = part.width_tok
+
+                    try:
+                        width = int(width_str)
+                    except ValueError:
+                        self.errfmt.Print_("printf got invalid width %r" %
+                                           width_str,
+                                           blame_loc=width_loc)
+                        return 1
+
+                precision = part.precision
+                if part.precision_star:
+                    if arg_index < num_args:
+                        precision_str = varargs[arg_index]
+                        precision_loc = locs[arg_index]  # type: loc_t
+                        arg_index += 1
+                    else:
+                        precision_str = ''
+                        precision_loc = part.precision_tok
+
+                    try:
+                        precision = int(precision_str)
+                    except ValueError:
+                        self.errfmt.Print_('printf got invalid precision %r' %
+                                           precision_str,
+                                           blame_loc=precision_loc)
+                        return 1
+
+                if arg_index < num_args:
+                    s = varargs[arg_index]
+                    word_loc = locs[arg_index]  # type: loc_t
+                    arg_index += 1
+                    has_arg = True
+                else:
+                    s = ''
+                    word_loc = loc.Missing
+                    has_arg = False
+
+                conv = part.conv
+                if conv == _CONV_STR:
+                    if precision >= 0:
+                        s = s[:precision]  # truncate
+
+                elif conv == _CONV_QUOTE:
+                    # TODO: most shells give \' for single quote, while OSH gives $'\''
+                    # this could matter when SSH'ing
+                    s = qsn.maybe_shell_encode(s)
+
+                elif conv == _CONV_ECHO:
+                    # Process just like echo -e, except \c handling is simpler.
+
+                    c_parts = []  # type: List[str]
+                    lex = match.EchoLexer(s)
+                    while True:
+                        id_, tok_val = lex.Next()
+                        if id_ == Id.Eol_Tok:  # Note: This is really a NUL terminator
+                            break
+
+                        # Note: DummyToken is OK because EvalCStringToken() doesn't have
+                        # any syntax errors.
+                        tok = lexer.DummyToken(id_, tok_val)
+                        p = word_compile.EvalCStringToken(tok)
+
+                        # Unusual behavior: '\c' aborts processing!
+                        if p is None:
+                            backslash_c = True
+                            break
+
+                        c_parts.append(p)
+                    s = ''.join(c_parts)
 
-                    precision = -1  # nonexistent
-                    if part.precision:
-                        if part.precision.id == Id.Format_Dot:
-                            precision_str = '0'
-                            precision_loc = part.precision  # type: loc_t
-                        elif part.precision.id in (Id.Format_Num,
-                                                   Id.Format_Zero):
-                            precision_str = lexer.TokenVal(part.precision)
-                            precision_loc = part.precision
-                        elif part.precision.id == Id.Format_Star:
-                            if arg_index < num_args:
-                                precision_str = varargs[arg_index]
-                                precision_loc = locs[arg_index]
-                                arg_index += 1
-                            else:
-                                precision_str = ''
-                                precision_loc = loc.Missing
-                        else:
-                            raise AssertionError()
+                else:
+                    # %(...)T and %d share this complex integer conversion logic
+
+                    try:
+                        d = int(
+                            s
+                        )  # note: spaces like ' -42 ' accepted and normalized
+
+                    except ValueError:
+                        # 'a is interpreted as the ASCII value of 'a'
+                        if len(s) >= 1 and s[0] in '\'"':
+                            # TODO: utf-8 decode s[1:] to be more correct.  Probably
+                            # depends on issue #366, a utf-8 library.
+                            # Note: len(s) == 1 means there is a NUL (0) after the quote..
+                            d = ord(s[1]) if len(s) >= 2 else 0
+
+                        # No argument means -1 for %(...)T as in Bash Reference Manual
+                        # 4.2 "If no argument is specified, conversion behaves as if -1
+                        # had been given."
+                        elif not has_arg and conv == _CONV_TIME:
+                            d = -1
 
-                        try:
-                            precision = int(precision_str)
-                        except ValueError:
-                            if precision_loc.tag() == loc_e.Missing:
-                                precision_loc = part.precision
+                        else:
+                            if has_arg:
+                                blame_loc = word_loc  # type: loc_t
+                            else:
+                                blame_loc = part.type_tok
                             self.errfmt.Print_(
-                                'printf got invalid precision %r' %
-                                precision_str,
-                                blame_loc=precision_loc)
+                                'printf expected an integer, got %r' % s,
+                                blame_loc)
                             return 1
 
-                    if arg_index < num_args:
-                        s = varargs[arg_index]
-                        word_loc = locs[arg_index]  # type: loc_t
-                        arg_index += 1
-                        has_arg = True
-                    else:
-                        s = ''
-                        word_loc = loc.Missing
-                        has_arg = False
-
-                    # Note: %s could be lexed into Id.Percent_S.  Although small string
-                    # optimization would remove the allocation as well.
-                    typ = lexer.TokenVal(part.type)
-                    if typ == 's':
+                    if conv == _CONV_TIME:
+                        # Initialize timezone:
+                        #   `localtime' uses the current timezone information initialized
+                        #   by `tzset'.  The function `tzset' refers to the environment
+                        #   variable `TZ'.  When the exported variable `TZ' is present,
+                        #   its value should be reflected in the real environment
+                        #   variable `TZ' before call of `tzset'.
+                        #
+                        # Note: unlike LANG, TZ doesn't seem to change behavior if it's
+                        # not exported.
+                        #
+                        # TODO: In YSH, provide an API that doesn't rely on libc's global
+                        # state.
+
+                        tzcell = self.mem.GetCell('TZ')
+                        if tzcell and tzcell.exported and tzcell.val.tag(
+                        ) == value_e.Str:
+                            tzval = cast(value.Str, tzcell.val)
+                            posix.putenv('TZ', tzval.s)
+
+                        time_.tzset()
+
+                        # Handle special values:
+                        #   User can specify two special values -1 and -2 as in Bash
+                        #   Reference Manual 4.2: "Two special argument values may be
+                        #   used: -1 represents the current time, and -2 represents the
+                        #   time the shell was invoked." from
+                        #   https://www.gnu.org/software/bash/manual/html_node/Bash-Builtins.html#index-printf
+                        if d == -1:  # the current time
+                            ts = time_.time()
+                        elif d == -2:  # the shell start time
+                            ts = self.shell_start_time
+                        else:
+                            ts = d
+
+                        s = time_.strftime(part.typ, time_.localtime(ts))
                         if precision >= 0:
                             s = s[:precision]  # truncate
 
-                    elif typ == 'q':
-                        # TODO: most shells give \' for single quote, while OSH gives $'\''
-                        # this could matter when SSH'ing
-                        s = qsn.maybe_shell_encode(s)
-
-                    elif typ == 'b':
-                        # Process just like echo -e, except \c handling is simpler.
-
-                        c_parts = []  # type: List[str]
-                        lex = match.EchoLexer(s)
-                        while True:
-                            id_, tok_val = lex.Next()
-                            if id_ == Id.Eol_Tok:  # Note: This is really a NUL terminator
-                                break
-
-                            # Note: DummyToken is OK because EvalCStringToken() doesn't have
-                            # any syntax errors.
-                            tok = lexer.DummyToken(id_, tok_val)
-                            p = word_compile.EvalCStringToken(tok)
-
-                            # Unusual behavior: '\c' aborts processing!
-                            if p is None:
-                                backslash_c = True
-                                break
-
-                            c_parts.append(p)
-                        s = ''.join(c_parts)
-
-                    elif part.type.id == Id.Format_Time or typ in 'diouxX':
-                        # %(...)T and %d share this complex integer conversion logic
-
-                        try:
-                            d = int(
-                                s
-                            )  # note: spaces like ' -42 ' accepted and normalized
-
-                        except ValueError:
-                            # 'a is interpreted as the ASCII value of 'a'
-                            if len(s) >= 1 and s[0] in '\'"':
-                                # TODO: utf-8 decode s[1:] to be more correct.  Probably
-                                # depends on issue #366, a utf-8 library.
-                                # Note: len(s) == 1 means there is a NUL (0) after the quote..
-                                d = ord(s[1]) if len(s) >= 2 else 0
-
-                            # No argument means -1 for %(...)T as in Bash Reference Manual
-                            # 4.2 "If no argument is specified, conversion behaves as if -1
-                            # had been given."
-                            elif not has_arg and part.type.id == Id.Format_Time:
-                                d = -1
-
-                            else:
-                                if has_arg:
-                                    blame_loc = word_loc  # type: loc_t
+                    else:  # typ in 'diouxX'
+                        # Disallowed because it depends on 32- or 64- bit
+                        typ = part.typ
+                        if d < 0 and typ in 'ouxX':
+                            e_die(
+                                "Can't format negative number %d with %%%s"
+                                % (d, typ), part.type_tok)
+
+                        if typ == 'o':
+                            s = mylib.octal(d)
+                        elif typ == 'x':
+                            s = mylib.hex_lower(d)
+                        elif typ == 'X':
+                            s = mylib.hex_upper(d)
+                        else:  # diu
+                            s = str(d)  # without spaces like ' -42 '
+
+                        # There are TWO different ways to ZERO PAD, and they differ on
+                        # the negative sign!  See spec/builtin-printf
+
+                        zero_pad = 0  # no zero padding
+                        if width >= 0 and part.zero_pad:
+                            zero_pad = 1  # style 1
+                        elif precision > 0 and len(s) < precision:
+                            zero_pad = 2  # style 2
+
+                        if zero_pad:
+                            negative = (s[0] == '-')
+                            if negative:
+                                digits = s[1:]
+                                sign = '-'
+                                if zero_pad == 1:
+                                    # [%06d] -42 becomes [-00042] (6 TOTAL)
+                                    n = width - 1
                                 else:
-                                    blame_loc = part.type
-                                self.errfmt.Print_(
-                                    'printf expected an integer, got %r' % s,
-                                    blame_loc)
-                                return 1
-
-                        if part.type.id == Id.Format_Time:
-                            # Initialize timezone:
-                            #   `localtime' uses the current timezone information initialized
-                            #   by `tzset'.  The function `tzset' refers to the environment
-                            #   variable `TZ'.  When the exported variable `TZ' is present,
-                            #   its value should be reflected in the real environment
-                            #   variable `TZ' before call of `tzset'.
-                            #
-                            # Note: unlike LANG, TZ doesn't seem to change behavior if it's
-                            # not exported.
-                            #
-                            # TODO: In YSH, provide an API that doesn't rely on libc's global
-                            # state.
-
-                            tzcell = self.mem.GetCell('TZ')
-                            if tzcell and tzcell.exported and tzcell.val.tag(
-                            ) == value_e.Str:
-                                tzval = cast(value.Str, tzcell.val)
-                                posix.putenv('TZ', tzval.s)
-
-                            time_.tzset()
-
-                            # Handle special values:
-                            #   User can specify two special values -1 and -2 as in Bash
-                            #   Reference Manual 4.2: "Two special argument values may be
-                            #   used: -1 represents the current time, and -2 represents the
-                            #   time the shell was invoked." from
-                            #   https://www.gnu.org/software/bash/manual/html_node/Bash-Builtins.html#index-printf
-                            if d == -1:  # the current time
-                                ts = time_.time()
-                            elif d == -2:  # the shell start time
-                                ts = self.shell_start_time
+                                    # [%6.6d] -42 becomes [-000042] (1 for '-' + 6)
+                                    n = precision
                             else:
-                                ts = d
-
-                            s = time_.strftime(typ[1:-2], time_.localtime(ts))
-                            if precision >= 0:
-                                s = s[:precision]  # truncate
-
-                        else:  # typ in 'diouxX'
-                            # Disallowed because it depends on 32- or 64- bit
-                            if d < 0 and typ in 'ouxX':
-                                e_die(
-                                    "Can't format negative number %d with %%%s"
-                                    % (d, typ), part.type)
-
-                            if typ == 'o':
-                                s = mylib.octal(d)
-                            elif typ == 'x':
-                                s = mylib.hex_lower(d)
-                            elif typ == 'X':
-                                s = mylib.hex_upper(d)
-                            else:  # diu
-                                s = str(d)  # without spaces like ' -42 '
-
-                            # There are TWO different ways to ZERO PAD, and they differ on
-                            # the negative sign!  See spec/builtin-printf
-
-                            zero_pad = 0  # no zero padding
-                            if width >= 0 and '0' in flags:
-                                zero_pad = 1  # style 1
-                            elif precision > 0 and len(s) < precision:
-                                zero_pad = 2  # style 2
-
-                            if zero_pad:
-                                negative = (s[0] == '-')
-                                if negative:
-                                    digits = s[1:]
-                                    sign = '-'
-                                    if zero_pad == 1:
-                                        # [%06d] -42 becomes [-00042] (6 TOTAL)
-                                        n = width - 1
-                                    else:
-                                        # [%6.6d] -42 becomes [-000042] (1 for '-' + 6)
-                                        n = precision
+                                digits = s
+                                sign = ''
+                                if zero_pad == 1:
+                                    n = width
                                 else:
-                                    digits = s
-                                    sign = ''
-                                    if zero_pad == 1:
-                                        n = width
-                                    else:
-                                        n = precision
-                                s = sign + digits.rjust(n, '0')
+                                    n = precision
+                            s = sign + digits.rjust(n, '0')
 
+                if width >= 0:
+                    if part.left_align:
+                        s = s.ljust(width, ' ')
                     else:
-                        raise AssertionError()
-
-                    if width >= 0:
-                        if '-' in flags:
-                            s = s.ljust(width, ' ')
-                        else:
-                            s = s.rjust(width, ' ')
-
-                    out.append(s)
+                        s = s.rjust(width, ' ')
 
-                else:
-                    raise AssertionError()
+                out.append(s)
 
                 if backslash_c:  # 'printf %b a\cb xx' - \c terminates processing!
                     break
@@ -468,9 +591,8 @@ class Printf(vm._Builtin):
         #log('vals %s', vals)
 
         arena = self.parse_ctx.arena
-        if fmt in self.parse_cache:
-            parts = self.parse_cache[fmt]
-        else:
+        parts = self.parse_cache.Get(fmt)
+        if parts is None:
             line_reader = reader.StringLineReader(fmt, arena)
             # TODO: Make public
             lexer = self.parse_ctx.MakeLexer(line_reader)
@@ -479,18 +601,19 @@ class Printf(vm._Builtin):
             with alloc.ctx_SourceCode(arena,
                                       source.ArgvWord('printf', fmt_loc)):
                 try:
-                    parts = parser.Parse()
+                    parsed = parser.Parse()
                 except error.Parse as e:
                     self.errfmt.PrettyPrintError(e)
                     return 2  # parse error
 
-            self.parse_cache[fmt] = parts
-
-        if 0:
-            print()
-            for part in parts:
-                part.PrettyPrint()
+            if 0:
                 print()
+                for part in parsed:
+                    part.PrettyPrint()
+                    print()
+
+            parts = _Compile(parsed)
+            self.parse_cache.Put(fmt, parts)
 
         out = []  # type: List[str]
         status = self._Format(parts, varargs, locs, out)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python2
+from __future__ import print_function
+
+import unittest
+
+from builtin import printf_osh  # module under test
+
+
+class FormatCacheTest(unittest.TestCase):
+
+    def testHitsAndMisses(self):
+        cache = printf_osh.FormatCache(10)
+        self.assertEqual(None, cache.Get('%s\n'))
+        parts = [printf_osh._Part('x')]
+        cache.Put('%s\n', parts)
+
+        self.assertEqual(parts, cache.Get('%s\n'))
+        self.assertEqual(parts, cache.Get('%s\n'))
+        self.assertEqual(None, cache.Get('%d\n'))
+
+    def testEviction(self):
+        cache = printf_osh.FormatCache(4)
+        for fmt in ['a', 'b', 'c', 'd']:
+            cache.Get(fmt)
+            cache.Put(fmt, [])
+
+        # Use 'a' and 'c' again, so 'b' and 'd' are evicted first
+        cache.Get('a')
+        cache.Get('c')
+
+        cache.Get('e')
+        cache.Put('e', [])
+        self.assertEqual(['a', 'c', 'e'], sorted(cache.entries))
+
+        # Never bigger than max_size
+        for i in xrange(100):
+            fmt = '%d' % i
+            if cache.Get(fmt) is None:
+                cache.Put(fmt, [])
+            self.assertTrue(len(cache.entries) <= 4)
+
+        cache = printf_osh.FormatCache(1)
+        cache.Put('a', [])
+        cache.Put('b', [])
+        self.assertEqual(['b'], list(cache.entries))
+
+
+if __name__ == '__main__':
+    unittest.main()
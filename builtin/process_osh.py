@@ -15,6 +15,7 @@ from core import dev
 from core import error
 from core.error import e_usage, e_die_status
 from core import process  # W1_OK, W1_ECHILD
+from core import pyos
 from core import vm
 from mycpp.mylib import log, tagswitch, print_stderr
 from frontend import flag_spec
@@ -238,6 +239,9 @@ class Wait(vm._Builtin):
 
     def Run(self, cmd_val):
         # type: (cmd_value.Argv) -> int
+
+        # Show output before blocking, and to processes that read it
+        pyos.FlushStdout()
         with dev.ctx_Tracer(self.tracer, 'wait', cmd_val.argv):
             return self._Run(cmd_val)
 
@@ -7,6 +7,7 @@ from _devbuild.gen.runtime_asdl import (cmd_value, scope_e)
 from _devbuild.gen.syntax_asdl import loc
 from _devbuild.gen.value_asdl import (value, value_e, value_t, LeftName)
 from core import error
+from core import packed_list
 from core import state
 from core import vm
 from frontend import flag_spec
@@ -14,6 +15,7 @@ from frontend import location
 from frontend import typed_args
 from mycpp import mylib
 from mycpp.mylib import tagswitch
+from osh import sparse_array
 
 from typing import TYPE_CHECKING, cast, List, Tuple, Any
 
@@ -159,11 +161,14 @@ class Append(vm._Builtin):
             if case(value_e.BashArray):
                 val = cast(value.BashArray, UP_val)
                 val.strs.extend(arg_r.Rest())
+            elif case(value_e.SparseArray):
+                val = cast(value.SparseArray, UP_val)
+                sparse_array.Append(val, arg_r.Rest())
             elif case(value_e.List):
                 val = cast(value.List, UP_val)
                 typed = [value.Str(s)
                          for s in arg_r.Rest()]  # type: List[value_t]
-                val.items.extend(typed)
+                packed_list.Items(val).extend(typed)
             else:
                 raise error.TypeErr(val, 'expected List or BashArray',
                                     loc.Missing)
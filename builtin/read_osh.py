@@ -5,7 +5,7 @@ from errno import EINTR
 from _devbuild.gen import arg_types
 from _devbuild.gen.runtime_asdl import (span_e, cmd_value)
 from _devbuild.gen.syntax_asdl import source, loc, loc_t
-from _devbuild.gen.value_asdl import value, LeftName
+from _devbuild.gen.value_asdl import value, value_t, LeftName
 from core import alloc
 from core import error
 from core.error import e_usage, e_die
@@ -190,14 +190,11 @@ def _ReadPortion(delim_byte, max_chars, cmd_ev):
 # with shell semantics.  dash, mksh, and zsh all read a single byte at a
 # time with read(0, 1).
 
-# TODO:
-# - ReadLineSlowly should have keep_newline (mapfile -t)
-#   - this halves memory usage!
 
 
-def ReadLineSlowly(cmd_ev):
-    # type: (CommandEvaluator) -> str
-    """Read a line from stdin."""
+def ReadLineSlowly(cmd_ev, delim_byte):
+    # type: (CommandEvaluator, int) -> str
+    """Read a line from stdin, including the delimiter."""
     ch_array = []  # type: List[int]
     while True:
         ch, err_num = pyos.ReadByte(0)
@@ -215,22 +212,104 @@ def ReadLineSlowly(cmd_ev):
         else:
             ch_array.append(ch)
 
-        # TODO: Add option to omit newline
-        if ch == pyos.NEWLINE_CH:
+        if ch == delim_byte:
             break
 
     return pyutil.ChArrayToString(ch_array)
 
 
-def ReadAll():
-    # type: () -> str
-    """Read all of stdin.
+# read --all-lines reads this much at once
+_LINES_BLOCK_SIZE = 1 << 16
 
-    Similar to command sub in core/executor.py.
+
+def ReadLines(delim, keep_delim, skip, max_lines, cmd_ev):
+    # type: (str, bool, int, int, CommandEvaluator) -> List[str]
+    """Read stdin in big blocks, and split it into lines in one pass.
+
+    Args:
+      delim: the character that ends a line
+      keep_delim: whether to leave the delimiter on each line
+      skip: discard this many lines first
+      max_lines: stop after this many lines, or -1 for no limit
+
+    Unlike ReadLineSlowly(), this reads past the last line it returns.  When
+    it stops at max_lines, and stdin is a regular file, it seeks back, so the
+    next read starts after that line.
+    """
+    lines = []  # type: List[str]
+    if max_lines == 0:
+        return lines
+
+    pieces = []  # type: List[str]  # a line that spans blocks
+    num_seen = 0  # including skipped lines
+    chunks = []  # type: List[str]
+    done = False
+    while not done:
+        n, err_num = pyos.Read(0, _LINES_BLOCK_SIZE, chunks)
+
+        if n < 0:
+            if err_num == EINTR:
+                cmd_ev.RunPendingTraps()
+                continue  # retry after running traps
+            raise pyos.ReadError(err_num)
+
+        if n == 0:  # EOF
+            break
+
+        block = chunks.pop()
+        pos = 0
+        while True:
+            i = block.find(delim, pos)
+            if i == -1:
+                break
+
+            if num_seen >= skip:
+                end = i + 1 if keep_delim else i
+                if len(pieces):
+                    pieces.append(block[pos:end])
+                    lines.append(''.join(pieces))
+                    del pieces[:]
+                else:
+                    lines.append(block[pos:end])  # common case: one copy
+
+            num_seen += 1
+            pos = i + 1
+
+            if len(lines) == max_lines:
+                done = True
+                break
+
+        if done:
+            # Give back what's after the last line, if we can
+            unused = len(block) - pos
+            if unused > 0:
+                pyos.SeekBack(0, unused)
+
+        elif pos < len(block) and num_seen >= skip:
+            pieces.append(block[pos:])
+
+    # The last line may not have a delimiter
+    if not done and len(pieces):
+        lines.append(''.join(pieces))
+    return lines
+
+
+def ReadAll(fd):
+    # type: (int) -> str
+    """Read everything from fd.
+
+    Used by read --all and $(< file) in core/executor.py.  A regular file is
+    read with one read() of its size, instead of 4096 bytes at a time, so
+    there's no list of chunks to join.
     """
+    block_size = 4096
+    size = pyos.FileSize(fd)
+    if size > block_size:
+        block_size = size
+
     chunks = []  # type: List[str]
     while True:
-        n, err_num = pyos.Read(0, 4096, chunks)
+        n, err_num = pyos.Read(fd, block_size, chunks)
 
         if n < 0:
             if err_num == EINTR:
@@ -243,6 +322,11 @@ def ReadAll():
         elif n == 0:  # EOF
             break
 
+        # Usually we're at EOF now, so don't allocate a big block to find out
+        block_size = 4096
+
+    if len(chunks) == 1:
+        return chunks[0]  # avoid a copy
     return ''.join(chunks)
 
 
@@ -317,6 +401,9 @@ class Read(vm._Builtin):
 
     def Run(self, cmd_val):
         # type: (cmd_value.Argv) -> int
+
+        # The writer may be waiting for our output, e.g. a prompt
+        pyos.FlushStdout()
         try:
             status = self._Run(cmd_val)
         except pyos.ReadError as e:  # different paths for read -d, etc.
@@ -335,6 +422,7 @@ class Read(vm._Builtin):
           read --line (&x)  # sets x
           read --all        # sets _reply
           read --all (&x)   # sets x
+          read --all-lines (&x)  # sets x to a List of lines
 
         Invalid for now:
 
@@ -389,11 +477,33 @@ class Read(vm._Builtin):
             return 0
 
         if arg.all:  # read --all
-            contents = ReadAll()
+            contents = ReadAll(STDIN_FILENO)
             self.mem.SetPlace(place, value.Str(contents), blame_loc)
             return 0
 
-        # arg.line or arg.all should be true
+        if arg.all_lines:  # read --all-lines
+            if arg.Z:
+                delim = '\0'
+            elif arg.d is not None:
+                delim = arg.d[0] if len(arg.d) else '\0'
+            else:
+                delim = '\n'
+
+            lines = ReadLines(delim, arg.with_eol, arg.skip, arg.max_lines,
+                              self.cmd_ev)
+            items = []  # type: List[value_t]
+            for line in lines:
+                if arg.q:
+                    try:
+                        line = self._MaybeDecodeLine(line)
+                    except error.Parse as e:
+                        self.errfmt.PrettyPrintError(e)
+                        return 1
+                items.append(value.Str(line))
+            self.mem.SetPlace(place, value.List(items, None), blame_loc)
+            return 0
+
+        # arg.line, arg.all, or arg.all_lines should be true
         raise AssertionError()
 
     def _Run(self, cmd_val):
@@ -404,15 +514,16 @@ class Read(vm._Builtin):
         arg = arg_types.read(attrs.attrs)
         names = arg_r.Rest()
 
-        if arg.q and not arg.line:
-            e_usage('--qsn can only be used with --line', loc.Missing)
+        if arg.q and not (arg.line or arg.all_lines):
+            e_usage('--qsn can only be used with --line or --all-lines',
+                    loc.Missing)
 
-        if arg.line or arg.all:
+        if arg.line or arg.all or arg.all_lines:
             return self._ReadYsh(arg, arg_r, cmd_val)
 
         if cmd_val.typed_args:
             raise error.Usage(
-                "doesn't accept typed args without --line or --all",
+                "doesn't accept typed args without --line or --all(-lines)",
                 cmd_val.typed_args.left)
 
         if arg.t >= 0.0:
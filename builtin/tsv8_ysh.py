@@ -0,0 +1,123 @@
+from __future__ import print_function
+
+from _devbuild.gen import arg_types
+from _devbuild.gen.runtime_asdl import cmd_value
+from _devbuild.gen.syntax_asdl import loc, loc_t
+from _devbuild.gen.value_asdl import value, LeftName
+from core import error
+from core.error import e_usage
+from core import pyos
+from core import state
+from core import vm
+from data_lang import tsv8
+from frontend import flag_spec
+from frontend import args
+from frontend import typed_args
+from mycpp import mylib
+
+import posix_ as posix
+
+from typing import List, TYPE_CHECKING
+if TYPE_CHECKING:
+    from _devbuild.gen.syntax_asdl import command_t
+    from core.ui import ErrorFormatter
+    from osh.cmd_eval import CommandEvaluator
+
+_TSV8_ACTION_ERROR = "builtin expects 'read' or 'write'"
+
+
+class Tsv8(vm._Builtin):
+    """TSV8 read and write.
+
+    tsv8 read (&t)                # t is a Dict of columns
+    tsv8 read name age (&t)       # only these columns
+    tsv8 read --batch 1000 (&t) { echo $[len(t.name)] }
+    tsv8 write (t)
+    """
+
+    def __init__(self, mem, cmd_ev, errfmt):
+        # type: (state.Mem, CommandEvaluator, ErrorFormatter) -> None
+        self.mem = mem
+        self.cmd_ev = cmd_ev  # To run blocks
+        self.errfmt = errfmt
+
+    def _Read(self, cmd_val, col_names, batch_size, action_loc):
+        # type: (cmd_value.Argv, List[str], int, loc_t) -> int
+        rd = typed_args.ReaderForProc(cmd_val)
+
+        # tsv8 read (&t) or tsv8 read --batch 10 (&t) { ... }
+        num_typed = 2 if batch_size > 0 else 1
+        if len(rd.pos_args) == num_typed:
+            place = rd.PosPlace()
+            blame_loc = cmd_val.typed_args.left  # type: loc_t
+        else:
+            blame_loc = cmd_val.arg_locs[0]
+            place = value.Place(LeftName('_reply', blame_loc),
+                                self.mem.TopNamespace())
+
+        block = None  # type: command_t
+        if batch_size > 0:
+            block = rd.PosCommand()
+        rd.Done()
+
+        r = tsv8.Reader(0, col_names)
+        try:
+            r.ReadHeader()
+            if batch_size > 0:
+                while True:
+                    batch = r.ReadBatch(batch_size)
+                    if batch is None:
+                        break
+                    self.mem.SetPlace(place, batch, blame_loc)
+                    unused = self.cmd_ev.EvalCommand(block)
+            else:
+                self.mem.SetPlace(place, r.ReadAll(), blame_loc)
+
+        except pyos.ReadError as e:
+            self.errfmt.PrintMessage("read error: %s" %
+                                     posix.strerror(e.err_num))
+            return 1
+        except error.Decode as e:
+            self.errfmt.Print_('tsv8 read: %s' % e.UserErrorString(),
+                               blame_loc=action_loc)
+            return 1
+
+        return 0
+
+    def Run(self, cmd_val):
+        # type: (cmd_value.Argv) -> int
+        arg_r = args.Reader(cmd_val.argv, locs=cmd_val.arg_locs)
+        arg_r.Next()  # skip 'tsv8'
+
+        action, action_loc = arg_r.Peek2()
+        if action is None:
+            raise error.Usage(_TSV8_ACTION_ERROR, loc.Missing)
+        arg_r.Next()
+
+        if action == 'write':
+            if not arg_r.AtEnd():
+                e_usage('write got too many args', arg_r.Location())
+
+            rd = typed_args.ReaderForProc(cmd_val)
+            val = rd.PosValue()
+            rd.Done()
+
+            try:
+                tsv8.Write(val, mylib.Stdout())
+            except error.Encode as e:
+                self.errfmt.Print_('tsv8 write: %s' % e.UserErrorString(),
+                                   blame_loc=action_loc)
+                return 1
+
+        elif action == 'read':
+            attrs = flag_spec.Parse('tsv8_read', arg_r)
+            arg = arg_types.tsv8_read(attrs.attrs)
+
+            # The rest of the words are columns to keep
+            col_names = arg_r.Rest()
+            return self._Read(cmd_val, col_names, arg.batch, action_loc)
+
+        else:
+            raise error.Usage(_TSV8_ACTION_ERROR, action_loc)
+
+        return 0
@@ -16,6 +16,7 @@ from core import state
 from core import ui
 from mycpp.mylib import log
 from frontend import location
+from osh import sparse_array
 from osh import word_
 from data_lang import qsn
 from pylib import os_path
@@ -200,6 +201,14 @@ def _PrintShValue(val, buf):
             parts.append(')')
             result = ' '.join(parts)
 
+        elif case(value_e.SparseArray):
+            val = cast(value.SparseArray, UP_val)
+            parts = ['(']
+            for s in sparse_array.Values(val):
+                parts.append(qsn.maybe_shell_encode(s))
+            parts.append(')')
+            result = ' '.join(parts)
+
         elif case(value_e.BashAssoc):
             val = cast(value.BashAssoc, UP_val)
             parts = ['(']
@@ -70,6 +70,37 @@ class Runtime(Exception):
         return self.msg
 
 
+class Decode(Exception):
+    """Invalid JSON or J8 data.
+
+    Thrown by data_lang/j8.py and caught by builtins like 'json read'.
+    """
+
+    def __init__(self, msg, line_num):
+        # type: (str, int) -> None
+        self.msg = msg
+        self.line_num = line_num
+
+    def UserErrorString(self):
+        # type: () -> str
+        return '%s (line %d)' % (self.msg, self.line_num)
+
+
+class Encode(Exception):
+    """A value that can't be serialized, like a List that contains itself.
+
+    Thrown by data_lang/j8.py and caught by builtins like 'json write'.
+    """
+
+    def __init__(self, msg):
+        # type: (str) -> None
+        self.msg = msg
+
+    def UserErrorString(self):
+        # type: () -> str
+        return self.msg
+
+
 class Parse(_ErrorWithLocation):
     """Used in the parsers."""
 
@@ -5,42 +5,57 @@ from errno import EINTR
 
 from _devbuild.gen.id_kind_asdl import Id
 from _devbuild.gen.option_asdl import builtin_i
-from _devbuild.gen.runtime_asdl import RedirValue, trace
+from _devbuild.gen.runtime_asdl import RedirValue, redirect_arg, trace
 from _devbuild.gen.syntax_asdl import (
     command,
     command_e,
     CommandSub,
     CompoundWord,
+    eval_plan_e,
     loc,
     loc_t,
+    Redir,
+    redir_loc,
 )
 from _devbuild.gen.value_asdl import value
 from builtin import hay_ysh
+from builtin import read_osh
 from core import dev
 from core import error
 from core import process
 from core.error import e_die, e_die_status
 from core import pyos
+from core import pyutil
+from core import state
 from core import ui
 from core import vm
 from frontend import consts
 from frontend import lexer
 from mycpp.mylib import log
+from osh import word_
 
 import posix_ as posix
+from posix_ import O_CREAT, O_EXCL, O_RDONLY, O_WRONLY
 
-from typing import cast, Dict, List, Optional, TYPE_CHECKING
+from typing import cast, Dict, List, Optional, Tuple, TYPE_CHECKING
 if TYPE_CHECKING:
     from _devbuild.gen.runtime_asdl import (cmd_value, CommandStatus,
                                             StatusArray)
     from _devbuild.gen.syntax_asdl import command_t
     from builtin import trap_osh
     from core import optview
-    from core import state
     from core.vm import _Builtin
 
 _ = log
 
+# Builtins that only write to stdout.  A pipeline can run them in the shell
+# process, e.g. 'write -- @items | while read x'.
+_OUTPUT_BUILTINS = [builtin_i.echo, builtin_i.printf, builtin_i.write]
+
+# Linux's default pipe capacity.  Bigger output from the first part of a
+# pipeline is written to a pipe by a child process, not to a temp file.
+_PIPE_BUF_SIZE = 1 << 16
+
 
 class _ProcessSubFrame(object):
     """To keep track of diff <(cat 1) <(cat 2) > >(tac)"""
@@ -138,6 +153,7 @@ class ShellExecutor(vm._Executor):
         # any pipelines started within subshells run in their parent's process
         # group, we only need one pointer here, not some collection.
         self.fg_pipeline = None  # type: Optional[process.Pipeline]
+        self.num_temp_files = 0  # for unique names
 
     def CheckCircularDeps(self):
         # type: () -> None
@@ -173,6 +189,7 @@ class ShellExecutor(vm._Executor):
         thunk = process.SubProgramThunk(self.cmd_ev,
                                         node,
                                         self.trap_state,
+                                        self.fd_state,
                                         inherit_errexit=inherit_errexit)
         p = process.Process(thunk, self.job_control, self.job_list,
                             self.tracer)
@@ -188,7 +205,7 @@ class ShellExecutor(vm._Executor):
 
         builtin_func = self.builtins[builtin_id]
 
-        with vm.ctx_FlushStdout():
+        with vm.ctx_FlushStdout(self.fd_state):
             # note: could be second word, like 'builtin read'
             with ui.ctx_Location(self.errfmt, cmd_val.arg_locs[0]):
                 try:
@@ -200,6 +217,10 @@ class ShellExecutor(vm._Executor):
                     self.errfmt.PrefixPrint(e.msg, '%r ' % arg0, e.location)
                     status = 2  # consistent error code for usage error
 
+        # Like bash, a builtin fails if its output can't be written
+        if (self.fd_state.CheckStdoutError(cmd_val.arg_locs[0]) != 0 and
+                status == 0):
+            status = 1
         return status
 
     def RunSimpleCommand(self, cmd_val, cmd_st, do_fork, call_procs=True):
@@ -383,39 +404,193 @@ class ShellExecutor(vm._Executor):
             self.job_list.AddJob(p)  # show in 'jobs' list
         return 0
 
+    def _OpenTempFile(self):
+        # type: () -> Tuple[int, int]
+        """Create a file that's removed when it's closed.
+
+        Returns:
+          (write fd, read fd), or (-1, -1) if TMPDIR isn't writable, etc.
+        """
+        tmp_dir = state.MaybeString(self.mem, 'TMPDIR')
+        if tmp_dir is None or len(tmp_dir) == 0:
+            tmp_dir = '/tmp'
+
+        self.num_temp_files += 1
+        path = '%s/oils-pipe-%d-%d' % (tmp_dir, posix.getpid(),
+                                       self.num_temp_files)
+        try:
+            w = posix.open(path, O_CREAT | O_EXCL | O_WRONLY, 0o600)
+        except (IOError, OSError):
+            return -1, -1
+
+        r = -1
+        try:
+            r = posix.open(path, O_RDONLY, 0)
+        except (IOError, OSError):
+            pass
+
+        # If it can't be removed now, it would be left behind, so use a pipe
+        try:
+            posix.unlink(path)
+        except (IOError, OSError):
+            if r != -1:
+                posix.close(r)
+                r = -1
+
+        if r == -1:
+            posix.close(w)
+            return -1, -1
+        return w, r
+
+    def _RunFirstPart(self, node):
+        # type: (command_t) -> Tuple[int, int]
+        """Run the first part of a pipeline in this process, if we can.
+
+        We can if it's echo, printf, or write, its words have no side effects,
+        and sigpipe_status_ok is on.  Then nobody can tell that it didn't run
+        in a child process.
+
+        Its output goes to a temp file instead of a pipe, because nothing reads
+        from the pipe until the next part starts.
+
+        Returns:
+          (fd to read the output from, status), or (-1, -1) to fork it
+        """
+        # A child writing to a reader that exits early gets SIGPIPE, and we
+        # can only hide that when its status 141 is turned into 0
+        if not self.exec_opts.sigpipe_status_ok():
+            return -1, -1
+
+        if node.tag() != command_e.Simple:
+            return -1, -1
+        simple = cast(command.Simple, node)
+
+        if (len(simple.words) == 0 or len(simple.more_env) != 0 or
+                len(simple.redirects) != 0 or simple.typed_args is not None or
+                simple.block is not None):
+            return -1, -1
+        for arg_word in simple.words:
+            if not word_.IsPure(arg_word):
+                return -1, -1
+
+        ok, arg0, _ = word_.StaticEval(simple.words[0])
+        if not ok:
+            return -1, -1
+
+        # Procs and hay names shadow builtins, like in RunSimpleCommand()
+        if (self.procs.get(arg0) is not None or self.hay_state.Resolve(arg0) or
+                self.exec_opts._running_hay()):
+            return -1, -1
+        builtin_id = consts.LookupNormalBuiltin(arg0)
+        if builtin_id not in _OUTPUT_BUILTINS:
+            return -1, -1
+
+        try:
+            cmd_val = self.cmd_ev.EvalSimpleArgv(simple)
+        except error._ErrorWithLocation:
+            # e.g. FatalRuntime or FailGlob.  Nothing has changed, so fork,
+            # and let the child report it
+            return -1, -1
+
+        argv = cmd_val.argv
+        # printf -v sets a variable
+        if (builtin_id == builtin_i.printf and len(argv) > 1 and
+                argv[1].startswith('-')):
+            return -1, -1
+
+        # Output that fits in a pipe costs less than a file in $TMPDIR,
+        # which may be on disk, or limited by ulimit -f
+        num_bytes = 0
+        for s in argv:
+            num_bytes += len(s) + 1
+        if num_bytes > _PIPE_BUF_SIZE:
+            return -1, -1
+
+        w, r = self._OpenTempFile()
+        if w == -1:
+            return -1, -1
+
+        self.tracer.OnSimpleCommand(argv)
+
+        # echo hi 1>&w
+        redirects = [
+            RedirValue(Id.Redir_GreatAnd, loc.Missing, redir_loc.Fd(1),
+                       redirect_arg.CopyFd(w))
+        ]
+        status = -1
+        if self.PushRedirects(redirects):
+            with vm.ctx_Redirect(self, len(redirects)):
+                try:
+                    status = self.RunBuiltin(builtin_id, cmd_val)
+                except error.FatalRuntime as e:  # e.g. printf %x -1
+                    # Like a child process running ExecuteAndCatch()
+                    self.errfmt.PrettyPrintError(e, prefix='fatal: ')
+                    status = e.ExitStatus()
+        posix.close(w)
+
+        if status == -1:
+            posix.close(r)
+            return -1, -1
+        return r, status
+
     def RunPipeline(self, node, status_out):
         # type: (command.Pipeline, CommandStatus) -> None
 
-        pi = process.Pipeline(self.exec_opts.sigpipe_status_ok(),
-                              self.job_control, self.job_list)
-        #self.job_list.AddPipeline(pi)
-
         # initialized with CommandStatus.CreateNull()
         pipe_locs = []  # type: List[loc_t]
+        pipe_status = []  # type: List[int]
 
-        # First n-1 processes (which is empty when n == 1)
         n = len(node.children)
-        for i in xrange(n - 1):
-            child = node.children[i]
+        with dev.ctx_Tracer(self.tracer, 'pipeline', None):
+            # With shopt -s sigpipe_status_ok, 'echo hi | wc -l' forks once
+            # instead of twice, and 'echo hi | read x' doesn't fork at all
+            start = 0
+            first_fd = -1
+            if n > 1:
+                first_fd, first_status = self._RunFirstPart(node.children[0])
+                if first_fd != -1:
+                    pipe_locs.append(loc.Command(node.children[0]))
+                    pipe_status.append(first_status)
+                    start = 1
+
+            last_child = node.children[n - 1]
+            if start == n - 1:  # only the last part is left
+                with process.ctx_Pipe(self.fd_state, first_fd):
+                    self.cmd_ev.ExecuteAndCatch(last_child)
+                posix.close(first_fd)
+                pipe_status.append(self.cmd_ev.LastStatus())
 
-            # TODO: determine these locations at parse time?
-            pipe_locs.append(loc.Command(child))
+            else:
+                pi = process.Pipeline(self.exec_opts.sigpipe_status_ok(),
+                                      self.job_control, self.job_list)
+                #self.job_list.AddPipeline(pi)
 
-            p = self._MakeProcess(child)
-            p.Init_ParentPipeline(pi)
-            pi.Add(p)
+                # First n-1 processes (which is empty when n == 1)
+                for i in xrange(start, n - 1):
+                    child = node.children[i]
 
-        last_child = node.children[n - 1]
-        # Last piece of code is in THIS PROCESS.  'echo foo | read line; echo $line'
-        pi.AddLast((self.cmd_ev, last_child))
-        pipe_locs.append(loc.Command(last_child))
+                    # TODO: determine these locations at parse time?
+                    pipe_locs.append(loc.Command(child))
 
-        with dev.ctx_Tracer(self.tracer, 'pipeline', None):
-            pi.StartPipeline(self.waiter)
-            self.fg_pipeline = pi
-            status_out.pipe_status = pi.RunLastPart(self.waiter, self.fd_state)
-            self.fg_pipeline = None  # clear in case we didn't end up forking
+                    p = self._MakeProcess(child)
+                    if i == start and first_fd != -1:
+                        p.AddStateChange(process.StdinFromFile(first_fd))
+                    p.Init_ParentPipeline(pi)
+                    pi.Add(p)
+
+                # Last piece of code is in THIS PROCESS.  'echo foo | read line; echo $line'
+                pi.AddLast((self.cmd_ev, last_child))
+
+                pi.StartPipeline(self.waiter)
+                if first_fd != -1:
+                    posix.close(first_fd)  # the child has it now
+                self.fg_pipeline = pi
+                pipe_status.extend(pi.RunLastPart(self.waiter, self.fd_state))
+                self.fg_pipeline = None  # clear in case we didn't end up forking
+
+            pipe_locs.append(loc.Command(last_child))
 
+        status_out.pipe_status = pipe_status
         status_out.pipe_locs = pipe_locs
 
     def RunSubshell(self, node):
@@ -426,6 +601,64 @@ class ShellExecutor(vm._Executor):
 
         return p.RunProcess(self.waiter, trace.ForkWait)
 
+    def _ReadFile(self, r):
+        # type: (Redir) -> Tuple[Optional[str], int]
+        """Read the file for $(< file) in this process.
+
+        Returns (contents, status).  contents is None if the redirect word
+        couldn't be evaluated, e.g. $(< $undef) with set -u.  Then the caller
+        forks __cat < file as before, and the child reports the error.
+        """
+        try:
+            redir = self.cmd_ev.EvalRedirect(r)
+        except error._ErrorWithLocation:  # RedirectEval, FailGlob, etc.
+            return None, -1
+
+        # < always has a path
+        filename = cast(redirect_arg.Path, redir.arg).filename
+        try:
+            fd = posix.open(filename, O_RDONLY, 0)
+        except (IOError, OSError) as e:
+            self.errfmt.Print_("Can't open %r: %s" %
+                               (filename, pyutil.strerror(e)),
+                               blame_loc=r.op)
+            return '', 1
+
+        err_num = 0
+        try:
+            contents = read_osh.ReadAll(fd)
+        except pyos.ReadError as e:  # e.g. $(< dir)
+            err_num = e.err_num
+        posix.close(fd)
+
+        if err_num != 0:
+            # Status 2, like __cat in a child process
+            self.errfmt.Print_('osh I/O error: %s' % posix.strerror(err_num),
+                               blame_loc=r.op)
+            return '', 2
+        return contents, 0
+
+    def _SetCommandSubStatus(self, status, cs_part):
+        # type: (int, CommandSub) -> None
+        # OSH has the concept of aborting in the middle of a WORD.  We're not
+        # waiting until the command is over!
+        if self.exec_opts.command_sub_errexit():
+            if status != 0:
+                msg = 'Command Sub exited with status %d' % status
+                raise error.ErrExit(status, msg, loc.WordPart(cs_part))
+
+        else:
+            # Set a flag so we check errexit at the same time as bash.  Example:
+            #
+            # a=$(false)
+            # echo foo  # no matter what comes here, the flag is reset
+            #
+            # Set ONLY until this command node has finished executing.
+
+            # HACK: move this
+            self.cmd_ev.check_command_sub_status = True
+            self.mem.SetLastStatus(status)
+
     def RunCommandSub(self, cs_part):
         # type: (CommandSub) -> str
 
@@ -447,10 +680,16 @@ class ShellExecutor(vm._Executor):
             # Detect '< file'
             if (len(simple.words) == 0 and len(simple.redirects) == 1 and
                     simple.redirects[0].op.id == Id.Redir_Less):
+                # Usually we read the file in this process, without a fork()
+                contents, status = self._ReadFile(simple.redirects[0])
+                if contents is not None:
+                    self._SetCommandSubStatus(status, cs_part)
+                    return contents.rstrip('\n')
+
                 # change it to __cat < file
                 # TODO: change to 'internal cat' (issue 1013)
                 tok = lexer.DummyToken(Id.Lit_Chars, '__cat')
-                cat_word = CompoundWord([tok])
+                cat_word = CompoundWord([tok], eval_plan_e.Unknown)
                 # MUTATE the command.Simple node.  This will only be done the first
                 # time in the parent process.
                 simple.words.append(cat_word)
@@ -485,25 +724,7 @@ class ShellExecutor(vm._Executor):
         posix.close(r)
 
         status = p.Wait(self.waiter)
-
-        # OSH has the concept of aborting in the middle of a WORD.  We're not
-        # waiting until the command is over!
-        if self.exec_opts.command_sub_errexit():
-            if status != 0:
-                msg = 'Command Sub exited with status %d' % status
-                raise error.ErrExit(status, msg, loc.WordPart(cs_part))
-
-        else:
-            # Set a flag so we check errexit at the same time as bash.  Example:
-            #
-            # a=$(false)
-            # echo foo  # no matter what comes here, the flag is reset
-            #
-            # Set ONLY until this command node has finished executing.
-
-            # HACK: move this
-            self.cmd_ev.check_command_sub_status = True
-            self.mem.SetLastStatus(status)
+        self._SetCommandSubStatus(status, cs_part)
 
         # Runtime errors test case: # $("echo foo > $@")
         # Why rstrip()?
@@ -633,6 +854,10 @@ class ShellExecutor(vm._Executor):
             return
         self.fd_state.Pop()
 
+    def MaybeFlushStdout(self):
+        # type: () -> None
+        self.fd_state.MaybeFlushStdout()
+
     def PushProcessSub(self):
         # type: () -> None
         if len(self.clean_frame_pool):
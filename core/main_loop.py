@@ -337,7 +337,11 @@ def Batch(cmd_ev, c_parser, errfmt, cmd_flags=0):
     status = 0
     while True:
         try:
-            node = c_parser.ParseLogicalLine()  # can raise ParseError
+            # The LST is immutable after parsing, so the GC can treat it as a
+            # unit.  TODO: Interactive() could do this, but completion runs
+            # shell code while the line is being read.
+            with mylib.ctx_Region():
+                node = c_parser.ParseLogicalLine()  # can raise ParseError
             if node is None:  # EOF
                 c_parser.CheckForPendingHereDocs()  # can raise ParseError
                 break
@@ -381,7 +385,8 @@ def ParseWholeFile(c_parser):
     """
     children = []  # type: List[command_t]
     while True:
-        node = c_parser.ParseLogicalLine()  # can raise ParseError
+        with mylib.ctx_Region():
+            node = c_parser.ParseLogicalLine()  # can raise ParseError
         if node is None:  # EOF
             c_parser.CheckForPendingHereDocs()  # can raise ParseError
             break
@@ -0,0 +1,240 @@
+"""
+packed_list.py - Unboxed items for YSH lists of Int, Float, or Bool
+
+A value.List normally holds value_t objects, so a list of 10 million integers
+is 10 million value.Int objects.  When every item has the same primitive type,
+the List can store them unboxed in List.packed, and List.items is None.
+
+- Reading an item, like L[i] or a for loop, boxes only that item.
+- len(), indexing, setvar L[i] = x, append, and slicing work on the unboxed
+  items.
+- Code that needs the List[value_t] calls Items(), which boxes the whole list
+  in place.  That happens when the list escapes to code that doesn't know
+  about packing, or when an item of another type is stored.
+
+So packing isn't visible to YSH code.
+"""
+
+from _devbuild.gen.value_asdl import (value, value_e, value_t, PackedItems)
+
+from typing import List, Optional, cast
+
+# Lists shorter than this aren't packed, because boxing them again is likely,
+# and saves little memory anyway
+_MIN_PACKED = 8
+
+
+def _Kind(val):
+    # type: (value_t) -> int
+    """Return the kind of packed storage for a value, or -1."""
+    tag = val.tag()
+    if tag in (value_e.Int, value_e.Float, value_e.Bool):
+        return tag
+    return -1
+
+
+def _NewPacked(kind):
+    # type: (int) -> PackedItems
+    if kind == value_e.Float:
+        return PackedItems(kind, None, [])
+    else:
+        return PackedItems(kind, [], None)
+
+
+def _PackOne(p, val):
+    # type: (PackedItems, value_t) -> None
+    """Append an item of the same kind."""
+    UP_val = val
+    if p.kind == value_e.Int:
+        p.ints.append(cast(value.Int, UP_val).i)
+    elif p.kind == value_e.Float:
+        p.floats.append(cast(value.Float, UP_val).f)
+    else:
+        p.ints.append(1 if cast(value.Bool, UP_val).b else 0)
+
+
+def _Box(p, i):
+    # type: (PackedItems, int) -> value_t
+    """Box one item.  Raises IndexError like List[value_t]."""
+    if p.kind == value_e.Int:
+        return value.Int(p.ints[i])
+    elif p.kind == value_e.Float:
+        return value.Float(p.floats[i])
+    else:
+        return value.Bool(p.ints[i] != 0)
+
+
+def _Length(p):
+    # type: (PackedItems) -> int
+    if p.kind == value_e.Float:
+        return len(p.floats)
+    else:
+        return len(p.ints)
+
+
+def _TryPack(items):
+    # type: (List[value_t]) -> Optional[PackedItems]
+    if len(items) < _MIN_PACKED:
+        return None
+
+    kind = _Kind(items[0])
+    if kind == -1:
+        return None
+    for item in items:
+        if item.tag() != kind:
+            return None
+
+    p = _NewPacked(kind)
+    for item in items:
+        _PackOne(p, item)
+    return p
+
+
+def NewList(items):
+    # type: (List[value_t]) -> value.List
+    """Make a List, packing the items if they're homogeneous.
+
+    For list literals, and other places that make a big list at once.
+    """
+    p = _TryPack(items)
+    if p:
+        return value.List(None, p)
+    return value.List(items, None)
+
+
+def FromRange(lower, upper):
+    # type: (int, int) -> value.List
+    """Like list(lower .. upper), without boxing each Int."""
+    if upper - lower < _MIN_PACKED:
+        items = []  # type: List[value_t]
+        for i in xrange(lower, upper):
+            items.append(value.Int(i))
+        return value.List(items, None)
+
+    ints = []  # type: List[int]
+    for i in xrange(lower, upper):
+        ints.append(i)
+    return value.List(None, PackedItems(value_e.Int, ints, None))
+
+
+def Items(li):
+    # type: (value.List) -> List[value_t]
+    """Return the boxed items of the List, which the caller may mutate."""
+    p = li.packed
+    if p:
+        n = _Length(p)
+        items = []  # type: List[value_t]
+        for i in xrange(n):
+            items.append(_Box(p, i))
+        li.items = items
+        li.packed = None
+    return li.items
+
+
+def Len(li):
+    # type: (value.List) -> int
+    p = li.packed
+    if p:
+        return _Length(p)
+    return len(li.items)
+
+
+def GetItem(li, i):
+    # type: (value.List, int) -> value_t
+    """Like L[i], with negative indices.  Raises IndexError."""
+    p = li.packed
+    if p:
+        return _Box(p, i)
+    return li.items[i]
+
+
+def SetItem(li, i, val):
+    # type: (value.List, int, value_t) -> None
+    """Like setvar L[i] = val.  Raises IndexError."""
+    p = li.packed
+    if p and _Kind(val) == p.kind:
+        UP_val = val
+        if p.kind == value_e.Int:
+            p.ints[i] = cast(value.Int, UP_val).i
+        elif p.kind == value_e.Float:
+            p.floats[i] = cast(value.Float, UP_val).f
+        else:
+            p.ints[i] = 1 if cast(value.Bool, UP_val).b else 0
+        return
+
+    Items(li)[i] = val
+
+
+def Append(li, val):
+    # type: (value.List, value_t) -> None
+    p = li.packed
+    if p:
+        if _Kind(val) == p.kind:
+            _PackOne(p, val)
+            return
+    else:
+        # Pack lists that are built with append, once they're big enough
+        items = li.items
+        if len(items) == _MIN_PACKED - 1:
+            items.append(val)
+            p = _TryPack(items)
+            if p:
+                li.items = None
+                li.packed = p
+            return
+
+    Items(li).append(val)
+
+
+def Pop(li):
+    # type: (value.List) -> value_t
+    """Like L->pop().  Raises IndexError."""
+    p = li.packed
+    if p:
+        val = _Box(p, -1)
+        if p.kind == value_e.Float:
+            p.floats.pop()
+        else:
+            p.ints.pop()
+        return val
+
+    return li.items.pop()
+
+
+def Slice(li, lower, upper):
+    # type: (value.List, int, int) -> value.List
+    """Like L[lower:upper]"""
+    p = li.packed
+    if p:
+        if p.kind == value_e.Float:
+            p2 = PackedItems(p.kind, None, p.floats[lower:upper])
+        else:
+            p2 = PackedItems(p.kind, p.ints[lower:upper], None)
+        return value.List(None, p2)
+
+    return value.List(li.items[lower:upper], None)
+
+
+def Concat(left, right):
+    # type: (value.List, value.List) -> value.List
+    """Like L1 ++ L2.  Neither list is boxed in place."""
+    p1 = left.packed
+    p2 = right.packed
+    if p1 is not None and p2 is not None and p1.kind == p2.kind:
+        if p1.kind == value_e.Float:
+            floats = []  # type: List[float]
+            floats.extend(p1.floats)
+            floats.extend(p2.floats)
+            return value.List(None, PackedItems(p1.kind, None, floats))
+        else:
+            ints = []  # type: List[int]
+            ints.extend(p1.ints)
+            ints.extend(p2.ints)
+            return value.List(None, PackedItems(p1.kind, ints, None))
+
+    items = []  # type: List[value_t]
+    for i in xrange(Len(left)):
+        items.append(GetItem(left, i))
+    for i in xrange(Len(right)):
+        items.append(GetItem(right, i))
+    return value.List(items, None)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python2
+"""
+packed_list_test.py: Tests for packed_list.py
+"""
+from __future__ import print_function
+
+import unittest
+
+from _devbuild.gen.value_asdl import value, value_e
+from core import packed_list  # module under test
+
+
+def _Ints(n):
+    return [value.Int(i) for i in xrange(n)]
+
+
+class PackedListTest(unittest.TestCase):
+
+    def testNewList(self):
+        # Short lists aren't packed
+        li = packed_list.NewList(_Ints(3))
+        self.assertEqual(None, li.packed)
+
+        li = packed_list.NewList(_Ints(10))
+        self.assertEqual(None, li.items)
+        self.assertEqual([0, 1, 2, 3, 4, 5, 6, 7, 8, 9], li.packed.ints)
+        self.assertEqual(10, packed_list.Len(li))
+        self.assertEqual(9, packed_list.GetItem(li, -1).i)
+
+        # Mixed lists aren't packed
+        items = _Ints(10)
+        items.append(value.Str('x'))
+        li = packed_list.NewList(items)
+        self.assertEqual(None, li.packed)
+
+        li = packed_list.NewList([value.Bool(i % 2 == 0) for i in xrange(8)])
+        self.assertEqual(value_e.Bool, li.packed.kind)
+        self.assertEqual(True, packed_list.GetItem(li, 0).b)
+        self.assertEqual(False, packed_list.GetItem(li, 1).b)
+
+    def testAppend(self):
+        li = value.List([], None)
+        for i in xrange(7):
+            packed_list.Append(li, value.Float(i + 0.5))
+        self.assertEqual(None, li.packed)
+
+        # The 8th item packs the list
+        packed_list.Append(li, value.Float(7.5))
+        self.assertEqual(None, li.items)
+        self.assertEqual(8, packed_list.Len(li))
+
+        self.assertEqual(7.5, packed_list.Pop(li).f)
+        self.assertEqual(7, packed_list.Len(li))
+
+        # An item of another type boxes the list
+        packed_list.Append(li, value.Int(42))
+        self.assertEqual(None, li.packed)
+        self.assertEqual(8, len(li.items))
+        self.assertEqual(0.5, li.items[0].f)
+
+    def testSetItem(self):
+        li = packed_list.NewList(_Ints(8))
+
+        packed_list.SetItem(li, -1, value.Int(99))
+        self.assertEqual(99, li.packed.ints[7])
+
+        self.assertRaises(IndexError, packed_list.SetItem, li, 8,
+                          value.Int(0))
+
+        packed_list.SetItem(li, 0, value.Str('x'))
+        self.assertEqual(None, li.packed)
+        self.assertEqual('x', li.items[0].s)
+        self.assertEqual(99, li.items[7].i)
+
+    def testSliceAndConcat(self):
+        li = packed_list.NewList(_Ints(10))
+
+        s = packed_list.Slice(li, 2, 4)
+        self.assertEqual([2, 3], s.packed.ints)
+
+        c = packed_list.Concat(li, li)
+        self.assertEqual(20, packed_list.Len(c))
+        self.assertEqual(value_e.Int, c.packed.kind)
+
+        # Concatenating different kinds doesn't box the operands
+        other = value.List([value.Str('x')], None)
+        c = packed_list.Concat(li, other)
+        self.assertEqual(11, len(c.items))
+        self.assertEqual(None, li.items)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,6 +11,7 @@ from __future__ import print_function
 
 from errno import EACCES, EBADF, ECHILD, EINTR, ENOENT, ENOEXEC
 import fcntl as fcntl_
+import time as time_
 from fcntl import F_DUPFD, F_GETFD, F_SETFD, FD_CLOEXEC
 from signal import (SIG_DFL, SIG_IGN, SIGINT, SIGPIPE, SIGQUIT, SIGTSTP,
                     SIGTTOU, SIGTTIN, SIGWINCH)
@@ -85,6 +86,10 @@ NO_FD = -1
 # bookkeeping), and dash/zsh (10) and mksh (24)
 _SHELL_MIN_FD = 100
 
+# How long builtin output can stay in the stdout buffer while a loop runs, in
+# seconds.  Note: the C++ time_.time() has a resolution of one second.
+_MAX_STDOUT_DELAY = 1.0
+
 # Style for 'jobs' builtin
 STYLE_DEFAULT = 0
 STYLE_LONG = 1
@@ -165,6 +170,14 @@ class _FdFrame(object):
         del self.saved[:]  # like list.clear() in Python 3.3
         del self.need_wait[:]
 
+    def ChangesStdio(self):
+        # type: () -> bool
+        """Does this frame redirect stdout or stderr?"""
+        for rf in self.saved:
+            if rf.orig_fd in (1, 2):
+                return True
+        return False
+
     def __repr__(self):
         # type: () -> str
         return '<_FdFrame %s>' % self.saved
@@ -201,6 +214,76 @@ class FdState(object):
         self.tracer = tracer
         self.waiter = waiter
 
+        self.buffer_stdout = False
+        # When a builtin first left output in the buffer, or -1.0
+        self.buffered_since = -1.0
+        # The first error writing to stdout, or 0.  After one, builtins flush
+        # right away, and the shell exits with failure.
+        self.stdout_errno = 0
+        self.UpdateStdoutBuffering()
+
+    def UpdateStdoutBuffering(self):
+        # type: () -> None
+        """Decide whether builtins can leave their output in the stdout buffer.
+
+        Flushing after every builtin costs a write() per 'echo'.  When nobody
+        can observe the delay, we instead flush before fork() and exec(),
+        before changing descriptors, before 'read' and 'wait', and on exit.
+        Long-running loops also flush, see MaybeFlushStdout().
+
+        Called when stdout or stderr may have changed.
+        """
+        self.buffer_stdout = pyos.StdoutCanBuffer()
+
+    def CanBufferStdout(self):
+        # type: () -> bool
+        return self.buffer_stdout and self.stdout_errno == 0
+
+    def NoteBufferedStdout(self):
+        # type: () -> None
+        """Called when a builtin leaves its output in the buffer."""
+        if self.buffered_since < 0.0:
+            self.buffered_since = time_.time()
+
+    def CheckStdoutError(self, blame_loc):
+        # type: (Optional[loc_t]) -> int
+        """Report a failed write to stdout, e.g. EPIPE.
+
+        The write may have flushed output that an earlier builtin left in the
+        buffer.  blame_loc is None when the shell exits.  Returns the error
+        number, or 0.
+        """
+        err_num = pyos.TakeStdoutError()
+        if err_num != 0:
+            msg = 'write error: %s' % posix.strerror(err_num)
+            if blame_loc:
+                self.errfmt.PrintMessage(msg, blame_loc)
+            else:
+                print_stderr('oils: %s' % msg)
+            if self.stdout_errno == 0:
+                self.stdout_errno = err_num
+        return err_num
+
+    def ForgetStdoutError(self):
+        # type: () -> None
+        """Called in a child process, which has its own stdout."""
+        unused = pyos.TakeStdoutError()
+        self.stdout_errno = 0
+
+    def MaybeFlushStdout(self):
+        # type: () -> None
+        """Flush output that has been buffered for a while.
+
+        Called on every loop iteration, so a long-running loop doesn't hold
+        back earlier output.  Otherwise it would be lost if the shell is killed
+        by a signal.
+        """
+        if self.buffered_since < 0.0:
+            return
+        if time_.time() - self.buffered_since >= _MAX_STDOUT_DELAY:
+            pyos.FlushStdout()
+            self.buffered_since = -1.0
+
     def Open(self, path):
         # type: (str) -> mylib.LineReader
         """Opens a path for read, but moves it out of the reserved 3-9 fd
@@ -492,6 +575,10 @@ class FdState(object):
         """Apply a group of redirects and remember to undo them."""
 
         #log('> fd_state.Push %s', redirects)
+
+        # Buffered output goes to the descriptor it was written for
+        pyos.FlushStdout()
+
         new_frame = _FdFrame()
         self.stack.append(new_frame)
         self.cur_frame = new_frame
@@ -505,6 +592,9 @@ class FdState(object):
                     self.Pop()
                     return False  # for bad descriptor, etc.
         #log('done applying %d redirects', len(redirects))
+
+        if new_frame.ChangesStdio():
+            self.UpdateStdoutBuffering()
         return True
 
     def PushStdinFromPipe(self, r):
@@ -525,6 +615,8 @@ class FdState(object):
 
     def Pop(self):
         # type: () -> None
+        pyos.FlushStdout()
+
         frame = self.stack.pop()
         #log('< Pop %s', frame)
         for rf in reversed(frame.saved):
@@ -548,6 +640,9 @@ class FdState(object):
                 posix.close(rf.saved_fd)
                 #log('dup2 %s %s', saved, orig)
 
+        if frame.ChangesStdio():
+            self.UpdateStdoutBuffering()
+
         # Wait for here doc processes to finish.
         for proc in frame.need_wait:
             unused_status = proc.Wait(self.waiter)
@@ -594,6 +689,26 @@ class StdinFromPipe(ChildStateChange):
         #log('child CLOSE w %d pid=%d', self.w, posix.getpid())
 
 
+class StdinFromFile(ChildStateChange):
+    """For the first process of a pipeline whose first part ran in the shell.
+
+    See ShellExecutor.RunPipeline().
+    """
+
+    def __init__(self, fd):
+        # type: (int) -> None
+        self.fd = fd
+
+    def __repr__(self):
+        # type: () -> str
+        return '<StdinFromFile %d>' % self.fd
+
+    def Apply(self):
+        # type: () -> None
+        posix.dup2(self.fd, 0)
+        posix.close(self.fd)  # close after dup
+
+
 class StdoutToPipe(ChildStateChange):
 
     def __init__(self, r, pipe_write_fd):
@@ -702,6 +817,7 @@ class ExternalProgram(object):
                         #self.debug_f.log('Not hijacking %s (%r)', argv, line)
                         pass
 
+        pyos.FlushStdout()
         try:
             posix.execve(argv0_path, argv, environ)
         except (IOError, OSError) as e:
@@ -791,11 +907,17 @@ class ExternalThunk(Thunk):
 class SubProgramThunk(Thunk):
     """A subprogram that can be executed in another process."""
 
-    def __init__(self, cmd_ev, node, trap_state, inherit_errexit=True):
-        # type: (CommandEvaluator, command_t, trap_osh.TrapState, bool) -> None
+    def __init__(self,
+                 cmd_ev,
+                 node,
+                 trap_state,
+                 fd_state,
+                 inherit_errexit=True):
+        # type: (CommandEvaluator, command_t, trap_osh.TrapState, FdState, bool) -> None
         self.cmd_ev = cmd_ev
         self.node = node
         self.trap_state = trap_state
+        self.fd_state = fd_state
         self.inherit_errexit = inherit_errexit  # for bash errexit compatibility
 
     def UserString(self):
@@ -815,6 +937,10 @@ class SubProgramThunk(Thunk):
         # signal handlers aren't inherited
         self.trap_state.ClearForSubProgram()
 
+        # stdout may be a pipe now, e.g. for $(echo hi) or 'echo hi | wc -l'
+        self.fd_state.ForgetStdoutError()
+        self.fd_state.UpdateStdoutBuffering()
+
         # NOTE: may NOT return due to exec().
         if not self.inherit_errexit:
             self.cmd_ev.mutable_opts.DisableErrExit()
@@ -839,6 +965,9 @@ class SubProgramThunk(Thunk):
         # If ProcessInit() doesn't turn off buffering, this is needed before
         # _exit()
         pyos.FlushStdout()
+        self.fd_state.CheckStdoutError(None)
+        if self.fd_state.stdout_errno != 0 and status == 0:
+            status = 1
 
         # We do NOT want to raise SystemExit here.  Otherwise dev.Tracer::Pop()
         # gets called in BOTH processes.
@@ -1019,6 +1148,9 @@ class Process(Job):
     def StartProcess(self, why):
         # type: (trace_t) -> int
         """Start this process with fork(), handling redirects."""
+        # Otherwise the child would write the buffered output a second time
+        pyos.FlushStdout()
+
         pid = posix.fork()
         if pid < 0:
             # When does this happen?
@@ -1,6 +1,7 @@
 #!/usr/bin/env python2
 """process_test.py: Tests for process.py."""
 
+import errno
 import os
 import unittest
 
@@ -106,6 +107,53 @@ class ProcessTest(unittest.TestCase):
         self.assertEqual('one', line1)
         self.assertEqual('one', line2)
 
+    def testStdoutBuffering(self):
+        to_file = RedirValue(Id.Redir_Great, runtime.NO_SPID, redir_loc.Fd(1),
+                             redirect_arg.Path('_tmp/buffered.txt'))
+        to_stdout = RedirValue(Id.Redir_GreatAnd, runtime.NO_SPID,
+                               redir_loc.Fd(2), redirect_arg.CopyFd(1))
+        to_null = RedirValue(Id.Redir_Great, runtime.NO_SPID, redir_loc.Fd(1),
+                             redirect_arg.Path('/dev/null'))
+        orig = self.fd_state.buffer_stdout
+
+        self.fd_state.Push([to_file])
+        self.assertEqual(True, self.fd_state.buffer_stdout)
+
+        # Output would be interleaved with stderr
+        self.fd_state.Push([to_stdout])
+        self.assertEqual(False, self.fd_state.buffer_stdout)
+        self.fd_state.Pop()
+        self.assertEqual(True, self.fd_state.buffer_stdout)
+
+        # Character devices aren't buffered
+        self.fd_state.Push([to_null])
+        self.assertEqual(False, self.fd_state.buffer_stdout)
+        self.fd_state.Pop()
+
+        self.fd_state.Pop()
+        self.assertEqual(orig, self.fd_state.buffer_stdout)
+
+        # Loops flush output that has been buffered for a while
+        self.fd_state.NoteBufferedStdout()
+        self.assertTrue(self.fd_state.buffered_since >= 0.0)
+        self.fd_state.buffered_since -= process._MAX_STDOUT_DELAY
+        self.fd_state.MaybeFlushStdout()
+        self.assertEqual(-1.0, self.fd_state.buffered_since)
+
+    def testStdoutError(self):
+        self.assertEqual(0, self.fd_state.CheckStdoutError(None))
+
+        # A failed write is reported once, and turns off buffering
+        pyos._stdout_errno = errno.EPIPE
+        self.assertEqual(errno.EPIPE, self.fd_state.CheckStdoutError(None))
+        self.assertEqual(0, self.fd_state.CheckStdoutError(None))
+        self.assertEqual(errno.EPIPE, self.fd_state.stdout_errno)
+        self.assertEqual(False, self.fd_state.CanBufferStdout())
+
+        # A child process has its own stdout
+        self.fd_state.ForgetStdoutError()
+        self.assertEqual(0, self.fd_state.stdout_errno)
+
     def testProcess(self):
         # 3 fds.  Does Python open it?  Shell seems to have it too.  Maybe it
         # inherits from the shell.
@@ -165,9 +213,12 @@ class ProcessTest(unittest.TestCase):
         node2 = _CommandNode('head', self.arena)
         node3 = _CommandNode('sort --reverse', self.arena)
 
-        thunk1 = process.SubProgramThunk(cmd_ev, node1, self.trap_state)
-        thunk2 = process.SubProgramThunk(cmd_ev, node2, self.trap_state)
-        thunk3 = process.SubProgramThunk(cmd_ev, node3, self.trap_state)
+        thunk1 = process.SubProgramThunk(cmd_ev, node1, self.trap_state,
+                                          self.fd_state)
+        thunk2 = process.SubProgramThunk(cmd_ev, node2, self.trap_state,
+                                          self.fd_state)
+        thunk3 = process.SubProgramThunk(cmd_ev, node3, self.trap_state,
+                                          self.fd_state)
 
         p = process.Pipeline(False, self.job_control, self.job_list)
         p.Add(Process(thunk1, self.job_control, self.job_list, self.tracer))
@@ -10,6 +10,7 @@ import pwd
 import resource
 import signal
 import select
+import stat
 import sys
 import termios  # for read -n
 import time
@@ -28,10 +29,95 @@ EOF_SENTINEL = 256  # bigger than any byte
 NEWLINE_CH = 10  # ord('\n')
 
 
+# The error number of a failed write to stdout, or 0.  See TakeStdoutError().
+_stdout_errno = 0
+
+
 def FlushStdout():
     # type: () -> None
-    """Flush CPython buffers."""
-    sys.stdout.flush()
+    """Flush CPython buffers.
+
+    A write error is remembered rather than raised, because many callers
+    flush output that a builtin wrote earlier.
+    """
+    global _stdout_errno
+    try:
+        sys.stdout.flush()
+    except IOError as e:
+        if _stdout_errno == 0:
+            _stdout_errno = e.errno
+
+
+def TakeStdoutError():
+    # type: () -> int
+    """Return the error number of a failed write to stdout, and forget it.
+
+    Returns 0 if all writes since the last call succeeded.
+    """
+    global _stdout_errno
+    err_num = _stdout_errno
+    _stdout_errno = 0
+    return err_num
+
+
+def StdoutCanBuffer():
+    # type: () -> bool
+    """Is stdout a pipe or regular file that isn't also stderr?
+
+    If so, a delay in writing to it can't be observed, except by processes
+    that we fork() or wait for.  Terminals, /dev/full, closed descriptors,
+    and 2>&1 return False.
+    """
+    try:
+        st1 = posix.fstat(1)
+    except OSError:
+        return False
+    if not stat.S_ISFIFO(st1.st_mode) and not stat.S_ISREG(st1.st_mode):
+        return False
+
+    try:
+        st2 = posix.fstat(2)
+    except OSError:
+        return True  # stderr is closed
+    return st1.st_dev != st2.st_dev or st1.st_ino != st2.st_ino
+
+
+def FileSize(fd):
+    # type: (int) -> int
+    """Return the size of the regular file open on fd, or -1.
+
+    -1 means it's not a regular file, or we can't tell, e.g. a pipe or a
+    closed descriptor.  Used to read a whole file with one read().
+    """
+    try:
+        st = posix.fstat(fd)
+    except OSError:
+        return -1
+    if not stat.S_ISREG(st.st_mode):
+        return -1
+    return st.st_size
+
+
+def SeekBack(fd, n):
+    # type: (int, int) -> bool
+    """Move the offset of a regular file back by n bytes.
+
+    Returns False if fd isn't a regular file, so the bytes can't be read
+    again.  Used to give back what a builtin read past the last line it
+    consumed.
+    """
+    try:
+        st = posix.fstat(fd)
+    except OSError:
+        return False
+    if not stat.S_ISREG(st.st_mode):
+        return False
+
+    try:
+        posix.lseek(fd, -n, 1)  # SEEK_CUR
+    except OSError:
+        return False
+    return True
 
 
 def WaitPid(waitpid_options):
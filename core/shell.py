@@ -59,6 +59,7 @@ from builtin import pure_ysh
 from builtin import readline_osh
 from builtin import read_osh
 from builtin import trap_osh
+from builtin import tsv8_ysh
 
 from builtin import func_eggex
 from builtin import func_hay
@@ -72,6 +73,7 @@ from builtin import method_str
 
 from ysh import expr_eval
 
+from osh import cmd_closure
 from osh import cmd_eval
 from osh import glob_
 from osh import history
@@ -537,6 +539,9 @@ def Main(
     cmd_ev = cmd_eval.CommandEvaluator(mem, exec_opts, errfmt, procs, assign_b,
                                        arena, cmd_deps, trap_state,
                                        signal_safe)
+    if mylib.PYTHON:
+        if environ.get('OILS_CLOSURES') == '1':
+            cmd_ev.closures = cmd_closure.Compiler(cmd_ev)
 
     # PromptEvaluator rendering is needed in non-interactive shells for @P.
     prompt_ev = prompt.Evaluator(lang, version_str, parse_ctx, mem)
@@ -656,8 +661,9 @@ def Main(
 
     b[builtin_i.times] = misc_osh.Times()
 
-    b[builtin_i.json] = json_ysh.Json(mem, errfmt, False)
-    b[builtin_i.j8] = json_ysh.Json(mem, errfmt, True)
+    b[builtin_i.json] = json_ysh.Json(mem, cmd_ev, errfmt, False)
+    b[builtin_i.j8] = json_ysh.Json(mem, cmd_ev, errfmt, True)
+    b[builtin_i.tsv8] = tsv8_ysh.Tsv8(mem, cmd_ev, errfmt)
 
     ### Process builtins
     b[builtin_i.exec_] = process_osh.Exec(mem, ext_prog, fd_state, search_path,
@@ -775,6 +781,8 @@ def Main(
         # identical to command sub
         'captureStdout': None,
         'promptVal': method_io.PromptVal(),
+        # for line in (_io->lines()) { ... }
+        'lines': method_io.Lines(),
         # like \w - working dir
         'getcwd': None,
         # like \u
@@ -1090,5 +1098,12 @@ def Main(
     mut_status = IntParamBox(status)
     cmd_ev.MaybeRunExitTrap(mut_status)
 
+    # Builtins may have left output in the buffer.  Flush it here, so write
+    # errors are reported.
+    pyos.FlushStdout()
+    fd_state.CheckStdoutError(None)
+    if fd_state.stdout_errno != 0 and mut_status.i == 0:
+        mut_status.i = 1
+
     # NOTE: We haven't closed the file opened with fd_state.Open
     return mut_status.i
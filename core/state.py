@@ -30,6 +30,7 @@ from frontend import location
 from frontend import match
 from mycpp import mylib
 from mycpp.mylib import log, print_stderr, tagswitch, iteritems, NewDict
+from osh import sparse_array
 from osh import split
 from pylib import os_path
 from pylib import path_stat
@@ -742,6 +743,11 @@ if mylib.PYTHON:
                     cell_json['type'] = 'BashArray'
                     cell_json['value'] = val.strs
 
+                elif case(value_e.SparseArray):
+                    val = cast(value.SparseArray, cell.val)
+                    cell_json['type'] = 'SparseArray'
+                    cell_json['value'] = val.d
+
                 elif case(value_e.BashAssoc):
                     val = cast(value.BashAssoc, cell.val)
                     cell_json['type'] = 'BashAssoc'
@@ -752,6 +758,24 @@ if mylib.PYTHON:
         return vars_json
 
 
+# Each distinct name looked up with dynamic scope gets an entry, e.g. with
+# ${!ref} or eval, so we don't let the cache grow without bound.
+_MAX_LOOKUP_ENTRIES = 1000
+
+
+class _LookupEntry(object):
+    """Cached result of a dynamic scope lookup.
+
+    It's valid while Mem.bind_version is equal to 'version'.
+    """
+
+    def __init__(self, version, cell, name_map):
+        # type: (int, Optional[Cell], Dict[str, Cell]) -> None
+        self.version = version
+        self.cell = cell
+        self.name_map = name_map
+
+
 def _GetWorkingDir():
     # type: () -> str
     """Fallback for pwd and $PWD when there's no 'cd' and no inherited $PWD."""
@@ -1036,6 +1060,16 @@ class Mem(object):
         frame = NewDict()  # type: Dict[str, Cell]
         self.var_stack = [frame]
 
+        # Dynamic scope lookups walk var_stack from the top, which is slow in
+        # deep call stacks.  So we cache them, until a frame is popped, or a
+        # binding is added or removed.  Pushing an empty frame doesn't change
+        # any lookup.
+        #
+        # Entries refer to cells and frames, so we clear the cache when a frame
+        # is popped or a binding is removed, and we bound its size.
+        self.bind_version = 0
+        self.lookup_cache = {}  # type: Dict[str, _LookupEntry]
+
         # The debug_stack isn't strictly necessary for execution.  We use it
         # for crash dumps and for 3 parallel arrays: BASH_SOURCE, FUNCNAME, and
         # BASH_LINENO.
@@ -1258,6 +1292,7 @@ class Mem(object):
         self.debug_stack.pop()
 
         self.var_stack.pop()
+        self._DropLookups()
 
         if should_pop_argv_stack:
             self.argv_stack.pop()
@@ -1302,9 +1337,16 @@ class Mem(object):
         frame = NewDict()  # type: Dict[str, Cell]
         self.var_stack.append(frame)
 
+    def _DropLookups(self):
+        # type: () -> None
+        """Invalidate cached lookups, and release the cells they refer to."""
+        self.bind_version += 1
+        self.lookup_cache.clear()
+
     def PopTemp(self):
         # type: () -> None
         self.var_stack.pop()
+        self._DropLookups()
 
     def TopNamespace(self):
         # type: () -> Dict[str, Cell]
@@ -1389,13 +1431,29 @@ class Mem(object):
           name_map: The name_map it should be set to or deleted from.
         """
         if which_scopes == scope_e.Dynamic:
+            entry = self.lookup_cache.get(name)
+            if entry and entry.version == self.bind_version:
+                return entry.cell, entry.name_map
+
+            cell = None  # type: Optional[Cell]
+            name_map = self.var_stack[0]  # set in global name_map
             for i in xrange(len(self.var_stack) - 1, -1, -1):
-                name_map = self.var_stack[i]
-                if name in name_map:
-                    cell = name_map[name]
-                    return cell, name_map
-            no_cell = None  # type: Optional[Cell]
-            return no_cell, self.var_stack[0]  # set in global name_map
+                frame = self.var_stack[i]
+                if name in frame:
+                    cell = frame[name]
+                    name_map = frame
+                    break
+
+            if entry:  # reuse it
+                entry.version = self.bind_version
+                entry.cell = cell
+                entry.name_map = name_map
+            else:
+                if len(self.lookup_cache) >= _MAX_LOOKUP_ENTRIES:
+                    self.lookup_cache.clear()
+                self.lookup_cache[name] = _LookupEntry(self.bind_version,
+                                                       cell, name_map)
+            return cell, name_map
 
         if which_scopes == scope_e.LocalOnly:
             name_map = self.var_stack[-1]
@@ -1518,6 +1576,7 @@ class Mem(object):
                 if cell is None:
                     cell = Cell(False, False, False, val)
                     frame[yval.name] = cell
+                    self.bind_version += 1
                 else:
                     cell.val = val
 
@@ -1543,6 +1602,7 @@ class Mem(object):
         else:
             cell = Cell(False, False, False, val)
             name_map[lval.name] = cell
+            self.bind_version += 1
 
     def SetNamed(self, lval, val, which_scopes, flags=0):
         # type: (LeftName, value_t, scope_t, int) -> None
@@ -1598,6 +1658,7 @@ class Mem(object):
             cell = Cell(bool(flags & SetExport), bool(flags & SetReadOnly),
                         bool(flags & SetNameref), val)
             name_map[cell_name] = cell
+            self.bind_version += 1
 
         # Maintain invariant that only strings and undefined cells can be
         # exported.
@@ -1695,6 +1756,11 @@ class Mem(object):
 
                         if 0 <= index and index < n:
                             strs[index] = rval.s
+                        elif sparse_array.ShouldBeSparse(n, index):
+                            # a[1000000]=x shouldn't allocate a huge list
+                            sp = sparse_array.FromDense(strs)
+                            sparse_array.SetItem(sp, index, rval.s)
+                            cell.val = sp
                         else:
                             # Fill it in with None.  It could look like this:
                             # ['1', 2, 3, None, None, '4', None]
@@ -1707,6 +1773,13 @@ class Mem(object):
                             strs[lval.index] = rval.s
                         return
 
+                    elif case2(value_e.SparseArray):
+                        sp = cast(value.SparseArray, UP_cell_val)
+                        if not sparse_array.SetItem(sp, lval.index, rval.s):
+                            e_die("Index %d is out of bounds" % lval.index,
+                                  left_loc)
+                        return
+
                 # This could be an object, eggex object, etc.  It won't be
                 # BashAssoc shouldn because we query IsBashAssoc before evaluating
                 # sh_lhs.  Could conslidate with s[i] case above
@@ -1742,14 +1815,20 @@ class Mem(object):
     def _BindNewArrayWithEntry(self, name_map, lval, val, flags):
         # type: (Dict[str, Cell], sh_lvalue.Indexed, value.Str, int) -> None
         """Fill 'name_map' with a new indexed array entry."""
-        no_str = None  # type: Optional[str]
-        items = [no_str] * lval.index
-        items.append(val.s)
-        new_value = value.BashArray(items)
+        if sparse_array.ShouldBeSparse(0, lval.index):
+            d = {}  # type: Dict[int, str]
+            d[lval.index] = val.s
+            new_value = value.SparseArray(d, lval.index)  # type: value_t
+        else:
+            no_str = None  # type: Optional[str]
+            items = [no_str] * lval.index
+            items.append(val.s)
+            new_value = value.BashArray(items)
 
         # arrays can't be exported; can't have BashAssoc flag
         readonly = bool(flags & SetReadOnly)
         name_map[lval.name] = Cell(False, readonly, False, new_value)
+        self.bind_version += 1
 
     def InternalSetGlobal(self, name, new_val):
         # type: (str, value_t) -> None
@@ -1788,7 +1867,7 @@ class Mem(object):
         if name == 'ARGV':
             items = [value.Str(s)
                      for s in self.GetArgv()]  # type: List[value_t]
-            return value.List(items)
+            return value.List(items, None)
 
         # "Registers"
         if name == '_status':
@@ -1810,11 +1889,11 @@ class Mem(object):
 
         if name == '_pipeline_status':
             items = [value.Int(i) for i in self.pipe_status[-1]]
-            return value.List(items)
+            return value.List(items, None)
 
         if name == '_process_sub_status':  # Oil naming convention
             items = [value.Int(i) for i in self.process_sub_status[-1]]
-            return value.List(items)
+            return value.List(items, None)
 
         if name == 'BASH_REMATCH':
             return value.BashArray(self.regex_matches[-1])  # top of stack
@@ -1971,6 +2050,7 @@ class Mem(object):
                 # Make variables in higher scopes visible.
                 # example: test/spec.sh builtin-vars -r 24 (ble.sh)
                 mylib.dict_erase(name_map, cell_name)
+                self._DropLookups()
 
                 # alternative that some shells use:
                 #   name_map[cell_name].val = value.Undef
@@ -1986,6 +2066,11 @@ class Mem(object):
 
                 val = cell.val
                 UP_val = val
+                if val.tag() == value_e.SparseArray:
+                    sp = cast(value.SparseArray, UP_val)
+                    sparse_array.UnsetItem(sp, lval.index)
+                    return True
+
                 if val.tag() != value_e.BashArray:
                     raise error.Runtime("%r isn't an array" % var_name)
 
@@ -271,6 +271,63 @@ class MemTest(unittest.TestCase):
         val = mem.GetValue('undef', scope_e.Dynamic)
         test_lib.AssertAsdlEqual(self, value.Undef, val)
 
+    def testDynamicLookupCache(self):
+        mem = _InitMem()
+
+        def _Get(name):
+            return mem.GetValue(name, scope_e.Dynamic)
+
+        # x=global
+        mem.SetValue(location.LName('x'), value.Str('global'),
+                     scope_e.Dynamic)
+        for i in xrange(50):
+            mem.PushCall('f', None, None)
+        self.assertEqual('global', _Get('x').s)
+        self.assertEqual('global', _Get('x').s)  # cached
+
+        # Mutating the cell is visible
+        mem.SetValue(location.LName('x'), value.Str('mutated'),
+                     scope_e.Dynamic)
+        self.assertEqual('mutated', _Get('x').s)
+
+        # local x=inner shadows it
+        mem.SetValue(location.LName('x'), value.Str('inner'),
+                     scope_e.LocalOnly)
+        self.assertEqual('inner', _Get('x').s)
+
+        # Popping the frame uncovers the global again
+        mem.PopCall(False)
+        self.assertEqual('mutated', _Get('x').s)
+
+        # Undefined names are cached, until they're bound
+        self.assertEqual(value_e.Undef, _Get('y').tag())
+        mem.SetValue(location.LName('y'), value.Str('y'), scope_e.LocalOnly)
+        self.assertEqual('y', _Get('y').s)
+
+        # unset y
+        mem.Unset(location.LName('y'), scope_e.Dynamic)
+        self.assertEqual(value_e.Undef, _Get('y').tag())
+
+        # Temp bindings
+        mem.PushTemp()
+        mem.SetValue(location.LName('x'), value.Str('temp'), scope_e.LocalOnly)
+        self.assertEqual('temp', _Get('x').s)
+        mem.PopTemp()
+        self.assertEqual('mutated', _Get('x').s)
+
+        # Popping a frame doesn't leave references to it in the cache
+        mem.PushCall('f', None, None)
+        mem.SetValue(location.LName('z'), value.Str('z'), scope_e.LocalOnly)
+        self.assertEqual('z', _Get('z').s)
+        self.assertIn('z', mem.lookup_cache)
+        mem.PopCall(False)
+        self.assertEqual(0, len(mem.lookup_cache))
+
+        # The number of entries is bounded
+        for i in xrange(state._MAX_LOOKUP_ENTRIES + 10):
+            self.assertEqual(value_e.Undef, _Get('v%d' % i).tag())
+        self.assertTrue(len(mem.lookup_cache) <= state._MAX_LOOKUP_ENTRIES)
+
     def testExportThenAssign(self):
         """Regression Test."""
         mem = _InitMem()
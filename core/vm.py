@@ -9,7 +9,7 @@ from _devbuild.gen.value_asdl import value, value_t
 from core import pyos
 from mycpp.mylib import log
 
-from typing import List, Any, TYPE_CHECKING
+from typing import List, Any, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from _devbuild.gen.runtime_asdl import cmd_value, RedirValue
     from _devbuild.gen.syntax_asdl import (command, command_t, CommandSub)
@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     from osh.cmd_eval import CommandEvaluator
     from osh import prompt
     from core import dev
+    from core import process
     from core import state
 
 _ = log
@@ -221,6 +222,10 @@ class _Executor(object):
         # type: (StatusArray) -> None
         pass
 
+    def MaybeFlushStdout(self):
+        # type: () -> None
+        pass
+
 
 #
 # Abstract base classes
@@ -319,9 +324,9 @@ class ctx_ProcessSub(object):
 
 class ctx_FlushStdout(object):
 
-    def __init__(self):
-        # type: () -> None
-        pass
+    def __init__(self, fd_state):
+        # type: (Optional[process.FdState]) -> None
+        self.fd_state = fd_state
 
     def __enter__(self):
         # type: () -> None
@@ -330,5 +335,10 @@ class ctx_FlushStdout(object):
     def __exit__(self, type, value, traceback):
         # type: (Any, Any, Any) -> None
 
-        # This function can't be translated, so it's in pyos
-        pyos.FlushStdout()
+        # Output can stay in the buffer when nobody can tell.  See
+        # FdState.UpdateStdoutBuffering().
+        if self.fd_state is None or not self.fd_state.CanBufferStdout():
+            # This function can't be translated, so it's in pyos
+            pyos.FlushStdout()
+        else:
+            self.fd_state.NoteBufferedStdout()
@@ -4,9 +4,18 @@
 
 #include <ctype.h>  // ispunct()
 #include <errno.h>
+#include <limits.h>  // INT_MAX
 #include <math.h>  // fmod()
 #include <pwd.h>   // passwd
 #include <signal.h>
+#include <stdio.h>
+#if defined(__APPLE__) || defined(__FreeBSD__) || defined(__NetBSD__) || \
+    defined(__OpenBSD__)
+  #define purge_stdio fpurge
+#else
+  #include <stdio_ext.h>  // __fpurge()
+  #define purge_stdio __fpurge
+#endif
 #include <sys/resource.h>  // getrusage
 #include <sys/select.h>    // select(), FD_ISSET, FD_SET, FD_ZERO
 #include <sys/stat.h>      // stat
@@ -242,6 +251,70 @@ bool InputAvailable(int fd) {
   return select(FD_SETSIZE, &fds, NULL, NULL, &timeout) > 0;
 }
 
+// The error number of a failed write to stdout, or 0
+static int gStdoutErrno = 0;
+
+// Remember the error of a failed write, including one that happened when
+// libc flushed a full buffer.  The output that couldn't be written is
+// dropped, so later flushes don't fail again.
+static void NoteStdoutError() {
+  if (ferror(stdout)) {
+    if (gStdoutErrno == 0) {
+      gStdoutErrno = errno ? errno : EIO;
+    }
+    purge_stdio(stdout);
+    clearerr(stdout);
+  }
+}
+
+void FlushStdout() {
+  // Flush libc buffers
+  fflush(stdout);
+  NoteStdoutError();
+}
+
+int TakeStdoutError() {
+  NoteStdoutError();
+  int err_num = gStdoutErrno;
+  gStdoutErrno = 0;
+  return err_num;
+}
+
+bool StdoutCanBuffer() {
+  struct stat st1;
+  if (::fstat(STDOUT_FILENO, &st1) < 0) {
+    return false;
+  }
+  if (!S_ISFIFO(st1.st_mode) && !S_ISREG(st1.st_mode)) {
+    return false;
+  }
+
+  struct stat st2;
+  if (::fstat(STDERR_FILENO, &st2) < 0) {
+    return true;  // stderr is closed
+  }
+  return st1.st_dev != st2.st_dev || st1.st_ino != st2.st_ino;
+}
+
+int FileSize(int fd) {
+  struct stat st;
+  if (::fstat(fd, &st) < 0 || !S_ISREG(st.st_mode)) {
+    return -1;
+  }
+  if (st.st_size > INT_MAX) {
+    return -1;  // too big for one read()
+  }
+  return st.st_size;
+}
+
+bool SeekBack(int fd, int n) {
+  struct stat st;
+  if (::fstat(fd, &st) < 0 || !S_ISREG(st.st_mode)) {
+    return false;
+  }
+  return ::lseek(fd, -static_cast<off_t>(n), SEEK_CUR) >= 0;
+}
+
 SignalSafe* InitSignalSafe() {
   gSignalSafe = Alloc<SignalSafe>();
   gHeap.RootGlobalVar(gSignalSafe);
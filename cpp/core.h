@@ -89,10 +89,12 @@ void PrintTimes();
 
 bool InputAvailable(int fd);
 
-inline void FlushStdout() {
-  // Flush libc buffers
-  fflush(stdout);
-}
+void FlushStdout();
+int TakeStdoutError();
+
+bool StdoutCanBuffer();
+int FileSize(int fd);
+bool SeekBack(int fd, int n);
 
 Tuple2<int, void*> PushTermAttrs(int fd, int mask);
 void PopTermAttrs(int fd, int orig_local_modes, void* term_attrs);
@@ -367,6 +367,81 @@ struct Node {
 };
 Node* gNode;
 
+TEST stdout_can_buffer_test() {
+  fflush(stdout);
+  int saved_out = dup(STDOUT_FILENO);
+  int saved_err = dup(STDERR_FILENO);
+
+  int fd = open("/dev/null", O_WRONLY);
+  dup2(fd, STDOUT_FILENO);
+  close(fd);
+  ASSERT_EQ(false, pyos::StdoutCanBuffer());  // character device
+
+  fd = open("_tmp/stdout_can_buffer.txt", O_WRONLY | O_CREAT | O_TRUNC, 0644);
+  ASSERT(fd >= 0);
+  dup2(fd, STDOUT_FILENO);
+  close(fd);
+  ASSERT_EQ(true, pyos::StdoutCanBuffer());
+
+  dup2(STDOUT_FILENO, STDERR_FILENO);  // 2>&1
+  ASSERT_EQ(false, pyos::StdoutCanBuffer());
+
+  dup2(saved_out, STDOUT_FILENO);
+  dup2(saved_err, STDERR_FILENO);
+  close(saved_out);
+  close(saved_err);
+
+  PASS();
+}
+
+TEST stdout_error_test() {
+  ASSERT_EQ(0, pyos::TakeStdoutError());
+
+  int saved_out = dup(STDOUT_FILENO);
+  int fd = open("/dev/full", O_WRONLY);
+  ASSERT(fd >= 0);
+  dup2(fd, STDOUT_FILENO);
+  close(fd);
+
+  fputs("lost\n", stdout);
+  pyos::FlushStdout();
+  dup2(saved_out, STDOUT_FILENO);
+  close(saved_out);
+
+  ASSERT_EQ(ENOSPC, pyos::TakeStdoutError());
+  ASSERT_EQ(0, pyos::TakeStdoutError());  // forgotten
+
+  // The output was dropped, so it isn't written again
+  pyos::FlushStdout();
+  ASSERT_EQ(0, pyos::TakeStdoutError());
+
+  PASS();
+}
+
+TEST file_size_test() {
+  int fd = open("_tmp/file_size.txt", O_WRONLY | O_CREAT | O_TRUNC, 0644);
+  ASSERT(fd >= 0);
+  ASSERT_EQ(0, pyos::FileSize(fd));
+  ASSERT_EQ(5, write(fd, "hello", 5));
+  ASSERT_EQ(5, pyos::FileSize(fd));
+
+  ASSERT(pyos::SeekBack(fd, 2));
+  ASSERT_EQ(3, lseek(fd, 0, SEEK_CUR));
+  close(fd);
+
+  ASSERT_EQ(-1, pyos::FileSize(fd));  // closed
+  ASSERT(!pyos::SeekBack(fd, 2));
+
+  int fds[2];
+  ASSERT_EQ(0, pipe(fds));
+  ASSERT_EQ(-1, pyos::FileSize(fds[0]));  // not a regular file
+  ASSERT(!pyos::SeekBack(fds[0], 2));
+  close(fds[0]);
+  close(fds[1]);
+
+  PASS();
+}
+
 TEST asan_global_leak_test() {
   // NOT reported as a leak
   gNode = static_cast<Node*>(malloc(sizeof(Node)));
@@ -395,6 +470,9 @@ int main(int argc, char** argv) {
   RUN_TEST(pyos_readbyte_test);
   RUN_TEST(pyos_read_test);
   RUN_TEST(pyos_test);  // non-hermetic
+  RUN_TEST(stdout_can_buffer_test);
+  RUN_TEST(stdout_error_test);
+  RUN_TEST(file_size_test);
   RUN_TEST(pyutil_test);
   RUN_TEST(strerror_test);
 
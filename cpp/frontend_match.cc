@@ -2,6 +2,10 @@
 
 #include "frontend_match.h"
 
+#include <string.h>  // memchr
+
+#include "cpp/ifs_split_shared.h"
+
 // This order is required to get it to compile, despite clang-format
 // clang-format off
 #include "_gen/frontend/types.asdl_c.h"
@@ -56,6 +60,22 @@ SimpleLexer* BraceRangeLexer(BigStr* s) {
   return Alloc<SimpleLexer>(&MatchBraceRangeToken, s);
 }
 
+Tuple2<Id_t, int> MatchJ8Token(BigStr* s, int start_pos) {
+  int id;
+  int end_pos;
+  ::MatchJ8Token(reinterpret_cast<const unsigned char*>(s->data_), len(s),
+                 start_pos, &id, &end_pos);
+  return Tuple2<Id_t, int>(static_cast<Id_t>(id), end_pos);
+}
+
+Tuple2<Id_t, int> MatchJ8StrToken(BigStr* s, int start_pos) {
+  int id;
+  int end_pos;
+  ::MatchJ8StrToken(reinterpret_cast<const unsigned char*>(s->data_), len(s),
+                    start_pos, &id, &end_pos);
+  return Tuple2<Id_t, int>(static_cast<Id_t>(id), end_pos);
+}
+
 SimpleLexer* GlobLexer(BigStr* s) {
   return Alloc<SimpleLexer>(&MatchGlobToken, s);
 }
@@ -107,4 +127,26 @@ bool LooksLikeInteger(BigStr* s) {
                             len(s));
 }
 
+List<BigStr*>* IfsSplit(BigStr* s, BigStr* ifs_whitespace, BigStr* ifs_other) {
+  int n = len(s);
+  if (memchr(s->data_, '\\', n) != nullptr) {
+    return nullptr;
+  }
+
+  struct IfsSplitState st;
+  IfsSplitInit(&st, reinterpret_cast<const unsigned char*>(s->data_), n,
+               reinterpret_cast<const unsigned char*>(ifs_whitespace->data_),
+               len(ifs_whitespace),
+               reinterpret_cast<const unsigned char*>(ifs_other->data_),
+               len(ifs_other));
+
+  auto parts = NewList<BigStr*>();
+  int start;
+  int end;
+  while (IfsSplitNext(&st, &start, &end)) {
+    parts->append(StrFromC(s->data_ + start, end - start));
+  }
+  return parts;
+}
+
 }  // namespace match
@@ -49,6 +49,10 @@ class SimpleLexer {
 //
 
 SimpleLexer* BraceRangeLexer(BigStr* s);
+
+// For data_lang/j8.py.  Like OneToken(), these don't allocate.
+Tuple2<Id_t, int> MatchJ8Token(BigStr* s, int start_pos);
+Tuple2<Id_t, int> MatchJ8StrToken(BigStr* s, int start_pos);
 SimpleLexer* GlobLexer(BigStr* s);
 SimpleLexer* EchoLexer(BigStr* s);
 
@@ -68,6 +72,9 @@ bool ShouldHijack(BigStr* s);
 bool LooksLikeFloat(BigStr* s);
 bool LooksLikeInteger(BigStr* s);
 
+// Returns nullptr if s has a backslash, which needs osh/split.py
+List<BigStr*>* IfsSplit(BigStr* s, BigStr* ifs_whitespace, BigStr* ifs_other);
+
 // StringToInt
 
 int MatchOption(BigStr* s);
@@ -27,6 +27,14 @@ TEST lexer_test() {
   int id = t.at0();
   ASSERT_EQ(Id::Eol_Tok, id);
 
+  auto t2 = match::MatchJ8Token(StrFromC("\"abc\" "), 0);
+  ASSERT_EQ(Id::J8_String, t2.at0());
+  ASSERT_EQ(5, t2.at1());
+
+  t2 = match::MatchJ8StrToken(StrFromC("\\u00e9"), 0);
+  ASSERT_EQ(Id::J8_Unicode4, t2.at0());
+  ASSERT_EQ(6, t2.at1());
+
   PASS();
 }
 
@@ -60,6 +68,34 @@ TEST func_test() {
   PASS();
 }
 
+TEST ifs_split_test() {
+  BigStr* ws = StrFromC(" \t\n");
+  BigStr* other = StrFromC(":");
+
+  List<BigStr*>* parts = match::IfsSplit(StrFromC("  a b\tc \n"), ws,
+                                         kEmptyString);
+  ASSERT_EQ(3, len(parts));
+  ASSERT(str_equals(StrFromC("a"), parts->at(0)));
+  ASSERT(str_equals(StrFromC("c"), parts->at(2)));
+
+  // Leading and doubled IFS chars give empty fields, trailing ones don't
+  parts = match::IfsSplit(StrFromC(":a::b : c:"), ws, other);
+  ASSERT_EQ(5, len(parts));
+  ASSERT(str_equals(kEmptyString, parts->at(0)));
+  ASSERT(str_equals(StrFromC("a"), parts->at(1)));
+  ASSERT(str_equals(kEmptyString, parts->at(2)));
+  ASSERT(str_equals(StrFromC("b"), parts->at(3)));
+  ASSERT(str_equals(StrFromC("c"), parts->at(4)));
+
+  parts = match::IfsSplit(kEmptyString, ws, other);
+  ASSERT_EQ(0, len(parts));
+
+  // Backslashes aren't handled
+  ASSERT_EQ(nullptr, match::IfsSplit(StrFromC("a\\ b"), ws, other));
+
+  PASS();
+}
+
 TEST for_test_coverage() {
   (void)match::GlobLexer(kEmptyString);
   (void)match::EchoLexer(kEmptyString);
@@ -78,6 +114,7 @@ int main(int argc, char** argv) {
 
   RUN_TEST(lexer_test);
   RUN_TEST(func_test);
+  RUN_TEST(ifs_split_test);
   RUN_TEST(for_test_coverage);
 
   gHeap.CleanProcessExit();
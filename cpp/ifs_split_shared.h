@@ -0,0 +1,99 @@
+#ifndef IFS_SPLIT_SHARED_H
+#define IFS_SPLIT_SHARED_H
+
+// IFS splitting without backslash escapes, where every field is a slice of
+// the input.  This is the common case of word splitting, e.g. $(cat list).
+//
+// This library is shared between cpp/ and pyext/.  It's equivalent to the
+// state machine in osh/split.py, but it only reports field boundaries, so it
+// doesn't allocate.
+//
+// Usage:
+//
+//   struct IfsSplitState st;
+//   IfsSplitInit(&st, s, len, ws, ws_len, other, other_len);
+//   int start, end;
+//   while (IfsSplitNext(&st, &start, &end)) {
+//     ... field is s[start:end] ...
+//   }
+//
+// Callers must check that s has no backslash first.
+
+enum {
+  IFS_CHAR_BLACK = 0,
+  IFS_CHAR_WHITE = 1,  // IFS whitespace like ' ' or '\t'
+  IFS_CHAR_GRAY = 2,   // other IFS chars like ':'
+};
+
+struct IfsSplitState {
+  unsigned char kind[256];
+  const unsigned char* s;
+  int len;
+  int pos;
+  // Like the DE_Gray and DE_White2 states: another IFS char here delimits an
+  // empty field.  It's set at the start, so ':a' gives ['', 'a'].
+  int gray_pending;
+};
+
+static inline void IfsSplitInit(struct IfsSplitState* st,
+                                const unsigned char* s, int len,
+                                const unsigned char* ifs_whitespace,
+                                int ws_len, const unsigned char* ifs_other,
+                                int other_len) {
+  int i;
+  for (i = 0; i < 256; ++i) {
+    st->kind[i] = IFS_CHAR_BLACK;
+  }
+  for (i = 0; i < ws_len; ++i) {
+    st->kind[ifs_whitespace[i]] = IFS_CHAR_WHITE;
+  }
+  for (i = 0; i < other_len; ++i) {
+    st->kind[ifs_other[i]] = IFS_CHAR_GRAY;
+  }
+  st->s = s;
+  st->len = len;
+  st->pos = 0;
+  st->gray_pending = 1;
+}
+
+// Returns 1 and sets [*start, *end) to the next field, or returns 0 at the end
+// of the string.
+static inline int IfsSplitNext(struct IfsSplitState* st, int* start,
+                               int* end) {
+  const unsigned char* s = st->s;
+  int n = st->len;
+  int i = st->pos;
+
+  while (i < n) {
+    switch (st->kind[s[i]]) {
+    case IFS_CHAR_WHITE:
+      i++;
+      break;
+
+    case IFS_CHAR_GRAY:
+      i++;
+      if (st->gray_pending) {
+        st->pos = i;
+        *start = i - 1;  // empty field
+        *end = i - 1;
+        return 1;
+      }
+      st->gray_pending = 1;
+      break;
+
+    default:  // IFS_CHAR_BLACK
+      *start = i;
+      while (i < n && st->kind[s[i]] == IFS_CHAR_BLACK) {
+        i++;
+      }
+      *end = i;
+      st->pos = i;
+      st->gray_pending = 0;
+      return 1;
+    }
+  }
+  st->pos = i;
+  return 0;
+}
+
+#endif  // IFS_SPLIT_SHARED_H
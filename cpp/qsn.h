@@ -7,6 +7,49 @@
 
 namespace qsn {
 
+// Is the byte printable ASCII, other than ' and \ ?
+inline bool IsPrintableByte(uint8_t c) {
+  return ' ' <= c && c <= '~' && c != '\'' && c != '\\';
+}
+
+// Return the end of the run of bytes at pos that don't need escaping.
+//
+// Checks 8 bytes at a time with 64-bit word operations ("SWAR"), so it's fast
+// without SIMD intrinsics.  Each test below is exact for whether ANY byte in
+// the word matches, which is all we need.
+inline int PrintableRunEnd(BigStr* s, int pos) {
+  const uint64_t kOnes = 0x0101010101010101ULL;
+  const uint64_t kHigh = 0x8080808080808080ULL;
+
+  int n = len(s);
+  const uint8_t* p = reinterpret_cast<const uint8_t*>(s->data_);
+  int i = pos;
+
+  while (i + 8 <= n) {
+    uint64_t x;
+    memcpy(&x, p + i, 8);  // unaligned load
+
+    uint64_t low = (x - kOnes * 0x20) & ~x & kHigh;  // a byte < 0x20
+    uint64_t high = ((x + kOnes) | x) & kHigh;       // a byte > 0x7e
+
+    uint64_t q = x ^ (kOnes * '\'');
+    uint64_t quote = (q - kOnes) & ~q & kHigh;  // a single quote
+
+    uint64_t b = x ^ (kOnes * '\\');
+    uint64_t backslash = (b - kOnes) & ~b & kHigh;  // a backslash
+
+    if (low | high | quote | backslash) {
+      break;  // find it below
+    }
+    i += 8;
+  }
+
+  while (i < n && IsPrintableByte(p[i])) {
+    i++;
+  }
+  return i;
+}
+
 inline bool IsUnprintableLow(BigStr* ch) {
   assert(len(ch) == 1);
   uint8_t c = ch->data_[0];  // explicit conversion necessary
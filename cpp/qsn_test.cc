@@ -31,6 +31,31 @@ TEST qsn_test() {
   PASS();
 }
 
+TEST printable_run_test() {
+  ASSERT_EQ(0, qsn::PrintableRunEnd(kEmptyString, 0));
+  ASSERT_EQ(3, qsn::PrintableRunEnd(StrFromC("abc"), 0));
+  ASSERT_EQ(3, qsn::PrintableRunEnd(StrFromC("abc"), 3));
+  ASSERT_EQ(3, qsn::PrintableRunEnd(StrFromC("abc\n"), 1));
+
+  // Each special byte stops the run, whether it's found 8 bytes at a time or
+  // one at a time
+  const char* special[] = {"\x01", "\x1f", "\x7f", "\x80", "\xff", "'", "\\"};
+  for (int i = 0; i < 7; ++i) {
+    for (int pos = 0; pos < 20; ++pos) {
+      char buf[32];
+      memset(buf, 'a', 20);
+      buf[20] = '\0';
+      buf[pos] = special[i][0];
+      ASSERT_EQ(pos, qsn::PrintableRunEnd(StrFromC(buf), 0));
+    }
+  }
+
+  // Every printable char other than ' and \ is OK
+  ASSERT_EQ(23, qsn::PrintableRunEnd(StrFromC(" !\"#&()[]^~ Az09 {|}`-_"), 0));
+
+  PASS();
+}
+
 GREATEST_MAIN_DEFS();
 
 int main(int argc, char** argv) {
@@ -39,6 +64,7 @@ int main(int argc, char** argv) {
   GREATEST_MAIN_BEGIN();
 
   RUN_TEST(qsn_test);
+  RUN_TEST(printable_run_test);
 
   gHeap.CleanProcessExit();
 
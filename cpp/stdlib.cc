@@ -54,6 +54,12 @@ int open(BigStr* path, int flags, int perms) {
   return result;
 }
 
+void unlink(BigStr* path) {
+  if (::unlink(path->data_) < 0) {
+    throw Alloc<OSError>(errno);
+  }
+}
+
 void dup2(int oldfd, int newfd) {
   if (::dup2(oldfd, newfd) < 0) {
     throw Alloc<OSError>(errno);
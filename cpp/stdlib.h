@@ -139,6 +139,8 @@ void dup2(int oldfd, int newfd);
 
 int open(BigStr* path, int flags, int perms);
 
+void unlink(BigStr* path);
+
 mylib::LineReader* fdopen(int fd, BigStr* c_mode);
 
 void execve(BigStr* argv0, List<BigStr*>* argv,
@@ -1,6 +1,7 @@
 #include "cpp/stdlib.h"
 
 #include <errno.h>
+#include <fcntl.h>  // O_WRONLY
 #include <sys/stat.h>
 
 #include "mycpp/gc_builtins.h"
@@ -60,6 +61,23 @@ TEST open_test() {
   PASS();
 }
 
+TEST unlink_test() {
+  BigStr* path = StrFromC("_tmp/unlink_test.txt");
+  int fd = posix::open(path, O_WRONLY | O_CREAT | O_TRUNC, 0644);
+  posix::close(fd);
+  posix::unlink(path);
+
+  bool caught = false;
+  try {
+    posix::unlink(path);  // already removed
+  } catch (IOError_OSError* e) {
+    caught = true;
+  }
+  ASSERT(caught);
+
+  PASS();
+}
+
 TEST time_test() {
   int ts = time_::time();
   log("ts = %d", ts);
@@ -139,6 +157,7 @@ int main(int argc, char** argv) {
   RUN_TEST(posix_test);
   RUN_TEST(putenv_test);
   RUN_TEST(open_test);
+  RUN_TEST(unlink_test);
   RUN_TEST(time_test);
   RUN_TEST(mtime_demo);
   RUN_TEST(listdir_test);
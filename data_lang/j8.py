@@ -30,18 +30,26 @@ Meta-syntax:
    <> is for non-J8 errors?  For the = oeprator
 """
 
-from _devbuild.gen.value_asdl import (value, value_e, value_t)
+from _devbuild.gen.id_kind_asdl import Id
+from _devbuild.gen.value_asdl import (value, value_e, value_t, value_str)
 
 from asdl import format as fmt
+from core import error
+from core import packed_list
+from core import pyos
 from data_lang import j8_str
-from data_lang import qsn
+from frontend import match
 from mycpp import mylib
-from mycpp.mylib import tagswitch, iteritems, log
+from mycpp.mylib import tagswitch, iteritems, log, NewDict
+from osh import sparse_array
+from osh import string_ops
+
+from errno import EINTR
 
 _ = log
 unused = j8_str
 
-from typing import cast
+from typing import cast, Dict, List, Optional
 
 
 class PrettyPrinter(object):
@@ -94,6 +102,53 @@ class PrettyPrinter(object):
         pass
 
 
+# Printer.Stream() writes the buffer out when it's this big
+_FLUSH_SIZE = 1 << 16
+
+
+def EncodeString(s, buf):
+    # type: (str, mylib.BufWriter) -> None
+    """Write a JSON string literal, escaping quotes and control chars.
+
+    Like yajl, other bytes are written as is, so UTF-8 stays literal.  Runs of
+    bytes that don't need escaping are written at once.
+    """
+    buf.write('"')
+    start = 0
+    for i in xrange(len(s)):
+        b = ord(s[i])
+        if b == 0x22:  # "
+            esc = '\\"'
+        elif b == 0x5c:  # backslash
+            esc = '\\\\'
+        elif b >= 0x20:
+            continue
+        elif b == 0x0a:
+            esc = '\\n'
+        elif b == 0x09:
+            esc = '\\t'
+        elif b == 0x0d:
+            esc = '\\r'
+        elif b == 0x08:
+            esc = '\\b'
+        elif b == 0x0c:
+            esc = '\\f'
+        else:
+            esc = ('\\u000' if b < 0x10 else '\\u001') + mylib.hex_lower(
+                b & 0xf)
+
+        if start < i:
+            buf.write(s[start:i])
+        buf.write(esc)
+        start = i + 1
+
+    if start == 0:
+        buf.write(s)
+    else:
+        buf.write(s[start:])
+    buf.write('"')
+
+
 class Printer(object):
     """
     For write --j8 (x) .  Output to monomorphic mylib.BufWriter.
@@ -166,18 +221,59 @@ class Printer(object):
 
         self.spaces = {0: ''}  # Dic
 
+        # The List and Dict values we're inside of, to detect cycles
+        self.visiting = []  # type: List[value_t]
+
+        # Stream() flushes the buffer here
+        self.out = None  # type: Optional[mylib.Writer]
+
     def _GetIndent(self, num_spaces):
         # type: (int) -> str
         if not num_spaces in self.spaces:
             self.spaces[num_spaces] = ' ' * num_spaces
         return self.spaces[num_spaces]
 
-    def Print(self, val, buf, indent, level=0):
-        # type: (value_t, mylib.BufWriter, int, int) -> None
-        """
+    def _MaybeFlush(self, buf):
+        # type: (mylib.BufWriter) -> None
+        if self.out and buf.tell() >= _FLUSH_SIZE:
+            self.out.write(buf.getvalue())
+            buf.clear()
+
+    def _Enter(self, val):
+        # type: (value_t) -> None
+        """Called before printing the items of a List or Dict."""
+        # Usually shallow, so a linear search is OK
+        for v in self.visiting:
+            if v is val:
+                raise error.Encode("Can't encode data structure with a cycle")
+        self.visiting.append(val)
+
+    def Print(self, val, buf, indent):
+        # type: (value_t, mylib.BufWriter, int) -> None
+        """Print val to buf.
+
         Args:
           indent: number of spaces, or -1 for everything on one line
         """
+        del self.visiting[:]
+        self.out = None
+        self._Print(val, buf, indent, 0)
+
+    def Stream(self, val, f, indent):
+        # type: (value_t, mylib.Writer, int) -> None
+        """Print val to f, flushing the buffer whenever it fills up.
+
+        So writing a big value doesn't need a string of the same size.
+        """
+        del self.visiting[:]
+        self.out = f
+        buf = mylib.BufWriter()
+        self._Print(val, buf, indent, 0)
+        f.write(buf.getvalue())
+        self.out = None
+
+    def _Print(self, val, buf, indent, level):
+        # type: (value_t, mylib.BufWriter, int, int) -> None
         #log('indent %r level %d', indent, level)
 
         # special value that means everything is on one line
@@ -207,48 +303,42 @@ class Printer(object):
 
             elif case(value_e.Int):
                 val = cast(value.Int, UP_val)
-                # TODO: buf.write_int() would avoid allocation
-                buf.write(str(val.i))
+                buf.write_int(val.i)
 
             elif case(value_e.Float):
                 val = cast(value.Float, UP_val)
-
-                # TODO: buf.write_float() would avoid allocation
-                buf.write(str(val.f))
+                buf.write_float(val.f)
 
             elif case(value_e.Str):
                 val = cast(value.Str, UP_val)
 
-                buf.write('"')
-                valid_utf8 = qsn.EncodeRunes(val.s, qsn.BIT8_UTF8, buf)
-
-                # TODO: check errors
-                # Is it possible to have invalid UTF-8 but valid JSON?
-                # Surrogate pairs?
-                if not valid_utf8:
-                    pass
-
-                buf.write('"')
+                # TODO: J8 strings, and checking UTF-8 for JSON
+                EncodeString(val.s, buf)
 
             elif case(value_e.List):
                 val = cast(value.List, UP_val)
+                self._Enter(val)
 
                 buf.write('[')
                 buf.write(maybe_newline)
-                for i, item in enumerate(val.items):
+                for i in xrange(packed_list.Len(val)):
+                    item = packed_list.GetItem(val, i)
                     if i != 0:
                         buf.write(',')
                         buf.write(maybe_newline)
 
                     buf.write(item_indent)
-                    self.Print(item, buf, indent, level + 1)
+                    self._Print(item, buf, indent, level + 1)
+                    self._MaybeFlush(buf)
                 buf.write(maybe_newline)
 
                 buf.write(bracket_indent)
                 buf.write(']')
+                self.visiting.pop()
 
             elif case(value_e.Dict):
                 val = cast(value.Dict, UP_val)
+                self._Enter(val)
 
                 buf.write('{')
                 buf.write(maybe_newline)
@@ -259,15 +349,87 @@ class Printer(object):
                         buf.write(maybe_newline)
 
                     buf.write(item_indent)
-                    buf.write('"')
-                    valid_utf8 = qsn.EncodeRunes(k, qsn.BIT8_UTF8, buf)
-                    # TODO: check errors
-                    if not valid_utf8:
-                        pass
-                    buf.write('":')
+                    EncodeString(k, buf)
+                    buf.write(':')
                     buf.write(maybe_space)
 
-                    self.Print(v, buf, indent, level + 1)
+                    self._Print(v, buf, indent, level + 1)
+                    self._MaybeFlush(buf)
+
+                    i += 1
+
+                buf.write(maybe_newline)
+                buf.write(bracket_indent)
+                buf.write('}')
+                self.visiting.pop()
+
+            elif case(value_e.Undef):
+                buf.write('null')
+
+            elif case(value_e.BashArray):
+                val = cast(value.BashArray, UP_val)
+
+                buf.write('[')
+                buf.write(maybe_newline)
+                for i, s in enumerate(val.strs):
+                    if i != 0:
+                        buf.write(',')
+                        buf.write(maybe_newline)
+
+                    buf.write(item_indent)
+                    if s is None:
+                        buf.write('null')
+                    else:
+                        EncodeString(s, buf)
+                    self._MaybeFlush(buf)
+                buf.write(maybe_newline)
+
+                buf.write(bracket_indent)
+                buf.write(']')
+
+            elif case(value_e.SparseArray):
+                val = cast(value.SparseArray, UP_val)
+
+                # Like a BashArray: write null for each hole
+                buf.write('[')
+                buf.write(maybe_newline)
+                i = 0
+                for index in sparse_array.Indices(val):
+                    while i <= index:
+                        if i != 0:
+                            buf.write(',')
+                            buf.write(maybe_newline)
+
+                        buf.write(item_indent)
+                        if i == index:
+                            EncodeString(val.d[index], buf)
+                        else:
+                            buf.write('null')
+                        self._MaybeFlush(buf)
+
+                        i += 1
+                buf.write(maybe_newline)
+
+                buf.write(bracket_indent)
+                buf.write(']')
+
+            elif case(value_e.BashAssoc):
+                val = cast(value.BashAssoc, UP_val)
+
+                buf.write('{')
+                buf.write(maybe_newline)
+                i = 0
+                for k2, s in iteritems(val.d):
+                    if i != 0:
+                        buf.write(',')
+                        buf.write(maybe_newline)
+
+                    buf.write(item_indent)
+                    EncodeString(k2, buf)
+                    buf.write(':')
+                    buf.write(maybe_space)
+                    EncodeString(s, buf)
+                    self._MaybeFlush(buf)
 
                     i += 1
 
@@ -276,20 +438,320 @@ class Printer(object):
                 buf.write('}')
 
             else:
-                # Print statically typed () depending on flags
-                # Or <> for invalid
-                pass
+                # TODO: Print statically typed () depending on flags
+                raise error.Encode("Can't encode value of type %s" %
+                                   value_str(val.tag(), dot=False))
+
+
+# How much to read from the file descriptor at once
+_READ_SIZE = 1 << 16
+
+# A token that may be incomplete, like 'tru' or '\u00', is refilled if it's
+# within this many bytes of the end of the buffer.  Longer than any fixed-size
+# token.
+_LOOKAHEAD = 16
+
+_ESCAPES = {
+    '"': '"',
+    '\\': '\\',
+    '/': '/',
+    'b': '\b',
+    'f': '\f',
+    'n': '\n',
+    'r': '\r',
+    't': '\t',
+}
 
 
 class Parser(object):
+    """Decode JSON into value_t, without an intermediate object graph.
+
+    Tokens are matched with the generated lexer in frontend/match, i.e.
+    lexer_def.J8_DEF and J8_STR_DEF.
+
+    The input is read from a file descriptor in chunks, and bytes are
+    discarded once they're consumed.  So memory usage is proportional to the
+    largest token, not to the size of the document.
+
+    ParseValue() can be called repeatedly, to decode a stream of values like
+    JSON Lines.
 
-    def Parse(self, s):
-        # type: (str) -> value_t
+    Unlike yajl, we don't validate UTF-8, or reject control chars in strings.
+    J8 escapes like \\yff and \\u{1f600} are accepted.
+    """
+
+    def __init__(self, s, fd):
+        # type: (str, int) -> None
+        """
+        Args:
+          s: initial input
+          fd: read more input from this descriptor, or -1 to parse only s
+        """
+        self.buf = s
+        self.pos = 0
+        self.fd = fd
+        self.eof = fd < 0
+        self.line_num = 1
+
+        # Current token.  The value of a string token is in tok_str.
+        self.tok_id = Id.Eol_Tok
+        self.tok_start = 0
+        self.tok_str = None  # type: str
+
+    def _Error(self, msg):
+        # type: (str) -> error.Decode
+        return error.Decode(msg, self.line_num)
+
+    def _Fill(self):
+        # type: () -> bool
+        """Read more input, discarding bytes before self.pos.
+
+        Returns False at EOF.
         """
-        Raises exception on error?
+        if self.eof:
+            return False
+
+        chunks = []  # type: List[str]
+        while True:
+            n, err_num = pyos.Read(self.fd, _READ_SIZE, chunks)
+            if n < 0:
+                if err_num == EINTR:
+                    continue  # retry, like read --all
+                raise pyos.ReadError(err_num)
+            break
+
+        if n == 0:
+            self.eof = True
+            return False
+
+        if self.pos == len(self.buf):
+            self.buf = chunks[0]
+        else:
+            self.buf = self.buf[self.pos:] + chunks[0]
+        self.pos = 0
+        return True
 
-        - Can parse either J8 or JSON strings
+    def _Match(self, in_str):
+        # type: (bool) -> int
+        """Match a token at self.pos, reading more input if it may be cut off.
 
+        Sets self.tok_start and returns the end position.
+        """
+        while True:
+            if in_str:
+                tok_id, end_pos = match.MatchJ8StrToken(self.buf, self.pos)
+            else:
+                tok_id, end_pos = match.MatchJ8Token(self.buf, self.pos)
+
+            if self.eof:
+                break
+            if tok_id in (Id.Unknown_Tok, Id.J8_BadBackslash):
+                # 'tru' or '\u00' may be complete after the next read
+                if self.pos + _LOOKAHEAD <= len(self.buf):
+                    break
+            elif end_pos < len(self.buf) or tok_id == Id.J8_Literals:
+                # Tokens like 123 that end at the buffer may continue.  But
+                # literal parts of strings can be split anywhere.
+                break
+            self._Fill()
+
+        self.tok_id = tok_id
+        self.tok_start = self.pos
+        self.pos = end_pos
+        return end_pos
+
+    def _String(self):
+        # type: () -> None
+        """Decode a string with escapes, after J8_LeftQuote."""
+        parts = []  # type: List[str]
+        high_surrogate = -1  # from \\uD800 of a pair
+
+        while True:
+            end_pos = self._Match(True)
+            tok_id = self.tok_id
+            start = self.tok_start
+
+            if tok_id == Id.J8_RightQuote:
+                break
+
+            if tok_id == Id.J8_Unicode4:
+                code = int(self.buf[start + 2:end_pos], 16)
+                if 0xDC00 <= code and code <= 0xDFFF and high_surrogate != -1:
+                    code = (0x10000 + ((high_surrogate - 0xD800) << 10) +
+                            (code - 0xDC00))
+                    high_surrogate = -1
+                else:
+                    if high_surrogate != -1:
+                        parts.append(string_ops.Utf8Encode(high_surrogate))
+                        high_surrogate = -1
+                    if 0xD800 <= code and code <= 0xDBFF:
+                        high_surrogate = code
+                        continue
+                parts.append(string_ops.Utf8Encode(code))
+                continue
+
+            if high_surrogate != -1:
+                parts.append(string_ops.Utf8Encode(high_surrogate))
+                high_surrogate = -1
+
+            if tok_id == Id.J8_Literals:
+                parts.append(self.buf[start:end_pos])
+
+            elif tok_id == Id.J8_OneChar:
+                parts.append(_ESCAPES[self.buf[start + 1]])
+
+            elif tok_id == Id.J8_UBraced:
+                code = int(self.buf[start + 3:end_pos - 1], 16)
+                if code > 0x10ffff:
+                    raise self._Error('Code point out of range')
+                parts.append(string_ops.Utf8Encode(code))
+
+            elif tok_id == Id.J8_YHex:
+                parts.append(chr(int(self.buf[start + 2:end_pos], 16)))
+
+            elif tok_id == Id.J8_BadBackslash:
+                raise self._Error('Invalid escape')
+
+            else:  # Id.Eol_Tok
+                if self.pos < len(self.buf):
+                    raise self._Error('Unexpected NUL byte')
+                raise self._Error('Unterminated string')
+
+        if high_surrogate != -1:
+            parts.append(string_ops.Utf8Encode(high_surrogate))
+
+        if len(parts) == 1:
+            self.tok_str = parts[0]
+        else:
+            self.tok_str = ''.join(parts)
+
+    def _Next(self):
+        # type: () -> None
+        """Read the next token into self.tok_id, skipping whitespace."""
+        while True:
+            end_pos = self._Match(False)
+            tok_id = self.tok_id
+
+            if tok_id == Id.J8_Newline:
+                self.line_num += 1
+            elif tok_id != Id.J8_Space:
+                break
+
+        if tok_id == Id.J8_String:
+            self.tok_str = self.buf[self.tok_start + 1:end_pos - 1]
+
+        elif tok_id == Id.J8_LeftQuote:
+            self._String()
+            self.tok_id = Id.J8_String
+
+        elif tok_id == Id.Unknown_Tok:
+            raise self._Error('Unexpected character %r' %
+                              self.buf[self.tok_start])
+
+        elif tok_id == Id.Eol_Tok:
+            if self.pos < len(self.buf):
+                raise self._Error('Unexpected NUL byte')
+
+    def _ParseList(self):
+        # type: () -> value_t
+        """ [ value, ... ] """
+        items = []  # type: List[value_t]
+
+        self._Next()
+        if self.tok_id == Id.J8_RBracket:
+            return value.List(items, None)
+
+        while True:
+            items.append(self._ParseValue())
+
+            self._Next()
+            if self.tok_id == Id.J8_RBracket:
+                break
+            if self.tok_id != Id.J8_Comma:
+                raise self._Error("Expected , or ] in list")
+            self._Next()
+
+        return packed_list.NewList(items)
+
+    def _ParseDict(self):
+        # type: () -> value_t
+        """ { "key": value, ... } """
+        d = NewDict()  # type: Dict[str, value_t]
+
+        self._Next()
+        if self.tok_id == Id.J8_RBrace:
+            return value.Dict(d)
+
+        while True:
+            if self.tok_id != Id.J8_String:
+                raise self._Error('Expected string for dict key')
+            key = self.tok_str
+
+            self._Next()
+            if self.tok_id != Id.J8_Colon:
+                raise self._Error('Expected : after dict key')
+
+            self._Next()
+            d[key] = self._ParseValue()
+
+            self._Next()
+            if self.tok_id == Id.J8_RBrace:
+                break
+            if self.tok_id != Id.J8_Comma:
+                raise self._Error('Expected , or } in dict')
+            self._Next()
+
+        return value.Dict(d)
+
+    def _ParseValue(self):
+        # type: () -> value_t
+        """Parse the value starting at the current token."""
+        tok_id = self.tok_id
+        if tok_id == Id.J8_LBracket:
+            return self._ParseList()
+        if tok_id == Id.J8_LBrace:
+            return self._ParseDict()
+        if tok_id == Id.J8_String:
+            return value.Str(self.tok_str)
+        if tok_id == Id.J8_Int:
+            tok = self.buf[self.tok_start:self.pos]
+            try:
+                return value.Int(int(tok))
+            except ValueError:
+                raise self._Error('Integer too big: %s' % tok)
+        if tok_id == Id.J8_Float:
+            return value.Float(float(self.buf[self.tok_start:self.pos]))
+        if tok_id == Id.J8_LeadingZero:
+            raise self._Error('Unexpected leading zero in %s' %
+                              self.buf[self.tok_start:self.pos])
+        if tok_id == Id.J8_Bool:
+            return value.Bool(self.buf[self.tok_start] == 't')
+        if tok_id == Id.J8_Null:
+            return value.Null
+        if tok_id == Id.Eol_Tok:
+            raise self._Error('Unexpected EOF')
+
+        raise self._Error('Unexpected token')
+
+    def ParseValue(self):
+        # type: () -> Optional[value_t]
+        """Parse the next value in the stream.
+
+        Returns None if there's only whitespace left.
         """
-        # TODO: feed it to lexer first, then parser
-        return None
+        self._Next()
+        if self.tok_id == Id.Eol_Tok:
+            return None
+        return self._ParseValue()
+
+    def Parse(self):
+        # type: () -> value_t
+        """Parse a single value, which must be the whole input."""
+        val = self.ParseValue()
+        if val is None:
+            raise self._Error('Unexpected EOF')
+
+        self._Next()
+        if self.tok_id != Id.Eol_Tok:
+            raise self._Error('Unexpected data after value')
+        return val
@@ -0,0 +1,137 @@
+#!/usr/bin/env python2
+"""
+j8_test.py: Tests for j8.py
+"""
+from __future__ import print_function
+
+import os
+import unittest
+
+from _devbuild.gen.value_asdl import value, value_e
+from core import error
+from data_lang import j8  # module under test
+from mycpp import mylib
+
+
+def _Parse(s):
+    return j8.Parser(s, -1).Parse()
+
+
+def _PipeParser(s):
+    """Return a Parser that reads s from a pipe."""
+    r, w = os.pipe()
+    os.write(w, s)
+    os.close(w)
+    return j8.Parser('', r)
+
+
+class ParserTest(unittest.TestCase):
+
+    def testValues(self):
+        self.assertEqual(value_e.Null, _Parse('null').tag())
+        self.assertEqual(True, _Parse(' true ').b)
+        self.assertEqual(-42, _Parse('-42').i)
+        self.assertEqual(1.5e3, _Parse('1.5e3').f)
+        self.assertEqual('x\ny/"', _Parse(r'"x\ny\/\""').s)
+
+        # Surrogate pair
+        self.assertEqual('\xc3\xa9\xf0\x9f\x98\x80',
+                         _Parse(r'"\u00e9\ud83d\ude00"').s)
+
+        # J8 escapes
+        self.assertEqual('\xff\xf0\x9f\x98\x80', _Parse(r'"\yff\u{1f600}"').s)
+
+        val = _Parse('{"a": [1, 2], "b": {}}')
+        self.assertEqual(['a', 'b'], val.d.keys())
+        self.assertEqual(2, len(val.d['a'].items))
+
+    def testErrors(self):
+        for s in ['', '[1,', '[1] 2', 'tru', r'"\q"', '"abc', '{"a" 1}', '1e',
+                  '"a\0b"', r'"\u{110000}"', '[1 2]', '007', '-01', '00.5']:
+            self.assertRaises(error.Decode, _Parse, s)
+
+    def testStream(self):
+        # Read 1 byte at a time, so every token spans reads
+        orig = j8._READ_SIZE
+        j8._READ_SIZE = 1
+        try:
+            p = _PipeParser('{"k": "a\\u00e9b", "n": 123}\n[true, null]\n')
+            val = p.ParseValue()
+            self.assertEqual('a\xc3\xa9b', val.d['k'].s)
+            self.assertEqual(123, val.d['n'].i)
+
+            val = p.ParseValue()
+            self.assertEqual(True, val.items[0].b)
+            self.assertEqual(2, p.line_num)
+
+            self.assertEqual(None, p.ParseValue())
+            self.assertEqual(3, p.line_num)
+        finally:
+            j8._READ_SIZE = orig
+
+
+class PrinterTest(unittest.TestCase):
+
+    def testPrint(self):
+        p = j8.Printer(0)
+        val = _Parse(r'{"k": [1, 2.5, "a\"b\n\u0001"], "e": []}')
+
+        buf = mylib.BufWriter()
+        p.Print(val, buf, -1)
+        self.assertEqual(r'{"k":[1,2.5,"a\"b\n\u0001"],"e":[]}',
+                         buf.getvalue())
+
+        buf = mylib.BufWriter()
+        p.Print(val, buf, 2)
+        self.assertEqual(
+            '{\n  "k": [\n    1,\n    2.5,\n    "a\\"b\\n\\u0001"\n  ],\n'
+            '  "e": [\n\n  ]\n}', buf.getvalue())
+
+    def testCycle(self):
+        p = j8.Printer(0)
+        val = value.List([value.Int(1)], None)
+        val.items.append(val)
+        self.assertRaises(error.Encode, p.Print, val, mylib.BufWriter(), -1)
+
+        # The same List twice isn't a cycle
+        val = value.List([], None)
+        buf = mylib.BufWriter()
+        p.Print(value.List([val, val], None), buf, -1)
+        self.assertEqual('[[],[]]', buf.getvalue())
+
+    def testSparseArray(self):
+        p = j8.Printer(0)
+        val = value.SparseArray({1: 'a', 3: 'b'}, 3)
+
+        buf = mylib.BufWriter()
+        p.Print(val, buf, -1)
+        self.assertEqual('[null,"a",null,"b"]', buf.getvalue())
+
+        # Like an empty BashArray
+        buf = mylib.BufWriter()
+        p.Print(value.SparseArray({}, -1), buf, -1)
+        self.assertEqual('[]', buf.getvalue())
+
+    def testStream(self):
+        orig = j8._FLUSH_SIZE
+        j8._FLUSH_SIZE = 4
+        try:
+            f = _Writer()
+            j8.Printer(0).Stream(_Parse('[1, 2, 3, ["abc", "def"]]'), f, -1)
+            self.assertEqual(['[1,2', ',3,["abc"', ',"def"', ']]'], f.chunks)
+        finally:
+            j8._FLUSH_SIZE = orig
+
+
+class _Writer(object):
+    """Records each write."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, s):
+        self.chunks.append(s)
+
+
+if __name__ == '__main__':
+    unittest.main()
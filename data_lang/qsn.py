@@ -126,6 +126,19 @@ MUST_QUOTE = 4  # maybe_shell_encode() uses this, for assoc array keys
 # can be done more simply with character tests.
 
 if mylib.PYTHON:
+    import re
+
+    # Printable ASCII, except for ' and \, which are escaped.  Matches the
+    # empty string, so match() never returns None.
+    _PRINTABLE_RUN_RE = re.compile(r"[ -&(-\[\]-~]*")
+
+    def PrintableRunEnd(s, pos):
+        # type: (str, int) -> int
+        """Return the end of the run of bytes at pos that don't need escaping.
+
+        In C++, this checks 8 bytes at a time.
+        """
+        return _PRINTABLE_RUN_RE.match(s, pos).end()
 
     def IsUnprintableLow(ch):
         # type: (str) -> bool
@@ -291,9 +304,20 @@ def _encode_bytes_x(s, buf):
     For BIT8_X_ESCAPE.
     """
 
-    # TODO: mylib.BufWriter() instead of List[str] produces less GC pressure
+    n = len(s)
+    i = 0
+    while i < n:
+        # Copy printable ASCII in bulk
+        j = PrintableRunEnd(s, i)
+        if j != i:
+            buf.write(s[i:j])
+            i = j
+            if i == n:
+                break
+
+        byte = s[i]
+        i += 1
 
-    for byte in s:
         #log('byte %r', byte)
         # append to buffer
         if byte == '\\':
@@ -387,7 +411,21 @@ def EncodeRunes(s, bit8_display, buf):
     r2 = ''
     r3 = ''
 
-    for byte in s:
+    n = len(s)
+    i = 0
+    while i < n:
+        if state == Start:
+            # Fast path: copy printable ASCII in bulk.  The state machine only
+            # runs on the bytes around it.
+            j = PrintableRunEnd(s, i)
+            if j != i:
+                buf.write(s[i:j])
+                i = j
+                if i == n:
+                    break
+
+        byte = s[i]
+        i += 1
 
         b = ord(byte)
 
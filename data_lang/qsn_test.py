@@ -32,6 +32,22 @@ class QStrTest(unittest.TestCase):
         # backslash handling
         self.assertEqual(r"$'\\'", qsn.maybe_shell_encode('\\'))
 
+    def testPrintableRunEnd(self):
+        self.assertEqual(0, qsn.PrintableRunEnd('', 0))
+        self.assertEqual(3, qsn.PrintableRunEnd('a b\n', 0))
+        self.assertEqual(3, qsn.PrintableRunEnd('a b\n', 3))
+        for ch in '\x00\x1f\x7f\x80\xff\'\\':
+            self.assertEqual(2, qsn.PrintableRunEnd('ab%sc' % ch, 0))
+
+        # Long runs are copied at once, with escapes around them
+        s = 'x' * 100 + '\n\xce\xbc' + 'y' * 100 + "'"
+        self.assertEqual("$'%s\\n\xce\xbc%s\\''" % ('x' * 100, 'y' * 100),
+                         qsn.maybe_shell_encode(s))
+        self.assertEqual("'%s\\n\\u{3bc}%s\\''" % ('x' * 100, 'y' * 100),
+                         qsn.encode(s, qsn.BIT8_U_ESCAPE))
+        self.assertEqual("'%s\\n\\xce\\xbc%s\\''" % ('x' * 100, 'y' * 100),
+                         qsn.encode(s, qsn.BIT8_X_ESCAPE))
+
     def testErrorRecoveryForInvalidUnicode(self):
         CASES = [
             # Preliminaries
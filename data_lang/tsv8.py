@@ -0,0 +1,417 @@
+#!/usr/bin/env python2
+"""
+tsv8.py: Read and write TSV8 tables
+
+TSV8 is TSV with a header, and cells that are J8 primitives:
+
+    !tsv8   name      age
+    !type   Str       Int
+            Alice     42
+            "a\\tb"    25
+
+- The first cell of each row says what it is.  Data rows have an empty first
+  cell, and other rows like !type start with !
+- A Str cell with a tab or newline is written as a J8 string, like "a\\tb".
+  Other cells are written as is.
+- The types are Str, Int, Float, and Bool.  The !type row is optional, and the
+  default is Str.
+
+A table is stored by column, as a Dict of Lists.  Int, Float, and Bool columns
+are packed, so a cell doesn't cost a value_t.  See core/packed_list.py.
+"""
+
+from _devbuild.gen.value_asdl import (value, value_e, value_t, value_str,
+                                      PackedItems)
+
+from core import error
+from core import packed_list
+from core import pyos
+from data_lang import j8
+from mycpp import mylib
+from mycpp.mylib import tagswitch, iteritems, NewDict
+
+from errno import EINTR
+
+from typing import cast, Dict, List, Optional, Tuple
+
+# How much to read from the file descriptor at once
+_READ_SIZE = 1 << 16
+
+# Write() writes the buffer out when it's this big
+_FLUSH_SIZE = 1 << 16
+
+_TYPE_NAMES = {
+    value_e.Str: 'Str',
+    value_e.Int: 'Int',
+    value_e.Float: 'Float',
+    value_e.Bool: 'Bool',
+}
+
+_TYPES = {
+    'Str': value_e.Str,
+    'Int': value_e.Int,
+    'Float': value_e.Float,
+    'Bool': value_e.Bool,
+}
+
+
+def _NewColumn(kind):
+    # type: (int) -> value.List
+    if kind == value_e.Str:
+        return value.List([], None)
+    if kind == value_e.Float:
+        return value.List(None, PackedItems(kind, None, []))
+    return value.List(None, PackedItems(kind, [], None))
+
+
+class Reader(object):
+    """Decode a TSV8 table into columns.
+
+    The input is read in big blocks, which are split into lines and then
+    cells.  Only the cells of the requested columns are decoded.
+    """
+
+    def __init__(self, fd, col_names):
+        # type: (int, List[str]) -> None
+        """
+        Args:
+          fd: read the table from this descriptor
+          col_names: the columns to keep, or [] for all of them
+        """
+        self.fd = fd
+        self.col_names = col_names
+
+        self.lines = []  # type: List[str]
+        self.i = 0  # next line in self.lines
+        self.partial = []  # type: List[str]  # a line that spans blocks
+        self.eof = False
+        self.line_num = 0
+
+        # Set by ReadHeader()
+        self.num_cells = 0
+        self.names = []  # type: List[str]
+        self.kinds = []  # type: List[int]
+        self.indices = []  # type: List[int]  # cell index of each column
+
+    def _Error(self, msg):
+        # type: (str) -> error.Decode
+        return error.Decode(msg, self.line_num)
+
+    def _Fill(self):
+        # type: () -> bool
+        """Read blocks until there's a complete line, and split them into lines.
+
+        Returns False at EOF.  Like val_ops.LineReader, the pieces of a long
+        line are joined once, when its newline arrives.
+        """
+        self.lines = []
+        self.i = 0
+
+        chunks = []  # type: List[str]
+        while not self.eof:
+            n, err_num = pyos.Read(self.fd, _READ_SIZE, chunks)
+            if n < 0:
+                if err_num == EINTR:
+                    continue  # retry, like read --all
+                raise pyos.ReadError(err_num)
+
+            if n == 0:
+                self.eof = True
+                if len(self.partial):  # the last line has no newline
+                    self.lines.append(''.join(self.partial))
+                    del self.partial[:]
+                break
+
+            lines = chunks.pop().split('\n')
+            tail = lines.pop()  # after the last newline
+            if len(lines) == 0:
+                self.partial.append(tail)
+                continue
+
+            if len(self.partial):
+                self.partial.append(lines[0])
+                lines[0] = ''.join(self.partial)
+                del self.partial[:]
+            if len(tail):
+                self.partial.append(tail)
+            self.lines = lines
+            break
+
+        return len(self.lines) != 0
+
+    def _PeekLine(self):
+        # type: () -> Optional[str]
+        """Return the next line without the newline, or None at EOF."""
+        while self.i == len(self.lines):
+            if not self._Fill():
+                return None
+        return self.lines[self.i]
+
+    def _NextLine(self):
+        # type: () -> Optional[str]
+        line = self._PeekLine()
+        if line is not None:
+            self.i += 1
+            self.line_num += 1
+        return line
+
+    def _DecodeStr(self, cell):
+        # type: (str) -> str
+        if not cell.startswith('"'):
+            return cell
+
+        try:
+            val = j8.Parser(cell, -1).Parse()
+        except error.Decode as e:
+            raise self._Error('Invalid string %s: %s' % (cell, e.msg))
+        if val.tag() != value_e.Str:
+            raise self._Error('Invalid string %s' % cell)
+        return cast(value.Str, val).s
+
+    def _Append(self, col, kind, cell):
+        # type: (value.List, int, str) -> None
+        if kind == value_e.Str:
+            col.items.append(value.Str(self._DecodeStr(cell)))
+            return
+
+        p = col.packed
+        if kind == value_e.Int:
+            try:
+                p.ints.append(int(cell))
+            except ValueError:
+                raise self._Error('Expected Int, got %r' % cell)
+
+        elif kind == value_e.Float:
+            try:
+                p.floats.append(float(cell))
+            except ValueError:
+                raise self._Error('Expected Float, got %r' % cell)
+
+        else:
+            if cell == 'true':
+                p.ints.append(1)
+            elif cell == 'false':
+                p.ints.append(0)
+            else:
+                raise self._Error('Expected Bool, got %r' % cell)
+
+    def ReadHeader(self):
+        # type: () -> None
+        """Read the !tsv8 row and the other ! rows."""
+        line = self._NextLine()
+        if line is None:
+            raise self._Error('Expected !tsv8 header')
+
+        cells = line.split('\t')
+        if cells[0] != '!tsv8':
+            raise self._Error('Expected !tsv8 header')
+        self.num_cells = len(cells)
+
+        all_names = []  # type: List[str]
+        all_kinds = []  # type: List[int]
+        for cell in cells[1:]:
+            all_names.append(self._DecodeStr(cell))
+            all_kinds.append(value_e.Str)  # the default
+
+        while True:
+            line = self._PeekLine()
+            if line is None or not line.startswith('!'):
+                break
+            self._NextLine()
+
+            cells = line.split('\t')
+            if cells[0] != '!type':
+                continue  # ignore other attributes
+
+            if len(cells) != self.num_cells:
+                raise self._Error('Expected %d cells, got %d' %
+                                  (self.num_cells, len(cells)))
+            for j in xrange(len(all_names)):
+                type_name = cells[j + 1]
+                if type_name not in _TYPES:
+                    raise self._Error('Invalid type %r' % type_name)
+                all_kinds[j] = _TYPES[type_name]
+
+        if len(self.col_names) == 0:
+            self.names = all_names
+            self.kinds = all_kinds
+            for j in xrange(len(all_names)):
+                self.indices.append(j + 1)
+            return
+
+        for name in self.col_names:
+            found = -1
+            for j, name2 in enumerate(all_names):
+                if name2 == name:
+                    found = j
+                    break
+            if found == -1:
+                raise self._Error("Table doesn't have column %r" % name)
+            self.names.append(name)
+            self.kinds.append(all_kinds[found])
+            self.indices.append(found + 1)
+
+    def _ReadRows(self, max_rows):
+        # type: (int) -> Tuple[value.Dict, int]
+        cols = []  # type: List[value.List]
+        for kind in self.kinds:
+            cols.append(_NewColumn(kind))
+
+        num_rows = 0
+        while num_rows != max_rows:
+            line = self._NextLine()
+            if line is None:
+                break
+
+            cells = line.split('\t')
+            if len(cells) != self.num_cells:
+                raise self._Error('Expected %d cells, got %d' %
+                                  (self.num_cells, len(cells)))
+            if len(cells[0]):
+                raise self._Error('Expected empty cell at start of row')
+
+            for j, col in enumerate(cols):
+                self._Append(col, self.kinds[j], cells[self.indices[j]])
+            num_rows += 1
+
+        d = NewDict()  # type: Dict[str, value_t]
+        for j, name in enumerate(self.names):
+            d[name] = cols[j]
+        return value.Dict(d), num_rows
+
+    def ReadBatch(self, max_rows):
+        # type: (int) -> Optional[value.Dict]
+        """Read up to max_rows rows.
+
+        Returns None when there are no more rows.
+        """
+        table, num_rows = self._ReadRows(max_rows)
+        if num_rows == 0:
+            return None
+        return table
+
+    def ReadAll(self):
+        # type: () -> value.Dict
+        table, _ = self._ReadRows(-1)
+        return table
+
+
+def _NeedsQuotes(s):
+    # type: (str) -> bool
+    return s.startswith('"') or '\t' in s or '\n' in s or '\r' in s
+
+
+def _WriteStr(s, buf):
+    # type: (str, mylib.BufWriter) -> None
+    if _NeedsQuotes(s):
+        j8.EncodeString(s, buf)
+    else:
+        buf.write(s)
+
+
+def _ColumnKind(name, col):
+    # type: (str, value.List) -> int
+    """Return the type of a column.  Every item must have the same type."""
+    if col.packed:
+        return col.packed.kind
+
+    items = col.items  # type: List[value_t]
+    if len(items) == 0:
+        return value_e.Str
+
+    kind = items[0].tag()
+    if kind not in _TYPE_NAMES:
+        raise error.Encode("Column %r can't have items of type %s" %
+                           (name, value_str(kind, dot=False)))
+    for item in items:
+        if item.tag() != kind:
+            raise error.Encode('Column %r has items of different types' %
+                               name)
+    return kind
+
+
+def _WriteCell(col, i, buf):
+    # type: (value.List, int, mylib.BufWriter) -> None
+    p = col.packed
+    if p:
+        if p.kind == value_e.Int:
+            buf.write_int(p.ints[i])
+        elif p.kind == value_e.Float:
+            buf.write_float(p.floats[i])
+        else:
+            buf.write('true' if p.ints[i] else 'false')
+        return
+
+    item = col.items[i]
+    UP_item = item
+    with tagswitch(item) as case:
+        if case(value_e.Str):
+            item = cast(value.Str, UP_item)
+            _WriteStr(item.s, buf)
+        elif case(value_e.Int):
+            item = cast(value.Int, UP_item)
+            buf.write_int(item.i)
+        elif case(value_e.Float):
+            item = cast(value.Float, UP_item)
+            buf.write_float(item.f)
+        elif case(value_e.Bool):
+            item = cast(value.Bool, UP_item)
+            buf.write('true' if item.b else 'false')
+        else:
+            raise AssertionError()  # checked by _ColumnKind
+
+
+def Write(val, f):
+    # type: (value_t, mylib.Writer) -> None
+    """Write a Dict of Lists with the same length as TSV8.
+
+    Raises error.Encode.
+    """
+    if val.tag() != value_e.Dict:
+        raise error.Encode('Expected a Dict of columns, got %s' %
+                           value_str(val.tag(), dot=False))
+    table = cast(value.Dict, val)
+
+    names = []  # type: List[str]
+    cols = []  # type: List[value.List]
+    kinds = []  # type: List[int]
+    num_rows = -1
+    for name, col_val in iteritems(table.d):
+        if col_val.tag() != value_e.List:
+            raise error.Encode('Column %r should be a List, got %s' %
+                               (name, value_str(col_val.tag(), dot=False)))
+        col = cast(value.List, col_val)
+
+        n = packed_list.Len(col)
+        if num_rows == -1:
+            num_rows = n
+        elif n != num_rows:
+            raise error.Encode('Column %r has %d rows, expected %d' %
+                               (name, n, num_rows))
+
+        names.append(name)
+        cols.append(col)
+        kinds.append(_ColumnKind(name, col))
+
+    buf = mylib.BufWriter()
+    buf.write('!tsv8')
+    for name in names:
+        buf.write('\t')
+        _WriteStr(name, buf)
+    buf.write('\n!type')
+    for kind in kinds:
+        buf.write('\t')
+        buf.write(_TYPE_NAMES[kind])
+    buf.write('\n')
+
+    for i in xrange(num_rows):
+        for col in cols:
+            buf.write('\t')
+            _WriteCell(col, i, buf)
+        buf.write('\n')
+
+        if buf.tell() >= _FLUSH_SIZE:
+            f.write(buf.getvalue())
+            buf.clear()
+
+    f.write(buf.getvalue())
@@ -0,0 +1,163 @@
+#!/usr/bin/env python2
+"""
+tsv8_test.py: Tests for tsv8.py
+"""
+from __future__ import print_function
+
+import os
+import unittest
+
+from _devbuild.gen.value_asdl import value, value_e
+from core import error
+from core import packed_list
+from data_lang import tsv8  # module under test
+from mycpp import mylib
+
+_TABLE = '''\
+!tsv8\tname\tage\tscore\tok
+!type\tStr\tInt\tFloat\tBool
+\tAlice\t42\t1.5\ttrue
+\t"a\\tb"\t25\t-2.0\tfalse
+\tBob\t7\t0.25\ttrue
+'''
+
+
+def _Reader(s, col_names=None):
+    r, w = os.pipe()
+    os.write(w, s)
+    os.close(w)
+    return tsv8.Reader(r, col_names or [])
+
+
+def _Strs(col):
+    return [item.s for item in col.items]
+
+
+class ReaderTest(unittest.TestCase):
+
+    def testReadAll(self):
+        # Lines span reads
+        orig = tsv8._READ_SIZE
+        tsv8._READ_SIZE = 5
+        try:
+            r = _Reader(_TABLE)
+            r.ReadHeader()
+            d = r.ReadAll().d
+        finally:
+            tsv8._READ_SIZE = orig
+
+        self.assertEqual(['name', 'age', 'score', 'ok'], d.keys())
+        self.assertEqual(['Alice', 'a\tb', 'Bob'], _Strs(d['name']))
+
+        # Numbers are packed
+        self.assertEqual([42, 25, 7], d['age'].packed.ints)
+        self.assertEqual([1.5, -2.0, 0.25], d['score'].packed.floats)
+        self.assertEqual(value_e.Bool, d['ok'].packed.kind)
+        self.assertEqual(False, packed_list.GetItem(d['ok'], 1).b)
+
+    def testLongRow(self):
+        # A row spans many reads, and the last row has no newline
+        orig = tsv8._READ_SIZE
+        tsv8._READ_SIZE = 4
+        try:
+            r = _Reader('!tsv8\tname\n\t%s\n\tend' % ('x' * 50))
+            r.ReadHeader()
+            d = r.ReadAll().d
+        finally:
+            tsv8._READ_SIZE = orig
+
+        self.assertEqual(['x' * 50, 'end'], _Strs(d['name']))
+
+    def testProjection(self):
+        r = _Reader(_TABLE, ['ok', 'name'])
+        r.ReadHeader()
+        d = r.ReadAll().d
+        self.assertEqual(['ok', 'name'], d.keys())
+        self.assertEqual(['Alice', 'a\tb', 'Bob'], _Strs(d['name']))
+
+        r = _Reader(_TABLE, ['nope'])
+        self.assertRaises(error.Decode, r.ReadHeader)
+
+    def testBatches(self):
+        r = _Reader(_TABLE, ['name'])
+        r.ReadHeader()
+        self.assertEqual(['Alice', 'a\tb'], _Strs(r.ReadBatch(2).d['name']))
+        self.assertEqual(['Bob'], _Strs(r.ReadBatch(2).d['name']))
+        self.assertEqual(None, r.ReadBatch(2))
+
+    def testDefaults(self):
+        # No !type row, other ! rows, and no newline at the end
+        r = _Reader('!tsv8\tx\ty\n!desc\tfoo\tbar\n\t1\t2')
+        r.ReadHeader()
+        d = r.ReadAll().d
+        self.assertEqual(['1'], _Strs(d['x']))
+        self.assertEqual(['2'], _Strs(d['y']))
+
+    def testErrors(self):
+        for s in [
+                '',
+                'name\tage\n',
+                '!tsv8\tx\n!type\tNull\n',
+                '!tsv8\tx\n!type\tInt\n\tfoo\n',
+                '!tsv8\tx\n!type\tFloat\n\t1.0.0\n',
+                '!tsv8\tx\n!type\tBool\n\tTrue\n',
+                '!tsv8\tx\n\t1\t2\n',
+                '!tsv8\tx\nz\t1\n',
+                '!tsv8\tx\n\t"abc\n',
+        ]:
+            r = _Reader(s)
+            try:
+                r.ReadHeader()
+                r.ReadAll()
+            except error.Decode as e:
+                pass
+            else:
+                self.fail('Expected error for %r' % s)
+
+
+class WriteTest(unittest.TestCase):
+
+    def testRoundTrip(self):
+        r = _Reader(_TABLE)
+        r.ReadHeader()
+        table = r.ReadAll()
+
+        buf = mylib.BufWriter()
+        tsv8.Write(table, buf)
+        self.assertEqual(_TABLE, buf.getvalue())
+
+    def testBoxed(self):
+        buf = mylib.BufWriter()
+        tsv8.Write(value.Dict(mylib.NewDict()), buf)
+        self.assertEqual('!tsv8\n!type\n', buf.getvalue())
+
+        table = value.Dict(mylib.NewDict())
+        table.d['name'] = value.List([value.Str('"q"'),
+                                      value.Str('x\ny')], None)
+        table.d['n'] = value.List([value.Int(1), value.Int(2)], None)
+        buf = mylib.BufWriter()
+        tsv8.Write(table, buf)
+        self.assertEqual(
+            '!tsv8\tname\tn\n!type\tStr\tInt\n'
+            '\t"\\"q\\""\t1\n\t"x\\ny"\t2\n', buf.getvalue())
+
+    def testErrors(self):
+        bad = [
+            value.Str('x'),
+            value.Dict({'a': value.Str('x')}),
+            value.Dict({'a': value.List([value.Int(1),
+                                         value.Str('x')], None)}),
+            value.Dict({'a': value.List([value.Null], None)}),
+        ]
+        for val in bad:
+            self.assertRaises(error.Encode, tsv8.Write, val,
+                              mylib.BufWriter())
+
+        table = value.Dict(mylib.NewDict())
+        table.d['a'] = value.List([], None)
+        table.d['b'] = value.List([value.Str('x')], None)
+        self.assertRaises(error.Encode, tsv8.Write, table, mylib.BufWriter())
+
+
+if __name__ == '__main__':
+    unittest.main()
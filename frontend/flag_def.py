@@ -115,6 +115,10 @@ READ_SPEC.ShortFlag('-p', args.String)  # prompt
 READ_SPEC.ShortFlag('-0')  # until NUL, like -r -d ''
 READ_SPEC.LongFlag('--all')
 READ_SPEC.LongFlag('--line')
+READ_SPEC.LongFlag('--all-lines')
+# A window of lines for --all-lines
+READ_SPEC.LongFlag('--skip', args.Int, default=0)
+READ_SPEC.LongFlag('--max-lines', args.Int, default=-1)
 # don't strip the trailing newline
 READ_SPEC.LongFlag('--with-eol')
 # Decode QSN after reading a line.  Note: A QSN string can't have literal
@@ -123,6 +127,9 @@ READ_SPEC.ShortFlag('-q', long_name='--qsn')
 
 MAPFILE_SPEC = FlagSpec('mapfile')
 MAPFILE_SPEC.ShortFlag('-t')
+MAPFILE_SPEC.ShortFlag('-d', args.String)
+MAPFILE_SPEC.ShortFlag('-n', args.Int)
+MAPFILE_SPEC.ShortFlag('-s', args.Int)
 
 CD_SPEC = FlagSpec('cd')
 CD_SPEC.ShortFlag('-L')
@@ -511,3 +518,17 @@ JSON_READ_SPEC.LongFlag('--validate',
                         args.Bool,
                         default=True,
                         help='Validate UTF-8')
+JSON_READ_SPEC.LongFlag('--lines',
+                        args.Bool,
+                        default=False,
+                        help='Read one value per line, and run a block on each')
+
+#
+# TSV8
+#
+
+TSV8_READ_SPEC = FlagSpec('tsv8_read')
+TSV8_READ_SPEC.LongFlag('--batch',
+                        args.Int,
+                        default=-1,
+                        help='Run a block on each batch of this many rows')
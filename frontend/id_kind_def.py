@@ -673,6 +673,35 @@ def AddKinds(spec):
 
     spec.AddKind('Range', ['Int', 'Char', 'Dots', 'Other'])
 
+    # For JSON and J8 data in data_lang/j8.py
+    spec.AddKind(
+        'J8',
+        [
+            'LBracket',
+            'RBracket',
+            'LBrace',
+            'RBrace',
+            'Comma',
+            'Colon',
+            'Null',
+            'Bool',
+            'Int',
+            'Float',
+            'LeadingZero',  # 007 is invalid
+            'String',  # "foo", without escapes
+            'LeftQuote',  # starts a string with escapes
+            'RightQuote',
+            'Space',
+            'Newline',
+            # Inside strings
+            'Literals',
+            'OneChar',  # \n
+            'Unicode4',  # \u03bc
+            'UBraced',  # \u{03bc}
+            'YHex',  # \yff
+            'BadBackslash',
+        ])
+
     # Note: not used now
     spec.AddKind(
         'QSN',
@@ -728,6 +728,52 @@ BRACE_RANGE_DEF = [
     R(r'[^\0]', Id.Range_Other),  # invalid
 ]
 
+# For data_lang/j8.py.  JSON is a subset of J8.
+#
+# lexer_gen.py doesn't translate |, so instead of -?(0|[1-9][0-9]*), a number
+# is matched by one of two rules.  Leading zeros like 007 make a longer match,
+# which is an error.
+_J8_FRAC_EXP_RE = r'(\.[0-9]+)?([eE][-+]?[0-9]+)?'
+
+J8_DEF = [
+    C('[', Id.J8_LBracket),
+    C(']', Id.J8_RBracket),
+    C('{', Id.J8_LBrace),
+    C('}', Id.J8_RBrace),
+    C(',', Id.J8_Comma),
+    C(':', Id.J8_Colon),
+    C('null', Id.J8_Null),
+    C('true', Id.J8_Bool),
+    C('false', Id.J8_Bool),
+
+    # Int comes first, so it wins over Float when both match
+    R(r'-?0', Id.J8_Int),
+    R(r'-?[1-9][0-9]*', Id.J8_Int),
+    R(r'-?0' + _J8_FRAC_EXP_RE, Id.J8_Float),
+    R(r'-?[1-9][0-9]*' + _J8_FRAC_EXP_RE, Id.J8_Float),
+    R(r'-?0[0-9]+', Id.J8_LeadingZero),
+
+    # Common case: a whole string without escapes is one token
+    R(r'"[^"\\\0]*"', Id.J8_String),
+    C('"', Id.J8_LeftQuote),
+    R(r'[ \r\t]+', Id.J8_Space),
+    C('\n', Id.J8_Newline),
+    R(r'[^\0]', Id.Unknown_Tok),
+]
+
+# Inside a string with escapes, after J8_LeftQuote
+J8_STR_DEF = [
+    R(r'[^"\\\0]+', Id.J8_Literals),
+    R(r'\\["\\/bfnrt]', Id.J8_OneChar),
+    R(r'\\u[0-9a-fA-F]{4}', Id.J8_Unicode4),
+    # J8 only
+    R(r'\\u\{[0-9a-fA-F]{1,6}\}', Id.J8_UBraced),
+    R(r'\\y[0-9a-fA-F]{2}', Id.J8_YHex),
+    C('"', Id.J8_RightQuote),
+    # Invalid escape like \z, or an incomplete one
+    C('\\', Id.J8_BadBackslash),
+]
+
 #
 # YSH lexing
 #
@@ -6,7 +6,7 @@ from _devbuild.gen.id_kind_asdl import Id, Id_t
 from _devbuild.gen.types_asdl import lex_mode_t
 from frontend import lexer_def
 
-from typing import Tuple, Callable, Dict, List, Any, TYPE_CHECKING
+from typing import Tuple, Callable, Dict, List, Optional, Any, TYPE_CHECKING
 
 # bin/osh should work without compiling fastlex?  But we want all the unit
 # tests to run with a known version of it.
@@ -131,6 +131,20 @@ def _MatchBraceRangeToken_Fast(line, start_pos):
     return tok_type, end_pos
 
 
+def _MatchJ8Token_Fast(line, start_pos):
+    # type: (str, int) -> Tuple[Id_t, int]
+    """Returns (id, end_pos)."""
+    tok_type, end_pos = fastlex.MatchJ8Token(line, start_pos)
+    return tok_type, end_pos
+
+
+def _MatchJ8StrToken_Fast(line, start_pos):
+    # type: (str, int) -> Tuple[Id_t, int]
+    """Returns (id, end_pos)."""
+    tok_type, end_pos = fastlex.MatchJ8StrToken(line, start_pos)
+    return tok_type, end_pos
+
+
 #def _MatchQsnToken_Fast(line, start_pos):
 #  # type: (str, int) -> Tuple[Id_t, int]
 #  """Returns (id, end_pos)."""
@@ -144,11 +158,14 @@ if fastlex:
     PS1_MATCHER = _MatchPS1Token_Fast
     HISTORY_MATCHER = _MatchHistoryToken_Fast
     BRACE_RANGE_MATCHER = _MatchBraceRangeToken_Fast
+    MatchJ8Token = _MatchJ8Token_Fast
+    MatchJ8StrToken = _MatchJ8StrToken_Fast
     #QSN_MATCHER = _MatchQsnToken_Fast
     IsValidVarName = fastlex.IsValidVarName
     ShouldHijack = fastlex.ShouldHijack
     LooksLikeInteger = fastlex.LooksLikeInteger
     LooksLikeFloat = fastlex.LooksLikeFloat
+    IfsSplit = fastlex.IfsSplit
 else:
     OneToken = _MatchOshToken_Slow(lexer_def.LEXER_DEF)
     ECHO_MATCHER = _MatchTokenSlow(lexer_def.ECHO_E_DEF)
@@ -156,6 +173,8 @@ else:
     PS1_MATCHER = _MatchTokenSlow(lexer_def.PS1_DEF)
     HISTORY_MATCHER = _MatchTokenSlow(lexer_def.HISTORY_DEF)
     BRACE_RANGE_MATCHER = _MatchTokenSlow(lexer_def.BRACE_RANGE_DEF)
+    MatchJ8Token = _MatchTokenSlow(lexer_def.J8_DEF)
+    MatchJ8StrToken = _MatchTokenSlow(lexer_def.J8_STR_DEF)
     #QSN_MATCHER = _MatchTokenSlow(lexer_def.QSN_DEF)
 
     # Used by osh/cmd_parse.py to validate for loop name.  Note it must be
@@ -187,6 +206,38 @@ else:
         # type: (str) -> bool
         return bool(_LOOKS_LIKE_FLOAT_RE.match(s))
 
+    def IfsSplit(s, ifs_whitespace, ifs_other):
+        # type: (str, str, str) -> Optional[List[str]]
+        """Split s into fields when it has no backslashes.
+
+        Same algorithm as cpp/ifs_split_shared.h.  Returns None if the caller
+        has to use the state machine in osh/split.py.
+        """
+        if '\\' in s:
+            return None
+
+        parts = []  # type: List[str]
+        n = len(s)
+        i = 0
+        gray_pending = True  # a leading IFS char like ':' gives an empty field
+        while i < n:
+            c = s[i]
+            if c in ifs_whitespace:
+                i += 1
+            elif c in ifs_other:
+                if gray_pending:
+                    parts.append('')
+                gray_pending = True
+                i += 1
+            else:
+                start = i
+                while (i < n and s[i] not in ifs_whitespace and
+                       s[i] not in ifs_other):
+                    i += 1
+                parts.append(s[start:i])
+                gray_pending = False
+        return parts
+
 
 class SimpleLexer(object):
 
@@ -40,6 +40,29 @@ class MatchTest(unittest.TestCase):
             if id_ == Id.Eol_Tok:
                 break
 
+    def testJ8Lexer(self):
+        s = '[null, -1.5e3, "a\\u00e9"]'
+        pos = 0
+        ids = []
+        while True:
+            id_, pos = match.MatchJ8Token(s, pos)
+            ids.append(id_)
+            if id_ == Id.J8_LeftQuote:
+                while id_ != Id.J8_RightQuote:
+                    id_, pos = match.MatchJ8StrToken(s, pos)
+                    ids.append(id_)
+            if id_ == Id.Eol_Tok:
+                break
+        self.assertEqual([
+            Id.J8_LBracket, Id.J8_Null, Id.J8_Comma, Id.J8_Space,
+            Id.J8_Float, Id.J8_Comma, Id.J8_Space, Id.J8_LeftQuote,
+            Id.J8_Literals, Id.J8_Unicode4, Id.J8_RightQuote, Id.J8_RBracket,
+            Id.Eol_Tok
+        ], ids)
+
+        # A string without escapes is one token
+        self.assertEqual((Id.J8_String, 5), match.MatchJ8Token('"abc"', 0))
+
     def testLooksLike(self):
         INTS = [
             (False, ''),
@@ -6,6 +6,7 @@ from _devbuild.gen.syntax_asdl import (loc, loc_t, ArgList, LiteralBlock,
                                        command_t, expr_t)
 from _devbuild.gen.value_asdl import (value, value_e, value_t)
 from core import error
+from core import packed_list
 from core.error import e_usage
 from frontend import location
 from mycpp import mylib
@@ -204,7 +205,7 @@ class Reader(object):
     def _ToList(self, val):
         # type: (value_t) -> List[value_t]
         if val.tag() == value_e.List:
-            return cast(value.List, val).items
+            return packed_list.Items(cast(value.List, val))
 
         raise error.TypeErr(val, 'Arg %d should be a List' % self.pos_consumed,
                             self.BlamePos())
@@ -304,6 +305,16 @@ class Reader(object):
         val = self.PosValue()
         return self._ToList(val)
 
+    def PosListValue(self):
+        # type: () -> value.List
+        """For List methods that handle packed items, like L->append()."""
+        val = self.PosValue()
+        if val.tag() == value_e.List:
+            return cast(value.List, val)
+
+        raise error.TypeErr(val, 'Arg %d should be a List' % self.pos_consumed,
+                            self.BlamePos())
+
     def PosDict(self):
         # type: () -> Dict[str, value_t]
         val = self.PosValue()
@@ -427,7 +438,7 @@ class Reader(object):
         if val.tag() == value_e.List:
             val = cast(value.List, UP_val)
             mylib.dict_erase(self.named_args, param_name)
-            return val.items
+            return packed_list.Items(val)
 
         raise error.TypeErr(val, 'Named arg %r should be a List' % param_name,
                             self._BlameNamed(param_name))
@@ -35,7 +35,7 @@ class TypedArgsTest(unittest.TestCase):
             value.Int(0xc0ffee),
             value.Str('foo'),
             value.List([value.Int(1), value.Int(2),
-                        value.Int(3)]),
+                        value.Int(3)], None),
             value.Dict({
                 'a': value.Int(0xaa),
                 'b': value.Int(0xbb)
@@ -109,7 +109,7 @@ class TypedArgsTest(unittest.TestCase):
             'name': value.Str('foo'),
             'numbers': value.List([value.Int(1),
                                    value.Int(2),
-                                   value.Int(3)]),
+                                   value.Int(3)], None),
             'blah': value.Dict({
                 'a': value.Int(0xaa),
                 'b': value.Int(0xbb)
@@ -49,6 +49,10 @@ class BumpLeakHeap {
 #endif
     return -1;  // no collection attempted
   }
+  void BeginRegion() {
+  }
+  void EndRegion() {
+  }
 
   void PrintStats(int fd);
 
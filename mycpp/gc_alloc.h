@@ -125,7 +125,8 @@ T* Alloc(Args&&... args) {
 #if MARK_SWEEP
   int obj_id;
   int pool_id;
-  void* place = gHeap.Allocate(num_bytes, &obj_id, &pool_id);
+  void* place = gHeap.AllocateInRegion(num_bytes, T::obj_header().type_tag,
+                                        &obj_id, &pool_id);
 #else
   void* place = gHeap.Allocate(num_bytes);
 #endif
@@ -158,7 +159,8 @@ inline BigStr* NewStr(int len) {
 #if MARK_SWEEP
   int obj_id;
   int pool_id;
-  void* place = gHeap.Allocate(num_bytes, &obj_id, &pool_id);
+  void* place = gHeap.AllocateInRegion(num_bytes, TypeTag::BigStr, &obj_id,
+                                        &pool_id);
 #else
   void* place = gHeap.Allocate(num_bytes);
 #endif
@@ -170,6 +172,7 @@ inline BigStr* NewStr(int len) {
   s->len_ = len;
   s->hash_ = 0;
   s->is_hashed_ = 0;
+  s->ascii_state_ = kAsciiUnknown;
 
 #if MARK_SWEEP
   header->obj_id = obj_id;
@@ -189,7 +192,8 @@ inline BigStr* OverAllocatedStr(int len) {
 #if MARK_SWEEP
   int obj_id;
   int pool_id;
-  void* place = gHeap.Allocate(num_bytes, &obj_id, &pool_id);
+  void* place = gHeap.AllocateInRegion(num_bytes, TypeTag::BigStr, &obj_id,
+                                        &pool_id);
 #else
   void* place = gHeap.Allocate(num_bytes);
 #endif
@@ -197,6 +201,7 @@ inline BigStr* OverAllocatedStr(int len) {
   auto s = new (header->ObjectAddress()) BigStr();
   s->hash_ = 0;
   s->is_hashed_ = 0;
+  s->ascii_state_ = kAsciiUnknown;
 
 #if MARK_SWEEP
   header->obj_id = obj_id;
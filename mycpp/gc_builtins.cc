@@ -26,16 +26,14 @@ BigStr* str(int i) {
 // TODO:
 // - This could use a fancy exact algorithm, not libc
 // - Does libc depend on locale?
-BigStr* str(double d) {
-  char buf[64];  // overestimate, but we use snprintf() to be safe
-
+int FormatFloat(double d, char* buf, int buf_size) {
   // Problem:
   // %f prints 3.0000000 and 3.500000
   // %g prints 3 and 3.5
   //
   // We want literal syntax to indicate float, so add '.'
 
-  int n = sizeof(buf) - 2;  // in case we add '.0'
+  int n = buf_size - 2;  // in case we add '.0'
 
   // %.9g digits for string that can be converted back to the same FLOAT
   // (not double)
@@ -47,16 +45,23 @@ BigStr* str(double d) {
   // int length = snprintf(buf, n, "%a", d);
 
   if (strchr(buf, 'i')) {  // inf or -inf
-    return StrFromC(buf);
+    return length;
   }
 
   if (!strchr(buf, '.')) {  // 12345 -> 12345.0
     buf[length] = '.';
     buf[length + 1] = '0';
     buf[length + 2] = '\0';
+    length += 2;
   }
 
-  return StrFromC(buf);
+  return length;
+}
+
+BigStr* str(double d) {
+  char buf[kFloatBufSize];
+  int length = FormatFloat(d, buf, kFloatBufSize);
+  return StrFromC(buf, length);
 }
 
 // Do we need this API?  Or is mylib.InternedStr(BigStr* s, int start, int end)
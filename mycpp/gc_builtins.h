@@ -121,6 +121,13 @@ BigStr* repr(BigStr* s);
 
 BigStr* str(int i);
 
+// Big enough for any double, plus the '.0' we may add
+const int kFloatBufSize = 64;
+
+// Format a float like str(), returning the length.  buf_size must be at least
+// kFloatBufSize.
+int FormatFloat(double d, char* buf, int buf_size);
+
 BigStr* str(double d);
 
 BigStr* intern(BigStr* s);
@@ -421,9 +421,24 @@ inline bool _cmp(BigStr* a, BigStr* b) {
   return mylib::str_cmp(a, b) < 0;
 }
 
+// A functor, so List<int>::sort() doesn't make _cmp an overloaded name
+template <typename T>
+struct _SortLess {
+  bool operator()(T a, T b) const {
+    return a < b;
+  }
+};
+
+template <>
+struct _SortLess<BigStr*> {
+  bool operator()(BigStr* a, BigStr* b) const {
+    return _cmp(a, b);
+  }
+};
+
 template <typename T>
 void List<T>::sort() {
-  std::sort(slab_->items_, slab_->items_ + len_, _cmp);
+  std::sort(slab_->items_, slab_->items_ + len_, _SortLess<T>());
 }
 
 // TODO: mycpp can just generate the constructor instead?
@@ -436,6 +436,12 @@ TEST test_list_sort() {
   ASSERT(str_equals(s->at(1), s2));
   ASSERT(str_equals(s->at(2), s3));
 
+  auto ints = NewList<int>(std::initializer_list<int>{1000000, 3, 42});
+  ints->sort();
+  ASSERT_EQ(3, ints->at(0));
+  ASSERT_EQ(42, ints->at(1));
+  ASSERT_EQ(1000000, ints->at(2));
+
   PASS();
 }
 
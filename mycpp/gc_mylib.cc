@@ -186,12 +186,10 @@ int BufWriter::capacity() {
   return str_ ? len(str_) : 0;
 }
 
-void BufWriter::Extend(BigStr* s) {
-  const int n = len(s);
-
+void BufWriter::Extend(const char* s, int n) {
   assert(capacity() >= len_ + n);
 
-  memcpy(end(), s->data_, n);
+  memcpy(end(), s, n);
   len_ += n;
   data()[len_] = '\0';
 }
@@ -208,11 +206,9 @@ void BufWriter::EnsureCapacity(int cap) {
   }
 }
 
-void BufWriter::write(BigStr* s) {
+void BufWriter::WriteRaw(const char* s, int n) {
   assert(is_valid_);  // Can't write() after getvalue()
 
-  int n = len(s);
-
   // write('') is a no-op, so don't create Buf if we don't need to
   if (n == 0) {
     return;
@@ -227,7 +223,23 @@ void BufWriter::write(BigStr* s) {
   }
 
   // Append the contents to the buffer
-  Extend(s);
+  Extend(s, n);
+}
+
+void BufWriter::write(BigStr* s) {
+  WriteRaw(s->data_, len(s));
+}
+
+void BufWriter::write_int(int i) {
+  char buf[kIntBufSize];
+  int n = snprintf(buf, kIntBufSize, "%d", i);
+  WriteRaw(buf, n);
+}
+
+void BufWriter::write_float(double f) {
+  char buf[kFloatBufSize];
+  int n = FormatFloat(f, buf, kFloatBufSize);
+  WriteRaw(buf, n);
 }
 
 BigStr* BufWriter::getvalue() {
@@ -245,4 +257,11 @@ BigStr* BufWriter::getvalue() {
   }
 }
 
+void BufWriter::clear() {
+  // The buffer was handed off by getvalue(), or we drop it
+  str_ = nullptr;
+  len_ = 0;
+  is_valid_ = true;
+}
+
 }  // namespace mylib
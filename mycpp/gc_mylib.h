@@ -30,6 +30,20 @@ inline void MaybeCollect() {
   gHeap.MaybeCollect();
 }
 
+// Put parser output in a region that the GC treats as a unit.  See Region in
+// mycpp/mark_sweep_heap.h for what callers must not do afterward.
+class ctx_Region {
+ public:
+  ctx_Region() {
+    gHeap.BeginRegion();
+  }
+  ~ctx_Region() {
+    gHeap.EndRegion();
+  }
+
+  DISALLOW_COPY_AND_ASSIGN(ctx_Region);
+};
+
 void print_stderr(BigStr* s);
 
 // const int kStdout = 1;
@@ -106,6 +120,12 @@ inline BigStr* octal(int i) {
   return ::StrFromC(buf, len);
 }
 
+// O(1) after the first call on a string, so ${#s} and ${s:i:1} in a loop
+// aren't quadratic
+inline bool is_ascii(BigStr* s) {
+  return s->is_ascii();
+}
+
 class LineReader {
  public:
   // Abstract type with no fields: unknown size
@@ -215,8 +235,18 @@ class BufWriter : public Writer {
   bool isatty() override {
     return false;
   }
+  // Like write(str(i)) and write(str(f)), without allocating a string
+  void write_int(int i);
+  void write_float(double f);
+
   // For cStringIO API
   BigStr* getvalue();
+  int tell() {
+    return is_valid_ ? len_ : 0;
+  }
+
+  // Start over after getvalue(), e.g. to flush a stream in chunks
+  void clear();
 
   static constexpr ObjHeader obj_header() {
     return ObjHeader::ClassFixed(field_mask(), sizeof(BufWriter));
@@ -230,7 +260,8 @@ class BufWriter : public Writer {
  private:
   void EnsureCapacity(int n);
 
-  void Extend(BigStr* s);
+  void Extend(const char* s, int n);
+  void WriteRaw(const char* s, int n);
   char* data();
   char* end();
   int capacity();
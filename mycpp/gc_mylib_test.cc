@@ -148,6 +148,23 @@ TEST BufWriter_test() {
   ASSERT(str_equals0("foobar", s));
   log("result = %s", s->data());
 
+  // Numbers are formatted like str()
+  writer = Alloc<mylib::BufWriter>();
+  writer->write_int(-42);
+  writer->write(foo);
+  writer->write_float(3.0);
+  writer->write_float(0.5);
+  ASSERT_EQ(12, writer->tell());
+  s = writer->getvalue();
+  ASSERT(str_equals0("-42foo3.00.5", s));
+
+  // clear() after getvalue() lets us write more
+  writer->clear();
+  ASSERT_EQ(0, writer->tell());
+  writer->write(bar);
+  s = writer->getvalue();
+  ASSERT(str_equals0("bar", s));
+
   PASS();
 }
 
@@ -15,11 +15,14 @@ GLOBAL_STR(kEmptyString, "");
 static const std::regex gStrFmtRegex("([^%]*)(?:%(-?[0-9]*)(.))?");
 static const int kMaxFmtWidth = 256;  // arbitrary...
 
-int BigStr::find(BigStr* needle, int pos) {
+int BigStr::find(BigStr* needle, int pos, int end) {
   int len_ = len(this);
+  if (end == -1 || end > len_) {
+    end = len_;
+  }
   assert(len(needle) == 1);  // Oil's usage
   char c = needle->data_[0];
-  for (int i = pos; i < len_; ++i) {
+  for (int i = pos; i < end; ++i) {
     if (data_[i] == c) {
       return i;
     }
@@ -79,6 +82,21 @@ bool BigStr::isupper() {
   return true;
 }
 
+// Unlike isupper() etc., this is true for an empty string, like Python 3
+bool BigStr::is_ascii() {
+  if (ascii_state_ == kAsciiUnknown) {
+    ascii_state_ = kAsciiYes;
+    int n = len(this);
+    for (int i = 0; i < n; ++i) {
+      if (data_[i] & 0x80) {
+        ascii_state_ = kAsciiNo;
+        break;
+      }
+    }
+  }
+  return ascii_state_ == kAsciiYes;
+}
+
 bool BigStr::startswith(BigStr* s) {
   int n = len(s);
   if (n > len(this)) {
@@ -527,7 +545,7 @@ List<BigStr*>* BigStr::split(BigStr* sep) {
 
 unsigned BigStr::hash(HashFunc h) {
   if (!is_hashed_) {
-    hash_ = h(data_, len_) >> 1;
+    hash_ = h(data_, len_) >> 3;
     is_hashed_ = 1;
   }
   return hash_;
@@ -23,7 +23,8 @@ class BigStr {
 
   BigStr* at(int i);
 
-  int find(BigStr* needle, int pos = 0);
+  // end is exclusive, like Python; -1 means the end of the string
+  int find(BigStr* needle, int pos = 0, int end = -1);
   int rfind(BigStr* needle);
 
   BigStr* slice(int begin);
@@ -54,6 +55,7 @@ class BigStr {
   bool isdigit();
   bool isalpha();
   bool isupper();
+  bool is_ascii();  // cached, like hash()
 
   BigStr* upper();
   BigStr* lower();
@@ -78,9 +80,10 @@ class BigStr {
   unsigned hash(HashFunc h);
 
   int len_;
-  unsigned hash_ : 31;
+  unsigned hash_ : 29;
   unsigned is_hashed_ : 1;
-  char data_[1];  // flexible array
+  unsigned ascii_state_ : 2;  // for is_ascii()
+  char data_[1];              // flexible array
 
  private:
   int _strip_left_pos();
@@ -91,6 +94,12 @@ class BigStr {
 
 constexpr int kStrHeaderSize = offsetof(BigStr, data_);
 
+// Values of BigStr::ascii_state_.  Strings are written to after NewStr(), so
+// is_ascii() computes it lazily.
+const int kAsciiUnknown = 0;
+const int kAsciiYes = 1;
+const int kAsciiNo = 2;
+
 // Note: for SmallStr, we might copy into the VALUE
 inline void BigStr::MaybeShrink(int str_len) {
   len_ = str_len;
@@ -145,8 +154,9 @@ class GlobalStr {
   // a buffer of size N).  For initializing global constant instances.
  public:
   int len_;
-  unsigned hash_ : 31;
+  unsigned hash_ : 29;
   unsigned is_hashed_ : 1;
+  unsigned ascii_state_ : 2;
   const char data_[N];
 
   DISALLOW_COPY_AND_ASSIGN(GlobalStr)
@@ -197,14 +207,22 @@ inline int len(const Str s) {
 #define GLOBAL_STR(name, val)                                                \
   GcGlobal<GlobalStr<sizeof(val)>> _##name = {                               \
       ObjHeader::Global(TypeTag::BigStr),                                    \
-      {.len_ = sizeof(val) - 1, .hash_ = 0, .is_hashed_ = 0, .data_ = val}}; \
+      {.len_ = sizeof(val) - 1,                                              \
+       .hash_ = 0,                                                           \
+       .is_hashed_ = 0,                                                      \
+       .ascii_state_ = kAsciiUnknown,                                        \
+       .data_ = val}};                                                       \
   BigStr* name = reinterpret_cast<BigStr*>(&_##name.obj);
 
 // New style for SmallStr compatibility
 #define GLOBAL_STR2(name, val)                                               \
   GcGlobal<GlobalStr<sizeof(val)>> _##name = {                               \
       ObjHeader::Global(TypeTag::BigStr),                                    \
-      {.len_ = sizeof(val) - 1, .hash_ = 0, .is_hashed_ = 0, .data_ = val}}; \
+      {.len_ = sizeof(val) - 1,                                              \
+       .hash_ = 0,                                                           \
+       .is_hashed_ = 0,                                                      \
+       .ascii_state_ = kAsciiUnknown,                                        \
+       .data_ = val}};                                                       \
   Str name(reinterpret_cast<BigStr*>(&_##name.obj));
 
 #endif  // MYCPP_GC_STR_H
@@ -116,6 +116,11 @@ TEST test_str_find() {
   ASSERT_EQ(0, s->find(StrFromC("a")));
   ASSERT_EQ(2, s->find(StrFromC("c")));
 
+  // start and end
+  ASSERT_EQ(4, s->find(StrFromC("a"), 1));
+  ASSERT_EQ(-1, s->find(StrFromC("a"), 1, 4));
+  ASSERT_EQ(4, s->find(StrFromC("a"), 1, 5));
+
   ASSERT_EQ(4, s->rfind(StrFromC("a")));
   ASSERT_EQ(6, s->rfind(StrFromC("c")));
 
@@ -1282,6 +1287,13 @@ TEST str_methods_test() {
   ASSERT((StrFromC("3"))->isdigit());
   ASSERT(!(StrFromC(""))->isdigit());
 
+  ASSERT((StrFromC(""))->is_ascii());
+  ASSERT((StrFromC("abc"))->is_ascii());
+  ASSERT(!(StrFromC("a\xce\xbc"))->is_ascii());
+  ASSERT(kStrFood->is_ascii());
+  ASSERT(kStrFood->is_ascii());  // cached
+  ASSERT_EQ(kAsciiYes, kStrFood->ascii_state_);
+
   log("slice()");
   ASSERT(str_equals0("f", kStrFood->at(0)));
 
@@ -31,6 +31,11 @@ void MarkSweepHeap::Init(int gc_threshold) {
     }
   }
 
+  e = getenv("OILS_GC_REGIONS");
+  if (e && strcmp(e, "1") == 0) {
+    regions_enabled_ = true;
+  }
+
   // only for developers
   e = getenv("_OILS_GC_VERBOSE");
   if (e && strcmp(e, "1") == 0) {
@@ -115,6 +120,123 @@ void* MarkSweepHeap::Allocate(size_t num_bytes, int* obj_id, int* pool_id) {
   return result;
 }
 
+// Most LST nodes are 16 to 64 bytes, so this holds about 1000 of them
+const int kRegionChunkSize = KiB(64);
+
+void* Region::Allocate(size_t num_bytes) {
+  num_bytes = (num_bytes + 7) & ~7;  // keep headers aligned
+
+  char* result;
+  if (num_bytes > kRegionChunkSize / 4) {
+    // Big objects get their own chunk, so we don't waste the rest of one
+    result = static_cast<char*>(malloc(num_bytes));
+    chunks_.push_back(result);
+  } else {
+    if (pos_ + num_bytes > end_) {
+      pos_ = static_cast<char*>(malloc(kRegionChunkSize));
+      end_ = pos_ + kRegionChunkSize;
+      chunks_.push_back(pos_);
+    }
+    result = pos_;
+    pos_ += num_bytes;
+  }
+  DCHECK(result != nullptr);
+
+  objs_.push_back(reinterpret_cast<ObjHeader*>(result));
+  num_objs_++;
+  num_bytes_ += num_bytes;
+  return result;
+}
+
+static inline bool IsOutPtr(RawObject* child, int region_id) {
+  if (child == nullptr) {
+    return false;
+  }
+  ObjHeader* header = ObjHeader::FromObject(child);
+  if (header->heap_tag == HeapTag::Global) {
+    return false;
+  }
+  return !(header->pool_id == kRegionPoolId && header->obj_id == region_id);
+}
+
+void Region::Close(int region_id) {
+  for (ObjHeader* header : objs_) {
+    switch (header->heap_tag) {
+    case HeapTag::FixedSize: {
+      auto fixed = reinterpret_cast<LayoutFixed*>(header->ObjectAddress());
+      int mask = FIELD_MASK(*header);
+      for (int i = 0; i < kFieldMaskBits; ++i) {
+        if ((mask & (1 << i)) && IsOutPtr(fixed->children_[i], region_id)) {
+          out_ptrs_.push_back(fixed->children_[i]);
+        }
+      }
+      break;
+    }
+
+    case HeapTag::Scanned: {
+      auto slab = reinterpret_cast<Slab<RawObject*>*>(header->ObjectAddress());
+      int n = NUM_POINTERS(*header);
+      for (int i = 0; i < n; ++i) {
+        if (IsOutPtr(slab->items_[i], region_id)) {
+          out_ptrs_.push_back(slab->items_[i]);
+        }
+      }
+      break;
+    }
+
+    default:  // Opaque objects have no children
+      break;
+    }
+  }
+
+  std::vector<ObjHeader*>().swap(objs_);  // release memory
+  is_open_ = false;
+}
+
+void Region::Free() {
+  for (char* chunk : chunks_) {
+    free(chunk);
+  }
+  chunks_.clear();
+}
+
+void MarkSweepHeap::BeginRegion() {
+  #ifndef NO_POOL_ALLOC
+  if (!regions_enabled_) {
+    return;
+  }
+  region_depth_++;
+  if (region_depth_ > 1) {  // nested, so use the outer region
+    return;
+  }
+
+  if (free_region_ids_.empty()) {
+    cur_region_id_ = regions_.size();
+    regions_.push_back(nullptr);
+  } else {
+    cur_region_id_ = free_region_ids_.back();
+    free_region_ids_.pop_back();
+  }
+  regions_[cur_region_id_] = new Region();
+  #endif
+}
+
+void MarkSweepHeap::EndRegion() {
+  #ifndef NO_POOL_ALLOC
+  if (!regions_enabled_) {
+    return;
+  }
+  DCHECK(region_depth_ > 0);
+  region_depth_--;
+  if (region_depth_ > 0) {
+    return;
+  }
+
+  regions_[cur_region_id_]->Close(cur_region_id_);
+  cur_region_id_ = -1;
+  #endif
+}
+
   #if 0
 void* MarkSweepHeap::Reallocate(void* p, size_t num_bytes) {
   FAIL(kNotImplemented);
@@ -138,6 +260,10 @@ void MarkSweepHeap::MaybeMarkAndPush(RawObject* obj) {
 
   int obj_id = header->obj_id;
   #ifndef NO_POOL_ALLOC
+  if (header->pool_id == kRegionPoolId) {
+    MarkRegion(regions_[obj_id]);
+    return;
+  }
   if (header->pool_id == 1) {
     if (pool1_.IsMarked(obj_id)) {
       return;
@@ -171,8 +297,37 @@ void MarkSweepHeap::MaybeMarkAndPush(RawObject* obj) {
   }
 }
 
+// A region's objects aren't marked one by one.  If the region is closed, its
+// pointers out are traced.  If it's open, there are no out_ptrs_ yet, so all of
+// its objects are traced.
+void MarkSweepHeap::MarkRegion(Region* region) {
+  if (region->is_live_) {
+    return;
+  }
+  region->is_live_ = true;
+
+  if (region->is_open_) {
+    for (ObjHeader* header : region->objs_) {
+      if (header->heap_tag != HeapTag::Opaque) {
+        gray_stack_.push_back(header);
+      }
+    }
+  } else {
+    gray_regions_.push_back(region);
+  }
+}
+
 void MarkSweepHeap::TraceChildren() {
-  while (!gray_stack_.empty()) {
+  while (!gray_stack_.empty() || !gray_regions_.empty()) {
+    if (gray_stack_.empty()) {
+      Region* region = gray_regions_.back();
+      gray_regions_.pop_back();
+      for (RawObject* child : region->out_ptrs_) {
+        MaybeMarkAndPush(child);
+      }
+      continue;
+    }
+
     ObjHeader* header = gray_stack_.back();
     gray_stack_.pop_back();
 
@@ -237,10 +392,34 @@ void MarkSweepHeap::Sweep() {
   }
   live_objs_.resize(last_live_index);  // remove dangling objects
 
+  #ifndef NO_POOL_ALLOC
+  SweepRegions();
+  #endif
+
   num_collections_++;
   max_survived_ = std::max(max_survived_, num_live());
 }
 
+void MarkSweepHeap::SweepRegions() {
+  int n = regions_.size();
+  for (int i = 0; i < n; ++i) {
+    Region* region = regions_[i];
+    if (region == nullptr) {
+      continue;
+    }
+    if (region->is_live_) {
+      region->is_live_ = false;
+      continue;
+    }
+    num_region_objs_ -= region->num_objs_;
+    region->Free();
+    delete region;
+    regions_[i] = nullptr;
+    free_region_ids_.push_back(i);
+    num_regions_freed_++;
+  }
+}
+
 int MarkSweepHeap::Collect() {
   #ifdef GC_TIMING
   struct timespec start, end;
@@ -281,6 +460,13 @@ int MarkSweepHeap::Collect() {
     }
   }
 
+  #ifndef NO_POOL_ALLOC
+  // The parser may hold objects in the open region that aren't rooted yet
+  if (cur_region_id_ != -1) {
+    MarkRegion(regions_[cur_region_id_]);
+  }
+  #endif
+
   // Traverse object graph.
   TraceChildren();
 
@@ -322,6 +508,7 @@ int MarkSweepHeap::Collect() {
   if (gc_millis > max_gc_millis_) {
     max_gc_millis_ = gc_millis;
   }
+  pause_counts_[PauseBucket(gc_millis)]++;
   #endif
 
   return num_live();  // for unit tests only
@@ -335,7 +522,8 @@ void MarkSweepHeap::PrintStats(int fd) {
 
   #ifndef NO_POOL_ALLOC
   dprintf(fd, "  num allocated    = %10d\n",
-          num_allocated_ + pool1_.num_allocated() + pool2_.num_allocated());
+          num_allocated_ + pool1_.num_allocated() + pool2_.num_allocated() +
+              num_region_allocated_);
   dprintf(fd, "  num in heap      = %10d\n", num_allocated_);
   #else
   dprintf(fd, "  num allocated    = %10d\n", num_allocated_);
@@ -351,6 +539,21 @@ void MarkSweepHeap::PrintStats(int fd) {
   dprintf(fd, "bytes allocated    = %10" PRId64 "\n", bytes_allocated_);
   #endif
 
+  #ifndef NO_POOL_ALLOC
+  int num_regions = 0;
+  int64_t region_bytes = 0;
+  for (Region* region : regions_) {
+    if (region) {
+      num_regions++;
+      region_bytes += region->num_bytes_;
+    }
+  }
+  dprintf(fd, "  num in regions   = %10d\n", num_region_allocated_);
+  dprintf(fd, "  num regions      = %10d\n", num_regions);
+  dprintf(fd, "  regions freed    = %10d\n", num_regions_freed_);
+  dprintf(fd, " region bytes      = %10" PRId64 "\n", region_bytes);
+  #endif
+
   dprintf(fd, "\n");
   dprintf(fd, "  num gc points    = %10d\n", num_gc_points_);
   dprintf(fd, "  num collections  = %10d\n", num_collections_);
@@ -361,6 +564,21 @@ void MarkSweepHeap::PrintStats(int fd) {
   dprintf(fd, "  max gc millis    = %10.1f\n", max_gc_millis_);
   dprintf(fd, "total gc millis    = %10.1f\n", total_gc_millis_);
   dprintf(fd, "\n");
+
+  // Keys have no padding inside, so benchmarks/gc_stats_to_tsv.py turns them
+  // into column names like pause_under_4_ms and pause_at_least_256_ms
+  char key[32];
+  int limit = 1;
+  for (int i = 0; i < kNumPauseBuckets; ++i) {
+    if (i == kNumPauseBuckets - 1) {
+      snprintf(key, sizeof(key), "pause at least %d ms", limit / 2);
+    } else {
+      snprintf(key, sizeof(key), "pause under %d ms", limit);
+    }
+    dprintf(fd, "%18s = %10d\n", key, pause_counts_[i]);
+    limit *= 2;
+  }
+  dprintf(fd, "\n");
   dprintf(fd, "roots capacity     = %10d\n",
           static_cast<int>(roots_.capacity()));
   dprintf(fd, " objs capacity     = %10d\n",
@@ -404,6 +622,14 @@ void MarkSweepHeap::FreeEverything() {
   #ifndef NO_POOL_ALLOC
   pool1_.Free();
   pool2_.Free();
+
+  for (Region* region : regions_) {  // e.g. a region that's still open
+    if (region) {
+      region->Free();
+      delete region;
+    }
+  }
+  regions_.clear();
   #endif
 }
 
@@ -189,6 +189,65 @@ class Pool {
   DISALLOW_COPY_AND_ASSIGN(Pool<CellsPerBlock COMMA CellSize>);
 };
 
+// GC pause times are counted in buckets that double in size: under 1 ms,
+// under 2 ms, ..., under 256 ms, and 256 ms or more.  OILS_GC_STATS prints
+// them, so benchmarks/gc.sh can compare the distribution of pauses, not just
+// the max and total.
+const int kNumPauseBuckets = 10;
+
+inline int PauseBucket(double gc_millis) {
+  int bucket = 0;
+  double limit = 1.0;
+  while (bucket < kNumPauseBuckets - 1 && gc_millis >= limit) {
+    bucket++;
+    limit *= 2;
+  }
+  return bucket;
+}
+
+// pool_id of objects in a Region.  Their obj_id is the region's index.
+const int kRegionPoolId = 3;
+
+// Objects that may go in a Region: the ASDL nodes, strings, and tuples that the
+// parser produces.  Mutable containers and other classes stay on the heap.
+inline bool CanAllocateInRegion(int type_tag) {
+  return type_tag < TypeTag::Dict || type_tag == TypeTag::BigStr ||
+         type_tag == TypeTag::Tuple;
+}
+
+// A Region holds the output of one parse, e.g. the LST for a logical line of
+// a sourced file.  Its objects are bump allocated, never marked or swept one
+// by one, and freed together.
+//
+// The collector treats a region as a unit.  It's live if any object in it is
+// reachable, and then the pointers it has to objects outside the region are
+// roots.  Those pointers are found once, when the region is closed, so region
+// objects must NOT be given new pointers afterward.  Setting ints and bools,
+// like command.Simple do_fork, is OK.
+class Region {
+ public:
+  Region() {
+  }
+
+  void* Allocate(size_t num_bytes);
+  void Close(int region_id);  // find out_ptrs_
+  void Free();
+
+  std::vector<char*> chunks_;
+  char* pos_ = nullptr;
+  char* end_ = nullptr;
+
+  std::vector<ObjHeader*> objs_;      // all objects, until Close()
+  std::vector<RawObject*> out_ptrs_;  // set by Close()
+  int num_objs_ = 0;
+  int64_t num_bytes_ = 0;
+
+  bool is_open_ = true;
+  bool is_live_ = false;  // reset after every collection
+
+  DISALLOW_COPY_AND_ASSIGN(Region);
+};
+
 class MarkSweepHeap {
  public:
   // reserve 32 frames to start
@@ -212,6 +271,26 @@ class MarkSweepHeap {
 
   void* Allocate(size_t num_bytes, int* obj_id, int* pool_id);
 
+  // Allocate in the current region, if there is one and the type allows it
+  void* AllocateInRegion(size_t num_bytes, int type_tag, int* obj_id,
+                         int* pool_id) {
+#ifndef NO_POOL_ALLOC
+    if (cur_region_id_ != -1 && CanAllocateInRegion(type_tag)) {
+      *pool_id = kRegionPoolId;
+      *obj_id = cur_region_id_;
+      num_region_objs_++;
+      num_region_allocated_++;
+      bytes_allocated_ += num_bytes;
+      return regions_[cur_region_id_]->Allocate(num_bytes);
+    }
+#endif
+    return Allocate(num_bytes, obj_id, pool_id);
+  }
+
+  // Regions nest.  Objects go in the outermost one.
+  void BeginRegion();
+  void EndRegion();
+
 #if 0
   void* Reallocate(void* p, size_t num_bytes);
 #endif
@@ -231,7 +310,7 @@ class MarkSweepHeap {
   int num_live() {
     return num_live_
 #ifndef NO_POOL_ALLOC
-           + pool1_.num_live() + pool2_.num_live()
+           + pool1_.num_live() + pool2_.num_live() + num_region_objs_
 #endif
         ;
   }
@@ -247,6 +326,9 @@ class MarkSweepHeap {
   // Show debug logging
   bool gc_verbose_ = false;
 
+  // Allocate parser output in regions; see Region
+  bool regions_enabled_ = false;
+
   // Current stats
   int num_live_ = 0;
   // Should we keep track of sizes?
@@ -261,6 +343,7 @@ class MarkSweepHeap {
   int num_growths_;
   double max_gc_millis_ = 0.0;
   double total_gc_millis_ = 0.0;
+  int pause_counts_[kNumPauseBuckets] = {};  // indexed by PauseBucket()
 
 #ifndef NO_POOL_ALLOC
   // 16,384 / 24 bytes = 682 cells (rounded), 16,368 bytes
@@ -284,7 +367,20 @@ class MarkSweepHeap {
 
   int greatest_obj_id_ = 0;
 
+  // Indexed by region ID.  Freed regions leave a nullptr, and their IDs are
+  // reused.
+  std::vector<Region*> regions_;
+  std::vector<int> free_region_ids_;
+  std::vector<Region*> gray_regions_;  // live regions to trace
+  int cur_region_id_ = -1;             // -1 if no region is open
+  int region_depth_ = 0;
+  int num_region_objs_ = 0;
+  int num_region_allocated_ = 0;
+  int num_regions_freed_ = 0;
+
  private:
+  void MarkRegion(Region* region);
+  void SweepRegions();
   void FreeEverything();
   void MaybePrintStats();
 
@@ -2,6 +2,7 @@
 
 #include "mycpp/gc_alloc.h"  // gHeap
 #include "mycpp/gc_list.h"
+#include "mycpp/gc_mylib.h"
 #include "vendor/greatest.h"
 
 TEST for_code_coverage() {
@@ -52,6 +53,18 @@ TEST mark_set_test() {
   PASS();
 }
 
+TEST pause_bucket_test() {
+  ASSERT_EQ(0, PauseBucket(0.0));
+  ASSERT_EQ(0, PauseBucket(0.9));
+  ASSERT_EQ(1, PauseBucket(1.0));
+  ASSERT_EQ(2, PauseBucket(3.5));
+  ASSERT_EQ(8, PauseBucket(255.0));
+  ASSERT_EQ(kNumPauseBuckets - 1, PauseBucket(256.0));
+  ASSERT_EQ(kNumPauseBuckets - 1, PauseBucket(1e6));
+
+  PASS();
+}
+
 TEST api_test() {
 #ifdef GC_ALWAYS
   // no objects live
@@ -171,6 +184,142 @@ TEST cycle_collection_test() {
   PASS();
 }
 
+// Like an ASDL node, so it's allocated in a region
+class LstNode {
+ public:
+  LstNode() : left_(nullptr), name_(nullptr), words_(nullptr) {
+  }
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::AsdlClass(1, 3);
+  }
+
+  LstNode* left_;
+  BigStr* name_;
+  List<BigStr*>* words_;
+};
+
+bool InRegion(void* obj) {
+  return ObjHeader::FromObject(obj)->pool_id == kRegionPoolId;
+}
+
+TEST region_test() {
+  gHeap.regions_enabled_ = true;
+
+  LstNode* node = nullptr;
+  StackRoots _roots({&node});
+
+  int num_freed = gHeap.num_regions_freed_;
+  int region_id;
+  {
+    mylib::ctx_Region ctx;
+    region_id = gHeap.cur_region_id_;
+    ASSERT(region_id != -1);
+
+    node = Alloc<LstNode>();
+    node->left_ = Alloc<LstNode>();
+    node->name_ = StrFromC("name");
+    node->words_ = NewList<BigStr*>();  // mutable, so not in the region
+    node->words_->append(StrFromC("word"));
+
+    {
+      mylib::ctx_Region ctx;  // nested regions use the outer one
+      ASSERT_EQ(region_id, gHeap.cur_region_id_);
+      node->left_->left_ = Alloc<LstNode>();
+    }
+    ASSERT_EQ(region_id, gHeap.cur_region_id_);
+  }
+  ASSERT_EQ(-1, gHeap.cur_region_id_);
+
+  ASSERT(InRegion(node));
+  ASSERT(InRegion(node->left_));
+  ASSERT(InRegion(node->left_->left_));
+  ASSERT(InRegion(node->name_));
+  ASSERT(!InRegion(node->words_));
+
+  // The List is the only pointer out of the region
+  ASSERT_EQ(1, static_cast<int>(gHeap.regions_[region_id]->out_ptrs_.size()));
+
+  // Heap objects the region points to stay alive, and the List can still be
+  // mutated
+  gHeap.Collect();
+  ASSERT_EQ(num_freed, gHeap.num_regions_freed_);
+  node->words_->append(StrFromC("word2"));
+  gHeap.Collect();
+  ASSERT(str_equals0("word", node->words_->at(0)));
+  ASSERT(str_equals0("word2", node->words_->at(1)));
+  ASSERT(str_equals0("name", node->name_));
+
+  // The region is freed as a unit
+  node = nullptr;
+  gHeap.Collect();
+  ASSERT_EQ(num_freed + 1, gHeap.num_regions_freed_);
+  ASSERT_EQ(nullptr, gHeap.regions_[region_id]);
+  ASSERT_EQ_FMT(0, gHeap.num_region_objs_, "%d");
+
+  gHeap.regions_enabled_ = false;
+  PASS();
+}
+
+TEST region_reachable_from_heap_test() {
+  gHeap.regions_enabled_ = true;
+
+  List<LstNode*>* nodes = nullptr;
+  LstNode* node = nullptr;
+  StackRoots _roots({&nodes, &node});
+
+  nodes = NewList<LstNode*>();
+  for (int i = 0; i < 3; ++i) {
+    mylib::ctx_Region ctx;
+
+    node = Alloc<LstNode>();
+    node->name_ = StrFromC("x");
+    if (i != 1) {
+      nodes->append(node);
+    }
+
+    // Collecting while a region is open doesn't free it, or its children
+    gHeap.Collect();
+    node = nullptr;
+    gHeap.Collect();
+  }
+  ASSERT_EQ_FMT(4, gHeap.num_region_objs_, "%d");  // 2 nodes and 2 strings
+
+  for (int i = 0; i < len(nodes); ++i) {
+    ASSERT(InRegion(nodes->at(i)));
+    ASSERT(str_equals0("x", nodes->at(i)->name_));
+  }
+
+  // Freed region IDs are reused
+  int num_regions = gHeap.regions_.size();
+  {
+    mylib::ctx_Region ctx;
+    Alloc<LstNode>();
+  }
+  ASSERT_EQ_FMT(num_regions, static_cast<int>(gHeap.regions_.size()), "%d");
+
+  nodes = nullptr;
+  gHeap.Collect();
+  ASSERT_EQ_FMT(0, gHeap.num_region_objs_, "%d");
+
+  gHeap.regions_enabled_ = false;
+  PASS();
+}
+
+TEST region_disabled_test() {
+  ASSERT(!gHeap.regions_enabled_);
+
+  LstNode* node = nullptr;
+  StackRoots _roots({&node});
+  {
+    mylib::ctx_Region ctx;
+    node = Alloc<LstNode>();
+  }
+  ASSERT(!InRegion(node));
+
+  PASS();
+}
+
 TEST pool_sanity_check() {
   Pool<2, 32> p;
 
@@ -320,10 +469,14 @@ int main(int argc, char **argv) {
 
   RUN_TEST(for_code_coverage);
   RUN_TEST(mark_set_test);
+  RUN_TEST(pause_bucket_test);
   RUN_TEST(api_test);
   RUN_TEST(string_collection_test);
   RUN_TEST(list_collection_test);
   RUN_TEST(cycle_collection_test);
+  RUN_TEST(region_test);
+  RUN_TEST(region_reachable_from_heap_test);
+  RUN_TEST(region_disabled_test);
 
   RUN_SUITE(pool_alloc);
 
@@ -9,6 +9,7 @@ except ImportError:  # for Python 3, imported through asdl/pybase.py
     cStringIO = None
     import io
 
+import re
 import sys
 
 from pylib import collections_
@@ -34,6 +35,27 @@ def MaybeCollect():
     pass
 
 
+class ctx_Region(object):
+    """Allocate the result of parsing in a region.
+
+    In C++, the GC treats the region as a unit, so it doesn't mark every Token
+    and command_t.  Objects allocated in the region must not be given new
+    pointers afterward.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        pass
+
+    def __enter__(self):
+        # type: () -> None
+        pass
+
+    def __exit__(self, type, value, traceback):
+        # type: (Any, Any, Any) -> None
+        pass
+
+
 def NewDict():
     """Make dictionaries ordered in Python, e.g. for JSON.
   
@@ -54,15 +76,53 @@ def print_stderr(s):
 
 
 if cStringIO:
-    BufWriter = cStringIO.StringIO
+    _StringIO = cStringIO.StringIO
 
     BufLineReader = cStringIO.StringIO
 else:  # Python 3
-    BufWriter = io.StringIO
+    _StringIO = io.StringIO
 
     BufLineReader = io.StringIO
 
 
+class BufWriter(object):
+    """Like cStringIO.StringIO, plus methods that avoid allocation in C++."""
+
+    def __init__(self):
+        # type: () -> None
+        self._Reset()
+
+    def _Reset(self):
+        # type: () -> None
+        self.f = _StringIO()
+
+        # Bind methods directly, since write() is hot
+        self.write = self.f.write
+        self.getvalue = self.f.getvalue
+        self.tell = self.f.tell
+
+    def write_int(self, i):
+        # type: (int) -> None
+        self.f.write(str(i))
+
+    def write_float(self, f):
+        # type: (float) -> None
+        self.f.write(str(f))
+
+    def clear(self):
+        # type: () -> None
+        """Discard the contents, e.g. after they're flushed with getvalue()."""
+        self._Reset()
+
+    def flush(self):
+        # type: () -> None
+        pass
+
+    def isatty(self):
+        # type: () -> bool
+        return False
+
+
 def Stdout():
     return sys.stdout
 
@@ -151,6 +211,18 @@ def octal(i):
     return '%o' % i
 
 
+_NON_ASCII_RE = re.compile(r'[\x80-\xff]')
+
+
+def is_ascii(s):
+    # type: (str) -> bool
+    """Like Python 3's str.isascii().
+
+    In C++, the result is cached in the string.
+    """
+    return _NON_ASCII_RE.search(s) is None
+
+
 def dict_erase(d, key):
     # type: (Dict[Any, Any], Any) -> None
     """
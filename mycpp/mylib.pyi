@@ -12,6 +12,13 @@ STDIN_FILENO: int
 
 def MaybeCollect() -> None: ...
 
+class ctx_Region(object):
+  def __init__(self) -> None: ...
+
+  def __enter__(self) -> None: ...
+
+  def __exit__(self, type: Any, value: Any, traceback: Any) -> None: ...
+
 def NewDict() -> Dict[str, Any]: ...
 
 def open(path: str) -> LineReader: ...
@@ -35,7 +42,11 @@ class Writer:
 
 class BufWriter(Writer):
   def write(self, s: str) -> None: ...
+  def write_int(self, i: int) -> None: ...
+  def write_float(self, f: float) -> None: ...
   def getvalue(self) -> str: ...
+  def tell(self) -> int: ...
+  def clear(self) -> None: ...
 
 def Stdout() -> Writer: ...
 
@@ -77,6 +88,8 @@ def hex_lower(i: int) -> str: ...
 def hex_upper(i: int) -> str: ...
 def octal(i: int) -> str: ...
 
+def is_ascii(s: str) -> bool: ...
+
 def dict_erase(d: Dict[Any, Any], key: Any) -> None: ...
 
 def str_cmp(s1: str, s2: str) -> int: ...
@@ -19,6 +19,7 @@ from _devbuild.gen.id_kind_asdl import Id, Id_t
 from _devbuild.gen.syntax_asdl import (
     Token,
     CompoundWord,
+    eval_plan_e,
     word,
     word_e,
     word_t,
@@ -250,7 +251,8 @@ def BraceDetect(w):
                 # ?  We're forcing braces right now but not commas.
                 if len(stack):
                     stack[-1].saw_comma = True
-                    stack[-1].alt_part.words.append(CompoundWord(cur_parts))
+                    stack[-1].alt_part.words.append(
+                        CompoundWord(cur_parts, eval_plan_e.Unknown))
                     cur_parts = []  # clear
                     append = False
 
@@ -287,7 +289,8 @@ def BraceDetect(w):
                             -1].saw_comma:  # {foo} is not a real alternative
                         return None  # early return
 
-                    stack[-1].alt_part.words.append(CompoundWord(cur_parts))
+                    stack[-1].alt_part.words.append(
+                        CompoundWord(cur_parts, eval_plan_e.Unknown))
 
                     frame = stack.pop()
                     cur_parts = frame.cur_parts
@@ -514,7 +517,7 @@ def BraceExpandWords(words):
                 # ahead of time
                 parts_list = _BraceExpand(w.parts)
                 for p in parts_list:
-                    out.append(CompoundWord(p))
+                    out.append(CompoundWord(p, eval_plan_e.Unknown))
 
             elif case(word_e.Compound):
                 w = cast(CompoundWord, UP_w)
@@ -7,7 +7,7 @@ import sys
 import unittest
 
 from _devbuild.gen.id_kind_asdl import Id
-from _devbuild.gen.syntax_asdl import word_part_e, CompoundWord
+from _devbuild.gen.syntax_asdl import word_part_e, CompoundWord, eval_plan_e
 from asdl import format as fmt
 from mycpp.mylib import log
 from core.test_lib import Tok
@@ -144,7 +144,7 @@ class BracesTest(unittest.TestCase):
         results = braces._BraceExpand(w.parts)
         self.assertEqual(1, len(results))
         for parts in results:
-            _PrettyPrint(CompoundWord(parts))
+            _PrettyPrint(CompoundWord(parts, eval_plan_e.Unknown))
             print('')
 
         w = _assertReadWord(self, 'B-{a,b}-E')
@@ -155,7 +155,7 @@ class BracesTest(unittest.TestCase):
         results = braces._BraceExpand(tree.parts)
         self.assertEqual(2, len(results))
         for parts in results:
-            _PrettyPrint(CompoundWord(parts))
+            _PrettyPrint(CompoundWord(parts, eval_plan_e.Unknown))
             print('')
 
         w = _assertReadWord(self, 'B-{a,={b,c,d}=,e}-E')
@@ -166,7 +166,7 @@ class BracesTest(unittest.TestCase):
         results = braces._BraceExpand(tree.parts)
         self.assertEqual(5, len(results))
         for parts in results:
-            _PrettyPrint(CompoundWord(parts))
+            _PrettyPrint(CompoundWord(parts, eval_plan_e.Unknown))
             print('')
 
         w = _assertReadWord(self, 'B-{a,b}-{c,d}-E')
@@ -177,7 +177,7 @@ class BracesTest(unittest.TestCase):
         results = braces._BraceExpand(tree.parts)
         self.assertEqual(4, len(results))
         for parts in results:
-            _PrettyPrint(CompoundWord(parts))
+            _PrettyPrint(CompoundWord(parts, eval_plan_e.Unknown))
             print('')
 
 
@@ -0,0 +1,434 @@
+#!/usr/bin/env python2
+"""
+cmd_closure.py - Run commands as trees of pre-bound closures.  Python only.
+
+CommandEvaluator._Execute() switches on the node type, evaluates redirects,
+and sets up process sub state for every node.  In C++ that's a switch
+statement and a few stack objects, but in Python it's a large part of the
+running time of bin/osh.
+
+This module compiles a node the first time it runs.  The result is a closure
+with its children and evaluator methods already bound:
+
+- Compound nodes that can't have redirects (lists, if, while, &&) skip the
+  redirect and process sub state, and call their children's closures directly.
+- Leaf nodes with no redirects, like 'echo hi' or 'x=1', skip redirect
+  evaluation and the dispatch switch.
+- Other nodes fall back to CommandEvaluator._ExecuteNode().
+
+Each closure does what _Execute() and _Dispatch() do for that node, so the
+semantics are the same.  It's enabled with OILS_CLOSURES=1, and isn't
+translated to C++.
+"""
+from __future__ import print_function
+
+from _devbuild.gen.id_kind_asdl import Id
+from _devbuild.gen.runtime_asdl import (CommandStatus, StatusArray, flow_e)
+from _devbuild.gen.syntax_asdl import (
+    loc,
+    loc_t,
+    Token,
+    command,
+    command_e,
+    command_t,
+    BraceGroup,
+    condition,
+    condition_e,
+)
+from core import error
+from core import state
+from core import vm
+from osh import cmd_eval
+
+from typing import Callable, Dict, List, Optional, Tuple, cast
+
+# The cache is keyed by node, so code that creates many nodes, like 'eval' in
+# a loop, would grow it without bound.  Start over when it's this big.
+_MAX_CACHED = 10000
+
+
+class Compiler(object):
+    """Compiles command_t nodes to closures, and caches them."""
+
+    def __init__(self, cmd_ev):
+        # type: (cmd_eval.CommandEvaluator) -> None
+        self.cmd_ev = cmd_ev
+        # id(node) -> (node, closure).  Holding the node makes sure the id
+        # isn't reused.
+        self.cache = {}  # type: Dict[int, Tuple[command_t, Callable[[], int]]]
+
+    def Execute(self, node):
+        # type: (command_t) -> int
+        """Like CommandEvaluator._Execute(), but compiles the node first."""
+        entry = self.cache.get(id(node))
+        if entry is not None:
+            return entry[1]()
+
+        if len(self.cache) >= _MAX_CACHED:
+            self.cache.clear()
+        fn = self.Compile(node)
+        self.cache[id(node)] = (node, fn)
+        return fn()
+
+    def Compile(self, node):
+        # type: (command_t) -> Callable[[], int]
+        """Return a closure that does what _Execute(node) does."""
+        UP_node = node
+        tag = node.tag()
+
+        if tag in (command_e.CommandList, command_e.DoGroup):
+            if tag == command_e.CommandList:
+                children = cast(command.CommandList, UP_node).children
+            else:
+                children = cast(command.DoGroup, UP_node).children
+            return self._Structural(self._CompileList(children))
+
+        if tag == command_e.BraceGroup:
+            node = cast(BraceGroup, UP_node)
+            if len(node.redirects) == 0:
+                return self._Structural(self._CompileList(node.children))
+
+        elif tag == command_e.NoOp:
+            return self._Structural(lambda: 0)
+
+        elif tag == command_e.Sentence:
+            node = cast(command.Sentence, UP_node)
+            if node.terminator.id == Id.Op_Semi:
+                # Not a real node, so there's no errexit check
+                return self._Structural(self.Compile(node.child))
+
+        elif tag == command_e.If:
+            node = cast(command.If, UP_node)
+            if (len(node.redirects) == 0 and
+                    all(arm.cond.tag() == condition_e.Shell
+                        for arm in node.arms)):
+                return self._Structural(self._CompileIf(node))
+
+        elif tag == command_e.WhileUntil:
+            node = cast(command.WhileUntil, UP_node)
+            if (len(node.redirects) == 0 and
+                    node.cond.tag() == condition_e.Shell):
+                return self._Structural(self._CompileWhileUntil(node),
+                                        node.keyword)
+
+        elif tag == command_e.AndOr:
+            node = cast(command.AndOr, UP_node)
+            return self._CompileAndOr(node)
+
+        elif tag == command_e.Simple:
+            node = cast(command.Simple, UP_node)
+            if len(node.redirects) == 0:
+                return self._Leaf(node, self._BindSimple(node))
+
+        elif tag == command_e.ShAssignment:
+            node = cast(command.ShAssignment, UP_node)
+            if len(node.redirects) == 0:
+                return self._Leaf(node, self._BindShAssignment(node))
+
+        elif tag == command_e.DBracket:
+            node = cast(command.DBracket, UP_node)
+            if len(node.redirects) == 0:
+                return self._Leaf(node, self._BindDBracket(node))
+
+        elif tag == command_e.DParen:
+            node = cast(command.DParen, UP_node)
+            if len(node.redirects) == 0:
+                return self._Leaf(node, self._BindDParen(node))
+
+        # Everything else is interpreted.  Its children still go through
+        # _Execute(), so they're compiled.
+        cmd_ev = self.cmd_ev
+        node = UP_node
+        return lambda: cmd_ev._ExecuteNode(node)
+
+    def _CompileList(self, children):
+        # type: (List[command_t]) -> Callable[[], int]
+        """Like _ExecuteList()."""
+        fns = [self.Compile(child) for child in children]
+        if len(fns) == 1:
+            return fns[0]
+
+        def run_list():
+            # type: () -> int
+            status = 0  # for empty list
+            for fn in fns:
+                status = fn()  # last status wins
+            return status
+
+        return run_list
+
+    def _CompileCondition(self, cond, blame_tok):
+        # type: (condition.Shell, Token) -> Callable[[], bool]
+        """Like _EvalCondition() for shell conditions."""
+        cmd_ev = self.cmd_ev
+        commands = cond.commands
+        run_list = self._CompileList(commands)
+
+        def eval_cond():
+            # type: () -> bool
+            cmd_ev._StrictErrExitList(commands)
+            with state.ctx_ErrExit(cmd_ev.mutable_opts, False, blame_tok):
+                cond_status = run_list()
+            return cond_status == 0
+
+        return eval_cond
+
+    def _CompileIf(self, node):
+        # type: (command.If) -> Callable[[], int]
+        """Like _DoIf()."""
+        arms = [
+            (self._CompileCondition(cast(condition.Shell, arm.cond),
+                                    arm.keyword),
+             self._CompileList(arm.action)) for arm in node.arms
+        ]
+        if node.else_action is not None:
+            else_fn = self._CompileList(node.else_action)
+        else:
+            else_fn = lambda: 0
+
+        def do_if():
+            # type: () -> int
+            for eval_cond, action in arms:
+                if eval_cond():
+                    return action()
+            return else_fn()
+
+        return do_if
+
+    def _CompileWhileUntil(self, node):
+        # type: (command.WhileUntil) -> Callable[[], int]
+        """Like _DoWhileUntil()."""
+        cmd_ev = self.cmd_ev
+        eval_cond = self._CompileCondition(cast(condition.Shell, node.cond),
+                                           node.keyword)
+        body = self.Compile(node.body)
+        is_until = node.keyword.id == Id.KW_Until
+
+        def do_while():
+            # type: () -> int
+            status = 0
+            with cmd_eval.ctx_LoopLevel(cmd_ev):
+                while True:
+                    try:
+                        b = eval_cond()
+                        if is_until:
+                            b = not b
+                        if not b:
+                            break
+                        status = body()  # last one wins
+
+                    except vm.IntControlFlow as e:
+                        status = 0
+                        action = e.HandleLoop()
+                        if action == flow_e.Break:
+                            break
+                        elif action == flow_e.Raise:
+                            raise
+            return status
+
+        return do_while
+
+    def _CompileAndOr(self, node):
+        # type: (command.AndOr) -> Callable[[], int]
+        """Like _DoAndOr(), wrapped like _Structural().
+
+        It's different because the last child is checked for errexit.
+        """
+        cmd_ev = self.cmd_ev
+        mem = cmd_ev.mem
+        children = node.children
+        fns = [self.Compile(child) for child in children]
+        ops = node.ops
+        n = len(fns)
+
+        def do_and_or():
+            # type: () -> int
+            cmd_ev.RunPendingTraps()
+            cmd_ev.check_command_sub_status = False
+
+            # Suppress failure for every child except the last one.
+            cmd_ev._StrictErrExit(children[0])
+            with state.ctx_ErrExit(cmd_ev.mutable_opts, False, ops[0]):
+                status = fns[0]()
+
+            check_errexit = False
+            i = 1
+            while i < n:
+                op = ops[i - 1]
+                op_id = op.id
+
+                if op_id == Id.Op_DPipe and status == 0:
+                    i += 1
+                    continue  # short circuit
+
+                elif op_id == Id.Op_DAmp and status != 0:
+                    i += 1
+                    continue  # short circuit
+
+                if i == n - 1:  # errexit handled differently for last child
+                    status = fns[i]()
+                    check_errexit = True
+                else:
+                    # blame the right && or ||
+                    cmd_ev._StrictErrExit(children[i])
+                    with state.ctx_ErrExit(cmd_ev.mutable_opts, False, op):
+                        status = fns[i]()
+
+                i += 1
+
+            mem.SetLastStatus(status)
+            if check_errexit:
+                cmd_ev._CheckStatus(status, CommandStatus.CreateNull(), node,
+                                    loc.Missing)
+            return status
+
+        return do_and_or
+
+    def _Structural(self, body, blame_tok=None):
+        # type: (Callable[[], int], Optional[Token]) -> Callable[[], int]
+        """Wrap a compound node that can't have redirects.
+
+        Its children evaluate words and run process subs in their own frames,
+        so there are no process sub codes or pipeline statuses to collect.  And
+        _Dispatch() doesn't set check_errexit for these nodes.
+        """
+        cmd_ev = self.cmd_ev
+        mem = cmd_ev.mem
+
+        # NOTE: mylib.MaybeCollect() is a no-op in Python, so we don't call it
+
+        if blame_tok is None:
+
+            def run():
+                # type: () -> int
+                cmd_ev.RunPendingTraps()
+                cmd_ev.check_command_sub_status = False
+                status = body()
+                mem.SetLastStatus(status)
+                return status
+
+        else:
+
+            def run():
+                # type: () -> int
+                cmd_ev.RunPendingTraps()
+                cmd_ev.check_command_sub_status = False
+                mem.SetTokenForLine(blame_tok)
+                status = body()
+                mem.SetLastStatus(status)
+                return status
+
+        return run
+
+    def _Leaf(self, node, do_node):
+        # type: (command_t, Callable[[CommandStatus], int]) -> Callable[[], int]
+        """Wrap a node with no redirects, like _Execute() does."""
+        cmd_ev = self.cmd_ev
+        mem = cmd_ev.mem
+        shell_ex = cmd_ev.shell_ex
+        errfmt = cmd_ev.errfmt
+        exec_opts = cmd_ev.exec_opts
+        status_array_pool = cmd_ev.status_array_pool
+
+        def run():
+            # type: () -> int
+            cmd_ev.RunPendingTraps()
+
+            cmd_st = CommandStatus.CreateNull()
+            if len(status_array_pool):
+                process_sub_st = status_array_pool.pop()
+            else:
+                process_sub_st = StatusArray.CreateNull()
+
+            errexit_loc = loc.Missing  # type: loc_t
+            check_errexit = True
+
+            # Process subs can appear in words, e.g. diff <(seq 3) <(seq 4)
+            with vm.ctx_ProcessSub(shell_ex, process_sub_st):
+                try:
+                    cmd_ev.check_command_sub_status = False
+                    status = do_node(cmd_st)
+                    check_errexit = cmd_st.check_errexit
+                except error.FailGlob as e:
+                    if not e.HasLocation():  # Last resort!
+                        e.location = mem.GetFallbackLocation()
+                    errfmt.PrettyPrintError(e, prefix='failglob: ')
+                    status = 1
+                    check_errexit = True  # probably not necessary?
+
+            # Leaf nodes don't set cmd_st.pipe_status
+
+            if process_sub_st.codes is None:
+                status_array_pool.append(process_sub_st)
+            else:
+                codes = process_sub_st.codes
+                mem.SetProcessSubStatus(codes)
+                if status == 0 and exec_opts.process_sub_fail():
+                    # Choose the LAST non-zero status, consistent with pipefail
+                    for i, st in enumerate(codes):
+                        if st != 0:
+                            status = st
+                            errexit_loc = process_sub_st.locs[i]
+
+            mem.SetLastStatus(status)
+            if check_errexit:
+                cmd_ev._CheckStatus(status, cmd_st, node, errexit_loc)
+            return status
+
+        return run
+
+    #
+    # Leaf bodies, which correspond to cases in _Dispatch()
+    #
+
+    def _BindSimple(self, node):
+        # type: (command.Simple) -> Callable[[CommandStatus], int]
+        cmd_ev = self.cmd_ev
+        mem = cmd_ev.mem
+        blame_tok = node.blame_tok
+
+        def do_simple(cmd_st):
+            # type: (CommandStatus) -> int
+            # for $LINENO, e.g.  PS4='+$SOURCE_NAME:$LINENO:'
+            if blame_tok is not None:
+                mem.SetTokenForLine(blame_tok)
+            return cmd_ev._DoSimple(node, cmd_st)
+
+        return do_simple
+
+    def _BindShAssignment(self, node):
+        # type: (command.ShAssignment) -> Callable[[CommandStatus], int]
+        cmd_ev = self.cmd_ev
+        mem = cmd_ev.mem
+        blame_tok = node.pairs[0].left
+
+        def do_assign(cmd_st):
+            # type: (CommandStatus) -> int
+            mem.SetTokenForLine(blame_tok)
+            return cmd_ev._DoShAssignment(node, cmd_st)
+
+        return do_assign
+
+    def _BindDBracket(self, node):
+        # type: (command.DBracket) -> Callable[[CommandStatus], int]
+        cmd_ev = self.cmd_ev
+        mem = cmd_ev.mem
+
+        def do_dbracket(cmd_st):
+            # type: (CommandStatus) -> int
+            mem.SetTokenForLine(node.left)
+            return cmd_ev._DoDBracket(node, cmd_st)
+
+        return do_dbracket
+
+    def _BindDParen(self, node):
+        # type: (command.DParen) -> Callable[[CommandStatus], int]
+        cmd_ev = self.cmd_ev
+        mem = cmd_ev.mem
+
+        def do_dparen(cmd_st):
+            # type: (CommandStatus) -> int
+            mem.SetTokenForLine(node.left)
+            return cmd_ev._DoDParen(node, cmd_st)
+
+        return do_dparen
@@ -0,0 +1,65 @@
+#!/usr/bin/env python2
+"""
+cmd_closure_test.py: Tests for cmd_closure.py
+"""
+from __future__ import print_function
+
+import unittest
+
+from core import test_lib
+from osh import cmd_closure  # module under test
+
+
+def _Run(cmd_ev, code_str, arena):
+    c_parser = test_lib.InitCommandParser(code_str, arena=arena)
+    node = c_parser.ParseLogicalLine()
+    return cmd_ev._Execute(node)
+
+
+class CompilerTest(unittest.TestCase):
+    def testSameResults(self):
+        CASES = [
+            ('x=1; y=$((x + 2))', 'y', '3'),
+            ('i=0; while [[ $i -lt 5 ]]; do i=$((i+1)); done', 'i', '5'),
+            ('i=0; until [[ $i -ge 3 ]]; do (( i++ )); done', 'i', '3'),
+            ('if (( 0 )); then r=a; elif (( 1 )); then r=b; else r=c; fi', 'r',
+             'b'),
+            ('(( 0 )) && r=x || r=y', 'r', 'y'),
+            ('{ r=1; r=2; }', 'r', '2'),
+            ('for i in a b; do r=$i; done', 'r', 'b'),
+            ('i=0; while (( 1 )); do i=$((i+1)); if [[ $i = 3 ]]; then break; '
+             'fi; done', 'i', '3'),
+        ]
+
+        for code_str, name, expected in CASES:
+            for compiled in [False, True]:
+                arena = test_lib.MakeArena('<cmd_closure_test.py>')
+                cmd_ev = test_lib.InitCommandEvaluator(arena=arena)
+                if compiled:
+                    cmd_ev.closures = cmd_closure.Compiler(cmd_ev)
+
+                status = _Run(cmd_ev, code_str, arena)
+                val = cmd_ev.mem.GetValue(name)
+                self.assertEqual(0, status, code_str)
+                self.assertEqual(expected, val.s, code_str)
+
+    def testCacheIsBounded(self):
+        arena = test_lib.MakeArena('<cmd_closure_test.py>')
+        cmd_ev = test_lib.InitCommandEvaluator(arena=arena)
+        compiler = cmd_closure.Compiler(cmd_ev)
+        cmd_ev.closures = compiler
+
+        saved = cmd_closure._MAX_CACHED
+        cmd_closure._MAX_CACHED = 5
+        try:
+            for i in xrange(20):
+                _Run(cmd_ev, 'x=%d' % i, arena)
+        finally:
+            cmd_closure._MAX_CACHED = saved
+
+        self.assertTrue(len(compiler.cache) <= 5, compiler.cache)
+        self.assertEqual('19', cmd_ev.mem.GetValue('x').s)
+
+
+if __name__ == '__main__':
+    unittest.main()
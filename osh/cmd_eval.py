@@ -26,6 +26,7 @@ from _devbuild.gen.syntax_asdl import (
     loc_e,
     Token,
     CompoundWord,
+    eval_plan_e,
     command,
     command_e,
     command_t,
@@ -50,6 +51,7 @@ from _devbuild.gen.syntax_asdl import (
     pat,
     pat_e,
     word,
+    word_e,
 )
 from _devbuild.gen.runtime_asdl import (
     cmd_value,
@@ -67,6 +69,7 @@ from _devbuild.gen.value_asdl import (value, value_e, value_t, y_lvalue,
 
 from core import dev
 from core import error
+from core import packed_list
 from core.error import e_die, e_die_status
 from core import pyos  # Time().  TODO: rename
 from core import state
@@ -79,6 +82,8 @@ from frontend import lexer
 from frontend import location
 from osh import braces
 from osh import sh_expr_eval
+from osh import sparse_array
+from osh import word_
 from osh import word_eval
 from mycpp import mylib
 from mycpp.mylib import log, switch, tagswitch
@@ -102,6 +107,7 @@ if TYPE_CHECKING:
     from core import optview
     from core.vm import _Executor, _AssignBuiltin
     from builtin import trap_osh
+    from osh.cmd_closure import Compiler
 
 # flags for main_loop.Batch, ExecuteAndCatch.  TODO: Should probably in
 # ExecuteAndCatch, along with SetValue() flags.
@@ -215,6 +221,21 @@ def PlusEquals(old_val, val):
             else:
                 raise AssertionError()  # parsing should prevent this
 
+        elif case(value_e.SparseArray):
+            if tag == value_e.Str:
+                e_die("Can't append string to array")
+
+            elif tag == value_e.BashArray:
+                old_sparse = cast(value.SparseArray, UP_old_val)
+                to_append = cast(value.BashArray, UP_val)
+
+                sp = sparse_array.Copy(old_sparse)
+                sparse_array.Append(sp, to_append.strs)
+                val = sp
+
+            else:
+                raise AssertionError()  # parsing should prevent this
+
         elif case(value_e.BashAssoc):
             # TODO: Could try to match bash, it will append to ${A[0]}
             pass
@@ -315,6 +336,14 @@ class CommandEvaluator(object):
 
         self.status_array_pool = []  # type: List[StatusArray]
 
+        # The return slot, filled in by ExecuteBody()
+        self.ret_status = 0
+        self.ret_val = None  # type: Optional[value_t]
+
+        if mylib.PYTHON:
+            # Set to a cmd_closure.Compiler by OILS_CLOSURES=1
+            self.closures = None  # type: Optional[Compiler]
+
     def CheckCircularDeps(self):
         # type: () -> None
         assert self.arith_ev is not None
@@ -335,7 +364,7 @@ class CommandEvaluator(object):
             e_die("Assignment builtin %r not configured" % cmd_val.argv[0],
                   cmd_val.arg_locs[0])
 
-        with vm.ctx_FlushStdout():
+        with vm.ctx_FlushStdout(None):  # always flush
             with ui.ctx_Location(self.errfmt, cmd_val.arg_locs[0]):
                 try:
                     status = builtin_func.Run(cmd_val)
@@ -403,7 +432,7 @@ class CommandEvaluator(object):
                                 blame_loc,
                                 show_code=cmd_st.show_code)
 
-    def _EvalRedirect(self, r):
+    def EvalRedirect(self, r):
         # type: (Redir) -> RedirValue
 
         result = RedirValue(r.op.id, r.op, r.loc, None)
@@ -495,8 +524,8 @@ class CommandEvaluator(object):
 
             elif case(redir_param_e.HereDoc):
                 arg = cast(redir_param.HereDoc, UP_arg)
-                w = CompoundWord(
-                    arg.stdin_parts)  # HACK: Wrap it in a word to eval
+                # HACK: Wrap it in a word to eval
+                w = CompoundWord(arg.stdin_parts, eval_plan_e.Unknown)
                 val = self.word_ev.EvalWordToString(w)
                 assert val.tag() == value_e.Str, val
                 result.arg = redirect_arg.HereDoc(val.s)
@@ -575,7 +604,7 @@ class CommandEvaluator(object):
 
         result = []  # type: List[RedirValue]
         for redir in redirects:
-            result.append(self._EvalRedirect(redir))
+            result.append(self.EvalRedirect(redir))
 
         return result
 
@@ -805,7 +834,7 @@ class CommandEvaluator(object):
                             index = val_ops.ToInt(lval.index,
                                                   'List index should be Int',
                                                   loc.Missing)
-                            obj.items[index] = rval
+                            packed_list.SetItem(obj, index, rval)
 
                         elif case(value_e.Dict):
                             obj = cast(value.Dict, UP_obj)
@@ -831,6 +860,21 @@ class CommandEvaluator(object):
 
             self.expr_ev.EvalAugmented(aug_lval, val, node.op, which_scopes)
 
+    def EvalSimpleArgv(self, node):
+        # type: (command.Simple) -> cmd_value.Argv
+        """Evaluate the words of a simple command, without running it.
+
+        For the first part of a pipeline that runs in this process.  See
+        ShellExecutor.RunPipeline().
+        """
+        # for $LINENO, like _Dispatch()
+        if node.blame_tok is not None:
+            self.mem.SetTokenForLine(node.blame_tok)
+
+        words = braces.BraceExpandWords(node.words)
+        cmd_val = self.word_ev.EvalWordSequence2(words)
+        return cast(cmd_value.Argv, cmd_val)
+
     def _DoSimple(self, node, cmd_st):
         # type: (command.Simple, CommandStatus) -> int
         cmd_st.check_errexit = True
@@ -1164,6 +1208,7 @@ class CommandEvaluator(object):
         status = 0
         with ctx_LoopLevel(self):
             while True:
+                self.shell_ex.MaybeFlushStdout()
                 try:
                     # blame while/until spid
                     b = self._EvalCondition(node.cond, node.keyword)
@@ -1271,6 +1316,21 @@ class CommandEvaluator(object):
                             'Range iteration expects at most 2 loop variables',
                             node.keyword)
 
+                elif case(value_e.Lines):
+                    val = cast(value.Lines, UP_val)
+                    it2 = val_ops.LinesIterator(val)
+
+                    if n == 1:
+                        name1 = location.LName(node.iter_names[0])
+                    elif n == 2:
+                        i_name = location.LName(node.iter_names[0])
+                        name1 = location.LName(node.iter_names[1])
+                    else:
+                        e_die_status(
+                            2,
+                            'Lines iteration expects at most 2 loop variables',
+                            node.keyword)
+
                 else:
                     raise error.TypeErr(val, 'for loop expected List or Dict',
                                         node.keyword)
@@ -1292,6 +1352,7 @@ class CommandEvaluator(object):
         status = 0  # in case we loop zero times
         with ctx_LoopLevel(self):
             while not it2.Done():
+                self.shell_ex.MaybeFlushStdout()
                 self.mem.SetLocalName(name1, it2.FirstValue())
                 if name2:
                     self.mem.SetLocalName(name2, it2.SecondValue())
@@ -1309,7 +1370,9 @@ class CommandEvaluator(object):
                     if action == flow_e.Break:
                         break
                     elif action == flow_e.Raise:
+                        it2.Stop()
                         raise
+        it2.Stop()
 
         return status
 
@@ -1329,6 +1392,7 @@ class CommandEvaluator(object):
 
         with ctx_LoopLevel(self):
             while True:
+                self.shell_ex.MaybeFlushStdout()
                 if for_cond:
                     # We only accept integers as conditions
                     cond_int = self.arith_ev.EvalToInt(for_cond)
@@ -1517,7 +1581,7 @@ class CommandEvaluator(object):
                 node = cast(command.Simple, UP_node)
 
                 # for $LINENO, e.g.  PS4='+$SOURCE_NAME:$LINENO:'
-                # Note that for '> $LINENO' the location token is set in _EvalRedirect.
+                # Note that for '> $LINENO' the location token is set in EvalRedirect.
                 # TODO: blame_tok should always be set.
                 if node.blame_tok is not None:
                     self.mem.SetTokenForLine(node.blame_tok)
@@ -1691,15 +1755,9 @@ class CommandEvaluator(object):
                         with dev.ctx_Tracer(self.tracer, 'trap', None):
                             self._Execute(trap_node)
 
-    def _Execute(self, node):
-        # type: (command_t) -> int
-        """Apply redirects, call _Dispatch(), and performs the errexit check.
-
-        Also runs trap handlers.
-        """
-        # TODO: Do this in "leaf" nodes?  SimpleCommand, DBracket, DParen should
-        # call self.DoTick()?  That will RunPendingTraps and check the Ctrl-C flag,
-        # and maybe throw an exception.
+    def _Tick(self):
+        # type: () -> None
+        """Run before every statement."""
         self.RunPendingTraps()
 
         # We only need this somewhat hacky check in osh-cpp since python's runtime
@@ -1711,6 +1769,25 @@ class CommandEvaluator(object):
         # Manual GC point before every statement
         mylib.MaybeCollect()
 
+    def _Execute(self, node):
+        # type: (command_t) -> int
+        if mylib.PYTHON:
+            if self.closures is not None:
+                return self.closures.Execute(node)
+
+        return self._ExecuteNode(node)
+
+    def _ExecuteNode(self, node):
+        # type: (command_t) -> int
+        """Apply redirects, call _Dispatch(), and performs the errexit check.
+
+        Also runs trap handlers.
+        """
+        # TODO: Do this in "leaf" nodes?  SimpleCommand, DBracket, DParen should
+        # call self.DoTick()?  That will RunPendingTraps and check the Ctrl-C flag,
+        # and maybe throw an exception.
+        self._Tick()
+
         # This has to go around redirect handling because the process sub could be
         # in the redirect word:
         #     { echo one; echo two; } > >(tac)
@@ -1826,6 +1903,127 @@ class CommandEvaluator(object):
 
         return status
 
+    def _StaticReturnArg(self, node):
+        # type: (command.ControlFlow) -> int
+        """Evaluate the arg to 'return', or return -1 if it's not static.
+
+        Like _DoControlFlow(), but it doesn't raise.  'return $x' and errors
+        like 'return z' still go through _DoControlFlow().
+        """
+        if node.arg_word:
+            UP_w = node.arg_word
+            if UP_w.tag() != word_e.Compound:
+                return -1
+            s = word_.FastStrEval(cast(CompoundWord, UP_w))
+            if s is None:
+                return -1
+
+            # Same quirk as _DoControlFlow()
+            if len(s) == 0 and not self.exec_opts.strict_control_flow():
+                arg = 0
+            else:
+                try:
+                    arg = int(s)
+                except ValueError:
+                    return -1
+        else:
+            arg = self.mem.LastStatus()
+        return arg
+
+    def _ExecuteBodyList(self, children, for_func):
+        # type: (List[command_t], bool) -> bool
+        """Like _ExecuteList(), but fills in the return slot.
+
+        Returns whether 'return' ran.
+        """
+        status = 0  # for empty list
+        for child in children:
+            node = child
+            if child.tag() == command_e.Sentence:  # e.g. return 3;
+                sentence = cast(command.Sentence, child)
+                if sentence.terminator.id == Id.Op_Semi:
+                    node = sentence.child
+
+            UP_node = node
+            with tagswitch(node) as case:
+                if case(command_e.Retval):
+                    node = cast(command.Retval, UP_node)
+                    if for_func:  # procs raise vm.ValueControlFlow
+                        self._Tick()
+                        self.check_command_sub_status = False
+                        self.mem.SetTokenForLine(node.keyword)
+                        self.ret_val = self.expr_ev.EvalExpr(
+                            node.val, node.keyword)
+                        return True
+
+                elif case(command_e.ControlFlow):
+                    node = cast(command.ControlFlow, UP_node)
+                    # funcs raise AssertionError, like in CallUserFunc()
+                    if (not for_func and
+                            node.keyword.id == Id.ControlFlow_Return):
+                        arg = self._StaticReturnArg(node)
+                        if arg != -1:
+                            self._Tick()
+                            self.check_command_sub_status = False
+                            self.mem.SetTokenForLine(node.keyword)
+                            self.tracer.OnControlFlow(node.keyword.tval, arg)
+                            # like IntControlFlow.StatusCode()
+                            self.ret_status = arg & 0xff
+                            return True
+
+                elif case(command_e.If):
+                    node = cast(command.If, UP_node)
+                    if len(node.redirects) == 0:
+                        # Like _Execute() and _DoIf()
+                        self._Tick()
+                        self.check_command_sub_status = False
+
+                        action = node.else_action
+                        for if_arm in node.arms:
+                            if self._EvalCondition(if_arm.cond,
+                                                   if_arm.keyword):
+                                action = if_arm.action
+                                break
+
+                        if self._ExecuteBodyList(action, for_func):
+                            return True
+                        status = self.ret_status
+                        self.mem.SetLastStatus(status)
+                        continue
+
+            # last status wins
+            status = self._Execute(child)
+
+        self.ret_status = status
+        return False
+
+    def ExecuteBody(self, body, for_func):
+        # type: (command_t, bool) -> bool
+        """Execute the body of a proc or func, and fill in the return slot.
+
+        A 'return' at the top level of the body, or in an 'if' there, is
+        handled without an exception, which is expensive in C++.  Other
+        returns raise vm.IntControlFlow or vm.ValueControlFlow, as before.
+
+        Returns:
+          Whether 'return' ran.  self.ret_status is the status of the body, or
+          the arg to 'return'.  For funcs, self.ret_val is the value of
+          'return (x)'.
+        """
+        if body.tag() == command_e.BraceGroup:
+            brace = cast(BraceGroup, body)
+            if len(brace.redirects) == 0:
+                # Like _Execute()
+                self._Tick()
+                self.check_command_sub_status = False
+                if self._ExecuteBodyList(brace.children, for_func):
+                    return True
+                self.mem.SetLastStatus(self.ret_status)
+                return False
+
+        self.ret_status = self._Execute(body)
+        return False
+
     def _ExecuteList(self, children):
         # type: (List[command_t]) -> int
         status = 0  # for empty list
@@ -2083,7 +2281,8 @@ class CommandEvaluator(object):
             # Redirects still valid for functions.
             # Here doc causes a pipe and Process(SubProgramThunk).
             try:
-                status = self._Execute(proc.body)
+                self.ExecuteBody(proc.body, False)
+                status = self.ret_status
             except vm.IntControlFlow as e:
                 if e.IsReturn():
                     status = e.StatusCode()
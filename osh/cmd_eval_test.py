@@ -12,8 +12,10 @@ cmd_eval_test.py: Tests for cmd_eval.py
 import unittest
 
 from _devbuild.gen.id_kind_asdl import Id
-from _devbuild.gen.syntax_asdl import (BracedVarSub, suffix_op, CompoundWord)
+from _devbuild.gen.syntax_asdl import (BracedVarSub, suffix_op, CompoundWord,
+                                       eval_plan_e)
 from core import test_lib
+from core import vm
 from core.test_lib import Tok
 
 
@@ -60,7 +62,7 @@ class VarOpTest(unittest.TestCase):
 
         # Now add some ops
         part = Tok(Id.Lit_Chars, 'default')
-        arg_word = CompoundWord([part])
+        arg_word = CompoundWord([part], eval_plan_e.Unknown)
         op_tok = Tok(Id.VTest_ColonHyphen, ':-')
         test_op = suffix_op.Unary(op_tok, arg_word)
         unset_sub.suffix_op = test_op
@@ -75,5 +77,39 @@ class VarOpTest(unittest.TestCase):
         print(part_vals)
 
 
+class ReturnSlotTest(unittest.TestCase):
+    def testExecuteBody(self):
+        CASES = [
+            # code, returned, status
+            ('f() { (( x = 1 )); }', False, 0),
+            ('f() { return 3; }', True, 3),
+            ('f() { return 300; }', True, 44),
+            ('f() { if (( 1 )); then return 5; fi; return 6; }', True, 5),
+            ('f() { if (( 0 )); then return 5; else (( 0 )); fi; }', False, 1),
+        ]
+        for code_str, returned, status in CASES:
+            arena = test_lib.MakeArena('<cmd_eval_test.py>')
+            c_parser = test_lib.InitCommandParser(code_str, arena=arena)
+            node = c_parser.ParseLogicalLine()
+            cmd_ev = test_lib.InitCommandEvaluator(arena=arena)
+
+            self.assertEqual(returned, cmd_ev.ExecuteBody(node.body, False),
+                             code_str)
+            self.assertEqual(status, cmd_ev.ret_status, code_str)
+
+        # 'return' inside a loop still raises
+        code_str = 'f() { while (( 1 )); do return 7; done; }'
+        arena = test_lib.MakeArena('<cmd_eval_test.py>')
+        c_parser = test_lib.InitCommandParser(code_str, arena=arena)
+        node = c_parser.ParseLogicalLine()
+        cmd_ev = test_lib.InitCommandEvaluator(arena=arena)
+        try:
+            cmd_ev.ExecuteBody(node.body, False)
+        except vm.IntControlFlow as e:
+            self.assertEqual(7, e.StatusCode())
+        else:
+            self.fail('Expected IntControlFlow')
+
+
 if __name__ == '__main__':
     unittest.main()
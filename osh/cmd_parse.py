@@ -38,6 +38,7 @@ from _devbuild.gen.syntax_asdl import (
     word_e,
     word_t,
     CompoundWord,
+    eval_plan_e,
     Token,
     word_part_e,
     word_part_t,
@@ -251,7 +252,7 @@ def _MakeAssignPair(parse_ctx, preparsed, arena):
         rhs = rhs_word.Empty  # type: rhs_word_t
     else:
         # tmp2 is for intersection of C++/MyPy type systems
-        tmp2 = CompoundWord(parts[offset:])
+        tmp2 = CompoundWord(parts[offset:], eval_plan_e.Unknown)
         word_.TildeDetectAssign(tmp2)
         rhs = tmp2
 
@@ -285,7 +286,7 @@ def _AppendMoreEnv(preparsed_list, more_env):
         if offset == n:
             val = rhs_word.Empty  # type: rhs_word_t
         else:
-            val = CompoundWord(parts[offset:])
+            val = CompoundWord(parts[offset:], eval_plan_e.Unknown)
 
         more_env.append(EnvPair(left_token, var_name, val))
 
@@ -54,6 +54,7 @@ from frontend import reader
 from mycpp import mylib
 from mycpp.mylib import log, tagswitch, switch, str_cmp
 from osh import bool_stat
+from osh import sparse_array
 from osh import word_eval
 
 import libc  # for fnmatch
@@ -132,19 +133,19 @@ def OldValue(lval, mem, exec_opts):
         elif case(sh_lvalue_e.Indexed):
             lval = cast(sh_lvalue.Indexed, UP_lval)
 
-            array_val = None  # type: value.BashArray
+            s = None  # type: Optional[str]
             with tagswitch(val) as case2:
                 if case2(value_e.Undef):
-                    array_val = value.BashArray([])
+                    pass
                 elif case2(value_e.BashArray):
-                    tmp = cast(value.BashArray, UP_val)
-                    # mycpp rewrite: add tmp.  cast() creates a new var in inner scope
-                    array_val = tmp
+                    array_val = cast(value.BashArray, UP_val)
+                    s = word_eval.GetArrayItem(array_val.strs, lval.index)
+                elif case2(value_e.SparseArray):
+                    sparse_val = cast(value.SparseArray, UP_val)
+                    s = sparse_array.GetItem(sparse_val, lval.index)
                 else:
                     e_die("Can't use [] on value of type %s" % ui.ValType(val))
 
-            s = word_eval.GetArrayItem(array_val.strs, lval.index)
-
             if s is None:
                 val = value.Str('')  # NOTE: Other logic is value.Undef?  0?
             else:
@@ -473,11 +474,12 @@ class ArithEvaluator(object):
         val = OldValue(lval, self.mem, self.exec_opts)
 
         # BASH_LINENO, arr (array name without strict_array), etc.
-        if (val.tag() in (value_e.BashArray, value_e.BashAssoc) and
+        if (val.tag() in (value_e.BashArray, value_e.SparseArray,
+                          value_e.BashAssoc) and
                 lval.tag() == sh_lvalue_e.Var):
             named_lval = cast(LeftName, lval)
             if word_eval.ShouldArrayDecay(named_lval.name, self.exec_opts):
-                if val.tag() == value_e.BashArray:
+                if val.tag() in (value_e.BashArray, value_e.SparseArray):
                     lval = sh_lvalue.Indexed(named_lval.name, 0, loc.Missing)
                 elif val.tag() == value_e.BashAssoc:
                     lval = sh_lvalue.Keyed(named_lval.name, '0', loc.Missing)
@@ -504,8 +506,9 @@ class ArithEvaluator(object):
         val = self.Eval(node)
 
         # BASH_LINENO, arr (array name without strict_array), etc.
-        if val.tag() in (value_e.BashArray, value_e.BashAssoc
-                         ) and node.tag() == arith_expr_e.VarSub:
+        if (val.tag() in (value_e.BashArray, value_e.SparseArray,
+                          value_e.BashAssoc) and
+                node.tag() == arith_expr_e.VarSub):
             vsub = cast(SimpleVarSub, node)
             if word_eval.ShouldArrayDecay(vsub.var_name, self.exec_opts):
                 val = word_eval.DecayArray(val)
@@ -678,6 +681,11 @@ class ArithEvaluator(object):
                             index = self.EvalToInt(node.right)
                             s = word_eval.GetArrayItem(array_val.strs, index)
 
+                        elif case(value_e.SparseArray):
+                            sparse_val = cast(value.SparseArray, UP_left)
+                            index = self.EvalToInt(node.right)
+                            s = sparse_array.GetItem(sparse_val, index)
+
                         elif case(value_e.BashAssoc):
                             left = cast(value.BashAssoc, UP_left)
                             key = self.EvalWordToString(node.right)
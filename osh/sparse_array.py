@@ -0,0 +1,128 @@
+"""
+sparse_array.py - Operations on value.SparseArray
+
+Bash arrays are usually dense, so value.BashArray stores them as a list, with
+None for unset entries.  But an assignment like a[1000000]=x would then
+allocate a million slots.
+
+Mem switches to value.SparseArray when an assignment would leave too many
+holes.  It maps index -> str, so memory and iteration are proportional to the
+number of entries, not the largest index.  Entries are visited in index order,
+like bash.
+"""
+
+from _devbuild.gen.value_asdl import value
+from mycpp import mylib
+from mycpp.mylib import iteritems
+
+from typing import List, Dict, Optional
+
+# Don't switch small arrays to the sparse representation
+_MIN_HOLES = 64
+
+
+def ShouldBeSparse(n, index):
+    # type: (int, int) -> bool
+    """Would assigning a[index] to a dense array of length n leave too many
+    holes?"""
+    num_holes = index - n
+    return num_holes > _MIN_HOLES and num_holes > n
+
+
+def FromDense(strs):
+    # type: (List[str]) -> value.SparseArray
+    d = {}  # type: Dict[int, str]
+    max_index = -1
+    for i, s in enumerate(strs):
+        if s is not None:
+            d[i] = s
+            max_index = i
+    return value.SparseArray(d, max_index)
+
+
+def Indices(sp):
+    # type: (value.SparseArray) -> List[int]
+    """Return indices in ascending order."""
+    indices = sp.d.keys()
+    indices.sort()
+    return indices
+
+
+def Values(sp):
+    # type: (value.SparseArray) -> List[str]
+    """Return values in index order, like ${a[@]}."""
+    result = [sp.d[i] for i in Indices(sp)]  # type: List[str]
+    return result
+
+
+def Copy(sp):
+    # type: (value.SparseArray) -> value.SparseArray
+    d = {}  # type: Dict[int, str]
+    for i, s in iteritems(sp.d):
+        d[i] = s
+    return value.SparseArray(d, sp.max_index)
+
+
+def _Normalize(sp, index):
+    # type: (value.SparseArray, int) -> int
+    """a[-1] is the entry with the largest index."""
+    if index < 0:
+        index += sp.max_index + 1
+    return index
+
+
+def GetItem(sp, index):
+    # type: (value.SparseArray, int) -> Optional[str]
+    index = _Normalize(sp, index)
+    if index < 0:
+        return None
+    return sp.d.get(index)
+
+
+def SetItem(sp, index, s):
+    # type: (value.SparseArray, int, str) -> bool
+    """Returns False if a negative index is out of bounds."""
+    index = _Normalize(sp, index)
+    if index < 0:
+        return False
+    sp.d[index] = s
+    if index > sp.max_index:
+        sp.max_index = index
+    return True
+
+
+def UnsetItem(sp, index):
+    # type: (value.SparseArray, int) -> None
+    """Like unset 'a[i]', which succeeds even if there's no entry."""
+    index = _Normalize(sp, index)
+    if index not in sp.d:
+        return
+    mylib.dict_erase(sp.d, index)
+
+    if index == sp.max_index:
+        max_index = -1
+        for i, _ in iteritems(sp.d):
+            if i > max_index:
+                max_index = i
+        sp.max_index = max_index
+
+
+def Append(sp, strs):
+    # type: (value.SparseArray, List[str]) -> None
+    """Like a+=(x y), which appends after the largest index."""
+    for s in strs:
+        sp.max_index += 1
+        sp.d[sp.max_index] = s
+
+
+def Slice(sp, begin, length, has_length):
+    # type: (value.SparseArray, int, int, bool) -> List[str]
+    """${a[@]:begin:length}, where begin is an index, not a position."""
+    begin = _Normalize(sp, begin)
+    strs = []  # type: List[str]
+    for i in Indices(sp):
+        if has_length and len(strs) == length:  # length could be 0
+            break
+        if i >= begin:
+            strs.append(sp.d[i])
+    return strs
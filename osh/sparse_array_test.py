@@ -0,0 +1,64 @@
+#!/usr/bin/env python2
+"""
+sparse_array_test.py: Tests for sparse_array.py
+"""
+from __future__ import print_function
+
+import unittest
+
+from osh import sparse_array  # module under test
+
+
+class SparseArrayTest(unittest.TestCase):
+
+    def testShouldBeSparse(self):
+        self.assertEqual(False, sparse_array.ShouldBeSparse(0, 5))
+        self.assertEqual(False, sparse_array.ShouldBeSparse(1000, 1500))
+        self.assertEqual(True, sparse_array.ShouldBeSparse(0, 1000000))
+        self.assertEqual(True, sparse_array.ShouldBeSparse(100, 1000))
+
+    def testOperations(self):
+        sp = sparse_array.FromDense(['a', None, 'c'])
+        self.assertEqual({0: 'a', 2: 'c'}, sp.d)
+        self.assertEqual(2, sp.max_index)
+
+        self.assertEqual(True, sparse_array.SetItem(sp, 1000000, 'z'))
+        self.assertEqual([0, 2, 1000000], sparse_array.Indices(sp))
+        self.assertEqual(['a', 'c', 'z'], sparse_array.Values(sp))
+
+        # Negative indices are relative to the largest index
+        self.assertEqual('z', sparse_array.GetItem(sp, -1))
+        self.assertEqual(None, sparse_array.GetItem(sp, -2))
+        self.assertEqual('a', sparse_array.GetItem(sp, -1000001))
+        self.assertEqual(None, sparse_array.GetItem(sp, -1000002))
+        self.assertEqual(False, sparse_array.SetItem(sp, -1000002, 'x'))
+
+        # Unsetting the last entry lowers max_index
+        sparse_array.UnsetItem(sp, -1)
+        self.assertEqual(2, sp.max_index)
+        sparse_array.UnsetItem(sp, 99)  # not an error
+        self.assertEqual(['a', 'c'], sparse_array.Values(sp))
+
+        sparse_array.Append(sp, ['d', 'e'])
+        self.assertEqual([0, 2, 3, 4], sparse_array.Indices(sp))
+
+        # The copy is independent
+        sp2 = sparse_array.Copy(sp)
+        sparse_array.SetItem(sp2, 10, 'f')
+        self.assertEqual(4, sp.max_index)
+        self.assertEqual(10, sp2.max_index)
+
+    def testSlice(self):
+        sp = sparse_array.FromDense([])
+        for i in [5, 10, 20]:
+            sparse_array.SetItem(sp, i, str(i))
+
+        # begin is an index, not a position
+        self.assertEqual(['10', '20'], sparse_array.Slice(sp, 6, -1, False))
+        self.assertEqual(['10'], sparse_array.Slice(sp, 6, 1, True))
+        self.assertEqual([], sparse_array.Slice(sp, 6, 0, True))
+        self.assertEqual(['20'], sparse_array.Slice(sp, -1, -1, False))
+
+
+if __name__ == '__main__':
+    unittest.main()
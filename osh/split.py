@@ -32,6 +32,7 @@ from _devbuild.gen.value_asdl import (value, value_e, value_t)
 from mycpp.mylib import log
 from core import pyutil
 from frontend import consts
+from frontend import match
 from mycpp import mylib
 from mycpp.mylib import tagswitch
 
@@ -183,6 +184,13 @@ class SplitContext(object):
         Also used by the explicit @split() function.
         """
         sp = self._GetSplitter(ifs=ifs)
+
+        # Fast path: without backslashes, every field is a slice of s, so we
+        # don't need spans.  This is the common case of $(cat list).
+        parts = match.IfsSplit(s, sp.ifs_whitespace, sp.ifs_other)
+        if parts is not None:
+            return parts
+
         spans = sp.Split(s, True)
         if 0:
             for span in spans:
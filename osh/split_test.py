@@ -3,8 +3,10 @@
 split.test.py: Tests for split.py
 """
 
+import random
 import unittest
 
+from frontend import match
 from osh import split  # module under test
 
 
@@ -25,6 +27,12 @@ def _RunSplitCases(test, sp, cases):
         test.assertEqual(expected_parts, parts,
                          '%r: %s != %s' % (s, expected_parts, parts))
 
+        # The fast path agrees, unless it punts on backslashes
+        fast_parts = match.IfsSplit(s, sp.ifs_whitespace, sp.ifs_other)
+        if fast_parts is not None:
+            test.assertEqual(expected_parts, fast_parts,
+                             '%r: %s != %s' % (s, expected_parts, fast_parts))
+
 
 class SplitTest(unittest.TestCase):
     def testSpansToParts(self):
@@ -158,6 +166,27 @@ class SplitTest(unittest.TestCase):
         sp = split.IfsSplitter('', '_-')
         _RunSplitCases(self, sp, CASES)
 
+    def testFastPathMatchesStateMachine(self):
+        r = random.Random(42)
+        splitters = [
+            split.IfsSplitter(split.DEFAULT_IFS, ''),
+            split.IfsSplitter(' ', '_'),
+            split.IfsSplitter('', '_-'),
+            split.IfsSplitter('', ''),
+        ]
+        for sp in splitters:
+            for _ in xrange(500):
+                n = r.randint(0, 8)
+                s = ''.join(r.choice('ab _-\t\n') for _ in xrange(n))
+
+                spans = sp.Split(s, True)
+                expected = split._SpansToParts(s, spans)
+                self.assertEqual(
+                    expected, match.IfsSplit(s, sp.ifs_whitespace,
+                                             sp.ifs_other), repr(s))
+
+        self.assertEqual(None, match.IfsSplit(r'a\ b', ' ', ''))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -17,6 +17,7 @@ from _devbuild.gen.syntax_asdl import loc, Token, suffix_op
 from core import pyutil
 from core import ui
 from core.error import e_die, e_strict
+from mycpp import mylib
 from mycpp.mylib import log
 from osh import glob_
 
@@ -170,6 +171,9 @@ def CountUtf8Chars(s):
     $ echo $?
     1
     """
+    if mylib.is_ascii(s):  # O(1) in C++
+        return len(s)
+
     num_chars = 0
     num_bytes = len(s)
     i = 0
@@ -188,6 +192,13 @@ def AdvanceUtf8Chars(s, num_chars, byte_offset):
     Used for shell slicing.
     """
     num_bytes = len(s)
+    if mylib.is_ascii(s):
+        # Same result as the loop below, without walking the string
+        end = byte_offset + num_chars
+        if end > num_bytes:
+            end = num_bytes
+        return max(byte_offset, end)
+
     i = byte_offset  # current byte position
 
     for _ in xrange(num_chars):
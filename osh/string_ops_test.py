@@ -79,6 +79,33 @@ class LibStrTest(unittest.TestCase):
                     break
             self.assertEqual(expected_indexes, actual_indexes)
 
+    def testAsciiFastPath(self):
+        # ASCII strings don't walk the string, but give the same answers
+        s = 'hello'
+        self.assertEqual(5, string_ops.CountUtf8Chars(s))
+        self.assertEqual(0, string_ops.CountUtf8Chars(''))
+
+        CASES = [
+            # num_chars, byte_offset, expected
+            (0, 0, 0),
+            (2, 0, 2),
+            (2, 1, 3),
+            (5, 0, 5),
+            (9, 0, 5),  # doesn't go past the end
+            (9, 3, 5),
+            (1, 7, 7),  # out of bounds offset is returned
+            (-1, 2, 2),
+        ]
+        for num_chars, byte_offset, expected in CASES:
+            self.assertEqual(
+                expected,
+                string_ops.AdvanceUtf8Chars(s, num_chars, byte_offset))
+
+        # Non-ASCII still walks the string
+        mu = '\xce\xbc'
+        self.assertEqual(3, string_ops.CountUtf8Chars('a' + mu + 'b'))
+        self.assertEqual(3, string_ops.AdvanceUtf8Chars('a' + mu + 'b', 2, 0))
+
     def testUnarySuffixOpDemo(self):
         print(string_ops)
 
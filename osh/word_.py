@@ -6,8 +6,13 @@ from _devbuild.gen.id_kind_asdl import Id, Kind, Id_t, Kind_t
 from _devbuild.gen.syntax_asdl import (
     Token,
     CompoundWord,
+    eval_plan_e,
+    eval_plan_t,
     DoubleQuoted,
     SingleQuoted,
+    SimpleVarSub,
+    BracedVarSub,
+    bracket_op_e,
     word,
     word_e,
     word_t,
@@ -111,57 +116,149 @@ def _EvalWordPart(part):
             raise AssertionError(part.tag())
 
 
-def FastStrEval(w):
-    # type: (CompoundWord) -> Optional[str]
-    """
-    TODO:
-    - Detect common case of CompoundWord([LiteralPart(Id.LitChars)])
-      For echo -e, test x -lt 0, etc.
-    - Store lexer.TokenVal() result in word_part.Literal(Token tok, str? sval)
-    - In EvalWordSequence2, append once to strs and locs, and short-circuit the
-      rest of the loop.  
-      - Do it in all public APIs: EvalWordTo{String,Pattern}()
-    """
-    if len(w.parts) != 1:
-        return None
+# Unquoted literals that evaluate to themselves: no globbing, no tilde
+# expansion, and no splicing.  Not Lit_Star, Lit_QMark, Lit_TildeLike,
+# Lit_Splice, or Lit_Other, which may be a trailing backslash.
+_STATIC_LITERAL_IDS = [
+    Id.Lit_Chars, Id.Lit_VarLike, Id.Lit_LBrace, Id.Lit_RBrace, Id.Lit_Comma,
+    Id.Lit_Equals, Id.Lit_Colon, Id.Lit_Pound, Id.Lit_Slash, Id.Lit_Percent,
+    Id.Lit_Dollar, Id.Lit_At, Id.Lit_Digits
+]
 
-    part0 = w.parts[0]
-    UP_part0 = part0
-    with tagswitch(part0) as case:
+
+def _FastPartEval(part, strs):
+    # type: (word_part_t, List[str]) -> bool
+    """Append the value of a static part to strs, or return False."""
+    UP_part = part
+    with tagswitch(part) as case:
         if case(word_part_e.Literal):
-            part0 = cast(Token, UP_part0)
+            tok = cast(Token, UP_part)
+            if tok.id not in _STATIC_LITERAL_IDS:
+                return False
+            strs.append(tok.tval)
+
+        elif case(word_part_e.EscapedLiteral):
+            part = cast(word_part.EscapedLiteral, UP_part)
+            strs.append(part.ch)
+
+        elif case(word_part_e.SingleQuoted):
+            part = cast(SingleQuoted, UP_part)
+            strs.append(word_compile.EvalSingleQuoted(part))
+
+        elif case(word_part_e.DoubleQuoted):
+            part = cast(DoubleQuoted, UP_part)
+            # Everything in "" is literal, except substitutions
+            for p in part.parts:
+                UP_p = p
+                with tagswitch(p) as case2:
+                    if case2(word_part_e.Literal):
+                        tok = cast(Token, UP_p)
+                        strs.append(tok.tval)
+                    elif case2(word_part_e.EscapedLiteral):
+                        p = cast(word_part.EscapedLiteral, UP_p)
+                        strs.append(p.ch)
+                    else:
+                        return False
 
-            if part0.id in (Id.Lit_Chars, Id.Lit_LBracket, Id.Lit_RBracket):
-                # Could add more tokens in this case
-                #   e.g. + is Lit_Other, and it's a Token in 'expr'
-                #   Right now it's Lit_Chars (e.g. ls -l) and [ and ] because I
-                #   know those are common
-                #   { } are not as common
+        else:
+            return False
 
-                #if part0.line is None:
-                #    log("part0 %s", part0)
+    return True
 
-                # TODO: word_part.Literal should have lazy (str? sval) field
+
+def _StaticStr(w):
+    # type: (CompoundWord) -> Optional[str]
+    """Return the value of a word with no substitutions, globs, or tildes."""
+    if len(w.parts) == 1:
+        part0 = w.parts[0]
+        UP_part0 = part0
+        with tagswitch(part0) as case:
+            if case(word_part_e.Literal):
+                part0 = cast(Token, UP_part0)
+                # [ and ] by themselves aren't globs.  They're common because
+                # of [ x -lt 0 ]
+                if part0.id in (Id.Lit_LBracket, Id.Lit_RBracket):
+                    return part0.tval
 
                 # TODO: instances created by lexer.DummyToken() don't have
                 # tok.line field, so they can't use lexer.TokenVal()
-                return part0.tval
-                #return lexer.TokenVal(part0)
+                if part0.id in _STATIC_LITERAL_IDS:
+                    return part0.tval
 
-            else:
                 # e.g. Id.Lit_Star needs to be glob expanded
-                # TODO: Consider moving Id.Lit_Star etc. to Kind.MaybeGlob?
                 return None
 
-        elif case(word_part_e.SingleQuoted):
-            part0 = cast(SingleQuoted, UP_part0)
-            # TODO: SingleQuoted should have lazy (str? sval) field
-            return word_compile.EvalSingleQuoted(part0)
+            elif case(word_part_e.SingleQuoted):
+                part0 = cast(SingleQuoted, UP_part0)
+                # TODO: SingleQuoted should have lazy (str? sval) field
+                return word_compile.EvalSingleQuoted(part0)
 
-        else:
-            # e.g. DoubleQuoted can't be optimized to a string, because it
-            # might have "$@" and such
+    # An empty word from brace expansion like {a,} is elided
+    if len(w.parts) == 0:
+        return None
+
+    # Multiple parts, like --foo=bar or 'a'"b" or a:b
+    strs = []  # type: List[str]
+    for p in w.parts:
+        if not _FastPartEval(p, strs):
             return None
+    return ''.join(strs)
+
+
+def _IsDollarName(part):
+    # type: (word_part_t) -> bool
+    """Is it $x, and not a special variable like $@?"""
+    if part.tag() != word_part_e.SimpleVarSub:
+        return False
+    vsub = cast(SimpleVarSub, part)
+    return vsub.left.id == Id.VSub_DollarName
+
+
+def _ClassifyWord(w):
+    # type: (CompoundWord) -> eval_plan_t
+    if _StaticStr(w) is not None:
+        return eval_plan_e.Static
+
+    if len(w.parts) != 1:
+        return eval_plan_e.General
+
+    part0 = w.parts[0]
+    if part0.tag() == word_part_e.DoubleQuoted:
+        dq = cast(DoubleQuoted, part0)
+        if len(dq.parts) == 1 and _IsDollarName(dq.parts[0]):
+            return eval_plan_e.DQVarSub
+        return eval_plan_e.General
+
+    if _IsDollarName(part0):
+        return eval_plan_e.VarSub
+    return eval_plan_e.General
+
+
+def EvalPlan(w):
+    # type: (CompoundWord) -> eval_plan_t
+    """Return how the word can be evaluated.
+
+    The plan only depends on the syntax, so it's computed once, and cached on
+    the word.
+    """
+    if w.plan == eval_plan_e.Unknown:
+        w.plan = _ClassifyWord(w)
+    return w.plan
+
+
+def FastStrEval(w):
+    # type: (CompoundWord) -> Optional[str]
+    """Evaluate a word with no substitutions, globs, or tildes.
+
+    This is the common case, e.g. ls -l, [ x -lt 0 ], --foo=bar, 'my dir', and
+    "a b".  These words evaluate to the same string every time, so we skip
+    creating part values, word splitting, and globbing.
+
+    Returns None if the word needs the general algorithm.
+    """
+    if EvalPlan(w) != eval_plan_e.Static:
+        return None
+    return _StaticStr(w)
 
 
 def StaticEval(UP_w):
@@ -243,7 +340,7 @@ def TildeDetect(UP_w):
     new_parts = [tilde_sub]  # type: List[word_part_t]
 
     if len(w.parts) == 1:  # can't be zero
-        return CompoundWord(new_parts)
+        return CompoundWord(new_parts, eval_plan_e.Unknown)
 
     part1 = w.parts[1]
     id_ = LiteralId(part1)
@@ -251,12 +348,12 @@ def TildeDetect(UP_w):
     # Lit_Slash is for ${x-~/foo}
     if id_ == Id.Lit_Slash:  # we handled ${x//~/} delimiter earlier,
         new_parts.extend(w.parts[1:])
-        return CompoundWord(new_parts)
+        return CompoundWord(new_parts, eval_plan_e.Unknown)
 
     # Lit_Chars is for ~/foo,
     if id_ == Id.Lit_Chars and cast(Token, part1).tval.startswith('/'):
         new_parts.extend(w.parts[1:])
-        return CompoundWord(new_parts)
+        return CompoundWord(new_parts, eval_plan_e.Unknown)
 
     # It could be something like '~foo:bar', which doesn't have a slash.
     return None
@@ -314,6 +411,77 @@ def HasArrayPart(w):
     return False
 
 
+# These are different in a child process, or change when they're read
+_PROCESS_VARS = ['BASHPID', 'RANDOM']
+
+
+def _IsPurePart(part):
+    # type: (word_part_t) -> bool
+    UP_part = part
+    with tagswitch(part) as case:
+        if case(word_part_e.Literal, word_part_e.EscapedLiteral,
+                word_part_e.SingleQuoted, word_part_e.TildeSub,
+                word_part_e.BracedRange, word_part_e.Splice):
+            return True
+
+        elif case(word_part_e.DoubleQuoted):
+            part = cast(DoubleQuoted, UP_part)
+            for p in part.parts:
+                if not _IsPurePart(p):
+                    return False
+            return True
+
+        elif case(word_part_e.SimpleVarSub):
+            part = cast(SimpleVarSub, UP_part)
+            return part.var_name not in _PROCESS_VARS
+
+        elif case(word_part_e.BracedVarSub):
+            part = cast(BracedVarSub, UP_part)
+            # ${x} and ${a[@]}, but not ${x:=default}, ${a[i++]}, or ${!ref}
+            if part.prefix_op or part.suffix_op:
+                return False
+            if (part.bracket_op and
+                    part.bracket_op.tag() != bracket_op_e.WholeArray):
+                return False
+            return part.var_name not in _PROCESS_VARS
+
+        elif case(word_part_e.BracedTuple):
+            part = cast(word_part.BracedTuple, UP_part)
+            for w in part.words:
+                if not IsPure(w):
+                    return False
+            return True
+
+        else:
+            # $(echo) and $((i++)) can change state, $[f()] calls a function,
+            # etc.
+            return False
+
+
+def IsPure(w):
+    # type: (word_t) -> bool
+    """Can we evaluate this word without changing the shell's state?
+
+    And does it have the same value in a child process?  Used to run 'echo $x'
+    in a pipeline without forking.
+    """
+    UP_w = w
+    with tagswitch(w) as case:
+        if case(word_e.Compound):
+            w = cast(CompoundWord, UP_w)
+            parts = w.parts
+        elif case(word_e.BracedTree):
+            w = cast(word.BracedTree, UP_w)
+            parts = w.parts
+        else:
+            return False
+
+    for part in parts:
+        if not _IsPurePart(part):
+            return False
+    return True
+
+
 def ShFunctionName(w):
     # type: (CompoundWord) -> str
     """Returns a valid shell function name, or the empty string.
@@ -437,8 +605,9 @@ def DetectAssocPair(w):
         id_ = LiteralId(parts[i])
         if id_ == Id.Lit_ArrayLhsClose:  # ]=
             # e.g. if we have [$x$y]=$a$b
-            key = CompoundWord(parts[1:i])  # $x$y
-            value = CompoundWord(parts[i + 1:])  # $a$b from
+            key = CompoundWord(parts[1:i], eval_plan_e.Unknown)  # $x$y
+            value = CompoundWord(parts[i + 1:],
+                                 eval_plan_e.Unknown)  # $a$b from
 
             # Type-annotated intermediate value for mycpp translation
             return AssocPair(key, value)
@@ -647,7 +816,7 @@ def IsVarSub(w):
 def ErrorWord(error_str):
     # type: (str) -> CompoundWord
     t = lexer.DummyToken(Id.Lit_Chars, error_str)
-    return CompoundWord([t])
+    return CompoundWord([t], eval_plan_e.Unknown)
 
 
 def Pretty(w):
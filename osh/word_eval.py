@@ -20,6 +20,7 @@ from _devbuild.gen.syntax_asdl import (
     word_e,
     word_t,
     CompoundWord,
+    eval_plan_e,
     rhs_word,
     rhs_word_e,
     rhs_word_t,
@@ -60,6 +61,7 @@ from frontend import location
 from mycpp.mylib import log, tagswitch, NewDict
 from osh import braces
 from osh import glob_
+from osh import sparse_array
 from osh import string_ops
 from osh import word_
 from osh import word_compile
@@ -111,6 +113,9 @@ def DecayArray(val):
     if val.tag() == value_e.BashArray:
         array_val = cast(value.BashArray, val)
         s = array_val.strs[0] if len(array_val.strs) else None
+    elif val.tag() == value_e.SparseArray:
+        sparse_val = cast(value.SparseArray, val)
+        s = sparse_val.d.get(0)
     elif val.tag() == value_e.BashAssoc:
         assoc_val = cast(value.BashAssoc, val)
         s = assoc_val.d['0'] if '0' in assoc_val.d else None
@@ -221,6 +226,10 @@ def _ValueToPartValue(val, quoted, part_loc):
             val = cast(value.BashArray, UP_val)
             return part_value.Array(val.strs)
 
+        elif case(value_e.SparseArray):
+            val = cast(value.SparseArray, UP_val)
+            return part_value.Array(sparse_array.Values(val))
+
         elif case(value_e.BashAssoc):
             val = cast(value.BashAssoc, UP_val)
             # bash behavior: splice values!
@@ -392,6 +401,15 @@ def _PerformSlice(
 
             result = value.BashArray(strs)
 
+        elif case(value_e.SparseArray):
+            val = cast(value.SparseArray, UP_val)
+            if has_length and length < 0:
+                e_die(
+                    "The length index of a array slice can't be negative: %d" %
+                    length, loc.WordPart(part))
+            result = value.BashArray(
+                sparse_array.Slice(val, begin, length, has_length))
+
         elif case(value_e.BashAssoc):
             e_die("Can't slice associative arrays", loc.WordPart(part))
 
@@ -619,6 +637,9 @@ class AbstractWordEvaluator(StringWordEvaluator):
             elif case(value_e.BashArray):
                 val = cast(value.BashArray, UP_val)
                 is_falsey = len(val.strs) == 0
+            elif case(value_e.SparseArray):
+                val = cast(value.SparseArray, UP_val)
+                is_falsey = len(val.d) == 0
             elif case(value_e.BashAssoc):
                 val = cast(value.BashAssoc, UP_val)
                 is_falsey = len(val.d) == 0
@@ -739,6 +760,10 @@ class AbstractWordEvaluator(StringWordEvaluator):
                     if s is not None:
                         length += 1
 
+            elif case(value_e.SparseArray):
+                val = cast(value.SparseArray, UP_val)
+                length = len(val.d)
+
             elif case(value_e.BashAssoc):
                 val = cast(value.BashAssoc, UP_val)
                 length = len(val.d)
@@ -765,6 +790,13 @@ class AbstractWordEvaluator(StringWordEvaluator):
                         indices.append(str(i))
                 return value.BashArray(indices)
 
+            elif case(value_e.SparseArray):
+                val = cast(value.SparseArray, UP_val)
+                indices = []
+                for i in sparse_array.Indices(val):
+                    indices.append(str(i))
+                return value.BashArray(indices)
+
             elif case(value_e.BashAssoc):
                 val = cast(value.BashAssoc, UP_val)
                 assert val.d is not None  # for MyPy, so it's not Optional[]
@@ -793,8 +825,8 @@ class AbstractWordEvaluator(StringWordEvaluator):
                 return self._VarRefValue(bvs_part, quoted, vsub_state,
                                          vtest_place)
 
-            elif case(value_e.BashArray):  # caught earlier but OK
-                e_die('Indirect expansion of array')
+            elif case(value_e.BashArray, value_e.SparseArray):
+                e_die('Indirect expansion of array')  # caught earlier but OK
 
             elif case(value_e.BashAssoc):  # caught earlier but OK
                 e_die('Indirect expansion of assoc array')
@@ -835,6 +867,15 @@ class AbstractWordEvaluator(StringWordEvaluator):
                                     s, op.op, arg_val.s, has_extglob))
                     new_val = value.BashArray(strs)
 
+                elif case(value_e.SparseArray):
+                    val = cast(value.SparseArray, UP_val)
+                    strs = []
+                    for s in sparse_array.Values(val):
+                        strs.append(
+                            string_ops.DoUnarySuffixOp(s, op.op, arg_val.s,
+                                                       has_extglob))
+                    new_val = value.BashArray(strs)
+
                 elif case(value_e.BashAssoc):
                     val = cast(value.BashAssoc, UP_val)
                     strs = []
@@ -896,6 +937,13 @@ class AbstractWordEvaluator(StringWordEvaluator):
                         strs.append(replacer.Replace(s, op))
                 val = value.BashArray(strs)
 
+            elif case2(value_e.SparseArray):
+                sparse_val = cast(value.SparseArray, val)
+                strs = []
+                for s in sparse_array.Values(sparse_val):
+                    strs.append(replacer.Replace(s, op))
+                val = value.BashArray(strs)
+
             elif case2(value_e.BashAssoc):
                 assoc_val = cast(value.BashAssoc, val)
                 strs = []
@@ -939,7 +987,7 @@ class AbstractWordEvaluator(StringWordEvaluator):
                 with tagswitch(val) as case2:
                     if case2(value_e.Str):
                         val = value.Str('')
-                    elif case2(value_e.BashArray):
+                    elif case2(value_e.BashArray, value_e.SparseArray):
                         val = value.BashArray([])
                     else:
                         raise NotImplementedError()
@@ -974,6 +1022,13 @@ class AbstractWordEvaluator(StringWordEvaluator):
                     array_val = cast(value.BashArray, UP_val)
                     tmp = [qsn.maybe_shell_encode(s) for s in array_val.strs]
                     result = value.Str(' '.join(tmp))
+                elif case(value_e.SparseArray):
+                    sparse_val = cast(value.SparseArray, UP_val)
+                    tmp = [
+                        qsn.maybe_shell_encode(s)
+                        for s in sparse_array.Values(sparse_val)
+                    ]
+                    result = value.Str(' '.join(tmp))
                 else:
                     e_die("Can't use @Q on %s" %
                           ui.ValType(val))  # TODO: location
@@ -983,7 +1038,7 @@ class AbstractWordEvaluator(StringWordEvaluator):
             # spec/ble-idioms.test.sh.
             chars = []  # type: List[str]
             with tagswitch(val) as case:
-                if case(value_e.BashArray):
+                if case(value_e.BashArray, value_e.SparseArray):
                     chars.append('a')
                 elif case(value_e.BashAssoc):
                     chars.append('A')
@@ -1071,6 +1126,18 @@ class AbstractWordEvaluator(StringWordEvaluator):
                 else:
                     val = value.Str(s)
 
+            elif case2(value_e.SparseArray):
+                sparse_val = cast(value.SparseArray, UP_val)
+                index = self.arith_ev.EvalToInt(anode)
+                vtest_place.index = a_index.Int(index)
+
+                s = sparse_array.GetItem(sparse_val, index)
+
+                if s is None:
+                    val = value.Undef
+                else:
+                    val = value.Str(s)
+
             elif case2(value_e.BashAssoc):
                 assoc_val = cast(value.BashAssoc, UP_val)
                 key = self.arith_ev.EvalWordToString(anode)
@@ -1171,7 +1238,8 @@ class AbstractWordEvaluator(StringWordEvaluator):
         else:  # no bracket op
             var_name = vtest_place.name
             if (var_name is not None and
-                    val.tag() in (value_e.BashArray, value_e.BashAssoc) and
+                    val.tag() in (value_e.BashArray, value_e.SparseArray,
+                                  value_e.BashAssoc) and
                     not vsub_state.is_type_query):
                 if ShouldArrayDecay(var_name, self.exec_opts,
                                     not (part.prefix_op or part.suffix_op)):
@@ -1397,6 +1465,10 @@ class AbstractWordEvaluator(StringWordEvaluator):
 
         # After applying suffixes, process join_array here.
         UP_val = val
+        if val.tag() == value_e.SparseArray:
+            val = value.BashArray(
+                sparse_array.Values(cast(value.SparseArray, UP_val)))
+            UP_val = val
         if val.tag() == value_e.BashArray:
             array_val = cast(value.BashArray, UP_val)
             if vsub_state.join_array:
@@ -1463,7 +1535,8 @@ class AbstractWordEvaluator(StringWordEvaluator):
         if token.id == Id.VSub_DollarName:
             # TODO: Special case for LINENO
             val = self.mem.GetValue(var_name)
-            if val.tag() in (value_e.BashArray, value_e.BashAssoc):
+            if val.tag() in (value_e.BashArray, value_e.SparseArray,
+                             value_e.BashAssoc):
                 if ShouldArrayDecay(var_name, self.exec_opts):
                     # for $BASH_SOURCE, etc.
                     val = DecayArray(val)
@@ -1492,6 +1565,30 @@ class AbstractWordEvaluator(StringWordEvaluator):
         v = _ValueToPartValue(val, quoted, part)
         part_vals.append(v)
 
+    def _FastVarSubEval(self, w, allow_unquoted):
+        # type: (CompoundWord, bool) -> Optional[str]
+        """Evaluate a word that's just $x or "$x", or return None.
+
+        Only string values take this path.  Arrays, unset variables, and
+        special variables like $@ go through _EvalSimpleVarSub.  Unquoted $x is
+        only allowed when the caller doesn't split or glob.
+        """
+        plan = word_.EvalPlan(w)
+        if plan == eval_plan_e.DQVarSub:
+            dq = cast(DoubleQuoted, w.parts[0])
+            inner = dq.parts[0]
+        elif plan == eval_plan_e.VarSub and allow_unquoted:
+            inner = w.parts[0]
+        else:
+            return None
+
+        vsub = cast(SimpleVarSub, inner)
+        val = self.mem.GetValue(vsub.var_name)
+        if val.tag() != value_e.Str:
+            return None
+        str_val = cast(value.Str, val)
+        return str_val.s
+
     def EvalSimpleVarSubToString(self, node):
         # type: (SimpleVarSub) -> str
         """For double quoted strings in YSH expressions.
@@ -1815,8 +1912,10 @@ class AbstractWordEvaluator(StringWordEvaluator):
             if fast_str is not None:
                 return value.Str(fast_str)
 
-            # Could we additionally optimize a=$b, if we know $b isn't an array
-            # etc.?
+            # a=$b and a="$b" don't split or glob
+            fast_str = self._FastVarSubEval(w, True)
+            if fast_str is not None:
+                return value.Str(fast_str)
 
         part_vals = []  # type: List[part_value_t]
         for p in w.parts:
@@ -2046,7 +2145,8 @@ class AbstractWordEvaluator(StringWordEvaluator):
                         rhs = rhs_word.Empty  # type: rhs_word_t
                     else:
                         # tmp is for intersection of C++/MyPy type systems
-                        tmp = CompoundWord(w.parts[part_offset:])
+                        tmp = CompoundWord(w.parts[part_offset:],
+                                           eval_plan_e.Unknown)
                         word_.TildeDetectAssign(tmp)
                         rhs = tmp
 
@@ -2184,13 +2284,20 @@ class AbstractWordEvaluator(StringWordEvaluator):
                 locs.append(w)
 
                 # e.g. the 'local' in 'local a=b c=d' will be here
-                if allow_assign and i == 0:
+                if allow_assign and i == 0 and len(w.parts) == 1:
                     builtin_id = consts.LookupAssignBuiltin(fast_str)
                     if builtin_id != consts.NO_INDEX:
                         return self._EvalAssignBuiltin(builtin_id, fast_str,
                                                        words)
                 continue
 
+            # "$x" is one arg, with no splitting or globbing
+            fast_str = self._FastVarSubEval(w, False)
+            if fast_str is not None:
+                strs.append(fast_str)
+                locs.append(w)
+                continue
+
             part_vals = []  # type: List[part_value_t]
             self._EvalWordToParts(w, part_vals, EXTGLOB_FILES)
 
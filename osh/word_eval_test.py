@@ -128,6 +128,25 @@ class WordEvalTest(unittest.TestCase):
             print(argv)
             print()
 
+    def testFastPaths(self):
+        # Static words and "$x" skip part values, but give the same argv as
+        # the general algorithm
+        node = assertParseSimpleCommand(
+            self, 'echo --foo=bar "$x" $y "$y" "$undef" x"$y"')
+        ev = InitEvaluator()
+        cmd_val = ev.EvalWordSequence2(node.words)
+        self.assertEqual([
+            'echo', '--foo=bar', '- -- ---', 'y', 'yy', 'y yy', '', 'xy yy'
+        ], cmd_val.argv)
+
+        # Unquoted $y is only fast when it isn't split
+        self.assertEqual('y yy', ev._FastVarSubEval(node.words[3], True))
+        self.assertEqual(None, ev._FastVarSubEval(node.words[3], False))
+        self.assertEqual('y yy', ev._FastVarSubEval(node.words[4], False))
+        self.assertEqual(None, ev._FastVarSubEval(node.words[5], False))
+
+        self.assertEqual('y yy', ev.EvalWordToString(node.words[3]).s)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -72,6 +72,7 @@ from _devbuild.gen.syntax_asdl import (
     word_e,
     word_t,
     CompoundWord,
+    eval_plan_e,
     word_part,
     word_part_t,
     y_lhs,
@@ -289,7 +290,7 @@ class WordParser(WordEmitter):
 
         self._GetToken()
         if self.token_type == Id.Right_DollarBrace:
-            pat = CompoundWord([])
+            pat = CompoundWord([], eval_plan_e.Unknown)
             return suffix_op.PatSub(pat, rhs_word.Empty, replace_mode,
                                     slash_tok)
 
@@ -806,13 +807,13 @@ class WordParser(WordEmitter):
 
             if self.token_type == Id.Right_ExtGlob:
                 if not read_word:
-                    arms.append(CompoundWord([]))
+                    arms.append(CompoundWord([], eval_plan_e.Unknown))
                 right_token = self.cur_token
                 break
 
             elif self.token_type == Id.Op_Pipe:
                 if not read_word:
-                    arms.append(CompoundWord([]))
+                    arms.append(CompoundWord([], eval_plan_e.Unknown))
                 read_word = False
                 self._SetNext(lex_mode_e.ExtGlob)
 
@@ -1624,7 +1625,7 @@ class WordParser(WordEmitter):
         could be an operator delimiting a compound word.  Can we change lexer modes
         and remove this special case?
         """
-        w = CompoundWord([])
+        w = CompoundWord([], eval_plan_e.Unknown)
         num_parts = 0
         brace_count = 0
         done = False
@@ -2004,7 +2005,7 @@ class WordParser(WordEmitter):
         This is just like reading a here doc line.  "\n" is allowed, as
         well as the typical substitutions ${x} $(echo hi) $((1 + 2)).
         """
-        w = CompoundWord([])
+        w = CompoundWord([], eval_plan_e.Unknown)
         self._ReadLikeDQ(None, False, w.parts)
         return w
 
@@ -7,6 +7,7 @@ from __future__ import print_function
 import unittest
 
 from _devbuild.gen.id_kind_asdl import Id
+from _devbuild.gen.syntax_asdl import eval_plan_e
 
 from core import test_lib
 from mycpp.mylib import log
@@ -117,6 +118,48 @@ class WordTest(unittest.TestCase):
         self.assertEqual('b', word_.FastStrEval(node.words[3]))
         self.assertEqual(']', word_.FastStrEval(node.words[4]))
 
+        # Multiple static parts
+        node = assertParseSimpleCommand(
+            self, """ls --foo=bar a,b x:y 'a'"b"\\c "" a[1] *.py ~/src""")
+        self.assertEqual('--foo=bar', word_.FastStrEval(node.words[1]))
+        self.assertEqual('a,b', word_.FastStrEval(node.words[2]))
+        self.assertEqual('x:y', word_.FastStrEval(node.words[3]))
+        self.assertEqual('abc', word_.FastStrEval(node.words[4]))
+        self.assertEqual('', word_.FastStrEval(node.words[5]))
+
+        # Globs and tildes need the general algorithm
+        self.assertEqual(None, word_.FastStrEval(node.words[6]))
+        self.assertEqual(None, word_.FastStrEval(node.words[7]))
+        self.assertEqual(None, word_.FastStrEval(node.words[8]))
+
+        # Substitutions in double quotes
+        node = assertParseSimpleCommand(self, 'echo "a $x"')
+        self.assertEqual(None, word_.FastStrEval(node.words[1]))
+
+    def testEvalPlan(self):
+        node = assertParseSimpleCommand(self, 'ls -l $x "$x" "$@" $x$y *.py')
+        w = node.words[1]
+        self.assertEqual(eval_plan_e.Unknown, w.plan)
+        self.assertEqual(eval_plan_e.Static, word_.EvalPlan(w))
+        self.assertEqual(eval_plan_e.Static, w.plan)  # cached
+
+        self.assertEqual(eval_plan_e.VarSub, word_.EvalPlan(node.words[2]))
+        self.assertEqual(eval_plan_e.DQVarSub, word_.EvalPlan(node.words[3]))
+        for w in node.words[4:]:
+            self.assertEqual(eval_plan_e.General, word_.EvalPlan(w))
+
+
+    def testIsPure(self):
+        node = assertParseSimpleCommand(
+            self, """echo a 'b' "c $x ${y}" ${a[@]} ~ {x,$y} {1..3}""")
+        for w in node.words:
+            self.assertEqual(True, word_.IsPure(w), w)
+
+        for s in ['$(date)', '"$((i++))"', '${x:=y}', '${a[i++]}', '${!ref}',
+                  '$BASHPID', '${RANDOM}', '{a,$(date)}']:
+            node = assertParseSimpleCommand(self, 'echo ' + s)
+            self.assertEqual(False, word_.IsPure(node.words[1]), s)
+
 
 if __name__ == '__main__':
     unittest.main()
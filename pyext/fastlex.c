@@ -10,6 +10,7 @@
 #include "_gen/frontend/id_kind.asdl_c.h"
 #include "_gen/frontend/types.asdl_c.h"  // for lex_mode_e
 #include "_gen/frontend/match.re2c.h"
+#include "cpp/ifs_split_shared.h"
 
 // TODO: Should this be shared among all extensions?
 // Log messages to stderr.
@@ -171,6 +172,54 @@ fastlex_MatchBraceRangeToken(PyObject *self, PyObject *args) {
   return Py_BuildValue("(ii)", id, end_pos);
 }
 
+static PyObject *
+fastlex_MatchJ8Token(PyObject *self, PyObject *args) {
+  unsigned char* line;
+  int line_len;
+
+  int start_pos;
+  if (!PyArg_ParseTuple(args, "s#i", &line, &line_len, &start_pos)) {
+    return NULL;
+  }
+
+  // Bounds checking.
+  if (start_pos > line_len) {
+    PyErr_Format(PyExc_ValueError,
+                 "Invalid MatchJ8Token call (start_pos = %d, line_len = %d)",
+                 start_pos, line_len);
+    return NULL;
+  }
+
+  int id;
+  int end_pos;
+  MatchJ8Token(line, line_len, start_pos, &id, &end_pos);
+  return Py_BuildValue("(ii)", id, end_pos);
+}
+
+static PyObject *
+fastlex_MatchJ8StrToken(PyObject *self, PyObject *args) {
+  unsigned char* line;
+  int line_len;
+
+  int start_pos;
+  if (!PyArg_ParseTuple(args, "s#i", &line, &line_len, &start_pos)) {
+    return NULL;
+  }
+
+  // Bounds checking.
+  if (start_pos > line_len) {
+    PyErr_Format(PyExc_ValueError,
+                 "Invalid MatchJ8StrToken call (start_pos = %d, line_len = %d)",
+                 start_pos, line_len);
+    return NULL;
+  }
+
+  int id;
+  int end_pos;
+  MatchJ8StrToken(line, line_len, start_pos, &id, &end_pos);
+  return Py_BuildValue("(ii)", id, end_pos);
+}
+
 static PyObject *
 fastlex_IsValidVarName(PyObject *self, PyObject *args) {
   unsigned  char *name;
@@ -215,6 +264,48 @@ fastlex_LooksLikeFloat(PyObject *self, PyObject *args) {
   return PyBool_FromLong(LooksLikeFloat(name, len));
 }
 
+static PyObject *
+fastlex_IfsSplit(PyObject *self, PyObject *args) {
+  unsigned char *s;
+  int len;
+  unsigned char *ifs_whitespace;
+  int ws_len;
+  unsigned char *ifs_other;
+  int other_len;
+
+  if (!PyArg_ParseTuple(args, "s#s#s#", &s, &len, &ifs_whitespace, &ws_len,
+                        &ifs_other, &other_len)) {
+    return NULL;
+  }
+
+  // Backslash escapes need the full state machine in osh/split.py
+  if (memchr(s, '\\', len) != NULL) {
+    Py_RETURN_NONE;
+  }
+
+  PyObject* parts = PyList_New(0);
+  if (parts == NULL) {
+    return NULL;
+  }
+
+  struct IfsSplitState st;
+  IfsSplitInit(&st, s, len, ifs_whitespace, ws_len, ifs_other, other_len);
+
+  int start;
+  int end;
+  while (IfsSplitNext(&st, &start, &end)) {
+    PyObject* part = PyString_FromStringAndSize((const char*)s + start,
+                                                end - start);
+    if (part == NULL || PyList_Append(parts, part) < 0) {
+      Py_XDECREF(part);
+      Py_DECREF(parts);
+      return NULL;
+    }
+    Py_DECREF(part);
+  }
+  return parts;
+}
+
 #ifdef OVM_MAIN
 #include "pyext/fastlex.c/methods.def"
 #else
@@ -231,12 +322,18 @@ static PyMethodDef methods[] = {
    "(line, start_pos) -> (id, end_pos)."},
   {"MatchBraceRangeToken", fastlex_MatchBraceRangeToken, METH_VARARGS,
    "(line, start_pos) -> (id, end_pos)."},
+  {"MatchJ8Token", fastlex_MatchJ8Token, METH_VARARGS,
+   "(line, start_pos) -> (id, end_pos)."},
+  {"MatchJ8StrToken", fastlex_MatchJ8StrToken, METH_VARARGS,
+   "(line, start_pos) -> (id, end_pos)."},
   {"IsValidVarName", fastlex_IsValidVarName, METH_VARARGS,
    "Is it a valid var name?"},
   // Should we hijack this shebang line?
   {"ShouldHijack", fastlex_ShouldHijack, METH_VARARGS, ""},
   {"LooksLikeInteger", fastlex_LooksLikeInteger, METH_VARARGS, ""},
   {"LooksLikeFloat", fastlex_LooksLikeFloat, METH_VARARGS, ""},
+  {"IfsSplit", fastlex_IfsSplit, METH_VARARGS,
+   "(s, ifs_whitespace, ifs_other) -> list of fields, or None"},
   {NULL, NULL},
 };
 #endif
@@ -78,6 +78,18 @@ class LexTest(unittest.TestCase):
     self.assertEqual(False, fastlex.IsValidVarName('x-'))
     self.assertEqual(False, fastlex.IsValidVarName('var_name-foo'))
 
+  def testIfsSplit(self):
+    self.assertEqual([], fastlex.IfsSplit('', ' \t\n', ''))
+    self.assertEqual(['a', 'b'], fastlex.IfsSplit(' a \tb\n', ' \t\n', ''))
+    self.assertEqual(['', 'a', '', 'b'], fastlex.IfsSplit(':a:: b :', ' ', ':'))
+    self.assertEqual(['a b'], fastlex.IfsSplit('a b', '', ''))
+
+    # NUL bytes are OK
+    self.assertEqual(['a\0b', 'c'], fastlex.IfsSplit('a\0b c', ' ', ''))
+
+    # The caller falls back to osh/split.py
+    self.assertEqual(None, fastlex.IfsSplit('a\\ b', ' ', ''))
+
 
 if __name__ == '__main__':
   unittest.main()
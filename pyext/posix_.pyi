@@ -151,7 +151,7 @@ def lchown(path: unicode, uid: int, gid: int) -> None: ...
 def link(source: unicode, link_name: str) -> None: ...
 _T = TypeVar("_T")
 def listdir(path: _T) -> List[_T]: ...
-def lseek(fd: int, pos: int, how: int) -> None: ...
+def lseek(fd: int, pos: int, how: int) -> int: ...
 def lstat(path: unicode) -> stat_result: ...
 def major(device: int) -> int: ...
 def makedev(major: int, minor: int) -> int: ...
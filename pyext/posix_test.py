@@ -57,8 +57,10 @@ FUNCS = [
     "getuid",
     "wait",
     "open",
+    "unlink",
     "close",
     "dup2",
+    "lseek",
     "read",
     "write",
     "fdopen",
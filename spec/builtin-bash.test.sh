@@ -1,4 +1,4 @@
-## oils_failures_allowed: 4
+## oils_failures_allowed: 3
 ## compare_shells: bash
 
 
@@ -179,6 +179,24 @@ n=3
 ## N-I dash/mksh/zsh/ash STDOUT:
 ## END
 
+#### mapfile -n on a regular file leaves the rest for the next command
+type mapfile >/dev/null 2>&1 || exit 0
+printf '%s\n' a{0..10} > $TMP/mapfile-n.txt
+{
+  mapfile -s 2 -n 3 -t arr
+  printf '[%s]\n' "${arr[@]}"
+  read -r next
+  echo "next=$next"
+} < $TMP/mapfile-n.txt
+## STDOUT:
+[a2]
+[a3]
+[a4]
+next=a5
+## END
+## N-I dash/mksh/zsh/ash STDOUT:
+## END
+
 #### mapfile / readarray stdin  TODO: Fix me.
 shopt -s lastpipe  # for bash
 
@@ -201,6 +201,31 @@ echo $flags '\0' '\1' '\8' | od -A n -c | sed 's/ \+/ /g'
 ## stdout-json: " \\0 \\ 1 \\ 8\n"
 ## BUG dash/ash stdout-json: " \\0 001 \\ 8\n"
 
+#### echo output isn't lost when a long loop is killed
+# The shell may buffer the output of builtins, but not for long
+timeout -s TERM 3 $SH -c 'echo before-loop; while test 1 = 1; do x=1; done' > out.txt
+echo status=$?
+cat out.txt
+## STDOUT:
+status=124
+before-loop
+## END
+
+#### echo to a closed pipe fails, and the loop stops
+{ trap '' PIPE
+  for i in $(seq 100000); do
+    echo $i || break
+  done
+  echo "stopped early: $(( i < 100000 ))" >&2
+} 2>err.txt | (exit)
+# Reported once: 'write error: Broken pipe', or 'I/O error' in dash
+grep -v 'error' err.txt
+grep -c 'error' err.txt
+## STDOUT:
+stopped early: 1
+1
+## END
+
 #### Read builtin
 # NOTE: there are TABS below
 read x <<EOF
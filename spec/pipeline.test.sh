@@ -140,6 +140,77 @@ cmd=
 cmd=echo
 ## END
 
+#### Words of a builtin in pipeline are evaluated in child
+shopt -s sigpipe_status_ok 2>/dev/null  # OSH runs simple ones in process
+i=0
+echo $(( i += 1 )) ${x=foo} | cat
+printf '%s\n' $(( i += 1 )) | cat
+echo "i=$i x=$x"
+## STDOUT:
+1 foo
+1
+i=0 x=
+## END
+
+#### Builtin in pipeline writes more than a pipe holds
+lines=$(seq 20000)
+shopt -s lastpipe 2>/dev/null
+shopt -s sigpipe_status_ok 2>/dev/null
+echo "$lines" | while read x; do n=$x; done
+echo n=$n
+printf '%s\n' "$lines" | wc -l
+## STDOUT:
+n=20000
+20000
+## END
+## N-I dash/mksh STDOUT:
+n=
+20000
+## END
+
+#### Builtin in pipeline when TMPDIR can't be written
+shopt -s lastpipe 2>/dev/null
+shopt -s sigpipe_status_ok 2>/dev/null
+TMPDIR=/nonexistent/dir
+echo hi | readlink /proc/self/fd/0 | cut -d : -f 1
+printf '%s\n' a b | while read x; do y=$y$x; done
+echo y=$y
+## STDOUT:
+pipe
+y=ab
+## END
+## N-I dash/mksh STDOUT:
+pipe
+y=
+## END
+
+#### Builtin in pipeline with words bigger than a pipe is run in a child
+shopt -s sigpipe_status_ok 2>/dev/null
+big=$(printf '%070000d' 0)
+echo "$big" | readlink /proc/self/fd/0 | cut -d : -f 1
+echo "$big" | wc -c
+## STDOUT:
+pipe
+70001
+## END
+
+#### Function shadows builtin in pipeline, and PIPESTATUS
+shopt -s sigpipe_status_ok 2>/dev/null
+echo() { command echo "[$@]"; }
+echo hi | cat
+printf '%s\n' a b | { read x; read y; command echo $x$y; }
+command echo ${PIPESTATUS[@]}
+## STDOUT:
+[hi]
+ab
+0 0
+## END
+## N-I dash status: 2
+## N-I dash STDOUT:
+[hi]
+ab
+## END
+
 #### bash/dash/mksh run the last command is run in its own process
 echo hi | read line
 echo "line=$line"
@@ -520,6 +520,27 @@ FOO
 ## END
 ## N-I dash/ash/yash stdout-json: "\n"
 
+#### $(< file) status, and a file bigger than one read()
+seq 2000 > big
+x=$(< big)
+echo status=$? len=${#x}
+
+x=$(< nonexistent)
+echo status=$?
+
+x=$(< big)
+echo status=$? len=${#x}
+## STDOUT:
+status=0 len=8892
+status=1
+status=0 len=8892
+## END
+## N-I dash/ash/yash STDOUT:
+status=0 len=0
+status=2
+status=0 len=0
+## END
+
 #### $(< file) with more statements
 
 # note that it doesn't do this without a command sub!
@@ -1,5 +1,5 @@
 
-## oils_failures_allowed: 6
+## oils_failures_allowed: 3
 
 #### append onto BashArray a=(1 2)
 shopt -s parse_at
@@ -267,15 +267,17 @@ status=2
 ## END
 
 #### read --all-lines
-seq 3 | read --all-lines :nums
+shopt -s parse_at
+seq 3 | read --all-lines (&nums)
 write --sep ' ' -- @nums
 ## STDOUT:
 1 2 3
 ## END
 
 #### read --all-lines --with-eol
-seq 3 | read --all-lines --with-eol :nums
-write --sep '' -- @nums
+shopt -s parse_at
+seq 3 | read --all-lines --with-eol (&nums)
+write --sep '' --end '' -- @nums
 ## STDOUT:
 1
 2
@@ -283,7 +285,8 @@ write --sep '' -- @nums
 ## END
 
 #### read --all-lines --qsn --with-eol
-read --all-lines --qsn --with-eol :lines << EOF
+shopt -s parse_at
+read --all-lines --qsn --with-eol (&lines) << 'EOF'
 foo
 bar
 'one\ntwo'
@@ -296,6 +299,37 @@ one
 two
 ## END
 
+#### read --all-lines --skip --max-lines, and delimiters
+shopt -s parse_at
+seq 10 > nums.txt
+read --all-lines --skip 3 --max-lines 2 (&nums) < nums.txt
+write --sep ' ' -- @nums
+
+read --all-lines --skip 8 --max-lines 5 (&nums) < nums.txt
+write --sep ' ' -- @nums
+
+printf 'a,b,c' | read --all-lines -d , (&parts)
+write --sep ' ' -- @parts
+
+printf 'x\0y\0' | read --all-lines -0 (&parts)
+write --sep ' ' -- @parts
+
+# Windows of a file, without reading it from the start
+{ read --all-lines --max-lines 3 (&a)
+  read --all-lines --skip 1 --max-lines 2 (&b)
+  read --all-lines (&c)
+} < nums.txt
+write --sep ' ' -- @a ; write --sep ' ' -- @b ; write --sep ' ' -- @c
+## STDOUT:
+4 5
+9 10
+a b c
+x y
+1 2 3
+5 6
+7 8 9 10
+## END
+
 #### read --all
 echo foo | read --all
 echo "[$_reply]"
@@ -151,3 +151,72 @@ for i, file in *.py {README,foo}.md {
 2 README.md
 3 foo.md
 ## END
+
+#### for line in (_io->lines())
+printf 'a\nb\n\nc' > lines.txt
+
+for line in (_io->lines()) {
+  echo "[$line]"
+} < lines.txt
+
+for i, line in (_io->lines()) {
+  echo "$i $line"
+} < lines.txt
+## STDOUT:
+[a]
+[b]
+[]
+[c]
+0 a
+1 b
+2 
+3 c
+## END
+
+#### _io->lines() resumes after break, and reads other descriptors
+seq 5 > nums.txt
+
+var L = _io->lines(3)
+{
+  for x in (L) {
+    echo first $x
+    if (x === '2') {
+      break
+    }
+  }
+  for x in (L) {
+    echo rest $x
+  }
+} 3< nums.txt
+
+echo $[len(list(_io->lines()))] < nums.txt
+## STDOUT:
+first 1
+first 2
+rest 3
+rest 4
+rest 5
+5
+## END
+
+#### read after break out of _io->lines() on a file
+seq 5 > nums.txt
+
+{
+  for x in (_io->lines()) {
+    echo loop $x
+    if (x === '2') {
+      break
+    }
+  }
+  read -r next  # unbuffered, unlike read --line
+  echo "read $next"
+  cat
+} < nums.txt
+## STDOUT:
+loop 1
+loop 2
+read 3
+4
+5
+## END
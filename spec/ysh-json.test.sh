@@ -146,6 +146,41 @@ pp cell y
 pipeline status = 1
 ## END
 
+#### json read with escapes and nested values
+echo '{"s": "a\tb\u00e9", "L": [1, 2.5, true, null], "d": {}}' | json read
+json write --pretty=0 (_reply)
+## STDOUT:
+{"s":"a\tbé","L":[1,2.5,true,null],"d":{}}
+## END
+
+#### json read --lines runs a block on each value
+shopt --set ysh:upgrade
+
+printf '{"name": "alice"}\n\n{"name": "bob"}\n' | json read --lines (&rec) {
+  echo $[rec.name]
+}
+echo status=$?
+
+printf '[1]\n[2, 3]\n' | json read --lines {
+  echo $[len(_reply)]
+}
+
+# Values before the error are still processed
+printf '1\n2\n[\n' | json read --lines {
+  echo $[_reply]
+}
+echo status=$?
+## status: 1
+## STDOUT:
+alice
+bob
+status=0
+1
+2
+1
+2
+## END
+
 #### json write expression
 json write --pretty=0 ([1,2,3])
 echo status=$?
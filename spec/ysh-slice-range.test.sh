@@ -129,6 +129,59 @@ for i in (5..1) {
 ## STDOUT:
 ## END
 
+#### Ranges are lazy: len(), in, subscript, and slice
+shopt --set ysh:upgrade
+
+var r = 1 .. 5
+echo $[len(r)] $[len(5 .. 1)]
+echo $[3 in r] $[5 in r] $[0 not in r]
+echo $[r[0]] $[r[-1]]
+write -- @[r[1:3]]
+echo ---
+write -- @[r[-2:]]
+
+# Doesn't allocate 10 billion integers
+var big = 0 .. 10_000_000_000
+echo $[len(big)] $[big[-1]] $[9_999_999_999 in big]
+
+try {
+  = r[4]
+}
+echo status=$_status
+## STDOUT:
+4 0
+true false true
+1 4
+2
+3
+---
+3
+4
+10000000000 9999999999 true
+status=3
+## END
+
+#### Splice Range into argv, and convert it to List
+shopt --set ysh:upgrade
+
+var r = 3 .. 6
+write -- @r
+write -- @[0 .. 2]
+echo ---
+var L = list(r)
+= L
+= list(0 .. 10)
+## STDOUT:
+3
+4
+5
+0
+1
+---
+(List)   [3, 4, 5]
+(List)   [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+## END
+
 #### Slices with Multiple Dimensions (for QTT)
 
 qtt pretty :mytable <<< '''
@@ -0,0 +1,118 @@
+## our_shell: ysh
+## tags: dev-minimal
+
+#### usage errors
+tsv8
+echo status=$?
+
+tsv8 zz
+echo status=$?
+
+## status: 2
+## STDOUT:
+## END
+
+#### tsv8 read into a Dict of columns
+printf '!tsv8\tname\tage\n!type\tStr\tInt\n\tAlice\t42\n\t"a\\tb"\t7\n' > t.tsv8
+
+tsv8 read (&t) < t.tsv8
+json write --pretty=F (t)
+
+# The default place is _reply
+tsv8 read < t.tsv8
+echo $[_reply.age[0] + _reply.age[1]]
+## STDOUT:
+{"name":["Alice","a\tb"],"age":[42,7]}
+49
+## END
+
+#### tsv8 read some columns
+printf '!tsv8\tname\tage\tok\n!type\tStr\tInt\tBool\n\tAlice\t42\ttrue\n' > t.tsv8
+
+tsv8 read ok name (&t) < t.tsv8
+json write --pretty=F (t)
+
+try { tsv8 read zz (&t) < t.tsv8 }
+echo status=$_status
+## STDOUT:
+{"ok":[true],"name":["Alice"]}
+status=1
+## END
+
+#### tsv8 read --batch
+for i in 1 2 3 4 5; do
+  echo "$i"
+done > nums.txt
+
+{ printf '!tsv8\tn\n!type\tInt\n'
+  while read -r n; do
+    printf '\t%s\n' "$n"
+  done < nums.txt
+} > t.tsv8
+
+{ tsv8 read --batch 2 (&b) {
+    json write --pretty=F (b)
+  }
+} < t.tsv8
+## STDOUT:
+{"n":[1,2]}
+{"n":[3,4]}
+{"n":[5]}
+## END
+
+#### tsv8 read errors
+printf 'name\n' > t.tsv8
+try { tsv8 read (&t) < t.tsv8 }
+echo status=$_status
+
+printf '!tsv8\tn\n!type\tInt\n\tfoo\n' > t.tsv8
+try { tsv8 read (&t) < t.tsv8 }
+echo status=$_status
+
+printf '!tsv8\tn\n\t1\t2\n' > t.tsv8
+try { tsv8 read (&t) < t.tsv8 }
+echo status=$_status
+## STDOUT:
+status=1
+status=1
+status=1
+## END
+
+#### tsv8 write
+var t = {name: ['Alice', 'a	b', '"q"'], age: [42, 7, 1], score: [1.5, 0.5, -2.0]}
+tsv8 write (t)
+## STDOUT:
+!tsv8	name	age	score
+!type	Str	Int	Float
+	Alice	42	1.5
+	"a\tb"	7	0.5
+	"\"q\""	1	-2.0
+## END
+
+#### tsv8 write then read
+var t = {name: ['Alice', 'Bob'], ok: [true, false]}
+tsv8 write (t) > t.tsv8
+tsv8 read (&t2) < t.tsv8
+json write --pretty=F (t2)
+## STDOUT:
+{"name":["Alice","Bob"],"ok":[true,false]}
+## END
+
+#### tsv8 write errors
+try { tsv8 write ('foo') }
+echo status=$_status
+
+try { tsv8 write ({a: [1, 2], b: [3]}) }
+echo status=$_status
+
+try { tsv8 write ({a: [1, 'x']}) }
+echo status=$_status
+
+try { tsv8 write ({a: [null]}) }
+echo status=$_status
+## STDOUT:
+status=1
+status=1
+status=1
+status=1
+## END
@@ -193,7 +193,7 @@ builtin-eval-source() {
 }
 
 builtin-io() {
-  sh-spec spec/builtin-io.test.sh --oils-failures-allowed 2 \
+  sh-spec spec/builtin-io.test.sh --oils-failures-allowed 3 \
     ${REF_SHELLS[@]} $ZSH $BUSYBOX_ASH $OSH_LIST "$@"
 }
 
@@ -860,6 +860,10 @@ ysh-json() {
   run-file ysh-json "$@"
 }
 
+ysh-tsv8() {
+  run-file ysh-tsv8 "$@"
+}
+
 ysh-keywords() {
   run-file ysh-keywords "$@"
 }
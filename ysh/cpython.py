@@ -7,6 +7,7 @@ from __future__ import print_function
 from _devbuild.gen.syntax_asdl import loc
 from _devbuild.gen.value_asdl import (value, value_e, value_t)
 from core import error
+from core import packed_list
 from core import vm
 from mycpp.mylib import log, NewDict, tagswitch
 
@@ -64,7 +65,7 @@ def _PyObjToValue(val):
 
         #if is_shell_array:
         #    return value.BashArray(shell_array)
-        return value.List(typed_array)
+        return value.List(typed_array, None)
 
     elif isinstance(val, xrange):
         # awkward, but should go away once everything is typed...
@@ -149,9 +150,18 @@ def _ValueToPyObj(val):
             val = cast(value.BashArray, UP_val)
             return val.strs
 
+        elif case(value_e.SparseArray):
+            # passthrough, since a list with None for each hole could be huge,
+            # e.g. after a[1000000000]=x
+            return val
+
         elif case(value_e.List):
             val = cast(value.List, UP_val)
-            return list(map(_ValueToPyObj, val.items))
+            items = [
+                packed_list.GetItem(val, i)
+                for i in xrange(packed_list.Len(val))
+            ]
+            return list(map(_ValueToPyObj, items))
 
         elif case(value_e.BashAssoc):
             val = cast(value.BashAssoc, UP_val)
@@ -178,6 +188,9 @@ def _ValueToPyObj(val):
         elif case(value_e.Command):
             return val  # passthrough
 
+        elif case(value_e.Lines):
+            return val  # passthrough
+
         else:
             raise error.Expr(
                 'Trying to convert unexpected type to pyobj: %r' % val,
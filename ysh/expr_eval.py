@@ -46,6 +46,7 @@ from _devbuild.gen.runtime_asdl import (
 from _devbuild.gen.value_asdl import (value, value_e, value_t, y_lvalue,
                                       y_lvalue_e, y_lvalue_t, IntBox, LeftName)
 from core import error
+from core import packed_list
 from core.error import e_die, e_die_status
 from core import pyutil
 from core import state
@@ -224,7 +225,7 @@ class ExprEvaluator(object):
                         index = val_ops.ToInt(lval.index,
                                               'List index should be Int',
                                               loc.Missing)
-                        lhs_val_ = obj.items[index]
+                        lhs_val_ = packed_list.GetItem(obj, index)
 
                     elif case(value_e.Dict):
                         obj = cast(value.Dict, UP_obj)
@@ -247,7 +248,7 @@ class ExprEvaluator(object):
                 with tagswitch(obj) as case:
                     if case(value_e.List):
                         obj = cast(value.List, UP_obj)
-                        obj.items[index] = new_val_
+                        packed_list.SetItem(obj, index, new_val_)
 
                     elif case(value_e.Dict):
                         obj = cast(value.Dict, UP_obj)
@@ -560,9 +561,7 @@ class ExprEvaluator(object):
             left = cast(value.List, UP_left)
             right = cast(value.List, UP_right)
 
-            c = list(left.items)  # mycpp rewrite of L1 + L2
-            c.extend(right.items)
-            return value.List(c)
+            return packed_list.Concat(left, right)
 
         else:
             raise error.TypeErrVerbose(
@@ -855,14 +854,14 @@ class ExprEvaluator(object):
                         index = cast(value.Slice, UP_index)
 
                         lower = index.lower.i if index.lower else 0
-                        upper = index.upper.i if index.upper else len(
-                            obj.items)
-                        return value.List(obj.items[lower:upper])
+                        upper = (index.upper.i
+                                 if index.upper else packed_list.Len(obj))
+                        return packed_list.Slice(obj, lower, upper)
 
                     elif case2(value_e.Int):
                         index = cast(value.Int, UP_index)
                         try:
-                            return obj.items[index.i]
+                            return packed_list.GetItem(obj, index.i)
                         except IndexError:
                             # TODO: expr.Subscript has no error location
                             raise error.Expr('index out of range', loc.Missing)
@@ -872,6 +871,33 @@ class ExprEvaluator(object):
                             index, 'List index expected Int or Slice',
                             loc.Missing)
 
+            elif case(value_e.Range):
+                # Like a List of Int, without materializing it
+                obj = cast(value.Range, UP_obj)
+                n = val_ops.RangeLen(obj)
+                with tagswitch(index) as case2:
+                    if case2(value_e.Slice):
+                        index = cast(value.Slice, UP_index)
+
+                        lower = index.lower.i if index.lower else 0
+                        upper = index.upper.i if index.upper else n
+                        return val_ops.RangeSlice(obj, lower, upper)
+
+                    elif case2(value_e.Int):
+                        index = cast(value.Int, UP_index)
+                        i = index.i
+                        if i < 0:
+                            i += n
+                        if i < 0 or i >= n:
+                            # TODO: expr.Subscript has no error location
+                            raise error.Expr('index out of range', loc.Missing)
+                        return value.Int(obj.lower + i)
+
+                    else:
+                        raise error.TypeErr(
+                            index, 'Range index expected Int or Slice',
+                            loc.Missing)
+
             elif case(value_e.Dict):
                 obj = cast(value.Dict, UP_obj)
                 if index.tag() != value_e.Str:
@@ -885,7 +911,8 @@ class ExprEvaluator(object):
                     # TODO: expr.Subscript has no error location
                     raise error.Expr('dict entry not found', loc.Missing)
 
-        raise error.TypeErr(obj, 'Subscript expected Str, List, or Dict',
+        raise error.TypeErr(obj,
+                            'Subscript expected Str, List, Dict, or Range',
                             loc.Missing)
 
     def _EvalAttribute(self, node):
@@ -991,7 +1018,7 @@ class ExprEvaluator(object):
                         strs = self.splitter.SplitForWordEval(stdout_str)
                         items = [value.Str(s)
                                  for s in strs]  # type: List[value_t]
-                        return value.List(items)
+                        return value.List(items, None)
                     else:
                         return value.Str(stdout_str)
 
@@ -1004,7 +1031,7 @@ class ExprEvaluator(object):
 
                 # It's equivalent to ['foo', 'bar']
                 items = [value.Str(s) for s in strs]
-                return value.List(items)
+                return value.List(items, None)
 
             elif case(expr_e.DoubleQuoted):
                 node = cast(DoubleQuoted, UP_node)
@@ -1089,13 +1116,13 @@ class ExprEvaluator(object):
             elif case(expr_e.List):
                 node = cast(expr.List, UP_node)
                 items = [self._EvalExpr(e) for e in node.elts]
-                return value.List(items)
+                return packed_list.NewList(items)
 
             elif case(expr_e.Tuple):
                 node = cast(expr.Tuple, UP_node)
                 # YSH language: Tuple syntax evaluates to LIST !
                 items = [self._EvalExpr(e) for e in node.elts]
-                return value.List(items)
+                return packed_list.NewList(items)
 
             elif case(expr_e.Dict):
                 node = cast(expr.Dict, UP_node)
@@ -13,6 +13,7 @@ from _devbuild.gen.value_asdl import (value, value_e, value_t, ProcDefaults,
                                       LeftName)
 
 from core import error
+from core import packed_list
 from core import state
 from core import vm
 from frontend import lexer
@@ -150,7 +151,7 @@ def _EvalPosArgs(expr_ev, exprs, pos_args):
             val = expr_ev._EvalExpr(e.child)
             if val.tag() != value_e.List:
                 raise error.TypeErr(val, 'Spread expected a List', e.left)
-            pos_args.extend(cast(value.List, val).items)
+            pos_args.extend(packed_list.Items(cast(value.List, val)))
         else:
             pos_args.append(expr_ev._EvalExpr(e))
 
@@ -297,7 +298,7 @@ def _BindWords(
 
         items = [value.Str(s)
                  for s in argv[num_params:]]  # type: List[value_t]
-        rest_val = value.List(items)
+        rest_val = value.List(items, None)
         mem.SetLocalName(lval, rest_val)
     else:
         if num_args > num_params:
@@ -369,7 +370,7 @@ def _BindTyped(
         if rest:
             lval = LeftName(rest.name, rest.blame_tok)
 
-            rest_val = value.List(pos_args[num_params:])
+            rest_val = value.List(pos_args[num_params:], None)
             mem.SetLocalName(lval, rest_val)
         else:
             if num_args > num_params:
@@ -535,7 +536,8 @@ def CallUserFunc(
         _BindFuncArgs(func, rd, mem)
 
         try:
-            cmd_ev._Execute(func.parsed.body)
+            if cmd_ev.ExecuteBody(func.parsed.body, True):
+                return cmd_ev.ret_val
 
             return value.Null  # implicit return
         except vm.ValueControlFlow as e:
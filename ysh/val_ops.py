@@ -7,13 +7,19 @@ from __future__ import print_function
 from _devbuild.gen.syntax_asdl import loc, loc_t, command_t
 from _devbuild.gen.value_asdl import (value, value_e, value_t)
 from core import error
+from core.error import e_die
+from core import packed_list
+from core import pyos
 from core import ui
-from mycpp.mylib import tagswitch
+from mycpp.mylib import tagswitch, iteritems
+from osh import sparse_array
 from ysh import regex_translate
 
+from errno import EINTR
 from typing import TYPE_CHECKING, cast, Dict, List, Optional
 
 import libc
+import posix_ as posix
 
 if TYPE_CHECKING:
     from core import state
@@ -54,7 +60,7 @@ def ToList(val, msg, blame_loc):
     UP_val = val
     if val.tag() == value_e.List:
         val = cast(value.List, UP_val)
-        return val.items
+        return packed_list.Items(val)
 
     raise error.TypeErr(val, msg, blame_loc)
 
@@ -146,7 +152,8 @@ def ToShellArray(val, blame_loc, prefix=''):
             strs = []  # type: List[str]
             # Note: it would be nice to add the index to the error message
             # prefix, WITHOUT allocating a string for every item
-            for item in val.items:
+            for i in xrange(packed_list.Len(val)):
+                item = packed_list.GetItem(val, i)
                 strs.append(Stringify(item, blame_loc, prefix=prefix))
 
         # I thought about getting rid of this to keep OSH and YSH separate,
@@ -157,6 +164,17 @@ def ToShellArray(val, blame_loc, prefix=''):
             val = cast(value.BashArray, UP_val)
             strs = val.strs
 
+        elif case2(value_e.SparseArray):
+            val = cast(value.SparseArray, UP_val)
+            strs = sparse_array.Values(val)
+
+        elif case2(value_e.Range):
+            # Produce the strings directly, without boxing each Int
+            val = cast(value.Range, UP_val)
+            strs = []
+            for i in xrange(val.lower, val.upper):
+                strs.append(str(i))
+
         else:
             raise error.TypeErr(val, "%sexpected List" % prefix, blame_loc)
 
@@ -192,6 +210,11 @@ class _ContainerIter(object):
         """Return Dict value or FAIL"""
         raise AssertionError("Shouldn't have called this")
 
+    def Stop(self):
+        # type: () -> None
+        """Called when the loop ends, possibly early with break."""
+        pass
+
 
 class ArrayIter(_ContainerIter):
     """ for x in 1 2 3 { """
@@ -228,6 +251,33 @@ class RangeIterator(_ContainerIter):
         return value.Int(self.val.lower + self.i)
 
 
+def RangeLen(val):
+    # type: (value.Range) -> int
+    """len(1 .. 5) is 4.  A range whose upper bound is lower is empty."""
+    n = val.upper - val.lower
+    return n if n > 0 else 0
+
+
+def RangeSlice(val, lower, upper):
+    # type: (value.Range, int, int) -> value.Range
+    """Like list(r)[lower:upper], but the result is another Range."""
+    n = RangeLen(val)
+
+    # Same rules as Python slices
+    if lower < 0:
+        lower = max(0, lower + n)
+    if upper < 0:
+        upper = max(0, upper + n)
+    if lower > n:
+        lower = n
+    if upper > n:
+        upper = n
+    if upper < lower:
+        upper = lower
+
+    return value.Range(val.lower + lower, val.lower + upper)
+
+
 class ListIterator(_ContainerIter):
     """ for x in (mylist) { """
 
@@ -235,7 +285,7 @@ class ListIterator(_ContainerIter):
         # type: (value.List) -> None
         _ContainerIter.__init__(self)
         self.val = val
-        self.n = len(val.items)
+        self.n = packed_list.Len(val)
 
     def Done(self):
         # type: () -> int
@@ -243,7 +293,133 @@ class ListIterator(_ContainerIter):
 
     def FirstValue(self):
         # type: () -> value_t
-        return self.val.items[self.i]
+        return packed_list.GetItem(self.val, self.i)
+
+
+# LineReader reads this much at once
+_LINES_BLOCK_SIZE = 1 << 16
+
+
+class LineReader(object):
+    """Read lines from a file descriptor, a block at a time.
+
+    Unlike read --line, it reads ahead, so a file of any size takes few
+    read() calls and constant memory.
+
+    When a loop stops early, GiveBack() seeks a regular file back to the
+    first unreturned line, so a later 'read' sees it.  A pipe can't be
+    rewound, so the lines stay buffered here, and only another loop over the
+    same reader sees them.
+    """
+
+    def __init__(self, fd):
+        # type: (int) -> None
+        self.fd = fd
+        self.lines = []  # type: List[str]
+        self.i = 0  # next line in self.lines
+        self.partial = []  # type: List[str]  # a line that spans blocks
+        self.eof = False
+        self.num_unread = 0  # bytes read from fd, but not returned yet
+
+    def _Fill(self):
+        # type: () -> None
+        """Read blocks until there's a complete line, or EOF."""
+        self.lines = []
+        self.i = 0
+
+        chunks = []  # type: List[str]
+        while not self.eof:
+            n, err_num = pyos.Read(self.fd, _LINES_BLOCK_SIZE, chunks)
+            if n < 0:
+                if err_num == EINTR:
+                    continue  # retry, like read --all
+                e_die('Error reading lines: %s' % posix.strerror(err_num))
+
+            self.num_unread += n
+            if n == 0:
+                self.eof = True
+                if len(self.partial):  # the last line has no newline
+                    self.lines.append(''.join(self.partial))
+                break
+
+            lines = chunks.pop().split('\n')
+            tail = lines.pop()  # after the last newline
+            if len(lines) == 0:
+                self.partial.append(tail)
+                continue
+
+            if len(self.partial):
+                self.partial.append(lines[0])
+                lines[0] = ''.join(self.partial)
+                del self.partial[:]
+            if len(tail):
+                self.partial.append(tail)
+            self.lines = lines
+            break
+
+    def ReadLine(self):
+        # type: () -> Optional[str]
+        """Return the next line without its newline, or None at EOF."""
+        if self.i == len(self.lines):
+            self._Fill()
+            if self.i == len(self.lines):
+                return None
+
+        line = self.lines[self.i]
+        self.i += 1
+
+        self.num_unread -= len(line) + 1
+        if self.num_unread < 0:  # the last line had no newline
+            self.num_unread = 0
+        return line
+
+    def GiveBack(self):
+        # type: () -> None
+        """Give back what was read past the last line returned, if fd is a
+        regular file."""
+        if self.num_unread == 0:
+            return
+        if pyos.SeekBack(self.fd, self.num_unread):
+            self.lines = []
+            self.i = 0
+            del self.partial[:]
+            self.eof = False
+            self.num_unread = 0
+
+
+class LinesIterator(_ContainerIter):
+    """ for line in (_io->lines()) { """
+
+    def __init__(self, val):
+        # type: (value.Lines) -> None
+        _ContainerIter.__init__(self)
+        reader = cast(LineReader, val.reader)
+        self.reader = reader
+        self.line = None  # type: Optional[str]
+
+        # Read each line in Done(), not Next(), so that after 'break', the
+        # next loop over the same reader starts at the right line
+        self.have_line = False
+
+    def Next(self):
+        # type: () -> None
+        self.i += 1
+        self.have_line = False
+
+    def Done(self):
+        # type: () -> int
+        if not self.have_line:
+            self.line = self.reader.ReadLine()
+            self.have_line = True
+        return self.line is None
+
+    def FirstValue(self):
+        # type: () -> value_t
+        return value.Str(self.line)
+
+    def Stop(self):
+        # type: () -> None
+        self.reader.GiveBack()
 
 
 class DictIterator(_ContainerIter):
@@ -296,6 +472,10 @@ def ToBool(val):
             val = cast(value.BashArray, UP_val)
             return len(val.strs) != 0
 
+        elif case(value_e.SparseArray):
+            val = cast(value.SparseArray, UP_val)
+            return len(val.d) != 0
+
         elif case(value_e.BashAssoc):
             val = cast(value.BashAssoc, UP_val)
             return len(val.d) != 0
@@ -314,7 +494,7 @@ def ToBool(val):
 
         elif case(value_e.List):
             val = cast(value.List, UP_val)
-            return len(val.items) > 0
+            return packed_list.Len(val) > 0
 
         elif case(value_e.Dict):
             val = cast(value.Dict, UP_val)
@@ -371,14 +551,28 @@ def ExactlyEqual(left, right, blame_loc):
 
             return True
 
+        elif case(value_e.SparseArray):
+            left = cast(value.SparseArray, UP_left)
+            right = cast(value.SparseArray, UP_right)
+            if len(left.d) != len(right.d):
+                return False
+
+            for index, s in iteritems(left.d):
+                if index not in right.d or right.d[index] != s:
+                    return False
+
+            return True
+
         elif case(value_e.List):
             left = cast(value.List, UP_left)
             right = cast(value.List, UP_right)
-            if len(left.items) != len(right.items):
+            n = packed_list.Len(left)
+            if n != packed_list.Len(right):
                 return False
 
-            for i in xrange(0, len(left.items)):
-                if not ExactlyEqual(left.items[i], right.items[i], blame_loc):
+            for i in xrange(0, n):
+                if not ExactlyEqual(packed_list.GetItem(left, i),
+                                    packed_list.GetItem(right, i), blame_loc):
                     return False
 
             return True
@@ -414,7 +608,7 @@ def ExactlyEqual(left, right, blame_loc):
 
 def Contains(needle, haystack):
     # type: (value_t, value_t) -> bool
-    """Haystack must be a Dict.
+    """Haystack must be a Dict or Range.
 
     We should have mylist->find(x) !== -1 for searching through a List.
     Things with different perf characteristics should look different.
@@ -426,8 +620,13 @@ def Contains(needle, haystack):
             s = ToStr(needle, "LHS of 'in' should be Str", loc.Missing)
             return s in haystack.d
 
+        elif case(value_e.Range):
+            haystack = cast(value.Range, UP_haystack)
+            i = ToInt(needle, "LHS of 'in' should be Int", loc.Missing)
+            return haystack.lower <= i and i < haystack.upper
+
         else:
-            raise error.TypeErr(haystack, "RHS of 'in' should be Dict",
+            raise error.TypeErr(haystack, "RHS of 'in' should be Dict or Range",
                                 loc.Missing)
 
     return False
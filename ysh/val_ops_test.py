@@ -4,6 +4,8 @@ val_ops_test.py: Tests for val_ops.py
 """
 from __future__ import print_function
 
+import os
+import tempfile
 import unittest
 
 from _devbuild.gen.value_asdl import value
@@ -26,7 +28,7 @@ class IteratorTest(unittest.TestCase):
 
         self.assert_(it.Done())
 
-        mylist = value.List([value.Str('x'), value.Str('y')])
+        mylist = value.List([value.Str('x'), value.Str('y')], None)
 
         it = val_ops.ListIterator(mylist)
         self.assertEqual('x', it.FirstValue().s)
@@ -39,6 +41,54 @@ class IteratorTest(unittest.TestCase):
 
         self.assert_(it.Done())
 
+    def testLineReader(self):
+        orig = val_ops._LINES_BLOCK_SIZE
+        try:
+            for block_size in [1, 2, 3, 100]:
+                val_ops._LINES_BLOCK_SIZE = block_size
+                for s in ['', '\n', 'a', 'ab\ncd', 'ab\n\ncde\n', '\n\nx']:
+                    r, w = os.pipe()
+                    os.write(w, s)
+                    os.close(w)
+
+                    reader = val_ops.LineReader(r)
+                    lines = []
+                    while True:
+                        line = reader.ReadLine()
+                        if line is None:
+                            break
+                        lines.append(line)
+                    os.close(r)
+
+                    expected = s.split('\n')
+                    if expected[-1] == '':
+                        expected.pop()
+                    self.assertEqual(expected, lines, (block_size, s))
+        finally:
+            val_ops._LINES_BLOCK_SIZE = orig
+
+    def testLineReaderGiveBack(self):
+        fd, path = tempfile.mkstemp()
+        try:
+            os.write(fd, 'a\nbb\nccc')
+            os.lseek(fd, 0, 0)
+
+            reader = val_ops.LineReader(fd)
+            self.assertEqual('a', reader.ReadLine())
+            reader.GiveBack()
+            self.assertEqual('bb\nccc', os.read(fd, 100))
+
+            # Nothing to give back after the last line
+            os.lseek(fd, 0, 0)
+            reader = val_ops.LineReader(fd)
+            for expected in ['a', 'bb', 'ccc', None]:
+                self.assertEqual(expected, reader.ReadLine())
+            reader.GiveBack()
+            self.assertEqual('', os.read(fd, 100))
+        finally:
+            os.close(fd)
+            os.unlink(path)
+
 
 if __name__ == '__main__':
     unittest.main()